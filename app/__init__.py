@@ -6,12 +6,15 @@ Flask Application Factory
 
 import os
 import sys
+import time
 import logging
 
 from flask import Flask, jsonify, request, g
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+from engine.metrics import observe
+
 # Load environment variables
 load_dotenv()
 
@@ -25,6 +28,7 @@ class PollingLogFilter(logging.Filter):
     SUPPRESSED_PATHS = [
         '/api/system/update-status',
         '/api/system/data-status',
+        '/api/system/progress',  # SSE 스트림 / long-poll 재연결
         '/api/kr/jongga-v2/status',
         '/api/kr/status',
         '/api/kr/stock-detail',  # 상세 조회 로그도 제외
@@ -43,14 +47,6 @@ class PollingLogFilter(logging.Filter):
 werkzeug_logger = logging.getLogger('werkzeug')
 werkzeug_logger.addFilter(PollingLogFilter())
 
-# Import Blueprints
-try:
-    from app.routes import kr_bp, common_bp
-    blueprints = [kr_bp, common_bp]
-except ImportError as e:
-    print(f"Error importing blueprints: {e}")
-    blueprints = []
-
 def create_app():
     # Ensure logs are printed to stdout
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', force=True)
@@ -108,6 +104,13 @@ def create_app():
     except Exception as e:
         print(f"[Startup] Failed to reset status files: {e}")
 
+    # 진행 상태 허브 소켓 오픈 (다른 워커의 진행 이벤트 수신용)
+    try:
+        from services.progress_hub import get_progress_hub
+        get_progress_hub().start()
+    except Exception as e:
+        print(f"Failed to start progress hub: {e}")
+
     # Start Scheduler (Singleton protected)
     try:
         from services import scheduler
@@ -137,6 +140,21 @@ def create_app():
         g.user_email = request.headers.get('X-User-Email') # 프론트에서 세션 이메일 전송
         g.session_id = request.headers.get('X-Session-Id') # 브라우저 세션 ID
 
+    # Middleware: 요청 처리 시간 (route 템플릿별 히스토그램, /api/admin/metrics)
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_time(response):
+        started = getattr(g, 'request_started', None)
+        if started is not None and request.url_rule is not None:
+            observe(
+                'http_request_seconds', time.perf_counter() - started,
+                method=request.method, route=request.url_rule.rule, status=response.status_code
+            )
+        return response
+
     # Middleware: Activity Logging
     @app.after_request
     def log_activity(response):
@@ -215,6 +233,7 @@ def create_app():
         return response
 
     # Register Blueprints with URL prefixes
+    # (라우트 모듈은 여기서 import - `import app`만으로 engine/services가 로드되지 않도록)
     from app.routes import kr_bp, common_bp
     app.register_blueprint(kr_bp, url_prefix='/api/kr')
     app.register_blueprint(common_bp, url_prefix='/api')
@@ -2,8 +2,29 @@
 # -*- coding: utf-8 -*-
 """
 App Routes Package
+
+블루프린트는 처음 접근할 때 import한다 (from app.routes import kr_bp).
+kr_market/common은 import 시 페이퍼 트레이딩 DB, 동기화 스레드, 쿼터 파일 마이그레이션을 시작하므로
+response_cache, kr_market_helpers 같은 하위 모듈만 쓰는 테스트/벤치마크가 이를 끌어오지 않도록 한다.
 """
-from .kr_market import kr_bp
-from .common import common_bp
+import importlib
+
+_LAZY_ATTRS = {
+    'kr_bp': ('app.routes.kr_market', 'kr_bp'),
+    'common_bp': ('app.routes.common', 'common_bp'),
+}
 
 __all__ = ['kr_bp', 'common_bp']
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module_name, attr = _LAZY_ATTRS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'app.routes' has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
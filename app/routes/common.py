@@ -3,8 +3,8 @@
 """
 공통 API 라우트
 """
-from flask import Blueprint, jsonify, request
-import pandas as pd
+from flask import Blueprint, Response, jsonify, request
+import hmac
 import os
 import json
 import logging
@@ -17,12 +17,14 @@ from threading import Lock, Thread
 import traceback
 import re
 from engine.utils import NumpyEncoder
+from engine.lazy_import import lazy_import
 
 # Add scripts directory to path for importing init_data
 scripts_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'scripts')
 if scripts_dir not in sys.path:
     sys.path.append(scripts_dir)
 
+pd = lazy_import('pandas')
 logger = logging.getLogger(__name__)
 
 common_bp = Blueprint('common', __name__)
@@ -52,6 +54,33 @@ def check_admin():
     return jsonify({'isAdmin': is_admin})
 
 
+@common_bp.route('/admin/metrics')
+def admin_metrics():
+    """
+    계측 메트릭 (Prometheus text format)
+    - `Authorization: Bearer <METRICS_TOKEN>` 또는 ?token= 필요
+    - METRICS_TOKEN이 설정되지 않았으면 비활성 (403)
+    - 값은 응답한 Gunicorn 워커 기준 (X-Metrics-Pid 헤더로 구분)
+    """
+    from engine.config import app_config
+    from engine.metrics import render_prometheus
+
+    expected = app_config.METRICS_TOKEN
+    if not expected:
+        return jsonify({'error': 'Metrics endpoint disabled (METRICS_TOKEN not set)'}), 403
+
+    auth = request.headers.get('Authorization', '')
+    token = auth[len('Bearer '):] if auth.startswith('Bearer ') else request.args.get('token', '')
+    if not hmac.compare_digest(token.encode(), expected.encode()):
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    return Response(
+        render_prometheus(),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+        headers={'X-Metrics-Pid': str(os.getpid())},
+    )
+
+
 try:
     import engine.shared as shared_state
 except ImportError:
@@ -63,6 +92,7 @@ except ImportError:
     import engine.shared as shared_state
 
 from services.paper_trading import paper_trading
+from services.progress_hub import get_progress_hub, publish_progress
 
 # Status File Path
 UPDATE_STATUS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data', 'update_status.json')
@@ -104,6 +134,7 @@ def save_update_status(status):
             
     except Exception as e:
         logger.error(f"Failed to save update status: {e}")
+    publish_progress('update', status)
 
 def start_update(items_list):
     """업데이트 시작"""
@@ -116,8 +147,8 @@ def start_update(items_list):
         status['currentItem'] = None
         save_update_status(status)
 
-def update_item_status(name, status_code):
-    """아이템 상태 업데이트"""
+def update_item_status(name, status_code, duration=None):
+    """아이템 상태 업데이트 (duration: 완료/실패 시 소요 시간, 초)"""
     with update_lock:
         status = load_update_status()
         for item in status['items']:
@@ -125,6 +156,9 @@ def update_item_status(name, status_code):
                 item['status'] = status_code
                 if status_code == 'running':
                     status['currentItem'] = name
+                    item['startedAt'] = datetime.now().isoformat()
+                if duration is not None:
+                    item['duration'] = duration
                 break
         save_update_status(status)
 
@@ -174,6 +208,125 @@ def get_update_status():
         return jsonify(status)
 
 
+# ====== 진행 상태 스트림 (SSE / long-poll) ======
+PROGRESS_CHANNELS = ('update', 'jongga_v2', 'vcp')
+PROGRESS_STREAM_MAX_SECONDS = int(os.getenv('PROGRESS_STREAM_MAX_SECONDS', '300'))
+PROGRESS_KEEPALIVE_SECONDS = 15
+# 워커당 동시 SSE 연결 + long-poll 대기 상한 (각각 gthread 1개를 점유하므로 일반 API용 스레드를 남겨 둔다)
+PROGRESS_STREAM_MAX_CONCURRENT = int(os.getenv('PROGRESS_STREAM_MAX_CONCURRENT', '4'))
+# 상한 초과 시 클라이언트에 알려 주는 재시도 간격 (초)
+PROGRESS_RETRY_AFTER_SECONDS = 30
+
+
+def _parse_progress_channels():
+    requested = [c.strip() for c in request.args.get('channels', '').split(',') if c.strip()]
+    return [c for c in requested if c in PROGRESS_CHANNELS] or list(PROGRESS_CHANNELS)
+
+
+def _progress_snapshot(channel):
+    """채널 현재 상태 (허브에 이벤트가 없으면 기존 상태 소스에서 1회 로드)"""
+    latest = get_progress_hub().latest(channel)
+    if latest is not None:
+        return latest
+    if channel == 'update':
+        with update_lock:
+            return load_update_status()
+    from app.routes.kr_market import VCP_STATUS, _load_v2_status
+    if channel == 'jongga_v2':
+        return _load_v2_status()
+    return dict(VCP_STATUS)
+
+
+def _format_sse(channel, data, event_id=None):
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {channel}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, cls=NumpyEncoder)}")
+    return "\n".join(lines) + "\n\n"
+
+
+@common_bp.route('/system/progress/stream')
+def stream_progress():
+    """
+    진행 상태 SSE 스트림 (update / jongga_v2 / vcp)
+    - 연결 직후 채널별 현재 상태를 보내고 이후 변경 시에만 이벤트 전송
+    - 유휴 시에는 keepalive 주석만 전송, 최대 연결 시간 후 종료 (EventSource가 자동 재연결)
+    - 워커당 동시 연결이 PROGRESS_STREAM_MAX_CONCURRENT를 넘으면 503 (클라이언트는 long-poll로 폴백)
+    """
+    from flask import Response, stream_with_context
+    import time
+
+    hub = get_progress_hub()
+    if not hub.try_open_stream(PROGRESS_STREAM_MAX_CONCURRENT):
+        response = jsonify({'error': 'Too many progress streams', 'fallback': '/api/system/progress'})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(PROGRESS_RETRY_AFTER_SECONDS)
+        return response
+
+    channels = _parse_progress_channels()
+
+    def generate():
+        since, _ = hub.events_since(0)
+        yield "retry: 2000\n\n"
+        for channel in channels:
+            yield _format_sse(channel, _progress_snapshot(channel), since)
+
+        deadline = time.monotonic() + PROGRESS_STREAM_MAX_SECONDS
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            seq, events = hub.wait_for_events(since, channels, timeout=min(PROGRESS_KEEPALIVE_SECONDS, remaining))
+            if not events:
+                yield ": keepalive\n\n"
+                continue
+            for event in events:
+                yield _format_sse(event['channel'], event['data'], event['seq'])
+            since = seq
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+    # 클라이언트가 끊거나 스트림이 끝나면 WSGI 서버가 close()를 호출한다
+    response.call_on_close(hub.close_stream)
+    return response
+
+
+@common_bp.route('/system/progress')
+def poll_progress():
+    """
+    진행 상태 long-poll (SSE를 쓸 수 없는 클라이언트용)
+    - since 생략: 현재 상태 즉시 반환 (응답의 seq를 다음 요청의 since로 사용)
+    - since=<seq>: 이후 변경이 생길 때까지 최대 timeout초 대기 (seq가 0이어도 대기)
+    - 대기는 SSE 스트림과 같은 PROGRESS_STREAM_MAX_CONCURRENT 슬롯을 쓴다. 슬롯이 없으면 대기 없이
+      since 이후 변경분만 바로 돌려주고 retry_after(초, Retry-After 헤더와 동일) 뒤에 다시 요청하게 한다.
+    """
+    channels = _parse_progress_channels()
+    hub = get_progress_hub()
+    since = request.args.get('since', type=int)
+    timeout = min(max(request.args.get('timeout', 25, type=float), 0), 55)
+
+    if since is None:
+        seq, _ = hub.events_since(0)
+        events = [{'seq': seq, 'channel': c, 'data': _progress_snapshot(c)} for c in channels]
+        return jsonify({'seq': seq, 'events': events})
+
+    if not hub.try_open_stream(PROGRESS_STREAM_MAX_CONCURRENT):
+        seq, events = hub.events_since(since, channels)
+        response = jsonify({'seq': seq, 'events': events, 'retry_after': PROGRESS_RETRY_AFTER_SECONDS})
+        response.headers['Retry-After'] = str(PROGRESS_RETRY_AFTER_SECONDS)
+        return response
+
+    try:
+        seq, events = hub.wait_for_events(since, channels, timeout=timeout)
+    finally:
+        hub.close_stream()
+    return jsonify({'seq': seq, 'events': events})
+
+
 @common_bp.route('/system/start-update', methods=['POST'])
 def api_start_update():
     """업데이트 시작 (백그라운드 실행)"""
@@ -198,212 +351,204 @@ def api_start_update():
     return jsonify({'status': 'ok'})
 
 
+# 업데이트 항목 의존성: (선행 항목, 공유 리소스)
+# - 가격/수급 수집은 서로 독립, Market Gate는 KODEX 200 가격만 필요 (수급은 표시용)
+# - AI Analysis / AI Jongga V2는 LLM 호출량 보호를 위해 동시에 실행하지 않음
+UPDATE_ITEM_DEPENDENCIES = {
+    'Daily Prices': ((), ()),
+    'Institutional Trend': ((), ()),
+    'Market Gate': (('Daily Prices',), ()),
+    'VCP Signals': (('Daily Prices', 'Institutional Trend'), ()),
+    'AI Analysis': (('VCP Signals',), ('llm',)),
+    'AI Jongga V2': (('Market Gate',), ('llm',)),
+}
+
+
 def run_background_update(target_date, selected_items=None, force=False):
-    """백그라운드에서 순차적으로 데이터 업데이트 실행"""
+    """백그라운드에서 데이터 업데이트 실행 (의존성 없는 항목은 병렬 실행)"""
     import asyncio
+    from services.task_graph import DependencyExecutor, TaskSpec
     
     # Default to all items if not specified
     if selected_items is None:
         selected_items = ['Daily Prices', 'Institutional Trend', 'Market Gate', 'VCP Signals', 'AI Analysis', 'AI Jongga V2']
 
-    try:
-        from scripts import init_data
-
-        # 1. Daily Prices
-        if 'Daily Prices' in selected_items:
-            if shared_state.STOP_REQUESTED: raise Exception("Stopped by user")
-            update_item_status('Daily Prices', 'running')
-            try:
-                # Force parameter supported
-                init_data.create_daily_prices(target_date, force=force)
-                update_item_status('Daily Prices', 'done')
-            except Exception as e:
-                logger.error(f"Daily Prices Failed: {e}")
-                update_item_status('Daily Prices', 'error')
-                if shared_state.STOP_REQUESTED: raise e # 중단 요청이면 전체 중단
+    from scripts import init_data
+
+    # 각 항목 함수는 선행 항목 결과 dict(upstream)를 받는다 (DependencyExecutor)
+    # 1. Daily Prices
+    def update_daily_prices(upstream):
+        # Force parameter supported
+        init_data.create_daily_prices(target_date, force=force)
+
+    # 2. Institutional Trend
+    def update_institutional_trend(upstream):
+        # Force parameter supported
+        init_data.create_institutional_trend(target_date, force=force)
+
+    # 2.5 Market Gate Analysis
+    def update_market_gate(upstream):
+        from engine.market_gate import MarketGate
+        mg = MarketGate()
+        result = mg.analyze(target_date, use_cache=False)
+        mg.save_analysis(result, target_date)
+        # 일별 히스토리 테이블 갱신 (백테스트/히스토리 조회용, 벡터화 1회 계산)
+        mg.build_history()
+
+    # 3. VCP Signals
+    def update_vcp_signals(upstream):
+        # 1. 시그널 생성 (기존 로직)
+        vcp_df = init_data.create_signals_log(target_date)
+        
+        # 2. [FIX] 기존 열린 시그널 성과 업데이트 (Tracker 연동)
+        try:
+            from engine.signal_tracker import SignalTracker
+            tracker = SignalTracker()
+            tracker.update_open_signals()
+            logger.info("SignalTracker: Open signals updated")
+        except Exception as tracker_e:
+            logger.warning(f"SignalTracker update failed (non-critical): {tracker_e}")
+        return vcp_df
+
+    # 4. AI Analysis
+    def update_ai_analysis(upstream):
+        # 같은 실행의 VCP 결과가 있으면 메모리에서 사용 (실시간성 보장)
+        vcp_df = upstream.get('VCP Signals')
+        from engine.kr_ai_analyzer import KrAiAnalyzer
+        import pandas as pd
+        import json
+        
+        # 경로 설정
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        data_dir = os.path.join(base_dir, 'data')
+        signals_path = os.path.join(data_dir, 'signals_log.csv')
+        
+        if os.path.exists(signals_path):
+            # 우선 메모리에 있는 vcp_df 사용 (실시간성 보장)
+            target_df = pd.DataFrame()
+            analysis_date = target_date if target_date else datetime.now().strftime('%Y-%m-%d')
             
-        # 2. Institutional Trend
-        if 'Institutional Trend' in selected_items:
-            if shared_state.STOP_REQUESTED: raise Exception("Stopped by user")
-            update_item_status('Institutional Trend', 'running')
-            try:
-                # Force parameter supported
-                init_data.create_institutional_trend(target_date, force=force)
-                update_item_status('Institutional Trend', 'done')
-            except Exception as e:
-                logger.error(f"Institutional Trend Failed: {e}")
-                update_item_status('Institutional Trend', 'error')
-                if shared_state.STOP_REQUESTED: raise e
-
-        # 2.5 Market Gate Analysis
-        if 'Market Gate' in selected_items:
-            if shared_state.STOP_REQUESTED: raise Exception("Stopped by user")
-            update_item_status('Market Gate', 'running')
-            try:
-                from engine.market_gate import MarketGate
-                mg = MarketGate()
-                result = mg.analyze(target_date)
-                mg.save_analysis(result, target_date)
-                update_item_status('Market Gate', 'done')
-            except Exception as e:
-                logger.error(f"Market Gate Failed: {e}")
-                update_item_status('Market Gate', 'error')
-                if shared_state.STOP_REQUESTED: raise e
-
-        # 3. VCP Signals
-        if 'VCP Signals' in selected_items:
-            if shared_state.STOP_REQUESTED: raise Exception("Stopped by user")
-            update_item_status('VCP Signals', 'running')
-            vcp_df = None
-            try:
-                # 1. 시그널 생성 (기존 로직)
-                vcp_df = init_data.create_signals_log(target_date)
-                
-                # 2. [FIX] 기존 열린 시그널 성과 업데이트 (Tracker 연동)
-                try:
-                    from engine.signal_tracker import SignalTracker
-                    tracker = SignalTracker()
-                    tracker.update_open_signals()
-                    logger.info("SignalTracker: Open signals updated")
-                except Exception as tracker_e:
-                    logger.warning(f"SignalTracker update failed (non-critical): {tracker_e}")
-                
-                update_item_status('VCP Signals', 'done')
-            except Exception as e:
-                logger.error(f"VCP Signals Failed: {e}")
-                update_item_status('VCP Signals', 'error')
-                if shared_state.STOP_REQUESTED: raise e
-
-        # 4. AI Analysis
-        if 'AI Analysis' in selected_items:
-            if shared_state.STOP_REQUESTED: raise Exception("Stopped by user")
-            update_item_status('AI Analysis', 'running')
-            try:
-                from engine.kr_ai_analyzer import KrAiAnalyzer
-                import pandas as pd
-                import json
-                
-                # 경로 설정
-                base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                data_dir = os.path.join(base_dir, 'data')
-                signals_path = os.path.join(data_dir, 'signals_log.csv')
-                
-                if os.path.exists(signals_path):
-                    # 우선 메모리에 있는 vcp_df 사용 (실시간성 보장)
-                    target_df = pd.DataFrame()
-                    analysis_date = target_date if target_date else datetime.now().strftime('%Y-%m-%d')
+            if vcp_df is not None and hasattr(vcp_df, 'empty') and not vcp_df.empty:
+                logger.info("VCP 결과 메모리에서 로드")
+                target_df = vcp_df.copy()
+                if 'signal_date' in target_df.columns:
+                    analysis_date = str(target_df['signal_date'].iloc[0])
+            else:
+                logger.info("VCP 결과 파일에서 로드 시도")
+                df = pd.read_csv(signals_path)
+                if not df.empty and 'signal_date' in df.columns:
+                    # 분석 날짜 결정
+                    if not target_date:
+                        analysis_date = str(df['signal_date'].max())
+                        
+                    # 해당 날짜 데이터 필터링
+                    target_df = df[df['signal_date'].astype(str) == analysis_date].copy()
+            
+            if not target_df.empty:
+                    # 티커 정규화 및 중복 제거 (분석 대상 확보)
+                    target_df['ticker'] = target_df['ticker'].astype(str).str.zfill(6)
+                    target_df = target_df.drop_duplicates(subset=['ticker'])
                     
-                    if 'VCP Signals' in selected_items and 'vcp_df' in locals() and vcp_df is not None and hasattr(vcp_df, 'empty') and not vcp_df.empty:
-                        logger.info("VCP 결과 메모리에서 로드")
-                        target_df = vcp_df.copy()
-                        if 'signal_date' in target_df.columns:
-                            analysis_date = str(target_df['signal_date'].iloc[0])
-                    else:
-                        logger.info("VCP 결과 파일에서 로드 시도")
-                        df = pd.read_csv(signals_path)
-                        if not df.empty and 'signal_date' in df.columns:
-                            # 분석 날짜 결정
-                            if not target_date:
-                                analysis_date = str(df['signal_date'].max())
-                                
-                            # 해당 날짜 데이터 필터링
-                            target_df = df[df['signal_date'].astype(str) == analysis_date].copy()
+                    # Score 숫자형 변환 (정렬 오류 방지)
+                    if 'score' in target_df.columns:
+                        target_df['score'] = pd.to_numeric(target_df['score'], errors='coerce').fillna(0)
                     
-                    if not target_df.empty:
-                            # 티커 정규화 및 중복 제거 (분석 대상 확보)
-                            target_df['ticker'] = target_df['ticker'].astype(str).str.zfill(6)
-                            target_df = target_df.drop_duplicates(subset=['ticker'])
-                            
-                            # Score 숫자형 변환 (정렬 오류 방지)
-                            if 'score' in target_df.columns:
-                                target_df['score'] = pd.to_numeric(target_df['score'], errors='coerce').fillna(0)
-                            
-                            # 점수 높은 순 정렬 후 상위 20개 분석 (사용자 요청: 전체/다수 분석)
-                            target_df = target_df.sort_values('score', ascending=False).head(20)
-                            tickers = target_df['ticker'].tolist()
-                            
-                            # [사용자 요청] 재분석 시 해당 날짜의 기존 AI 결과 파일 삭제 (찌꺼기 데이터 방지)
-                            date_str_clean = analysis_date.replace('-', '')
-                            target_filename = f'ai_analysis_results_{date_str_clean}.json'
-                            target_filepath = os.path.join(data_dir, target_filename)
-                            
-                            if os.path.exists(target_filepath):
-                                try:
-                                    os.remove(target_filepath)
-                                    logger.info(f"기존 AI 분석 파일 삭제 완료: {target_filename}")
-                                except Exception as del_err:
-                                    logger.warning(f"기존 AI 파일 삭제 실패: {del_err}")
-
-                            logger.info(f"AI 분석 시작: {len(tickers)} 종목 ({analysis_date})")
-                            
-                            analyzer = KrAiAnalyzer()
-                            # 분석 실행
-                            results = analyzer.analyze_multiple_stocks(tickers)
-                            
-                            # 메타데이터 추가
-                            results['generated_at'] = datetime.now().isoformat()
-                            results['signal_date'] = analysis_date
-                            
-                            # 2. 날짜별 파일 저장
-                            date_str = analysis_date.replace('-', '')
-                            filename = f'ai_analysis_results_{date_str}.json'
-                            filepath = os.path.join(data_dir, filename)
-                            
-                            with open(filepath, 'w', encoding='utf-8') as f:
-                                json.dump(results, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
-                            logger.info(f"AI 분석 결과 저장 완료: {filepath}")
-                                
-                            # 3. 최신 결과 업데이트 (target_date가 없거나 오늘인 경우)
-                            # 또는 사용자가 조회할 때 편의를 위해 항상 최신 파일도 갱신할지?
-                            # -> 일단 target_date 모드일 때는 최신 파일 건드리지 않는 게 안전 (혼선 방지)
-                            is_today = analysis_date == datetime.now().strftime('%Y-%m-%d')
-                            if not target_date or is_today:
-                                 main_path = os.path.join(data_dir, 'ai_analysis_results.json')
-                                 with open(main_path, 'w', encoding='utf-8') as f:
-                                    json.dump(results, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
-                            
-                            update_item_status('AI Analysis', 'done')
-                    else:
-                        logger.info(f"[{analysis_date}] 시그널 데이터가 없어 AI 분석 생략")
-                        update_item_status('AI Analysis', 'done')
+                    # 점수 높은 순 정렬 후 상위 20개 분석 (사용자 요청: 전체/다수 분석)
+                    target_df = target_df.sort_values('score', ascending=False).head(20)
+                    tickers = target_df['ticker'].tolist()
+                    
+                    # [사용자 요청] 재분석 시 해당 날짜의 기존 AI 결과 파일 삭제 (찌꺼기 데이터 방지)
+                    date_str_clean = analysis_date.replace('-', '')
+                    target_filename = f'ai_analysis_results_{date_str_clean}.json'
+                    target_filepath = os.path.join(data_dir, target_filename)
+                    
+                    if os.path.exists(target_filepath):
+                        try:
+                            os.remove(target_filepath)
+                            logger.info(f"기존 AI 분석 파일 삭제 완료: {target_filename}")
+                        except Exception as del_err:
+                            logger.warning(f"기존 AI 파일 삭제 실패: {del_err}")
+
+                    logger.info(f"AI 분석 시작: {len(tickers)} 종목 ({analysis_date})")
+                    
+                    analyzer = KrAiAnalyzer()
+                    # 분석 실행
+                    results = analyzer.analyze_multiple_stocks(tickers)
+                    
+                    # 메타데이터 추가
+                    results['generated_at'] = datetime.now().isoformat()
+                    results['signal_date'] = analysis_date
+                    
+                    # 2. 날짜별 파일 저장
+                    date_str = analysis_date.replace('-', '')
+                    filename = f'ai_analysis_results_{date_str}.json'
+                    filepath = os.path.join(data_dir, filename)
+                    
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        json.dump(results, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
+                    logger.info(f"AI 분석 결과 저장 완료: {filepath}")
+                        
+                    # 3. 최신 결과 업데이트 (target_date가 없거나 오늘인 경우)
+                    # 또는 사용자가 조회할 때 편의를 위해 항상 최신 파일도 갱신할지?
+                    # -> 일단 target_date 모드일 때는 최신 파일 건드리지 않는 게 안전 (혼선 방지)
+                    is_today = analysis_date == datetime.now().strftime('%Y-%m-%d')
+                    if not target_date or is_today:
+                         main_path = os.path.join(data_dir, 'ai_analysis_results.json')
+                         with open(main_path, 'w', encoding='utf-8') as f:
+                            json.dump(results, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
 
-                else:
-                    update_item_status('AI Analysis', 'done')
+            else:
+                logger.info(f"[{analysis_date}] 시그널 데이터가 없어 AI 분석 생략")
 
-            except Exception as e:
-                logger.error(f"AI Analysis Failed: {e}")
-                update_item_status('AI Analysis', 'error')
-                if shared_state.STOP_REQUESTED: raise e
-
-        # 5. AI Jongga V2
-        if 'AI Jongga V2' in selected_items:
-            if shared_state.STOP_REQUESTED: raise Exception("Stopped by user")
-            update_item_status('AI Jongga V2', 'running')
-            try:
-                # 비동기 실행을 위해 asyncio run
-                # run_screener는 engine.generator에 정의됨
-                from engine.generator import run_screener
-                
-                async def run_async_screener():
-                    await run_screener(capital=50000000, target_date=target_date)
-                    
-                asyncio.run(run_async_screener())
-                update_item_status('AI Jongga V2', 'done')
-                
-                # AI Analysis도 완료된 것으로 간주 (run_screener가 다 함)
-                update_item_status('AI Analysis', 'done') 
-                
-            except Exception as e:
-                logger.error(f"AI Jongga V2 Failed: {e}")
-                update_item_status('AI Jongga V2', 'error')
-                if shared_state.STOP_REQUESTED: raise e
+    # 5. AI Jongga V2
+    def update_jongga_v2(upstream):
+        # 비동기 실행을 위해 asyncio run
+        # run_screener는 engine.generator에 정의됨
+        from engine.generator import run_screener
+        
+        async def run_async_screener():
+            await run_screener(capital=50000000, target_date=target_date)
+            
+        asyncio.run(run_async_screener())
+
+    item_funcs = {
+        'Daily Prices': update_daily_prices,
+        'Institutional Trend': update_institutional_trend,
+        'Market Gate': update_market_gate,
+        'VCP Signals': update_vcp_signals,
+        'AI Analysis': update_ai_analysis,
+        'AI Jongga V2': update_jongga_v2,
+    }
+
+    tasks = []
+    for name in selected_items:
+        if name not in item_funcs:
+            continue
+        depends_on, resources = UPDATE_ITEM_DEPENDENCIES[name]
+        tasks.append(TaskSpec(name, item_funcs[name], depends_on, resources))
 
+    try:
+        executor = DependencyExecutor(
+            tasks,
+            max_workers=len(tasks) or 1,
+            on_status=lambda name, status, duration: update_item_status(name, status, duration),
+            should_stop=lambda: shared_state.STOP_REQUESTED,
+        )
+        results = executor.run()
+
+        # AI Jongga V2가 성공하면 AI Analysis도 완료된 것으로 간주 (run_screener가 다 함)
+        jongga = results.get('AI Jongga V2')
+        ai_result = results.get('AI Analysis')
+        if jongga and jongga.status == 'done' and (ai_result is None or ai_result.status == 'error'):
+            update_item_status('AI Analysis', 'done')
+
+        durations = {name: r.duration for name, r in results.items() if r.status != 'cancelled'}
+        logger.info(f"Background Update 항목별 소요 시간(초): {durations}")
+
+        if shared_state.STOP_REQUESTED:
+            logger.info("Background Update Stopped: Stopped by user")
     except Exception as e:
-        if str(e) == "Stopped by user" or shared_state.STOP_REQUESTED:
-            logger.info(f"Background Update Stopped: {e}")
-        else:
-            logger.error(f"Background Update Failed: {e}")
-        # Stop Requested면 무시, 아니면 에러 로깅
+        logger.error(f"Background Update Failed: {e}")
     finally:
         finish_update()
 
@@ -623,8 +768,6 @@ def get_realtime_prices():
 @common_bp.route('/system/data-status')
 def get_data_status():
     """데이터 파일 상태 조회"""
-    import json
-    
     # Check these data files
     data_files_to_check = [
         {
@@ -666,16 +809,17 @@ def get_data_status():
 
     ]
     
+    from engine.data_catalog import describe_file
+
     files_status = []
     
     for file_info in data_files_to_check:
         path = file_info['path']
-        exists = os.path.exists(path)
+        # 행 수/크기/수정 시각은 데이터 카탈로그 매니페스트에서 조회 (파일 변경 시에만 재계산)
+        entry = describe_file(path)
         
-        if exists:
-            stat = os.stat(path)
-            size_bytes = stat.st_size
-            mtime = datetime.fromtimestamp(stat.st_mtime)
+        if entry:
+            size_bytes = entry['size']
             
             # Format size
             if size_bytes > 1024 * 1024:
@@ -685,31 +829,14 @@ def get_data_status():
             else:
                 size_str = f"{size_bytes} B"
             
-            # Count rows if CSV
-            row_count = None
-            if path.endswith('.csv'):
-                try:
-                    row_count = sum(1 for _ in open(path)) - 1  # -1 for header
-                except:
-                    pass
-            elif path.endswith('.json'):
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    if 'signals' in data:
-                        row_count = len(data['signals'])
-                    elif isinstance(data, list):
-                        row_count = len(data)
-                except:
-                    pass
-            
             files_status.append({
                 'name': file_info['name'],
                 'path': path,
                 'exists': True,
-                'lastModified': mtime.isoformat(),
+                'lastModified': entry['last_modified'],
                 'size': size_str,
-                'rowCount': row_count,
+                'rowCount': entry.get('row_count'),
+                'dateRange': entry.get('date_range'),
                 'link': file_info.get('link', ''),
                 'menu': file_info.get('menu', '')
             })
@@ -925,6 +1052,13 @@ def manage_env():
                 'chatbot_sessions.json'
             ]
             
+            # 챗봇 무료 사용량 (usage.db)
+            try:
+                from services.usage_tracker import chatbot_quota
+                chatbot_quota.reset()
+            except Exception as e:
+                logger.error(f"Failed to reset chatbot quota: {e}")
+
             for fname in files_to_delete:
                 path = os.path.join(data_dir, fname)
                 if os.path.exists(path):
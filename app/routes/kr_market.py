@@ -1,9 +1,10 @@
+from __future__ import annotations
+
 import os
 import json
 import logging
 import threading
 from datetime import datetime, timedelta
-import pandas as pd
 from flask import Blueprint, jsonify, request, current_app
 
 from app.routes.kr_market_helpers import (
@@ -36,13 +37,19 @@ from app.routes.kr_market_helpers import (
     _normalize_text,
     _paginate_items,
     _prepare_cumulative_price_dataframe,
-    _recalculate_jongga_grade,
-    _recalculate_jongga_grades,
     _select_signals_for_gemini_reanalysis,
     _should_use_jongga_ai_payload,
     _sort_and_limit_vcp_signals,
     _sort_jongga_signals,
 )
+from app.routes.response_cache import cached_json, mark_uncacheable, track_input
+from services.progress_hub import get_progress_hub, publish_progress
+from engine.jongga_archive import ARCHIVE_FILENAME, get_archive, archive_result_file
+from engine.llm_scheduler import PRIORITY_INTERACTIVE, llm_priority
+from engine.lazy_import import lazy_import
+from engine.metrics import file_label, timer
+
+pd = lazy_import('pandas')
 
 kr_bp = Blueprint('kr', __name__)
 logger = logging.getLogger(__name__)
@@ -156,16 +163,19 @@ def handle_interval_config():
 
 
 def get_data_path(filename: str) -> str:
-    """데이터 파일 경로 반환"""
-    return os.path.join(DATA_DIR, filename)
+    """데이터 파일 경로 반환 (응답 캐시 대상 요청이면 입력 파일로 기록)"""
+    path = os.path.join(DATA_DIR, filename)
+    track_input(path)
+    return path
 
 
 def load_json_file(filename: str) -> dict:
     """JSON 파일 로드"""
     filepath = get_data_path(filename)
     if os.path.exists(filepath):
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with timer('data_load_seconds', kind='json', file=file_label(filename)):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
     return {}
 
 
@@ -173,7 +183,8 @@ def load_csv_file(filename: str) -> pd.DataFrame:
     """CSV 파일 로드"""
     filepath = get_data_path(filename)
     if os.path.exists(filepath):
-        return pd.read_csv(filepath, low_memory=False)
+        with timer('data_load_seconds', kind='csv', file=file_label(filename)):
+            return pd.read_csv(filepath, low_memory=False)
     return pd.DataFrame()
 
 
@@ -200,6 +211,7 @@ def _load_latest_vcp_price_map() -> dict:
 def _count_total_scanned_stocks(data_dir: str) -> int:
     """스캔 대상 종목 수(korean_stocks_list.csv 라인 수-헤더)를 반환한다."""
     stocks_file = os.path.join(data_dir, "korean_stocks_list.csv")
+    track_input(stocks_file)
     if not os.path.exists(stocks_file):
         return 0
 
@@ -209,24 +221,16 @@ def _count_total_scanned_stocks(data_dir: str) -> int:
 
 def _load_jongga_result_payloads(limit: int = 0) -> list:
     """
-    jongga_v2_results 파일들을 최신순으로 로드한다.
+    jongga_v2_results 이력을 최신순으로 로드한다 (아카이브 인덱스 조회).
     반환값: [(filepath, payload), ...]
     """
-    import glob
-
-    pattern = os.path.join(DATA_DIR, "jongga_v2_results_*.json")
-    files = sorted(glob.glob(pattern), reverse=True)
-    if limit > 0:
-        files = files[:limit]
-
     payloads = []
-    for filepath in files:
-        try:
-            payload = load_json_file(os.path.basename(filepath))
-            if isinstance(payload, dict):
-                payloads.append((filepath, payload))
-        except Exception as e:
-            logger.error(f"Error processing file {filepath}: {e}")
+    try:
+        for date_key, source_file, payload in get_archive(DATA_DIR).load_payloads(limit=limit):
+            filename = source_file or f"jongga_v2_results_{date_key.replace('-', '')}.json"
+            payloads.append((os.path.join(DATA_DIR, filename), payload))
+    except Exception as e:
+        logger.error(f"Error loading jongga archive: {e}")
     return payloads
 
 
@@ -290,6 +294,7 @@ def get_kr_market_status():
 
 
 @kr_bp.route('/signals')
+@cached_json()
 def get_kr_signals():
     """오늘의 VCP + 외인매집 시그널 (BLUEPRINT 로직 적용)"""
     try:
@@ -390,57 +395,65 @@ VCP_STATUS = {
     'progress': 0
 }
 
+def _update_vcp_status(**fields):
+    """VCP 상태 갱신 + 진행 이벤트 발행 (SSE 구독자/다른 워커에 즉시 전달)"""
+    VCP_STATUS.update(fields)
+    publish_progress('vcp', dict(VCP_STATUS))
+
+
 @kr_bp.route('/signals/status')
 def get_vcp_status():
-    """VCP 스크리너 상태 조회"""
-    return jsonify(VCP_STATUS)
+    """VCP 스크리너 상태 조회 (다른 워커에서 실행 중인 경우 진행 허브의 최신 상태 사용)"""
+    return jsonify(get_progress_hub().latest('vcp') or VCP_STATUS)
 
 def _run_vcp_background(target_date_arg, max_stocks_arg):
     """백그라운드 VCP 스크리너 실행 (Module Level Helper)"""
     try:
-        VCP_STATUS['running'] = True
-        VCP_STATUS['status'] = 'running'
-        VCP_STATUS['progress'] = 0
+        _update_vcp_status(
+            running=True,
+            status='running',
+            progress=0,
+        )
         
         if target_date_arg:
             msg = f"[VCP] 지정 날짜 분석 시작: {target_date_arg}"
         else:
             msg = "[VCP] 실시간 분석 시작..."
         
-        VCP_STATUS['message'] = msg
+        _update_vcp_status(message=msg)
         logger.info(msg)
         print(f"\n{msg}", flush=True)
             
         from scripts import init_data
         
         # 1. 최신 데이터 수집 (가격 업데이트)
-        VCP_STATUS['message'] = "가격 데이터 업데이트 중..."
+        _update_vcp_status(message="가격 데이터 업데이트 중...")
         logger.info(f"[VCP Screener] 최신 가격 데이터 수집 시작")
         print(f"[VCP Screener] 최신 가격 데이터 수집 시작...", flush=True)
         init_data.create_daily_prices(target_date=target_date_arg)
-        VCP_STATUS['progress'] = 30
+        _update_vcp_status(progress=30)
         
         # 1.5 수급 데이터 업데이트 (필수)
-        VCP_STATUS['message'] = "수급 데이터 분석 중..."
+        _update_vcp_status(message="수급 데이터 분석 중...")
         logger.info(f"[VCP Screener] 기관/외인 수급 데이터 업데이트")
         print(f"[VCP Screener] 기관/외인 수급 데이터 업데이트...", flush=True)
         init_data.create_institutional_trend(target_date=target_date_arg)
-        VCP_STATUS['progress'] = 50
+        _update_vcp_status(progress=50)
         
         # 2. 실제 데이터 기반 VCP 스크리너 실행 (init_data.py) + AI 분석
-        VCP_STATUS['message'] = "VCP 패턴 분석 및 AI 진단 중..."
+        _update_vcp_status(message="VCP 패턴 분석 및 AI 진단 중...")
         logger.info(f"[VCP Screener] VCP 시그널 분석 및 AI 수행")
         print(f"[VCP Screener] VCP 시그널 분석 및 AI 수행...", flush=True)
         
         # run_ai=True로 AI 자동 수행
         result_df = init_data.create_signals_log(target_date=target_date_arg, run_ai=True)
-        VCP_STATUS['progress'] = 80
+        _update_vcp_status(progress=80)
 
         # [NEW] 최신 가격 업데이트 (Entry != Current 반영을 위해)
-        VCP_STATUS['message'] = "최신 가격 동기화 중..."
+        _update_vcp_status(message="최신 가격 동기화 중...")
         logger.info(f"[VCP Screener] 최신 가격 동기화 수행")
         init_data.update_vcp_signals_recent_price()
-        VCP_STATUS['progress'] = 100
+        _update_vcp_status(progress=100)
         
         if isinstance(result_df, pd.DataFrame):
             success_msg = f"완료: {len(result_df)}개 시그널 감지"
@@ -449,21 +462,27 @@ def _run_vcp_background(target_date_arg, max_stocks_arg):
         else:
             success_msg = "완료: 조건 충족 종목 없음"
             
-        VCP_STATUS['message'] = success_msg
-        VCP_STATUS['status'] = 'success'
+        _update_vcp_status(
+            message=success_msg,
+            status='success',
+        )
         logger.info(f"[VCP Screener] {success_msg}")
         print(f"[VCP Screener] {success_msg}\n", flush=True)
             
     except Exception as e:
         logger.error(f"[VCP Screener] 실패: {e}")
         print(f"[VCP Screener] ⛔️ 실패: {e}", flush=True)
-        VCP_STATUS['message'] = f"실패: {str(e)}"
-        VCP_STATUS['status'] = 'error'
+        _update_vcp_status(
+            message=f"실패: {str(e)}",
+            status='error',
+        )
         import traceback
         traceback.print_exc()
     finally:
-            VCP_STATUS['running'] = False
-            VCP_STATUS['last_run'] = datetime.now().isoformat()
+            _update_vcp_status(
+                running=False,
+                last_run=datetime.now().isoformat(),
+            )
 
 @kr_bp.route('/signals/run', methods=['POST'])
 def run_vcp_signals_screener():
@@ -486,10 +505,12 @@ def run_vcp_signals_screener():
         
         # [RACE CONDITION FIX]
         # 스레드 시작 전에 상태를 먼저 업데이트하여 프론트엔드 폴링 시 'idle'로 오인하는 것 방지
-        VCP_STATUS['running'] = True
-        VCP_STATUS['status'] = 'running'
-        VCP_STATUS['progress'] = 0
-        VCP_STATUS['message'] = "분석 요청 중..."
+        _update_vcp_status(
+            running=True,
+            status='running',
+            progress=0,
+            message="분석 요청 중...",
+        )
 
         thread = threading.Thread(target=_run_vcp_background, args=(target_date, max_stocks))
         thread.daemon = True
@@ -590,7 +611,9 @@ def reanalyze_vcp_failed_ai():
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            ai_results = loop.run_until_complete(analyzer.analyze_batch(stocks_to_analyze))
+            with llm_priority(PRIORITY_INTERACTIVE):
+                # 실패 항목 재분석이므로 LLM 결과 캐시(실패 당시 응답일 수 있음)를 건너뛴다
+                ai_results = loop.run_until_complete(analyzer.analyze_batch(stocks_to_analyze, use_cache=False))
         finally:
             loop.close()
 
@@ -689,6 +712,7 @@ def get_kr_stock_chart(ticker):
 
 
 @kr_bp.route('/ai-analysis')
+@cached_json()
 def get_kr_ai_analysis():
     """KR AI 분석 전체 - kr_ai_analysis.json 직접 읽기 (V2 호환 최적화)"""
     try:
@@ -805,6 +829,7 @@ def get_cumulative_performance():
         return jsonify({'error': str(e)}), 500
 
 @kr_bp.route('/market-gate')
+@cached_json(ttl=60)
 def get_kr_market_gate():
     """KR Market Gate 상태 (프론트엔드 호환 형식)"""
     try:
@@ -892,6 +917,8 @@ def get_kr_market_gate():
         # [FIX] 실시간 분석 제거 (비동기 처리 원칙)
         # 데이터가 없거나 갱신이 필요하면 백그라운드 분석 트리거
         if not is_valid or needs_update:
+            # 분석 중 응답은 캐시하지 않는다 (다음 요청이 다시 확인/트리거해야 함)
+            mark_uncacheable()
             if not is_valid:
                 logger.info("[Market Gate] 유효한 데이터 없음. 백그라운드 분석 자동 시작.")
             elif needs_update:
@@ -976,6 +1003,44 @@ def get_kr_market_gate():
         return jsonify({'error': str(e)}), 500
 
 
+@kr_bp.route('/market-gate/history')
+def get_kr_market_gate_history():
+    """
+    Market Gate 일별 점수 시계열 (date 지정 시 해당일 상태, start/end 지정 시 구간)
+    마지막으로 저장된 히스토리를 그대로 응답하고, 오래됐으면 재계산은 백그라운드로 돌린다.
+    """
+    try:
+        from engine.market_gate import MarketGate
+        mg = MarketGate(DATA_DIR)
+        is_stale = mg.history_is_stale()
+        if is_stale:
+            mg.rebuild_history_in_background()
+        history = mg.load_history()
+
+        target_date = request.args.get('date')
+        if target_date:
+            state = mg.get_gate_state(target_date, history=history)
+            if state is None:
+                return jsonify({'error': f'{target_date} 이전 Market Gate 데이터가 없습니다.'}), 404
+            return jsonify(state)
+
+        start = request.args.get('start')
+        end = request.args.get('end')
+        if start:
+            history = history[history['date'] >= start]
+        if end:
+            history = history[history['date'] <= end]
+
+        return jsonify({
+            'count': len(history),
+            'stale': is_stale,
+            'history': history.to_dict(orient='records')
+        })
+    except Exception as e:
+        logger.error(f"Error in get_kr_market_gate_history: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @kr_bp.route('/market-gate/update', methods=['POST'])
 def update_kr_market_gate():
     """Market Gate 및 관련 데이터(Smart Money) 강제 업데이트"""
@@ -1001,8 +1066,8 @@ def update_kr_market_gate():
         from engine.market_gate import MarketGate
         mg = MarketGate()
         
-        # 분석 실행
-        result = mg.analyze(target_date=target_date)
+        # 분석 실행 (강제 갱신이므로 입력 스냅샷 무시)
+        result = mg.analyze(target_date=target_date, use_cache=False)
         
         # 결과 저장
         saved_path = mg.save_analysis(result, target_date=target_date)
@@ -1192,6 +1257,7 @@ def get_kr_realtime_prices():
 
 
 @kr_bp.route('/jongga-v2/latest', methods=['GET'])
+@cached_json()
 def get_jongga_v2_latest():
     """종가베팅 v2 최신 결과 조회"""
     try:
@@ -1200,27 +1266,23 @@ def get_jongga_v2_latest():
         
         # 빈 데이터이거나 signals가 0개인 경우 최근 유효 데이터 검색
         if not data or len(data.get('signals', [])) == 0:
-            import glob
-            # 날짜별 파일 검색 (최신순 정렬)
-            pattern = os.path.join(DATA_DIR, 'jongga_v2_results_*.json')
-            files = sorted(glob.glob(pattern), reverse=True)
-            
-            # 유효한 데이터가 있는 파일 찾기
-            for file_path in files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        candidate = json.load(f)
-                        if len(candidate.get('signals', [])) > 0:
-                            # 유효한 데이터 발견 - 주말/휴일 안내 메시지 추가
-                            if _recalculate_jongga_grades(candidate):
-                                with open(file_path, 'w', encoding='utf-8') as wf:
-                                    json.dump(candidate, wf, ensure_ascii=False, indent=2)
-                            candidate['message'] = f"주말/휴일로 인해 {candidate.get('date', '')} 거래일 데이터를 표시합니다."
-                            logger.info(f"[Jongga V2] 최근 유효 데이터 사용: {file_path}")
-                            return jsonify(candidate)
-                except Exception as e:
-                    logger.warning(f"파일 읽기 실패: {file_path} - {e}")
-                    continue
+            # 시그널이 있는 최근 날짜 (아카이브 인덱스 조회)
+            archive_path = os.path.join(DATA_DIR, ARCHIVE_FILENAME)
+            track_input(archive_path)
+            track_input(archive_path + '-wal')  # WAL 모드: 커밋은 -wal 파일에 먼저 기록됨
+            try:
+                recent = get_archive(DATA_DIR).latest_with_signals()
+            except Exception as e:
+                logger.warning(f"종가베팅 아카이브 조회 실패: {e}")
+                recent = None
+
+            if recent:
+                date_key, source_file, candidate = recent
+                # 유효한 데이터 발견 - 주말/휴일 안내 메시지 추가
+                # (등급은 재산정 작업이 저장해 둔 값을 그대로 사용)
+                candidate['message'] = f"주말/휴일로 인해 {candidate.get('date', '')} 거래일 데이터를 표시합니다."
+                logger.info(f"[Jongga V2] 최근 유효 데이터 사용: {source_file or date_key}")
+                return jsonify(candidate)
             
             # 유효한 데이터가 없는 경우 -> 데이터 없음 응답 반환 (자동 실행 비활성화)
             now = datetime.now()
@@ -1252,11 +1314,7 @@ def get_jongga_v2_latest():
                 logger.warning(f"Failed to inject prices for Jongga V2: {e}")
 
         if data and data.get('signals'):
-            # 저장 데이터의 grade가 이전 규칙으로 남아 있는 케이스 보정
-            if _recalculate_jongga_grades(data):
-                with open(get_data_path('jongga_v2_latest.json'), 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-
+            # 이전 규칙 grade 보정은 engine.jongga_rescore 작업이 파일에 반영 (조회 시 쓰기 없음)
             _sort_jongga_signals(data['signals'])
             _normalize_jongga_signals_for_frontend(data['signals'])
 
@@ -1277,24 +1335,8 @@ def get_jongga_v2_results():
 def get_jongga_v2_dates():
     """데이터가 존재하는 날짜 목록 조회"""
     try:
-        # DATA_DIR에서 날짜별 파일 목록 조회 (예: jongga_v2_results_20260130.json)
-        dates = []
-        import glob
-        pattern = os.path.join(DATA_DIR, 'jongga_v2_results_*.json')
-        files = glob.glob(pattern)
-        
-        for file_path in files:
-            filename = os.path.basename(file_path)
-            # jongga_v2_results_20260130.json -> 20260130
-            date_part = filename.replace('jongga_v2_results_', '').replace('.json', '')
-            
-            # YYYYMMDD -> YYYY-MM-DD 변환
-            if len(date_part) == 8:
-                formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:]}"
-                dates.append(formatted_date)
-            else:
-                # 다른 형식이 있다면 그대로 추가하거나 무시
-                dates.append(date_part)
+        # 아카이브된 날짜 목록 (jongga_v2_results_YYYYMMDD.json 기준 YYYY-MM-DD)
+        dates = get_archive(DATA_DIR).list_dates()
         
         # 최신 데이터 날짜도 확인하여 목록에 없으면 추가
         try:
@@ -1319,26 +1361,21 @@ def get_jongga_v2_dates():
 def get_jongga_v2_history(target_date):
     """특정 날짜의 종가베팅 결과 조회"""
     try:
-        # 날짜 형식 변환: YYYY-MM-DD -> YYYYMMDD
+        # 날짜 형식 정규화: YYYYMMDD -> YYYY-MM-DD (아카이브 키)
         date_str = target_date.replace('-', '')
+        date_key = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}" if len(date_str) == 8 and date_str.isdigit() else target_date
         
-        # 기본 디렉토리에서 해당 날짜 파일 로드(예: jongga_v2_results_20260130.json)
-        history_file = os.path.join(DATA_DIR, f'jongga_v2_results_{date_str}.json')
-        
-        if os.path.exists(history_file):
-            with open(history_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if data and 'signals' in data:
-                    # 저장 데이터의 grade 보정
-                    _recalculate_jongga_grades(data)
-                    _sort_jongga_signals(data['signals'])
-                return jsonify(data)
+        # 아카이브에서 해당 날짜 payload 조회 (jongga_v2_results_YYYYMMDD.json 스냅샷)
+        data = get_archive(DATA_DIR).load_payload(date_key)
+        if data is not None:
+            if 'signals' in data:
+                _sort_jongga_signals(data['signals'])
+            return jsonify(data)
         
         # 최신 파일의 날짜와 같으면 최신 파일 반환
         latest_data = load_json_file('jongga_v2_latest.json')
         if latest_data and latest_data.get('date', '')[:10] == target_date:
             if latest_data and 'signals' in latest_data:
-                _recalculate_jongga_grades(latest_data)
                 _sort_jongga_signals(latest_data['signals'])
             return jsonify(latest_data)
         
@@ -1358,14 +1395,16 @@ def get_jongga_v2_history(target_date):
 V2_STATUS_FILE = os.path.join(DATA_DIR, 'v2_screener_status.json')
 
 def _save_v2_status(running: bool):
+    payload = {
+        'isRunning': running, 
+        'updated_at': datetime.now().isoformat()
+    }
     try:
         with open(V2_STATUS_FILE, 'w', encoding='utf-8') as f:
-            json.dump({
-                'isRunning': running, 
-                'updated_at': datetime.now().isoformat()
-            }, f)
+            json.dump(payload, f)
     except Exception as e:
         logger.error(f"Failed to save V2 status: {e}")
+    publish_progress('jongga_v2', payload)
 
 def _load_v2_status():
     try:
@@ -1377,7 +1416,8 @@ def _load_v2_status():
         return {'isRunning': False}
 
 
-def _run_jongga_v2_background(capital: int = 50_000_000, markets: list = None, target_date: str = None):
+def _run_jongga_v2_background(capital: int = 50_000_000, markets: list = None, target_date: str = None,
+                              resume: bool = None):
     """
     백그라운드에서 Jongga V2 엔진 실행 (Flask request context 불필요)
 
@@ -1385,6 +1425,7 @@ def _run_jongga_v2_background(capital: int = 50_000_000, markets: list = None, t
         capital: 초기 투자금 (기본값: 5000만원)
         markets: 대상 시장 리스트 ['KOSPI', 'KOSDAQ']
         target_date: 분석 기준일 (YYYY-MM-DD, 테스트용)
+        resume: 미완료 실행 체크포인트에서 이어서 실행 (None이면 JONGGA_RESUME_ENABLED)
     """
     if markets is None:
         markets = ['KOSPI', 'KOSDAQ']
@@ -1419,7 +1460,7 @@ def _run_jongga_v2_background(capital: int = 50_000_000, markets: list = None, t
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            result = loop.run_until_complete(run_screener(capital=capital, markets=markets, target_date=target_date))
+            result = loop.run_until_complete(run_screener(capital=capital, markets=markets, target_date=target_date, resume=resume))
         finally:
             # [FIX] Close all async generators before closing the loop
             # This prevents "Task was destroyed but it is pending" error
@@ -1474,11 +1515,12 @@ def run_jongga_v2_screener():
     capital = req_data.get('capital', 50_000_000)
     markets = req_data.get('markets', ['KOSPI', 'KOSDAQ'])
     target_date = req_data.get('target_date', None)  # YYYY-MM-DD 형식 (테스트용)
+    resume = req_data.get('resume', None)  # false: 체크포인트 무시하고 처음부터
 
     def _run_wrapper():
         """Wrapper for background execution with status management"""
         try:
-            _run_jongga_v2_background(capital=capital, markets=markets, target_date=target_date)
+            _run_jongga_v2_background(capital=capital, markets=markets, target_date=target_date, resume=resume)
         except Exception as e:
             logger.error(f"Background Engine Failed: {e}")
             import traceback
@@ -1557,7 +1599,8 @@ def analyze_single_stock():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             try:
-                signal = loop.run_until_complete(analyze_single_stock_by_code(code))
+                with llm_priority(PRIORITY_INTERACTIVE):
+                    signal = loop.run_until_complete(analyze_single_stock_by_code(code, use_cache=False))
             finally:
                 loop.close()
             
@@ -1639,23 +1682,17 @@ def reanalyze_gemini_all():
         # signals가 비어있는 경우 최근 유효 데이터 검색
         if not all_signals:
             print(">>> [Data] 시그널 없음 - 최근 유효 데이터 검색 중...")
-            import glob
-            pattern = str(Path(__file__).parent.parent.parent / 'data' / 'jongga_v2_results_*.json')
-            files = sorted(glob.glob(pattern), reverse=True)
-            
-            for file_path in files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        candidate = json.load(f)
-                        if len(candidate.get('signals', [])) > 0:
-                            data = candidate
-                            all_signals = data.get('signals', [])
-                            latest_file = Path(file_path)  # 파일 경로 업데이트
-                            print(f">>> [Data] 유효 데이터 발견: {file_path} ({len(all_signals)}개 시그널)")
-                            break
-                except Exception as e:
-                    print(f">>> [Data] 파일 읽기 실패: {file_path} - {e}")
-                    continue
+            try:
+                recent = get_archive(DATA_DIR).latest_with_signals()
+            except Exception as e:
+                print(f">>> [Data] 아카이브 조회 실패: {e}")
+                recent = None
+
+            if recent:
+                date_key, source_file, data = recent
+                all_signals = data.get('signals', [])
+                latest_file = Path(get_data_path(source_file or f"jongga_v2_results_{date_key.replace('-', '')}.json"))  # 파일 경로 업데이트
+                print(f">>> [Data] 유효 데이터 발견: {latest_file} ({len(all_signals)}개 시그널)")
         
         if not all_signals:
             return jsonify({'status': 'error', 'error': '분석할 시그널이 없습니다. 평일에 엔진을 먼저 실행해주세요.'}), 404
@@ -1730,7 +1767,10 @@ def reanalyze_gemini_all():
                     chunk_stock_names = [item.get('stock', {}).get('stock_name', 'Unknown') for item in chunk_data]
                     print(f"\n>>> 청크 {chunk_idx + 1}/{len(chunks)} 처리 시작: {chunk_stock_names}")
                     
-                    chunk_results = await analyzer.analyze_news_batch(chunk_data, market_status)
+                    # force=true는 LLM 결과 캐시를 우회하여 실제로 다시 호출
+                    chunk_results = await analyzer.analyze_news_batch(
+                        chunk_data, market_status, use_cache=not force_update
+                    )
                     
                     if chunk_results:
                         for name, res in chunk_results.items():
@@ -1738,28 +1778,13 @@ def reanalyze_gemini_all():
                     
                     return chunk_results or {}
                 
-                # 모든 청크 순차/병렬 처리 (Concurrency 제어 + Delay 적용)
+                # 모든 청크 동시 제출 - 동시성/Rate Limit은 LLM 스케줄러가 제어하고,
+                # 사용자 요청이므로 진행 중인 대량 분석보다 먼저 슬롯을 받는다
                 async def process_all_chunks():
-                    concurrency = app_config.ANALYSIS_LLM_CONCURRENCY if is_analysis_llm else app_config.LLM_CONCURRENCY
-                    delay = app_config.ANALYSIS_LLM_REQUEST_DELAY if is_analysis_llm else 0.5
-                    
-                    semaphore = asyncio.Semaphore(concurrency)
-                    results = []
-                    
-                    # 청크 단위로 순차 실행하되, 내부적으로 Semaphore로 동시성 제어
-                    for i, chunk in enumerate(chunks):
-                        async with semaphore:
-                            res = await process_chunk(i, chunk)
-                            results.append(res)
-                        
-                        # 마지막 청크가 아니면 대기
-                        if i < len(chunks) - 1:
-                            print(f">>> [Rate Limit] 청크 간 대기: {delay}초...")
-                            await asyncio.sleep(delay)
-                            
-                    return results
+                    return await asyncio.gather(*(process_chunk(i, chunk) for i, chunk in enumerate(chunks)))
                 
-                all_results = loop.run_until_complete(process_all_chunks())
+                with llm_priority(PRIORITY_INTERACTIVE):
+                    all_results = loop.run_until_complete(process_all_chunks())
                 
                 # 결과 병합
                 for chunk_result in all_results:
@@ -1782,6 +1807,8 @@ def reanalyze_gemini_all():
             data['updated_at'] = datetime.now().isoformat()
             with open(latest_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+            if latest_file.name.startswith('jongga_v2_results_'):
+                archive_result_file(str(latest_file))
                 
             return jsonify({
                 'status': 'success',
@@ -2156,31 +2183,34 @@ def get_data_status():
             'jongga': 'jongga_v2_latest.json'
         }
         
+        from engine.data_catalog import describe_file
+
+        entries = {}
         for key, filename in files.items():
             filepath = get_data_path(filename)
-            if os.path.exists(filepath):
-                mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
+            # 크기/수정 시각/행 수는 데이터 카탈로그 매니페스트에서 조회
+            entry = describe_file(filepath)
+            entries[key] = entry
+            if entry:
                 status['files'][key] = {
                     'exists': True,
-                    'updated_at': mtime.isoformat(),
-                    'size': os.path.getsize(filepath)
+                    'updated_at': entry['last_modified'],
+                    'size': entry['size']
                 }
                 
                 # 가장 최근 파일 수정 시간을 전체 업데이트 시간으로 간주
-                if status['last_update'] is None or mtime > datetime.fromisoformat(status['last_update']):
-                    status['last_update'] = mtime.isoformat()
+                if status['last_update'] is None or entry['last_modified'] > status['last_update']:
+                    status['last_update'] = entry['last_modified']
             else:
                 status['files'][key] = {'exists': False}
         
         # 데이터 카운트 (가능한 경우)
         try:
-            stocks_df = load_csv_file('korean_stocks_list.csv')
-            if not stocks_df.empty:
-                status['collected_stocks'] = len(stocks_df)
+            if entries['stocks'] and entries['stocks'].get('row_count'):
+                status['collected_stocks'] = entries['stocks']['row_count']
                 
-            signals_df = load_csv_file('signals_log.csv')
-            if not signals_df.empty:
-                status['signals_count'] = len(signals_df)
+            if entries['signals'] and entries['signals'].get('row_count'):
+                status['signals_count'] = entries['signals']['row_count']
                 
             gate_data = load_json_file('market_gate.json')
             if gate_data:
@@ -2440,12 +2470,19 @@ def get_stock_detail(ticker):
 # Chatbot API Endpoints
 # ============================================================
 
+def _resolve_chatbot_owner_id():
+    """챗봇 owner 식별자 (로그인 이메일 우선, 없으면 브라우저 세션 ID)"""
+    user_email = request.headers.get('X-User-Email')
+    session_id_header = request.headers.get('X-Session-Id')
+    return user_email if (user_email and user_email != 'user@example.com') else session_id_header
+
+
 @kr_bp.route('/chatbot/welcome', methods=['GET'])
 def kr_chatbot_welcome():
     """챗봇 웰컴 메시지"""
     try:
         from chatbot import get_chatbot
-        bot = get_chatbot()
+        bot = get_chatbot(_resolve_chatbot_owner_id())
         msg = bot.get_welcome_message()
         return jsonify({'message': msg})
     except Exception as e:
@@ -2456,12 +2493,10 @@ def kr_chatbot_sessions():
     """챗봇 세션 관리"""
     try:
         from chatbot import get_chatbot
-        bot = get_chatbot()
         
         # [Fix] Owner Isolation
-        user_email = request.headers.get('X-User-Email')
-        session_id_header = request.headers.get('X-Session-Id')
-        owner_id = user_email if (user_email and user_email != 'user@example.com') else session_id_header
+        owner_id = _resolve_chatbot_owner_id()
+        bot = get_chatbot(owner_id)
 
         if request.method == 'GET':
             # List all sessions (Filtered by owner)
@@ -2481,6 +2516,8 @@ def kr_chatbot_sessions():
 @kr_bp.route('/chatbot', methods=['POST'])
 def kr_chatbot():
     """KR 챗봇 (멀티모달 + 세션 지원 + API Key/Quota 연동)"""
+    use_free_tier = False
+    usage_key = None
     try:
         from chatbot import get_chatbot
         
@@ -2510,9 +2547,8 @@ def kr_chatbot():
             if not server_key_available:
                  return jsonify({'error': '시스템 API Key가 설정되지 않았습니다.', 'code': 'SERVER_CONFIG_MISSING'}), 503
 
-            # 쿼터 확인 (이메일 또는 세션 ID 기준)
-            used = get_user_usage(usage_key)
-            if used >= MAX_FREE_USAGE:
+            # 쿼터 선차감 (이메일 또는 세션 ID 기준) - 확인과 증가를 한 번에 처리해 동시 요청도 한도를 넘지 않음
+            if increment_user_usage(usage_key) is None:
                  return jsonify({'error': '무료 사용량(10회)을 초과했습니다. [설정 > API]에서 개인 API Key를 등록해주세요.', 'code': 'QUOTA_EXCEEDED'}), 402
             
             use_free_tier = True
@@ -2564,31 +2600,54 @@ def kr_chatbot():
             persona = data.get('persona', None)
             watchlist = data.get('watchlist', None)
         
-        bot = get_chatbot()
+        bot = get_chatbot(usage_key, api_key=user_api_key)
 
         from flask import Response, stream_with_context
         import json
 
+        def refund_quota(reason):
+            # 3. Quota Refund (선차감분 - 에러/경고 응답은 사용량에서 제외)
+            if not use_free_tier:
+                return
+            try:
+                new_usage = refund_user_usage(usage_key)
+                logger.info(f"[QUOTA] 사용량 환불 ({reason}): {usage_key} -> {new_usage}회")
+            except Exception as e:
+                logger.error(f"[QUOTA] 사용량 환불 실패 ({usage_key}): {e}")
+
         def generate():
             full_response = ""
             usage_metadata = {}
-            for chunk in bot.chat_stream(
-                message, 
-                session_id=parsed_session_id, 
-                model=model_name, 
-                files=files if files else None, 
-                watchlist=watchlist,
-                persona=persona,
-                api_key=user_api_key,
-                owner_id=usage_key
-            ):
-                if "chunk" in chunk:
-                    full_response += chunk["chunk"]
-                if "usage_metadata" in chunk:
-                    usage_metadata = chunk["usage_metadata"]
-                
-                # Server-Sent Events format
-                yield f"data: {json.dumps(chunk)}\n\n"
+            has_error = False
+            # 스트림을 끝까지 보내지 못하면(예외, 클라이언트 연결 끊김 = GeneratorExit) 선차감분 환불
+            completed = False
+            try:
+                for chunk in bot.chat_stream(
+                    message, 
+                    session_id=parsed_session_id, 
+                    model=model_name, 
+                    files=files if files else None, 
+                    watchlist=watchlist,
+                    persona=persona,
+                    api_key=user_api_key,
+                    owner_id=usage_key
+                ):
+                    if "chunk" in chunk:
+                        full_response += chunk["chunk"]
+                    if "usage_metadata" in chunk:
+                        usage_metadata = chunk["usage_metadata"]
+                    if chunk.get("error"):
+                        has_error = True
+                    
+                    # Server-Sent Events format
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                completed = True
+            finally:
+                if not completed:
+                    refund_quota('stream incomplete')
+
+            if has_error or full_response.startswith('⚠️'):
+                refund_quota('error' if has_error else 'warning')
             
             # [Log] Chat Activity after streaming completes
             try:
@@ -2626,25 +2685,14 @@ def kr_chatbot():
         response.headers['X-Accel-Buffering'] = 'no'
         response.headers['Connection'] = 'keep-alive'
         return response
-
-        # 3. Quota Update (If Free Tier & Success)
-        if use_free_tier:
-             # 에러가 아니고, 경고 메시지(⚠️)가 아닐 때만 차감
-             resp_text = response_data.get('response', '')
-             has_error = response_data.get('error')
-             starts_with_warning = str(resp_text).startswith('⚠️')
-             logger.info(f"[QUOTA] use_free_tier={use_free_tier}, has_error={has_error}, starts_with_warning={starts_with_warning}, usage_key={usage_key}")
-             
-             if not has_error and not starts_with_warning:
-                 new_usage = increment_user_usage(usage_key)
-                 logger.info(f"[QUOTA] 사용량 차감 완료: {usage_key} -> {new_usage}회")
-             else:
-                 logger.info(f"[QUOTA] 차감 스킵: error={has_error}, warning={starts_with_warning}")
-        
-        return jsonify(response_data)
              
     except Exception as e:
         logger.error(f"[{usage_key}] Chatbot API Error: {e}")
+        if use_free_tier:
+            try:
+                refund_user_usage(usage_key)
+            except Exception:
+                pass
         return jsonify({'error': str(e)}), 500
 
 
@@ -2653,7 +2701,7 @@ def kr_chatbot_models():
     """사용 가능 모델 목록"""
     try:
         from chatbot import get_chatbot
-        bot = get_chatbot()
+        bot = get_chatbot(_resolve_chatbot_owner_id())
         models = bot.get_available_models()
         current = bot.current_model_name
         return jsonify({'models': models, 'current': current})
@@ -2665,7 +2713,7 @@ def kr_chatbot_suggestions():
     """AI 기반 동적 추천 질문 생성"""
     try:
         from chatbot import get_chatbot
-        bot = get_chatbot()
+        bot = get_chatbot(_resolve_chatbot_owner_id())
         
         # 관심종목 파라미터 (comma separated)
         watchlist_param = request.args.get('watchlist')
@@ -2686,7 +2734,7 @@ def kr_chatbot_history():
     try:
         from chatbot import get_chatbot
         
-        bot = get_chatbot()
+        bot = get_chatbot(_resolve_chatbot_owner_id())
         session_id = request.args.get('session_id')
         
         if request.method == 'GET':
@@ -2726,7 +2774,7 @@ def kr_chatbot_profile():
     """사용자 프로필 설정"""
     try:
         from chatbot import get_chatbot
-        bot = get_chatbot()
+        bot = get_chatbot(_resolve_chatbot_owner_id())
         
         if request.method == 'GET':
             profile = bot.get_user_profile()
@@ -2814,23 +2862,24 @@ def handle_config_interval():
 # Chatbot & Quota Routes (Free Tier Logic)
 # ==============================================================================
 
-QUOTA_FILE = os.path.join(DATA_DIR, 'user_quota.json')
+# 사용량은 services.usage_tracker.chatbot_quota(usage.db)에 기록 (구 user_quota.json은 최초 1회 이관)
 MAX_FREE_USAGE = 10
 
 def get_user_usage(email):
     """사용자 사용량 조회"""
-    data = load_json_file('user_quota.json')
-    return data.get(email, 0)
+    from services.usage_tracker import chatbot_quota
+    return chatbot_quota.get_usage(email)
 
 def increment_user_usage(email):
-    """사용자 사용량 증가"""
-    data = load_json_file('user_quota.json')
-    current = data.get(email, 0)
-    data[email] = current + 1
-    
-    with open(QUOTA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
-    return current + 1
+    """사용자 사용량 증가 (한도 내에서만 증가, 반환: 증가 후 사용량 / 한도 초과 시 None)"""
+    from services.usage_tracker import chatbot_quota
+    allowed, used = chatbot_quota.try_increment(email, MAX_FREE_USAGE)
+    return used if allowed else None
+
+def refund_user_usage(email, amount=1):
+    """선차감한 사용량 환불 (반환: 환불 후 사용량)"""
+    from services.usage_tracker import chatbot_quota
+    return chatbot_quota.decrement(email, amount)
 
 @kr_bp.route('/user/quota')
 def get_user_quota_info():
@@ -2879,14 +2928,8 @@ def recharge_user_quota():
         if not usage_key:
             return jsonify({'error': '세션 정보가 없습니다.'}), 400
         
-        # 현재 사용량 조회 후 5회 차감 (최소 0)
-        quota_data = load_json_file('user_quota.json')
-        current_usage = quota_data.get(usage_key, 0)
-        new_usage = max(0, current_usage - 5)
-        quota_data[usage_key] = new_usage
-        
-        with open(QUOTA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(quota_data, f, indent=2)
+        # 사용량 5회 차감 (최소 0, 원자적)
+        new_usage = refund_user_usage(usage_key, 5)
         
         remaining = max(0, MAX_FREE_USAGE - new_usage)
         
@@ -2908,7 +2951,7 @@ def clear_chat_history():
     """대화 기록 초기화"""
     try:
         from chatbot import get_chatbot
-        bot = get_chatbot()
+        bot = get_chatbot(_resolve_chatbot_owner_id())
         bot.history.clear_all()
         return jsonify({'status': 'ok'})
     except Exception as e:
@@ -3,34 +3,22 @@
 """
 KR Market 라우트 헬퍼 모듈
 
-판별/등급 재산정 로직을 분리해 라우트 파일 결합도를 낮춘다.
+판별/정렬/정규화 로직을 분리해 라우트 파일 결합도를 낮춘다.
+(등급 재산정은 engine.jongga_rescore 작업이 담당)
 """
 
 import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-import pandas as pd
-
-
-_VALID_AI_ACTIONS = {"BUY", "SELL", "HOLD"}
-_INVALID_AI_REASONS = {
-    "",
-    "-",
-    "n/a",
-    "na",
-    "none",
-    "null",
-    "분석 실패",
-    "분석 대기중",
-    "분석 대기 중",
-    "분석중",
-    "분석 중",
-    "no analysis available.",
-    "no analysis available",
-    "analysis failed",
-    "failed",
-}
+from engine.constants import AI_ANALYSIS
+from engine.lazy_import import lazy_import
+
+pd = lazy_import('pandas')
+
+
+_VALID_AI_ACTIONS = AI_ANALYSIS.VALID_ACTIONS
+_INVALID_AI_REASONS = AI_ANALYSIS.INVALID_REASONS
 
 _JONGGA_GRADE_PRIORITY = {"S": 3, "A": 2, "B": 1}
 
@@ -102,97 +90,6 @@ def _is_vcp_ai_analysis_failed(row: dict) -> bool:
     return False
 
 
-def _recalculate_jongga_grade(signal: dict) -> tuple[str, bool]:
-    """종가베팅 단일 시그널 등급을 현재 기준으로 재산정."""
-    try:
-        tv = float(signal.get("trading_value", 0) or 0)
-        change_pct = float(signal.get("change_pct", 0) or 0)
-        score = signal.get("score") or {}
-        score_total = int((score.get("total") if isinstance(score, dict) else score) or 0)
-        score_details = signal.get("score_details") or {}
-        foreign_net_buy = float(score_details.get("foreign_net_buy", 0) or 0)
-        inst_net_buy = float(score_details.get("inst_net_buy", 0) or 0)
-        has_dual_buy = foreign_net_buy > 0 and inst_net_buy > 0
-    except Exception:
-        return "D", False
-
-    prev_grade = str(signal.get("grade", "")).strip().upper()
-    new_grade = "D"
-    if (
-        tv >= 1_000_000_000_000
-        and score_total >= 10
-        and change_pct >= 3.0
-        and has_dual_buy
-    ):
-        new_grade = "S"
-    elif (
-        tv >= 500_000_000_000
-        and score_total >= 8
-        and change_pct >= 3.0
-        and has_dual_buy
-    ):
-        new_grade = "A"
-    elif (
-        tv >= 100_000_000_000
-        and score_total >= 6
-        and change_pct >= 3.0
-        and has_dual_buy
-    ):
-        new_grade = "B"
-
-    if prev_grade != new_grade:
-        signal["grade"] = new_grade
-        return new_grade, True
-
-    return new_grade, False
-
-
-def _recalculate_jongga_grades(data: dict) -> bool:
-    """종가베팅 signals grade + by_grade 동기화."""
-    if not data or "signals" not in data:
-        return False
-
-    signals = data.get("signals", [])
-    if not isinstance(signals, list):
-        return False
-
-    changed = False
-    grade_count = {"S": 0, "A": 0, "B": 0, "C": 0, "D": 0}
-
-    for sig in signals:
-        if not isinstance(sig, dict):
-            continue
-        _, did_change = _recalculate_jongga_grade(sig)
-        changed = changed or did_change
-        grade = str(sig.get("grade", "D")).strip().upper()
-        if grade not in grade_count:
-            grade_count[grade] = 0
-        grade_count[grade] += 1
-
-    prev_by_grade = data.get("by_grade")
-    new_by_grade = {"S": 0, "A": 0, "B": 0, "C": 0, "D": 0}
-    if isinstance(prev_by_grade, dict):
-        for grade_key in new_by_grade:
-            if grade_key in prev_by_grade:
-                value = prev_by_grade[grade_key]
-                if isinstance(value, (int, float)):
-                    new_by_grade[grade_key] = int(value)
-                else:
-                    new_by_grade[grade_key] = 0
-
-    for grade_key, count in grade_count.items():
-        if grade_key in new_by_grade:
-            new_by_grade[grade_key] = count
-        elif count > 0:
-            new_by_grade[grade_key] = count
-
-    if data.get("by_grade") != new_by_grade:
-        data["by_grade"] = new_by_grade
-        changed = True
-
-    return changed
-
-
 def _jongga_sort_key(signal: dict) -> tuple[int, float]:
     """종가베팅 시그널 정렬 키: Grade(S>A>B) 우선, 이후 점수 내림차순."""
     grade_value = _JONGGA_GRADE_PRIORITY.get(
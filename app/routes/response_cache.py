@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+조회 API 응답 캐시 (워커 프로세스별 LRU)
+
+- 키: 엔드포인트 경로 + 정렬된 쿼리 인자
+- 버전: 응답을 만드는 동안 읽은 입력 파일들의 (size, mtime_ns). 파일이 없던 경로도
+  기록하므로 나중에 파일이 생기면 캐시가 무효화된다.
+- 값: 직렬화가 끝난 JSON bytes + ETag. 히트 시 파일/pandas를 거치지 않고 stat만 한다.
+- If-None-Match가 ETag와 같으면 본문 없이 304를 반환한다.
+- 입력 파일 기록은 track_input()으로 하며, kr_market.get_data_path()가 자동으로 호출한다.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+from flask import Response, request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '128'))
+DEFAULT_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', str(32 * 1024 * 1024)))
+DEFAULT_TTL_SEC = float(os.getenv('RESPONSE_CACHE_TTL_SEC', '300'))
+
+_tracking = threading.local()
+
+
+def _fingerprint(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def track_input(path: str) -> None:
+    """현재 캐시 대상 요청이 path에 의존함을 기록 (캐시 대상 요청이 아니면 무시)"""
+    inputs = getattr(_tracking, 'inputs', None)
+    if inputs is not None and path not in inputs:
+        inputs[path] = _fingerprint(path)
+
+
+def mark_uncacheable() -> None:
+    """현재 응답을 캐시하지 않도록 표시 (백그라운드 작업을 트리거한 응답 등)"""
+    if getattr(_tracking, 'inputs', None) is not None:
+        _tracking.uncacheable = True
+
+
+class _Entry:
+    __slots__ = ('body', 'etag', 'inputs', 'created_at')
+
+    def __init__(self, body: bytes, etag: str, inputs: Dict[str, Optional[Tuple[int, int]]]):
+        self.body = body
+        self.etag = etag
+        self.inputs = inputs
+        self.created_at = time.monotonic()
+
+    def is_fresh(self, ttl: float) -> bool:
+        if ttl and time.monotonic() - self.created_at > ttl:
+            return False
+        return all(_fingerprint(path) == fp for path, fp in self.inputs.items())
+
+
+class ResponseCache:
+    """직렬화된 JSON 응답 LRU 캐시"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[tuple, _Entry]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, ttl: float) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        # stat은 락 밖에서 수행
+        if entry is not None and entry.is_fresh(ttl):
+            self.hits += 1
+            return entry
+        if entry is not None:
+            self._discard(key, entry)
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple, entry: _Entry) -> None:
+        if len(entry.body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old.body)
+            self._entries[key] = entry
+            self._bytes += len(entry.body)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.body)
+
+    def _discard(self, key: tuple, entry: _Entry) -> None:
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+                self._bytes -= len(entry.body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+response_cache = ResponseCache()
+
+
+def _json_response(body: bytes, etag: str) -> Response:
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    # 브라우저는 저장하되 매번 ETag로 재검증
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def cached_json(ttl: float = DEFAULT_TTL_SEC) -> Callable:
+    """
+    GET JSON 라우트용 응답 캐시 데코레이터
+
+    Args:
+        ttl: 입력 파일이 그대로여도 응답을 다시 만드는 주기 (시간에 따라 달라지는 응답 대비)
+    """
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if getattr(_tracking, 'inputs', None) is not None:
+                # 캐시된 라우트가 다른 캐시 라우트를 호출하는 경우 (alias) - 바깥 요청이 기록
+                return view(*args, **kwargs)
+
+            key = (request.path, tuple(sorted(request.args.items(multi=True))))
+            entry = response_cache.get(key, ttl)
+            if entry is not None:
+                return _json_response(entry.body, entry.etag)
+
+            _tracking.inputs, _tracking.uncacheable = {}, False
+            try:
+                result = view(*args, **kwargs)
+                inputs, uncacheable = _tracking.inputs, _tracking.uncacheable
+            finally:
+                _tracking.inputs = None
+
+            # (response, status) 튜플 / 오류 응답 / 비 JSON 응답은 그대로 반환
+            if uncacheable or not isinstance(result, Response) or result.status_code != 200 \
+                    or result.mimetype != 'application/json':
+                return result
+
+            body = result.get_data()
+            etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+            response_cache.put(key, _Entry(body, etag, inputs))
+            return _json_response(body, etag)
+        return wrapper
+    return decorator
@@ -1,21 +1,33 @@
-from .core import KRStockChatbot
+import threading
+from typing import Optional
+
+from .core import KRStockChatbot, DATA_DIR
 from .prompts import build_system_prompt
+from .runtime_pool import ChatbotRuntimePool, SharedChatbotAssets, build_owner_key
+
+__all__ = ['KRStockChatbot', 'build_system_prompt', 'get_chatbot', 'get_chatbot_pool']
+
+_chatbot_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_chatbot_pool() -> ChatbotRuntimePool:
+    global _chatbot_pool
+    if _chatbot_pool is None:
+        with _pool_lock:
+            if _chatbot_pool is None:
+                shared_assets = SharedChatbotAssets(DATA_DIR)
+                _chatbot_pool = ChatbotRuntimePool(
+                    factory=lambda key: KRStockChatbot(key, shared_assets=shared_assets)
+                )
+
+                # Register cleanup on exit
+                import atexit
+                atexit.register(_chatbot_pool.clear)
+
+    return _chatbot_pool
+
 
-__all__ = ['KRStockChatbot', 'build_system_prompt']
-
-_chatbot_instance = None
-
-def get_chatbot():
-    global _chatbot_instance
-    if _chatbot_instance is None:
-        _chatbot_instance = KRStockChatbot("default_user")
-        
-        # Register cleanup on exit
-        import atexit
-        def cleanup_chatbot():
-            global _chatbot_instance
-            if _chatbot_instance:
-                _chatbot_instance.close()
-        atexit.register(cleanup_chatbot)
-        
-    return _chatbot_instance
+def get_chatbot(owner_id: Optional[str] = None, api_key: Optional[str] = None):
+    """owner(이메일/세션 ID) 또는 API Key 기준 챗봇 인스턴스 반환 (인자 없으면 기본 사용자)."""
+    return get_chatbot_pool().get(build_owner_key(owner_id, api_key))
@@ -13,12 +13,7 @@ def clear_current_session_messages(bot: Any, session_id: Optional[str]) -> bool:
     """현재 세션 메시지를 초기화한다."""
     if not session_id:
         return False
-    session = bot.history.get_session(session_id)
-    if not session:
-        return False
-    session["messages"] = []
-    bot.history._save()
-    return True
+    return bot.history.update_session(session_id, lambda session: session.update(messages=[]))
 
 
 def handle_clear_command(bot: Any, parts: List[str], session_id: Optional[str]) -> str:
@@ -35,6 +30,9 @@ def handle_clear_command(bot: Any, parts: List[str], session_id: Optional[str])
 def handle_refresh_command(bot: Any) -> str:
     """데이터 캐시 초기화."""
     bot._data_cache = None
+    shared_assets = getattr(bot, "shared_assets", None)
+    if shared_assets is not None:
+        shared_assets.market_cache.invalidate()
     return "✅ 데이터 캐시가 새로고침되었습니다."
 
 
@@ -64,10 +62,7 @@ def handle_model_command(bot: Any, parts: List[str], session_id: Optional[str])
         return f"⚠️ 유효하지 않은 모델입니다. 가능한 모델: {', '.join(bot.get_available_models())}"
 
     if session_id:
-        session = bot.history.get_session(session_id)
-        if session:
-            session["model"] = requested_model
-            bot.history._save()
+        bot.history.update_session(session_id, lambda session: session.update(model=requested_model))
     return f"✅ 모델이 '{requested_model}'로 변경되었습니다."
 
 
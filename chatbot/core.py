@@ -5,6 +5,7 @@ KR Stock Chatbot Core - 메인 챗봇 클래스
 Gemini AI 연동 및 대화 처리 로직 (지원 모델 설정 가능)
 """
 
+import importlib.util
 import os
 import logging
 from typing import Optional, Callable, Dict, Any, List, Tuple
@@ -19,9 +20,9 @@ try:
 except ImportError:
     pass
 
+# google-genai는 클라이언트 생성 시점에 로드 (runtime_setup_service._default_client_factory)
 try:
-    from google import genai
-    GEMINI_AVAILABLE = True
+    GEMINI_AVAILABLE = importlib.util.find_spec('google.genai') is not None
 except ImportError:
     GEMINI_AVAILABLE = False
 
@@ -153,11 +154,18 @@ class KRStockChatbot:
         self, 
         user_id: str,
         api_key: str = None,
-        data_fetcher: Optional[Callable] = None
+        data_fetcher: Optional[Callable] = None,
+        shared_assets: Optional[Any] = None,
     ):
         self.user_id = user_id
-        self.memory = MemoryManager(user_id)
-        self.history = HistoryManager(user_id)
+        # 런타임 풀에서 생성된 경우 종목 맵/시장 데이터 캐시를 공유 (chatbot.runtime_pool)
+        self.shared_assets = shared_assets
+        if shared_assets is not None:
+            self.memory = shared_assets.get_memory(lambda: MemoryManager(user_id))
+            self.history = shared_assets.get_history(lambda: HistoryManager(user_id))
+        else:
+            self.memory = MemoryManager(user_id)
+            self.history = HistoryManager(user_id)
         self.data_fetcher = data_fetcher
         
         # Cache initialization
@@ -205,6 +213,9 @@ class KRStockChatbot:
 
     def _load_stock_map(self):
         """korean_stocks_list.csv 로드하여 매핑 생성"""
+        if self.shared_assets is not None:
+            self.stock_map, self.ticker_map = self.shared_assets.get_stock_maps(_load_stock_map_impl)
+            return
         self.stock_map, self.ticker_map = _load_stock_map_impl(DATA_DIR, logger)
 
     def _init_user_profile_from_env(self):
@@ -29,6 +29,10 @@ logger = logging.getLogger(__name__)
 
 def get_cached_data(bot: Any) -> Dict[str, Any]:
     """시장 데이터 캐시를 조회하고 필요 시 갱신한다."""
+    shared_assets = getattr(bot, "shared_assets", None)
+    if shared_assets is not None:
+        return shared_assets.market_cache.get(bot.data_fetcher, fetch_mock_data)
+
     now = datetime.now()
     if (
         bot._data_cache is None
@@ -5,7 +5,7 @@
 """
 
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 REASONING_START_REGEX = re.compile(
@@ -144,12 +144,134 @@ def _extract_reasoning_and_answer(text: str, is_streaming: bool = False) -> Tupl
     return reasoning, processed
 
 
-def _compute_stream_delta(previous: str, current: str) -> Tuple[bool, str]:
+# 스트리밍 파서에서 미완성 마커로 보류할 최대 길이 ("[" 이후 "]"가 오지 않은 구간)
+_MAX_PENDING_MARKER_SPAN = 40
+_MARKER_PREFIX_CHARS = " \t\r\n*_-\\"
+_STREAM_TRAILING_HOLD_REGEX = re.compile(r"[\s\*\_\-\[\]\\]+$")
+# 마커 뒤에 이 문자들만 있으면 닫는 장식(**, __)/개행이 아직 덜 온 것일 수 있다
+_MARKER_TAIL_REGEX = re.compile(r"[\s\*\_]*")
+
+
+class StreamingReasoningParser:
     """
-    이전/현재 텍스트를 비교해 델타를 계산한다.
-    returns: (reset_needed, delta_text)
+    [추론 과정]/[답변] 블록을 청크 단위로 분리하는 증분 파서.
+
+    누적 텍스트 전체를 매 청크마다 재파싱하지 않고, 미완성 마커가 걸칠 수 있는
+    짧은 꼬리 구간만 보류(pending)한 채 새로 확정된 텍스트만 델타로 반환한다.
     """
-    if current.startswith(previous):
-        return False, current[len(previous) :]
-    return True, current
 
+    MODE_DETECT = "detect"
+    MODE_REASONING = "reasoning"
+    MODE_ANSWER = "answer"
+
+    def __init__(self):
+        self.mode = self.MODE_DETECT
+        self._pending = ""
+        self._reasoning_seen = False
+        # 채널별 출력 상태: 선행 공백 스킵 여부 + 모드 전환 시 보류된 후행 공백
+        self._started = {self.MODE_REASONING: False, self.MODE_ANSWER: False}
+        self._held_whitespace = {self.MODE_REASONING: "", self.MODE_ANSWER: ""}
+        self._reasoning_parts: List[str] = []
+        self._answer_parts: List[str] = []
+
+    @property
+    def reasoning(self) -> str:
+        return "".join(self._reasoning_parts)
+
+    @property
+    def answer(self) -> str:
+        return "".join(self._answer_parts)
+
+    def feed(self, chunk: str) -> Tuple[str, str]:
+        """청크를 추가하고 (reasoning_delta, answer_delta)를 반환한다."""
+        if not chunk:
+            return "", ""
+        self._pending += chunk
+        return self._drain(final=False)
+
+    def finish(self) -> Tuple[str, str]:
+        """스트림 종료 시 보류 구간을 확정한다."""
+        return self._drain(final=True)
+
+    def _channel(self) -> str:
+        return self.MODE_REASONING if self.mode == self.MODE_REASONING else self.MODE_ANSWER
+
+    def _find_marker(self, text: str) -> Tuple[Optional[re.Match], Optional[str]]:
+        """현재 모드에서 전환을 일으키는 가장 앞의 마커를 찾는다."""
+        candidates = []
+        if self.mode == self.MODE_REASONING:
+            match = ANSWER_HEADER_REGEX.search(text)
+            if match:
+                candidates.append((match, self.MODE_ANSWER))
+        else:
+            if not self._reasoning_seen:
+                match = REASONING_START_REGEX.search(text)
+                if match:
+                    candidates.append((match, self.MODE_REASONING))
+            match = ANSWER_HEADER_REGEX.search(text)
+            if match:
+                candidates.append((match, self.MODE_ANSWER))
+        if not candidates:
+            return None, None
+        return min(candidates, key=lambda c: c[0].start())
+
+    def _hold_index(self, text: str, limit: Optional[int] = None) -> int:
+        """마커가 시작될 수 있는 꼬리 구간의 시작 인덱스 (보류 대상)."""
+        hold = len(text) if limit is None else limit
+        bracket = text.rfind("[", 0, hold)
+        if bracket != -1 and "]" not in text[bracket:] and len(text) - bracket < _MAX_PENDING_MARKER_SPAN:
+            hold = bracket
+            while hold > 0 and text[hold - 1] in _MARKER_PREFIX_CHARS:
+                hold -= 1
+        trailing = _STREAM_TRAILING_HOLD_REGEX.search(text[:hold])
+        if trailing:
+            hold = trailing.start()
+        return hold
+
+    def _emit(self, channel: str, text: str) -> str:
+        if text and self._held_whitespace[channel]:
+            text = self._held_whitespace[channel] + text
+            self._held_whitespace[channel] = ""
+        if not self._started[channel]:
+            text = text.lstrip()
+            if not text:
+                return ""
+            self._started[channel] = True
+        if channel == self.MODE_REASONING:
+            self._reasoning_parts.append(text)
+        else:
+            self._answer_parts.append(text)
+        return text
+
+    def _drain(self, final: bool) -> Tuple[str, str]:
+        deltas = {self.MODE_REASONING: [], self.MODE_ANSWER: []}
+
+        while True:
+            text = self._pending
+            match, next_mode = self._find_marker(text)
+            # 마커 뒤에 장식/개행만 남아 있으면 마커가 더 길어질 수 있으므로 보류
+            if match and (final or not _MARKER_TAIL_REGEX.fullmatch(text, match.end())):
+                channel = self._channel()
+                before = text[:match.start()]
+                stripped = before.rstrip()
+                deltas[channel].append(self._emit(channel, stripped))
+                if self._started[channel]:
+                    self._held_whitespace[channel] += before[len(stripped):]
+                if next_mode == self.MODE_REASONING:
+                    self._reasoning_seen = True
+                self.mode = next_mode
+                self._pending = text[match.end():]
+                continue
+            break
+
+        text = self._pending
+        if final:
+            text = text.rstrip()
+            self._pending = ""
+        else:
+            hold = self._hold_index(text, match.start() if match else None)
+            text, self._pending = text[:hold], text[hold:]
+        if text:
+            deltas[self._channel()].append(self._emit(self._channel(), text))
+
+        return "".join(deltas[self.MODE_REASONING]), "".join(deltas[self.MODE_ANSWER])
@@ -9,7 +9,7 @@ from __future__ import annotations
 import logging
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
-from .markdown_utils import _compute_stream_delta, _extract_reasoning_and_answer
+from .markdown_utils import StreamingReasoningParser, _extract_reasoning_and_answer
 
 
 def extract_usage_metadata(response: Any) -> Dict[str, int]:
@@ -83,74 +83,50 @@ def is_retryable_stream_error(error_msg: str) -> bool:
     )
 
 
-def yield_stream_deltas(
+def yield_parser_deltas(
     session_id: str,
-    streamed_reasoning: str,
-    streamed_answer: str,
-    current_reasoning: str,
-    current_answer: str,
-) -> Generator[Dict[str, Any], None, Tuple[str, str]]:
-    """스트리밍 중 추론/답변 델타를 계산하고 이벤트를 방출한다."""
-    reasoning_reset, reasoning_delta = _compute_stream_delta(
-        streamed_reasoning,
-        current_reasoning,
-    )
-    if reasoning_reset:
-        streamed_reasoning = ""
-        yield {"reasoning_clear": True, "session_id": session_id}
+    reasoning_delta: str,
+    answer_delta: str,
+) -> Generator[Dict[str, Any], None, None]:
+    """증분 파서가 반환한 추론/답변 델타를 스트리밍 이벤트로 방출한다."""
     if reasoning_delta:
-        streamed_reasoning = current_reasoning
         yield {
             "reasoning_chunk": reasoning_delta,
             "session_id": session_id,
         }
-
-    answer_reset, answer_delta = _compute_stream_delta(
-        streamed_answer,
-        current_answer,
-    )
-    if answer_reset:
-        streamed_answer = ""
-        yield {"answer_clear": True, "session_id": session_id}
     if answer_delta:
-        streamed_answer = current_answer
         yield {
             "chunk": answer_delta,
             "answer_chunk": answer_delta,
             "session_id": session_id,
         }
 
-    return streamed_reasoning, streamed_answer
-
 
 def stream_single_model_response(
     response_stream: Any,
     session_id: str,
 ) -> Generator[Dict[str, Any], None, Tuple[str, str, str]]:
-    """단일 모델 응답 스트림을 처리하고 최종 누적 상태를 반환한다."""
-    bot_response = ""
-    streamed_reasoning = ""
-    streamed_answer = ""
+    """단일 모델 응답 스트림을 처리하고 최종 누적 상태를 반환한다.
+
+    StreamingReasoningParser가 청크 간 상태를 유지하므로 청크당 비용은
+    누적 응답 길이와 무관하다.
+    """
+    response_parts: List[str] = []
+    parser = StreamingReasoningParser()
 
     for chunk in response_stream:
         chunk_text = getattr(chunk, "text", "")
         if not chunk_text:
             continue
 
-        bot_response += chunk_text
-        current_reasoning, current_answer = _extract_reasoning_and_answer(
-            bot_response,
-            is_streaming=True,
-        )
-        streamed_reasoning, streamed_answer = yield from yield_stream_deltas(
-            session_id=session_id,
-            streamed_reasoning=streamed_reasoning,
-            streamed_answer=streamed_answer,
-            current_reasoning=current_reasoning,
-            current_answer=current_answer,
-        )
+        response_parts.append(chunk_text)
+        reasoning_delta, answer_delta = parser.feed(chunk_text)
+        yield from yield_parser_deltas(session_id, reasoning_delta, answer_delta)
+
+    reasoning_delta, answer_delta = parser.finish()
+    yield from yield_parser_deltas(session_id, reasoning_delta, answer_delta)
 
-    return bot_response, streamed_reasoning, streamed_answer
+    return "".join(response_parts), parser.reasoning, parser.answer
 
 
 def stream_with_fallback_models(
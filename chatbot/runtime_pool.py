@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+챗봇 런타임 풀 (owner/API Key 별 LRU 인스턴스 관리)
+
+- 종목 맵/시장 데이터 캐시처럼 읽기 전용이고 로딩 비용이 큰 자산은 전 인스턴스가 공유한다.
+- 인스턴스는 최대 개수(LRU)와 유휴 시간(TTL) 기준으로 정리된다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_MAX_SIZE = 32
+DEFAULT_POOL_IDLE_TTL = 1800  # seconds
+DEFAULT_OWNER_KEY = "default_user"
+
+
+class SharedMarketDataCache:
+    """여러 챗봇 인스턴스가 공유하는 시장 데이터 TTL 캐시."""
+
+    def __init__(self, ttl: int = 60):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+        self._timestamp: Optional[datetime] = None
+
+    def get(self, data_fetcher: Optional[Callable[[], Dict[str, Any]]], fallback_fetcher: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """유효한 캐시를 반환하고 만료 시 한 스레드만 갱신한다."""
+        with self._lock:
+            now = datetime.now()
+            if (
+                self._data is None
+                or self._timestamp is None
+                or (now - self._timestamp).total_seconds() > self.ttl
+            ):
+                try:
+                    self._data = data_fetcher() if data_fetcher else fallback_fetcher()
+                    self._timestamp = now
+                except Exception as e:
+                    logger.error("Shared data fetch error: %s", e)
+                    if self._data is None:
+                        self._data = {"market": {}, "vcp_stocks": [], "sector_scores": {}}
+            return self._data
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._data = None
+            self._timestamp = None
+
+
+class SharedChatbotAssets:
+    """챗봇 인스턴스 간 공유되는 자산 (종목 맵, 시장 데이터 캐시, 메모리/히스토리 저장소)."""
+
+    def __init__(self, data_dir: Path, cache_ttl: int = 60):
+        self.data_dir = data_dir
+        self.market_cache = SharedMarketDataCache(ttl=cache_ttl)
+        self._lock = threading.Lock()
+        self._stock_maps: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None
+        self._memory: Optional[Any] = None
+        self._history: Optional[Any] = None
+
+    def get_memory(self, factory: Callable[[], Any]) -> Any:
+        """chatbot_memory.json은 단일 파일이므로 인스턴스 간 하나의 MemoryManager를 공유한다."""
+        with self._lock:
+            if self._memory is None:
+                self._memory = factory()
+            return self._memory
+
+    def get_history(self, factory: Callable[[], Any]) -> Any:
+        """chatbot_history.json도 단일 파일이므로 HistoryManager 하나를 공유한다 (내부 잠금으로 쓰기 직렬화)."""
+        with self._lock:
+            if self._history is None:
+                self._history = factory()
+            return self._history
+
+    def get_stock_maps(self, loader: Callable[[Path, Any], Tuple[Dict[str, str], Dict[str, str]]]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """종목 맵을 최초 1회만 로드하고 이후 공유한다."""
+        if self._stock_maps is not None:
+            return self._stock_maps
+        with self._lock:
+            if self._stock_maps is None:
+                self._stock_maps = loader(self.data_dir, logger)
+            return self._stock_maps
+
+    def reload_stock_maps(self) -> None:
+        """종목 리스트 갱신 후 다음 접근 시 재로딩되도록 초기화한다."""
+        with self._lock:
+            self._stock_maps = None
+
+
+def build_owner_key(owner_id: Optional[str] = None, api_key: Optional[str] = None) -> str:
+    """풀 키 생성 (owner 우선, 없으면 API Key 해시, 둘 다 없으면 기본 사용자)."""
+    if owner_id:
+        return f"owner:{owner_id}"
+    if api_key:
+        digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        return f"key:{digest}"
+    return DEFAULT_OWNER_KEY
+
+
+class ChatbotRuntimePool:
+    """owner 키 기준 챗봇 런타임 LRU 풀 (thread-safe)."""
+
+    def __init__(
+        self,
+        factory: Callable[[str], Any],
+        max_size: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._factory = factory
+        if max_size is None:
+            max_size = int(os.getenv("CHATBOT_POOL_MAX_SIZE", DEFAULT_POOL_MAX_SIZE))
+        if idle_ttl is None:
+            idle_ttl = float(os.getenv("CHATBOT_POOL_IDLE_TTL", DEFAULT_POOL_IDLE_TTL))
+        self.max_size = max(1, int(max_size))
+        # 0 이하면 유휴 축출 비활성화
+        self.idle_ttl = float(idle_ttl)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (instance, last_used)
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._creating: Dict[str, threading.Event] = {}
+
+    def get(self, key: str) -> Any:
+        """키에 해당하는 인스턴스를 반환한다 (없으면 생성, 생성은 키별 1회)."""
+        while True:
+            with self._lock:
+                self._evict_idle_locked()
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries[key] = (entry[0], self._clock())
+                    self._entries.move_to_end(key)
+                    instance = entry[0]
+                    break
+                pending = self._creating.get(key)
+                if pending is None:
+                    pending = threading.Event()
+                    self._creating[key] = pending
+                    instance = None
+                    break
+            # 다른 스레드가 같은 키를 생성 중이면 완료까지 대기 후 재시도
+            pending.wait()
+
+        if instance is not None:
+            return instance
+
+        try:
+            instance = self._factory(key)
+        except Exception:
+            with self._lock:
+                self._creating.pop(key, None)
+            pending.set()
+            raise
+
+        with self._lock:
+            self._entries[key] = (instance, self._clock())
+            self._entries.move_to_end(key)
+            self._creating.pop(key, None)
+            self._evict_overflow_locked()
+        pending.set()
+        return instance
+
+    def evict(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """전체 인스턴스를 정리한다 (프로세스 종료 시)."""
+        with self._lock:
+            instances = [inst for inst, _ in self._entries.values()]
+            self._entries.clear()
+        self._close_all(instances)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._entries.keys())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # 축출된 인스턴스는 다른 스레드가 아직 사용 중일 수 있으므로 close() 없이 참조만 해제한다.
+    def _evict_idle_locked(self) -> None:
+        if self.idle_ttl <= 0:
+            return
+        now = self._clock()
+        expired = [k for k, (_, last_used) in self._entries.items() if now - last_used > self.idle_ttl]
+        for k in expired:
+            del self._entries[k]
+
+    def _evict_overflow_locked(self) -> None:
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _close_all(instances: List[Any]) -> None:
+        for instance in instances:
+            try:
+                close = getattr(instance, "close", None)
+                if close:
+                    close()
+            except Exception as e:
+                logger.debug("Chatbot runtime close error: %s", e)
@@ -7,10 +7,11 @@
 import json
 import logging
 import os
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from .markdown_utils import _normalize_markdown_text
 
@@ -89,12 +90,18 @@ class MemoryManager:
 
 
 class HistoryManager:
-    """대화 히스토리 매니저 (세션별 관리 + JSON 영구 저장)"""
+    """
+    대화 히스토리 매니저 (세션별 관리 + JSON 영구 저장)
+
+    chatbot_history.json은 단일 파일이므로 프로세스 안에서는 인스턴스 하나를 공유하고
+    (chatbot.runtime_pool.SharedChatbotAssets), 읽기-수정-쓰기는 _lock 안에서 한다.
+    """
 
     def __init__(self, user_id: str, data_dir: Optional[Path] = None):
         self.user_id = user_id
         self.data_dir = data_dir or (Path(__file__).parent.parent / "data")
         self.file_path = self.data_dir / "chatbot_history.json"
+        self._lock = threading.RLock()
 
         # Structure: { session_id: { id, title, messages, created_at, updated_at, model } }
         self.sessions = self._load()
@@ -179,6 +186,12 @@ class HistoryManager:
                 logger.error(f"Failed to load history: {e}")
         return {}
 
+    def _reload(self) -> Dict[str, Any]:
+        """조회용 최신 스냅샷 (쓰기 중인 스레드가 들고 있는 self.sessions를 중간에 바꾸지 않도록 잠금)"""
+        with self._lock:
+            self.sessions = self._load()  # [Fix] Multi-worker Sync
+            return self.sessions
+
     def _save(self) -> None:
         try:
             self._atomic_write(self.sessions)
@@ -192,53 +205,67 @@ class HistoryManager:
         owner_id: str = None,
         session_id: str = None,
     ) -> str:
-        self.sessions = self._load()  # [Fix] Multi-worker Sync
-        session_id = session_id or str(uuid.uuid4())
-        self.sessions[session_id] = {
-            "id": session_id,
-            "title": "새로운 대화",
-            "messages": [],
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "model": model_name,
-            "owner_id": owner_id,  # [Fix] Session Ownership
-        }
-        if save_immediate:
-            self._save()
-        return session_id
+        with self._lock:
+            self.sessions = self._load()  # [Fix] Multi-worker Sync
+            session_id = session_id or str(uuid.uuid4())
+            self.sessions[session_id] = {
+                "id": session_id,
+                "title": "새로운 대화",
+                "messages": [],
+                "created_at": datetime.now().isoformat(),
+                "updated_at": datetime.now().isoformat(),
+                "model": model_name,
+                "owner_id": owner_id,  # [Fix] Session Ownership
+            }
+            if save_immediate:
+                self._save()
+            return session_id
 
     def delete_session(self, session_id: str) -> bool:
-        self.sessions = self._load()  # [Fix] Multi-worker Sync
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-            self._save()
-            return True
-        return False
-
-    def delete_message(self, session_id: str, msg_index: int) -> bool:
-        self.sessions = self._load()  # [Fix] Multi-worker Sync
-        if session_id in self.sessions:
-            session = self.sessions[session_id]
-            if 0 <= msg_index < len(session["messages"]):
-                del session["messages"][msg_index]
-                session["updated_at"] = datetime.now().isoformat()
+        with self._lock:
+            self.sessions = self._load()  # [Fix] Multi-worker Sync
+            if session_id in self.sessions:
+                del self.sessions[session_id]
                 self._save()
                 return True
-        return False
+            return False
+
+    def delete_message(self, session_id: str, msg_index: int) -> bool:
+        with self._lock:
+            self.sessions = self._load()  # [Fix] Multi-worker Sync
+            if session_id in self.sessions:
+                session = self.sessions[session_id]
+                if 0 <= msg_index < len(session["messages"]):
+                    del session["messages"][msg_index]
+                    session["updated_at"] = datetime.now().isoformat()
+                    self._save()
+                    return True
+            return False
+
+    def update_session(self, session_id: str, mutate: Callable[[Dict[str, Any]], None]) -> bool:
+        """최신 파일 기준으로 세션 하나를 수정하고 저장한다 (세션이 없으면 False)."""
+        with self._lock:
+            self.sessions = self._load()
+            session = self.sessions.get(session_id)
+            if session is None:
+                return False
+            mutate(session)
+            self._save()
+            return True
 
     def clear_all(self) -> None:
-        self.sessions = {}
-        self._save()
+        with self._lock:
+            self.sessions = {}
+            self._save()
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        self.sessions = self._load()  # [Fix] Multi-worker Sync
-        return self.sessions.get(session_id)
+        return self._reload().get(session_id)
 
     def get_all_sessions(self, owner_id: str = None) -> list:
-        self.sessions = self._load()  # [Fix] Multi-worker Sync
+        sessions = self._reload()
         # Filter out empty or ephemeral-only sessions AND filter by owner
         valid_sessions = []
-        for s in self.sessions.values():
+        for s in sessions.values():
             # [Fix] Owner Check
             # If owner_id is provided, only show sessions for that owner.
             # If session has no owner (legacy), it might be visible to all or migration needed.
@@ -300,48 +327,48 @@ class HistoryManager:
         )
 
     def add_message(self, session_id: str, role: str, message: str, save: bool = True) -> None:
-        # Always reload latest snapshot before mutating.
-        # Without this, stale in-memory state from another worker can resurrect deleted sessions.
-        self.sessions = self._load()
-        if session_id not in self.sessions:
-            # Fallback (Ephemeral check handled in chat, but here strictly requires existence or auto-create)
-            # Since chat method handles ephemeral, if we reach here, we must modify a session.
-            # If logic is correct, this might be rare, but let's be safe.
-            self.create_session(session_id=session_id)  # Auto-recover
-
-        session = self.sessions[session_id]
-
-        # FIX: Store parts as objects for Gemini SDK compatibility
-        # parts=[{"text": "message"}] instead of parts=["message"]
-        # Add timestamp
-        session["messages"].append(
-            {
-                "role": role,
-                "parts": [{"text": message}],
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
-        session["updated_at"] = datetime.now().isoformat()
-
-        # Auto-title (first user message)
-        if len(session["messages"]) == 1 and role == "user":
-            clean_msg = message.strip().replace("\n", " ")
-            session["title"] = clean_msg[:30] + "..." if len(clean_msg) > 30 else clean_msg
-        elif len(session["messages"]) == 2 and role == "user":
-            clean_msg = message.strip().replace("\n", " ")
-            session["title"] = clean_msg[:30] + "..." if len(clean_msg) > 30 else clean_msg
+        with self._lock:
+            # Always reload latest snapshot before mutating.
+            # Without this, stale in-memory state from another worker can resurrect deleted sessions.
+            self.sessions = self._load()
+            if session_id not in self.sessions:
+                # Fallback (Ephemeral check handled in chat, but here strictly requires existence or auto-create)
+                # Since chat method handles ephemeral, if we reach here, we must modify a session.
+                # If logic is correct, this might be rare, but let's be safe.
+                self.create_session(session_id=session_id)  # Auto-recover
 
-        # Limit per session (optional, kept 50 for now)
-        if len(session["messages"]) > 50:
-            session["messages"] = session["messages"][-50:]
+            session = self.sessions[session_id]
 
-        if save:
-            self._save()
+            # FIX: Store parts as objects for Gemini SDK compatibility
+            # parts=[{"text": "message"}] instead of parts=["message"]
+            # Add timestamp
+            session["messages"].append(
+                {
+                    "role": role,
+                    "parts": [{"text": message}],
+                    "timestamp": datetime.now().isoformat(),
+                }
+            )
+            session["updated_at"] = datetime.now().isoformat()
+
+            # Auto-title (first user message)
+            if len(session["messages"]) == 1 and role == "user":
+                clean_msg = message.strip().replace("\n", " ")
+                session["title"] = clean_msg[:30] + "..." if len(clean_msg) > 30 else clean_msg
+            elif len(session["messages"]) == 2 and role == "user":
+                clean_msg = message.strip().replace("\n", " ")
+                session["title"] = clean_msg[:30] + "..." if len(clean_msg) > 30 else clean_msg
+
+            # Limit per session (optional, kept 50 for now)
+            if len(session["messages"]) > 50:
+                session["messages"] = session["messages"][-50:]
+
+            if save:
+                self._save()
 
     def get_messages(self, session_id: str) -> list:
         # Sync from disk for multi-worker consistency.
-        self.sessions = self._load()
-        session = self.sessions.get(session_id)
+        session = self._reload().get(session_id)
         if session:
             # FIX: Sanitize legacy messages where parts might be strings
             sanitized = []
@@ -383,5 +410,4 @@ class HistoryManager:
 
     def to_dict(self) -> Dict[str, Any]:
         """전체 세션 딕셔너리를 반환한다."""
-        self.sessions = self._load()
-        return self.sessions
+        return self._reload()
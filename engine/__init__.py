@@ -2,20 +2,52 @@
 # -*- coding: utf-8 -*-
 """
 Engine Package
+
+하위 모듈(engine.xxx)을 import할 때마다 패키지 초기화가 먼저 실행되므로, 여기서는 아무것도
+미리 import하지 않는다. 패키지 수준 이름(engine.Scorer 등)은 처음 접근할 때 로드한다.
+(google-genai, pykrx, pandas 등이 워커/CLI 기동 시간에 포함되지 않도록)
 """
-from .models import *
-from .config import config, app_config
-from .scorer import Scorer
-from .position_sizer import PositionSizer
-try:
-    from .llm_analyzer import LLMAnalyzer
-except ImportError:
-    LLMAnalyzer = None
-    print("Warning: LLMAnalyzer could not be imported (missing dependencies?)")
-from .collectors import KRXCollector, EnhancedNewsCollector
+import importlib
+
+# 이름 → (모듈, 속성). 속성이 None이면 모듈 자체
+_LAZY_ATTRS = {
+    'models': ('engine.models', None),
+    'config': ('engine.config', 'config'),
+    'app_config': ('engine.config', 'app_config'),
+    'scorer': ('engine.scorer', None),
+    'position_sizer': ('engine.position_sizer', None),
+    'llm_analyzer': ('engine.llm_analyzer', None),
+    'collectors': ('engine.collectors', None),
+    'Scorer': ('engine.scorer', 'Scorer'),
+    'PositionSizer': ('engine.position_sizer', 'PositionSizer'),
+    'LLMAnalyzer': ('engine.llm_analyzer', 'LLMAnalyzer'),
+    'KRXCollector': ('engine.collectors', 'KRXCollector'),
+    'EnhancedNewsCollector': ('engine.collectors', 'EnhancedNewsCollector'),
+}
 
 __all__ = [
     'models', 'config', 'scorer', 'position_sizer', 'llm_analyzer', 'collectors',
-    'config', 'app_config', 'Scorer', 'PositionSizer', 'LLMAnalyzer',
+    'app_config', 'Scorer', 'PositionSizer', 'LLMAnalyzer',
     'KRXCollector', 'EnhancedNewsCollector'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module_name, attr = _LAZY_ATTRS[name]
+        module = importlib.import_module(module_name)
+        value = module if attr is None else getattr(module, attr)
+        globals()[name] = value
+        return value
+
+    # 기존 `from .models import *` 호환 (engine.StockData 등)
+    models = importlib.import_module('engine.models')
+    if not name.startswith('_') and hasattr(models, name):
+        value = getattr(models, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'engine' has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -17,6 +17,7 @@ from datetime import datetime, timedelta
 
 from engine.collectors.base import BaseCollector, CollectorError, DataSourceUnavailableError
 from engine.models import StockData, ChartData, SupplyData
+from engine.metrics import timer
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +81,8 @@ class KRXCollector(BaseCollector):
             for days_ago in range(7):
                 try:
                     check_date = (base_date - timedelta(days=days_ago)).strftime('%Y%m%d')
-                    df = stock.get_market_ohlcv_by_ticker(check_date, market=market)
+                    with timer('collector_request_seconds', collector='krx', op='top_gainers', source='pykrx'):
+                        df = stock.get_market_ohlcv_by_ticker(check_date, market=market)
                     if not df.empty:
                         logger.info(f"pykrx 데이터 로드 성공: {check_date}")
                         break
@@ -97,7 +99,8 @@ class KRXCollector(BaseCollector):
 
         # 2. Fallback: 로컬 daily_prices.csv 사용
         logger.info(f"Fallback: 로컬 daily_prices.csv 사용 ({market}) Target={target_date}")
-        return self._load_from_local_csv(market, top_n, target_date)
+        with timer('collector_request_seconds', collector='krx', op='top_gainers', source='csv'):
+            return self._load_from_local_csv(market, top_n, target_date)
 
     # ========================================================================
     # Helper Methods
@@ -315,7 +318,8 @@ class KRXCollector(BaseCollector):
             if os.path.exists(csv_path):
                 # 효율성을 위해 전체를 읽지 않고 최적화할 수 있으나, 여기서는 단순 구현
                 # 실전에서는 DB나 인덱싱된 파일을 사용하는 것이 좋음
-                df = pd.read_csv(csv_path)
+                with timer('collector_request_seconds', collector='krx', op='stock_detail', source='csv'):
+                    df = pd.read_csv(csv_path)
                 df['ticker'] = df['ticker'].astype(str).str.zfill(6)
                 stock_df = df[df['ticker'] == code].copy()
                 
@@ -358,7 +362,8 @@ class KRXCollector(BaseCollector):
             start_date = end_date - timedelta(days=int(days * 1.6) + 10)
             start_date_str = start_date.strftime("%Y%m%d")
 
-            df = stock.get_market_ohlcv_by_date(start_date_str, end_date_str, code)
+            with timer('collector_request_seconds', collector='krx', op='chart', source='pykrx'):
+                df = stock.get_market_ohlcv_by_date(start_date_str, end_date_str, code)
 
             if not df.empty:
                 df = df.tail(days)
@@ -381,7 +386,8 @@ class KRXCollector(BaseCollector):
             if not os.path.exists(csv_path):
                 return None
 
-            df = pd.read_csv(csv_path)
+            with timer('collector_request_seconds', collector='krx', op='chart', source='csv'):
+                df = pd.read_csv(csv_path)
             df['ticker'] = df['ticker'].astype(str).str.zfill(6)
             df['date'] = pd.to_datetime(df['date'])
             
@@ -424,7 +430,8 @@ class KRXCollector(BaseCollector):
             end_dt = datetime.strptime(end_date, "%Y%m%d")
             start_date = (end_dt - timedelta(days=10)).strftime('%Y%m%d')
             
-            df = stock.get_market_trading_value_by_date(start_date, end_date, code)
+            with timer('collector_request_seconds', collector='krx', op='supply', source='pykrx'):
+                df = stock.get_market_trading_value_by_date(start_date, end_date, code)
             
             if not df.empty:
                 df = df.tail(5)
@@ -449,7 +456,8 @@ class KRXCollector(BaseCollector):
             if not os.path.exists(csv_path):
                 return SupplyData(0, 0, 0)
 
-            df = pd.read_csv(csv_path)
+            with timer('collector_request_seconds', collector='krx', op='supply', source='csv'):
+                df = pd.read_csv(csv_path)
             df['ticker'] = df['ticker'].astype(str).str.zfill(6)
             df['date'] = pd.to_datetime(df['date'])
             
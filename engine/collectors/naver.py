@@ -14,6 +14,7 @@ from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 
 from engine.collectors.base import BaseCollector, CollectorError
+from engine.metrics import inc, timer, url_route
 
 logger = logging.getLogger(__name__)
 
@@ -261,37 +262,43 @@ class NaverFinanceCollector(BaseCollector):
         """
         import requests
         import time
-        
-        for attempt in range(retries):
-            try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-                
-                # 429 Too Many Requests 처리
-                if response.status_code == 429:
-                    wait_time = (2 ** attempt) * 0.5  # 0.5s, 1s, 2s
-                    logger.warning(f"Naver API Rate Limit (429). Waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                    
-                # 5xx Server Error 처리
-                if 500 <= response.status_code < 600:
-                    wait_time = (2 ** attempt) * 0.5
-                    logger.warning(f"Naver Server Error ({response.status_code}). Waiting {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                # Connection Error 등
-                if attempt < retries - 1:
-                    wait_time = (2 ** attempt) * 0.5
-                    logger.debug(f"Request failed ({e}). Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Request failed after {retries} attempts: {url}")
-                    return None
-                    
+
+        op = url_route(url)
+        with timer('collector_request_seconds', collector='naver', op=op):
+            for attempt in range(retries):
+                if attempt:
+                    inc('collector_retries_total', collector='naver', op=op)
+                try:
+                    response = requests.get(url, headers=headers, timeout=timeout)
+                    inc('collector_responses_total', collector='naver', op=op, status=response.status_code)
+
+                    # 429 Too Many Requests 처리
+                    if response.status_code == 429:
+                        wait_time = (2 ** attempt) * 0.5  # 0.5s, 1s, 2s
+                        logger.warning(f"Naver API Rate Limit (429). Waiting {wait_time}s...")
+                        time.sleep(wait_time)
+                        continue
+
+                    # 5xx Server Error 처리
+                    if 500 <= response.status_code < 600:
+                        wait_time = (2 ** attempt) * 0.5
+                        logger.warning(f"Naver Server Error ({response.status_code}). Waiting {wait_time}s...")
+                        time.sleep(wait_time)
+                        continue
+
+                    return response
+
+                except requests.RequestException as e:
+                    # Connection Error 등
+                    if attempt < retries - 1:
+                        wait_time = (2 ** attempt) * 0.5
+                        logger.debug(f"Request failed ({e}). Retrying in {wait_time}s...")
+                        time.sleep(wait_time)
+                    else:
+                        inc('collector_responses_total', collector='naver', op=op, status='error')
+                        logger.error(f"Request failed after {retries} attempts: {url}")
+                        return None
+
         return None
 
     # ========================================================================
@@ -14,6 +14,7 @@ from datetime import datetime
 
 from engine.collectors.base import BaseCollector, CollectorError
 from engine.models import NewsItem
+from engine.metrics import timer
 
 logger = logging.getLogger(__name__)
 
@@ -174,7 +175,8 @@ class EnhancedNewsCollector(BaseCollector):
         headers_finance = self.headers.copy()
         headers_finance['Referer'] = f'https://finance.naver.com/item/news.naver?code={code}'
 
-        response = requests.get(url, headers=headers_finance, timeout=5)
+        with timer('collector_request_seconds', collector='news', op='naver_finance'):
+            response = requests.get(url, headers=headers_finance, timeout=5)
 
         if not response.ok:
             return []
@@ -238,7 +240,8 @@ class EnhancedNewsCollector(BaseCollector):
         from bs4 import BeautifulSoup
 
         search_url = f'https://search.naver.com/search.naver?where=news&query={stock_name}&sort=1'
-        response = requests.get(search_url, headers=self.headers, timeout=5)
+        with timer('collector_request_seconds', collector='news', op='naver_search'):
+            response = requests.get(search_url, headers=self.headers, timeout=5)
 
         if not response.ok:
             return []
@@ -299,7 +302,8 @@ class EnhancedNewsCollector(BaseCollector):
         from bs4 import BeautifulSoup
 
         daum_url = f'https://search.daum.net/search?w=news&q={stock_name}&sort=recency'
-        response = requests.get(daum_url, headers=self.headers, timeout=5)
+        with timer('collector_request_seconds', collector='news', op='daum_search'):
+            response = requests.get(daum_url, headers=self.headers, timeout=5)
 
         if not response.ok:
             return []
@@ -134,11 +134,21 @@ class AppConfig:
     @property
     def ANALYSIS_LLM_API_TIMEOUT(self):
         return int(os.getenv("ANALYSIS_LLM_API_TIMEOUT", 120))
-    
+
+    @property
+    def ANALYSIS_LLM_CHUNK_TOKEN_BUDGET(self):
+        """배치 요청 1건의 예상 토큰 상한 (종목 입력 + 예상 출력)"""
+        return int(os.getenv("ANALYSIS_LLM_CHUNK_TOKEN_BUDGET", 8000))
+
     @property
-    def ANALYSIS_LLM_REQUEST_DELAY(self):
-        """API 호출 간 강제 대기 시간 (초)"""
-        return float(os.getenv("ANALYSIS_LLM_REQUEST_DELAY", 5.0))
+    def PIPELINE_STREAMING(self):
+        """종가베팅 파이프라인 스트리밍 모드 (Phase 간 종목 단위 전달)"""
+        return os.getenv("PIPELINE_STREAMING", "false").lower() == "true"
+
+    @property
+    def JONGGA_RESUME_ENABLED(self):
+        """종가베팅 재실행 시 (날짜, 시장)별 체크포인트에서 이어서 실행"""
+        return os.getenv("JONGGA_RESUME_ENABLED", "true").lower() == "true"
 
     # VCP Signals AI Analysis Settings
     @property
@@ -166,6 +176,19 @@ class AppConfig:
     def PERPLEXITY_API_KEY(self):
         return os.getenv("PERPLEXITY_API_KEY", "").strip()
 
+    # LLM 결과 캐시 (engine.llm_cache)
+    @property
+    def LLM_CACHE_ENABLED(self):
+        return os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+
+    @property
+    def LLM_CACHE_TTL_HOURS(self):
+        return float(os.getenv("LLM_CACHE_TTL_HOURS", 24))
+
+    @property
+    def LLM_CACHE_MAX_ENTRIES(self):
+        return int(os.getenv("LLM_CACHE_MAX_ENTRIES", 5000))
+
     @property
     def DATA_SOURCE(self):
         return os.getenv("DATA_SOURCE", "krx")
@@ -187,6 +210,11 @@ class AppConfig:
         # Setter support for runtime update (optional, but requested in previous code)
         os.environ["MARKET_GATE_UPDATE_INTERVAL_MINUTES"] = str(value)
 
+    @property
+    def METRICS_TOKEN(self):
+        """/api/admin/metrics 접근 토큰 (비어 있으면 엔드포인트 비활성)"""
+        return os.getenv("METRICS_TOKEN", "").strip()
+
     @property
     def SCHEDULER_ENABLED(self):
         """스케줄러 활성화 여부"""
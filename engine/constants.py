@@ -302,6 +302,7 @@ class LLMThresholds:
         CONCURRENCY_ANALYSIS: 분석용 LLM 동시성
         CONCURRENCY_GENERAL: 일반용 LLM 동시성
         REQUEST_DELAY: 요청 간 지연 시간 (초)
+        OUTPUT_TOKENS_PER_STOCK: 배치 응답에서 종목당 예상 출력 토큰 (청크 토큰 예산 계산용)
         TIMEOUT_ANALYSIS: 분석용 LLM 타임아웃 (초)
         TIMEOUT_GENERAL: 일반용 LLM 타임아웃 (초)
         MAX_RETRIES: 최대 재시도 횟수
@@ -312,6 +313,7 @@ class LLMThresholds:
     CONCURRENCY_ANALYSIS: int = 2
     CONCURRENCY_GENERAL: int = 3
     REQUEST_DELAY: float = 2.0
+    OUTPUT_TOKENS_PER_STOCK: int = 300
     TIMEOUT_ANALYSIS: int = 120
     TIMEOUT_GENERAL: int = 60
     MAX_RETRIES: int = 5
@@ -561,12 +563,32 @@ class AIAnalysisThresholds:
         CONFIDENCE_BUY_MIN: BUY 추천 최소 신뢰도 (75%)
         TARGET_PRICE_RATIO: 목표가 배수 (1.15배)
         STOP_LOSS_RATIO: 손절가 비율 (0.95배)
+        VALID_ACTIONS: 유효한 AI action 값
+        INVALID_REASONS: 분석 결과로 보지 않는 reason 문구 (소문자, 실패/placeholder)
     """
     CONFIDENCE_MIN: int = 50
     CONFIDENCE_MAX: int = 95
     CONFIDENCE_BUY_MIN: int = 75
     TARGET_PRICE_RATIO: float = 1.15
     STOP_LOSS_RATIO: float = 0.95
+    VALID_ACTIONS: frozenset = frozenset({"BUY", "SELL", "HOLD"})
+    INVALID_REASONS: frozenset = frozenset({
+        "",
+        "-",
+        "n/a",
+        "na",
+        "none",
+        "null",
+        "분석 실패",
+        "분석 대기중",
+        "분석 대기 중",
+        "분석중",
+        "분석 중",
+        "no analysis available.",
+        "no analysis available",
+        "analysis failed",
+        "failed",
+    })
 
 
 # =============================================================================
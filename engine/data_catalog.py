@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+데이터 카탈로그 매니페스트 (data/data_catalog.json)
+
+- 데이터 파일을 쓰는 쪽(scripts/init_data.py, MarketGate.save_analysis, 종가베팅 결과 저장)이
+  행 수 / 날짜 범위 / 크기 / 수정 시각 / 내용 해시를 기록한다.
+- 상태 조회 API는 파일을 다시 읽지 않고 매니페스트만 조회한다.
+- 매니페스트를 갱신하지 않는 다른 writer가 파일을 바꿔도 (size, mtime) 불일치로 감지되어
+  해당 항목만 1회 재계산된다. 이때는 조회 경로이므로 내용 해시는 계산하지 않는다 (sha256=None).
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = 'data_catalog.json'
+DATE_COLUMNS = ('date', 'signal_date')
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _scan_csv(path: str) -> Tuple[Optional[int], Optional[Dict[str, str]]]:
+    """CSV 행 수와 날짜 범위 (날짜 컬럼만 읽음)"""
+    try:
+        df = pd.read_csv(path, usecols=lambda col: col in DATE_COLUMNS, dtype=str)
+    except Exception:
+        try:
+            return sum(1 for _ in open(path, encoding='utf-8-sig')) - 1, None
+        except Exception:
+            return None, None
+
+    if df.shape[1] == 0:
+        # 날짜 컬럼이 없으면 usecols 결과가 비어 있으므로 행 수만 센다
+        with open(path, encoding='utf-8-sig') as f:
+            return max(sum(1 for _ in f) - 1, 0), None
+
+    dates = df.iloc[:, 0].dropna()
+    date_range = {'start': str(dates.min()), 'end': str(dates.max())} if not dates.empty else None
+    return len(df), date_range
+
+
+def _scan_json(path: str) -> Tuple[Optional[int], Optional[Dict[str, str]]]:
+    """JSON 레코드 수 (signals 배열 또는 최상위 리스트)와 날짜 범위"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        return None, None
+
+    records = None
+    if isinstance(data, dict) and 'signals' in data:
+        records = data['signals']
+    elif isinstance(data, list):
+        records = data
+
+    dates = []
+    if isinstance(data, dict):
+        for key in ('date', 'signal_date', 'dataset_date'):
+            if data.get(key):
+                dates.append(str(data[key])[:10])
+                break
+    if not dates and isinstance(records, list):
+        for rec in records:
+            if isinstance(rec, dict):
+                for key in DATE_COLUMNS:
+                    if rec.get(key):
+                        dates.append(str(rec[key])[:10])
+                        break
+
+    date_range = {'start': min(dates), 'end': max(dates)} if dates else None
+    row_count = len(records) if isinstance(records, list) else None
+    return row_count, date_range
+
+
+class DataCatalog:
+    """data 디렉토리 단위 매니페스트 (thread/process-safe)"""
+
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        self.manifest_path = os.path.join(data_dir, CATALOG_FILENAME)
+        self._lock = threading.Lock()
+        # (manifest mtime_ns, entries) - 매니페스트가 바뀌지 않았으면 재파싱하지 않음
+        self._cached: Tuple[Optional[int], Dict[str, Any]] = (None, {})
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), os.path.abspath(self.data_dir))
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            mtime_ns = os.stat(self.manifest_path).st_mtime_ns
+        except OSError:
+            return {}
+        if self._cached[0] == mtime_ns:
+            return self._cached[1]
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('files', {})
+        except Exception as e:
+            logger.warning(f"데이터 카탈로그 로드 실패: {e}")
+            entries = {}
+        self._cached = (mtime_ns, entries)
+        return entries
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        """다른 프로세스의 갱신을 잃지 않도록 파일 락 안에서 read-modify-write"""
+        os.makedirs(self.data_dir, exist_ok=True)
+        with self._lock, open(self.manifest_path + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self._cached = (None, {})
+                entries = dict(self._read_manifest())
+                entries[key] = entry
+                tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'updated_at': datetime.now().isoformat(), 'files': entries}, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.manifest_path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def record(
+        self,
+        path: str,
+        row_count: Optional[int] = None,
+        date_range: Optional[Dict[str, str]] = None,
+        compute_hash: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        파일 기록 직후 호출. row_count/date_range를 넘기면 파일 재스캔을 생략한다.
+        compute_hash=False면 전체 파일을 읽는 sha256 계산을 생략한다 (조회 경로용).
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        if row_count is None:
+            if path.endswith('.csv'):
+                row_count, scanned_range = _scan_csv(path)
+            elif path.endswith('.json'):
+                row_count, scanned_range = _scan_json(path)
+            else:
+                scanned_range = None
+            date_range = date_range or scanned_range
+
+        entry = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'mtime_ns': stat.st_mtime_ns,
+            'last_modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            'row_count': int(row_count) if row_count is not None else None,
+            'date_range': date_range,
+            'sha256': _file_hash(path) if compute_hash else None,
+        }
+        try:
+            self._write_entry(self._key(path), entry)
+        except Exception as e:
+            logger.warning(f"데이터 카탈로그 갱신 실패 ({path}): {e}")
+        return entry
+
+    def record_dataframe(self, path: str, df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """to_csv 직후 메모리의 DataFrame으로 행 수/날짜 범위를 기록"""
+        date_range = None
+        for col in DATE_COLUMNS:
+            if col in df.columns:
+                dates = df[col].dropna().astype(str)
+                if not dates.empty:
+                    date_range = {'start': dates.min()[:10], 'end': dates.max()[:10]}
+                break
+        return self.record(path, row_count=len(df), date_range=date_range)
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        파일 상태 조회. 매니페스트가 최신이면 O(1), 파일이 바뀌었으면 해당 항목만 재계산.
+        변경 감지는 (size, mtime)으로 충분하므로 재계산 시 해시는 건너뛴다.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        entry = self._read_manifest().get(self._key(path))
+        if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+            return entry
+        return self.record(path, compute_hash=False)
+
+
+_catalogs: Dict[str, DataCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(data_dir: str) -> DataCatalog:
+    key = os.path.abspath(data_dir)
+    with _catalogs_lock:
+        if key not in _catalogs:
+            _catalogs[key] = DataCatalog(data_dir)
+        return _catalogs[key]
+
+
+def record_file(path: str, row_count: Optional[int] = None, date_range: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+    """path가 속한 디렉토리의 카탈로그에 기록"""
+    return get_catalog(os.path.dirname(os.path.abspath(path))).record(path, row_count, date_range)
+
+
+def record_dataframe(path: str, df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    return get_catalog(os.path.dirname(os.path.abspath(path))).record_dataframe(path, df)
+
+
+def describe_file(path: str) -> Optional[Dict[str, Any]]:
+    return get_catalog(os.path.dirname(os.path.abspath(path))).get(path)
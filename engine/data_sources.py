@@ -6,13 +6,17 @@ Engine - Data Source Strategy Pattern
 데이터 소스 추상화를 위한 전략 패턴 구현
 FDR, pykrx, yfinance 등 다양한 데이터 소스를 통일된 인터페이스로 사용합니다.
 """
+from __future__ import annotations
+
 import logging
-import pandas as pd
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, List, Any
 from datetime import datetime, timedelta
 
+from engine.lazy_import import lazy_import
+
 logger = logging.getLogger(__name__)
+pd = lazy_import('pandas')
 
 
 # =============================================================================
@@ -37,6 +37,10 @@ from engine.position_sizer import PositionSizer
 from engine.llm_analyzer import LLMAnalyzer
 from engine.market_gate import MarketGate
 from engine.utils import NumpyEncoder
+from engine.jongga_rescore import rescore_payload
+from engine.jongga_archive import archive_result_file
+from engine.data_catalog import record_file
+from engine.jongga_checkpoint import RunCheckpoint
 
 # [REFACTORED] Import the phase-based pipeline
 from engine.phases import (
@@ -147,8 +151,7 @@ class SignalGenerator:
         # Phase 3: LLM Batch Analysis
         phase3 = Phase3LLMAnalyzer(
             llm_analyzer=self.llm_analyzer,
-            chunk_size=10,
-            request_delay=2.0
+            chunk_size=10
         )
 
         # Phase 4: Signal Finalization
@@ -163,7 +166,8 @@ class SignalGenerator:
             phase1=phase1,
             phase2=phase2,
             phase3=phase3,
-            phase4=phase4
+            phase4=phase4,
+            streaming=app_config.PIPELINE_STREAMING
         )
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -180,6 +184,7 @@ class SignalGenerator:
         target_date: date = None,
         markets: List[str] = None,
         top_n: int = 300,
+        resume: Optional[bool] = None,
     ) -> List[Signal]:
         """
         시그널 생성 (Refactored to use SignalGenerationPipeline)
@@ -189,6 +194,9 @@ class SignalGenerator:
         - Phase 2: News Collection
         - Phase 3: LLM Batch Analysis
         - Phase 4: Signal Finalization
+
+        Args:
+            resume: (날짜, 시장)별 체크포인트에서 이어서 실행 (None이면 JONGGA_RESUME_ENABLED)
         """
         start_time = time.time()
 
@@ -199,6 +207,8 @@ class SignalGenerator:
 
         markets = markets or ["KOSPI", "KOSDAQ"]
         all_signals = []
+        if resume is None:
+            resume = app_config.JONGGA_RESUME_ENABLED
 
         # 스캔 통계 초기화 (run 당 1회)
         self.scan_stats = {
@@ -246,6 +256,10 @@ class SignalGenerator:
             if self._pipeline and hasattr(self._pipeline, 'phase2'):
                 phase2_pass_before = self._pipeline.phase2.get_stats().get('passed', 0)
 
+            # 단계별 체크포인트 (실패/중단 후 재실행 시 남은 작업만 수행)
+            checkpoint = self._open_checkpoint(target_date, market, resume)
+            self._pipeline.set_checkpoint(checkpoint)
+
             # [REFACTORED] Use SignalGenerationPipeline
             try:
                 market_status = await self._get_market_status(target_date)
@@ -256,11 +270,15 @@ class SignalGenerator:
                 )
 
                 all_signals.extend(signals)
+                if checkpoint:
+                    checkpoint.complete()
 
                 elapsed = time.time() - start_time
                 print(f"  ✓ {market} 완료: {len(signals)}개 시그널 ({elapsed:.1f}초)")
 
             except NoCandidatesError as e:
+                if checkpoint:
+                    checkpoint.complete()
                 logger.warning(f"[{market}] {e}")
                 print(f"  - {market}: 조건에 맞는 후보 종목이 없습니다. ({e})")
                 continue
@@ -269,6 +287,7 @@ class SignalGenerator:
                 print(f"  ✗ {market} 실패: {e}")
                 continue
             finally:
+                self._pipeline.set_checkpoint(None)
                 if self._pipeline and hasattr(self._pipeline, 'phase1'):
                     phase1_pass_after = self._pipeline.phase1.get_stats().get('passed', 0)
                     self.scan_stats["phase1"] += max(0, phase1_pass_after - phase1_pass_before)
@@ -290,6 +309,14 @@ class SignalGenerator:
 
         return all_signals
 
+    def _open_checkpoint(self, target_date: date, market: str, resume: bool) -> Optional[RunCheckpoint]:
+        """실행 체크포인트 열기 (실패 시 체크포인트 없이 진행)"""
+        try:
+            return RunCheckpoint.open(target_date.isoformat(), market, resume=resume)
+        except Exception as e:
+            logger.warning(f"[Checkpoint] {market} 체크포인트 사용 불가: {e}")
+            return None
+
     async def _sync_toss_data(self, candidates: List[StockData], target_date: date = None) -> None:
         """
         Toss 증권 데이터 동기화 (Hybrid 모드)
@@ -470,8 +497,10 @@ class SignalGenerator:
             print(f"    ⚠️ 시그널 생성 오류 {stock.name}: {e}")
             return None
 
-    async def _analyze_stock(self, stock: StockData, target_date: date) -> Optional[Signal]:
-        """단일 종목 분석 (기존 호환용 - Batch 미사용)"""
+    async def _analyze_stock(
+        self, stock: StockData, target_date: date, use_cache: bool = True
+    ) -> Optional[Signal]:
+        """단일 종목 분석 (기존 호환용 - Batch 미사용, use_cache=False면 LLM 캐시 우회)"""
         # 1. Base Analysis
         base_data = await self._analyze_base(stock)
         if not base_data: return None
@@ -484,7 +513,9 @@ class SignalGenerator:
         if news_list and self.llm_analyzer.client:
             print(f"    [LLM] Analyzing {stock.name} news...")
             news_dicts = [{"title": n.title, "summary": n.summary} for n in news_list]
-            llm_result = await self.llm_analyzer.analyze_news_sentiment(stock.name, news_dicts)
+            llm_result = await self.llm_analyzer.analyze_news_sentiment(
+                stock.name, news_dicts, use_cache=use_cache
+            )
 
         # 4. Finalize
         return self._create_final_signal(
@@ -525,9 +556,12 @@ async def run_screener(
     markets: List[str] = None,
     target_date: str = None,  # YYYY-MM-DD 형식 (테스트용)
     top_n: int = 300,
+    resume: Optional[bool] = None,
 ) -> ScreenerResult:
     """
     스크리너 실행 (간편 함수)
+
+    resume: 같은 날짜/시장의 미완료 실행 체크포인트에서 이어서 실행 (None이면 JONGGA_RESUME_ENABLED)
     """
     start_time = time.time()
     
@@ -542,7 +576,7 @@ async def run_screener(
             parsed_date = None
 
     async with SignalGenerator(capital=capital) as generator:
-        signals = await generator.generate(target_date=parsed_date, markets=markets, top_n=top_n)
+        signals = await generator.generate(target_date=parsed_date, markets=markets, top_n=top_n, resume=resume)
         summary = generator.get_summary(signals)
         
         # 2. Market Gate 실행
@@ -638,8 +672,13 @@ async def run_screener(
 async def analyze_single_stock_by_code(
     code: str,
     capital: float = 50_000_000,
+    use_cache: bool = False,
 ) -> Optional[Signal]:
-    """단일 종목 재분석 (Toss Data Priority)"""
+    """
+    단일 종목 재분석 (Toss Data Priority)
+
+    명시적 재분석 요청이므로 기본적으로 LLM 결과 캐시를 우회한다 (use_cache=False).
+    """
     async with SignalGenerator(capital=capital) as generator:
         # 1. Toss 데이터 우선 조회
         stock = None
@@ -696,7 +735,7 @@ async def analyze_single_stock_by_code(
 
         # 재분석 실행
         # (단일 분석 시점엔 장중일 수도 있으니 today 사용, 하지만 종가베팅은 보통 장 마감 후)
-        new_signal = await generator._analyze_stock(stock, date.today())
+        new_signal = await generator._analyze_stock(stock, date.today(), use_cache=use_cache)
 
         if new_signal:
             # JSON 업데이트
@@ -705,6 +744,12 @@ async def analyze_single_stock_by_code(
         return new_signal
 
 
+def _record_result_file(path: str, data: dict) -> None:
+    """결과 JSON을 데이터 카탈로그에 기록 (상태 조회 API가 파일을 다시 읽지 않도록)"""
+    day = str(data.get("date") or "")[:10]
+    record_file(path, row_count=len(data.get("signals") or []), date_range={'start': day, 'end': day} if day else None)
+
+
 def save_result_to_json(result: ScreenerResult):
     """결과 JSON 저장"""
     data_dir = "data"
@@ -725,17 +770,23 @@ def save_result_to_json(result: ScreenerResult):
         "updated_at": datetime.now().isoformat()
     }
 
+    # 현재 등급 규칙으로 grade/by_grade/정렬을 확정하고 규칙 버전을 기록 (조회 시 재산정 불필요)
+    rescore_payload(data)
+
     # Daily 파일
     date_str = result.date.strftime("%Y%m%d")
     daily_path = os.path.join(data_dir, f"jongga_v2_results_{date_str}.json")
 
     with open(daily_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+    # 날짜/종목 인덱스 아카이브 (이력 조회용)
+    archive_result_file(daily_path)
 
     # Latest 파일
     latest_path = os.path.join(data_dir, "jongga_v2_latest.json")
     with open(latest_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+    _record_result_file(latest_path, data)
 
     print(f"\n[저장 완료] Daily: {daily_path}")
     print(f"[저장 완료] Latest: {latest_path}")
@@ -762,29 +813,15 @@ def update_single_signal_json(code: str, signal: Signal):
 
     data["signals"] = updated_signals
     
-    # [Sort] Grade (S>A>B>C>D) -> Score Descending
-    def sort_key_dict(s):
-        grade_map = {'S': 3, 'A': 2, 'B': 1}
-        grade_val = grade_map.get(str(s.get('grade', '')).strip().upper(), 0)
-        
-        score_obj = s.get('score', 0)
-        if isinstance(score_obj, dict):
-            total_score = score_obj.get('total', 0)
-        else:
-            try:
-                total_score = float(score_obj)
-            except (ValueError, TypeError):
-                total_score = 0
-                
-        return (grade_val, total_score)
-
-    data["signals"].sort(key=sort_key_dict, reverse=True)
+    # [Sort] 등급 재산정 + Grade (S>A>B>C>D) -> Score Descending
+    rescore_payload(data)
 
     data["updated_at"] = datetime.now().isoformat()
 
     # 저장
     with open(latest_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+    _record_result_file(latest_path, data)
 
     # Daily 파일도 업데이트
     date_str = date.today().strftime("%Y%m%d")
@@ -792,6 +829,7 @@ def update_single_signal_json(code: str, signal: Signal):
     if os.path.exists(daily_path):
         with open(daily_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+        archive_result_file(daily_path)
 
 
 # 테스트용 메인
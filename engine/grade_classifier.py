@@ -12,12 +12,18 @@ import logging
 from typing import Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 from engine.models import StockData, ScoreDetail, Grade, ChartData, SupplyData
 from engine.config import SignalConfig
 from engine.constants import PRICE_CHANGE
 
 logger = logging.getLogger(__name__)
 
+# 배치 판정 등급 코드 (0 = 탈락)
+GRADE_CODE_NONE = 0
+GRADE_BY_CODE = (None, Grade.S, Grade.A, Grade.B)
+
 
 # =============================================================================
 # Filter Result
@@ -103,6 +109,39 @@ class FilterValidator:
         # 모든 필터 통과
         return FilterResult(passed=True)
 
+    def validate_batch(
+        self,
+        trading_value: np.ndarray,
+        change_pct: np.ndarray,
+        news_score: np.ndarray,
+        last_open: np.ndarray,
+        last_close: np.ndarray,
+        last_high: np.ndarray,
+        has_candle: np.ndarray,
+        allow_no_news: bool = False
+    ) -> np.ndarray:
+        """
+        validate()의 배치 버전 (N개 종목 통과 여부 마스크)
+
+        Args:
+            trading_value, change_pct, news_score: 종목별 값 (N,)
+            last_open, last_close, last_high: 마지막 캔들 (N,)
+            has_candle: 차트 데이터 존재 여부 (없으면 윗꼬리 필터 통과)
+            allow_no_news: 뉴스 없음 허용 여부
+
+        Returns:
+            bool 배열 (N,)
+        """
+        passed = trading_value >= self.config.trading_value_min
+        passed &= (PRICE_CHANGE.MIN <= change_pct) & (change_pct <= PRICE_CHANGE.MAX)
+        if not allow_no_news:
+            passed &= news_score != 0
+
+        body = np.abs(last_close - last_open)
+        upper_shadow = last_high - np.maximum(last_open, last_close)
+        long_shadow = has_candle & (body > 0) & (upper_shadow > body * 0.5)
+        return passed & ~long_shadow
+
     def _validate_trading_value(self, trading_value: int) -> FilterResult:
         """
         거래대금 필터 (최소값)
@@ -293,6 +332,30 @@ class GradeClassifier:
             self._has_dual_buy(supply)                       # 외인+기관 동반 매수
         )
 
+    def classify_batch(
+        self,
+        trading_value: np.ndarray,
+        change_pct: np.ndarray,
+        total_score: np.ndarray,
+        dual_buy: np.ndarray
+    ) -> np.ndarray:
+        """
+        classify()의 배치 버전
+
+        Returns:
+            등급 코드 배열 (GRADE_BY_CODE 인덱스, 0 = 점수 미달)
+        """
+        common = (change_pct >= PRICE_CHANGE.MIN) & dual_buy
+        return np.select(
+            [
+                common & (trading_value >= self.config.trading_value_s) & (total_score >= self.config.min_s_grade),
+                common & (trading_value >= self.config.trading_value_a) & (total_score >= self.config.min_a_grade),
+                common & (trading_value >= self.config.trading_value_b) & (total_score >= self.config.min_b_grade),
+            ],
+            [1, 2, 3],
+            default=GRADE_CODE_NONE,
+        ).astype(np.int8)
+
     @staticmethod
     def _has_dual_buy(supply: SupplyData) -> bool:
         """외인+기관 동반 매수 여부"""
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+종가베팅 결과 아카이브 (data/jongga_archive.db, SQLite)
+
+- jongga_signals: (date, position) 키의 시그널 행 (원본 dict JSON 보관, 파일 내 순서 유지).
+  같은 날짜에 같은 종목이 여러 번 있어도 원본 파일과 동일하게 모두 보관한다.
+- jongga_dates: 날짜별 요약 행 (시그널 수, by_grade, signals를 제외한 payload, 원본 파일 stat)
+- save_result_to_json 등 결과 파일을 쓰는 쪽이 저장 시점에 기록한다.
+- 날짜 목록 / 특정 날짜 조회 / 날짜 교차 조회는 디렉토리 스캔 없이 인덱스 조회로 처리한다.
+- 프로세스당 첫 접근 시 1회, 아카이브보다 새로운 jongga_v2_results_*.json을 백필한다
+  (배포 이전 파일, 아카이브를 거치지 않는 외부 writer 대응).
+- 연결은 engine.sqlite_db 공용 계층(스레드별 연결 재사용, WAL, busy 재시도)을 사용한다.
+- 아카이브는 결과 파일에서 언제든 다시 만들 수 있으므로 스키마 버전이 바뀌면 테이블을 재생성하고 백필한다.
+"""
+
+import glob
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from engine.constants import FILE_PATHS
+from engine.sqlite_db import get_database
+from engine.utils import NumpyEncoder
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILENAME = 'jongga_archive.db'
+RESULTS_PREFIX = 'jongga_v2_results_'
+RESULTS_PATTERN = FILE_PATHS.JONGGA_RESULTS_TEMPLATE.format(date='*')
+
+# PRAGMA user_version - 2: jongga_signals 키를 (date, ticker) -> (date, position)으로 변경
+SCHEMA_VERSION = 2
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS jongga_dates (
+        date TEXT PRIMARY KEY,
+        signal_count INTEGER NOT NULL,
+        by_grade TEXT,
+        summary TEXT NOT NULL,
+        source_file TEXT,
+        source_size INTEGER,
+        source_mtime_ns INTEGER,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS jongga_signals (
+        date TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        ticker TEXT NOT NULL,
+        grade TEXT,
+        score_total REAL,
+        payload TEXT NOT NULL,
+        PRIMARY KEY (date, position)
+    )
+    """,
+    'CREATE INDEX IF NOT EXISTS idx_jongga_signals_ticker ON jongga_signals (ticker, date)',
+)
+
+
+def date_from_results_filename(path: str) -> Optional[str]:
+    """jongga_v2_results_20260130.json -> 2026-01-30 (8자리가 아니면 원문 그대로)"""
+    name = os.path.basename(path)
+    if not (name.startswith(RESULTS_PREFIX) and name.endswith('.json')):
+        return None
+    date_part = name[len(RESULTS_PREFIX):-len('.json')]
+    if len(date_part) == 8 and date_part.isdigit():
+        return f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:]}"
+    return date_part or None
+
+
+def _signal_ticker(signal: dict, position: int) -> str:
+    raw_code = signal.get('stock_code') or signal.get('ticker') or signal.get('code')
+    if raw_code:
+        return str(raw_code).strip().zfill(6)
+    return f"#{position}"
+
+
+def _signal_score_total(signal: dict) -> Optional[float]:
+    score = signal.get('score')
+    value = score.get('total') if isinstance(score, dict) else score
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class JonggaArchive:
+    """종가베팅 결과 SQLite 아카이브 (thread/process-safe, WAL)"""
+
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        self.db_path = os.path.join(data_dir, ARCHIVE_FILENAME)
+        self.db = get_database(self.db_path)
+        self._sync_lock = threading.Lock()
+        self._synced_pid: Optional[int] = None
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            # 여러 워커가 동시에 열어도 한 번만 재생성되도록 쓰기 잠금 안에서 버전 확인
+            with self.db.transaction() as conn:
+                version = conn.execute('PRAGMA user_version').fetchone()[0]
+                if version < SCHEMA_VERSION:
+                    conn.execute('DROP TABLE IF EXISTS jongga_signals')
+                    conn.execute('DROP TABLE IF EXISTS jongga_dates')
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                if version < SCHEMA_VERSION:
+                    conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            self._schema_ready = True
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def record_payload(self, date_key: str, payload: dict, source_file: Optional[str] = None) -> int:
+        """
+        날짜 1개 분량 payload 기록 (같은 날짜 재실행 시 해당 날짜 스냅샷 교체)
+
+        Returns:
+            기록된 시그널 수
+        """
+        signals = payload.get('signals') if isinstance(payload.get('signals'), list) else []
+        summary = {k: v for k, v in payload.items() if k != 'signals'}
+
+        rows = []
+        for position, signal in enumerate(signals):
+            if not isinstance(signal, dict):
+                continue
+            rows.append((
+                date_key, position, _signal_ticker(signal, position),
+                str(signal.get('grade', '') or '').strip().upper() or None,
+                _signal_score_total(signal),
+                json.dumps(signal, ensure_ascii=False, cls=NumpyEncoder),
+            ))
+
+        source_size = source_mtime_ns = None
+        if source_file:
+            try:
+                stat = os.stat(source_file)
+                source_size, source_mtime_ns = stat.st_size, stat.st_mtime_ns
+            except OSError:
+                pass
+
+        self._ensure_schema()
+        with self.db.transaction() as conn:
+            conn.execute('DELETE FROM jongga_signals WHERE date = ?', (date_key,))
+            conn.executemany(
+                'INSERT INTO jongga_signals (date, position, ticker, grade, score_total, payload) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows,
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO jongga_dates '
+                '(date, signal_count, by_grade, summary, source_file, source_size, source_mtime_ns, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    date_key, len(rows),
+                    json.dumps(payload.get('by_grade'), ensure_ascii=False, cls=NumpyEncoder),
+                    json.dumps(summary, ensure_ascii=False, cls=NumpyEncoder),
+                    os.path.basename(source_file) if source_file else None,
+                    source_size, source_mtime_ns,
+                    datetime.now().isoformat(),
+                ),
+            )
+        return len(rows)
+
+    def record_file(self, path: str) -> Optional[int]:
+        """jongga_v2_results_*.json 파일 1개를 읽어 기록"""
+        date_key = date_from_results_filename(path)
+        if not date_key:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        if not isinstance(payload, dict):
+            return None
+        return self.record_payload(date_key, payload, source_file=path)
+
+    def sync_files(self) -> int:
+        """아카이브에 없거나 stat이 달라진 결과 파일만 백필 (반환: 기록한 파일 수)"""
+        self._ensure_schema()
+        known = {
+            row['source_file']: (row['source_size'], row['source_mtime_ns'])
+            for row in self.db.query('SELECT source_file, source_size, source_mtime_ns FROM jongga_dates')
+        }
+
+        recorded = 0
+        for path in glob.glob(os.path.join(self.data_dir, RESULTS_PATTERN)):
+            try:
+                stat = os.stat(path)
+                if known.get(os.path.basename(path)) == (stat.st_size, stat.st_mtime_ns):
+                    continue
+                if self.record_file(path) is not None:
+                    recorded += 1
+            except Exception as e:
+                logger.warning(f"[JonggaArchive] 백필 실패 {path}: {e}")
+        if recorded:
+            logger.info(f"[JonggaArchive] {recorded}개 결과 파일 백필")
+        return recorded
+
+    def ensure_synced(self) -> None:
+        """프로세스당 1회 백필 (fork된 워커는 각자 1회)"""
+        if self._synced_pid == os.getpid():
+            return
+        with self._sync_lock:
+            if self._synced_pid == os.getpid():
+                return
+            try:
+                self.sync_files()
+            finally:
+                self._synced_pid = os.getpid()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def list_dates(self, with_signals_only: bool = False) -> List[str]:
+        """아카이브된 날짜 목록 (최신순)"""
+        self.ensure_synced()
+        query = 'SELECT date FROM jongga_dates'
+        if with_signals_only:
+            query += ' WHERE signal_count > 0'
+        return [row['date'] for row in self.db.query(query + ' ORDER BY date DESC')]
+
+    def _build_payload(self, row: sqlite3.Row) -> dict:
+        payload = json.loads(row['summary'])
+        payload['signals'] = [
+            json.loads(sig['payload'])
+            for sig in self.db.query(
+                'SELECT payload FROM jongga_signals WHERE date = ? ORDER BY position', (row['date'],)
+            )
+        ]
+        return payload
+
+    def load_payload(self, date_key: str) -> Optional[dict]:
+        """특정 날짜 payload (원본 파일과 동일한 구조)"""
+        self.ensure_synced()
+        row = self.db.query_one('SELECT * FROM jongga_dates WHERE date = ?', (date_key,))
+        return self._build_payload(row) if row else None
+
+    def load_payloads(self, limit: int = 0, with_signals_only: bool = False) -> List[Tuple[str, Optional[str], dict]]:
+        """
+        최신순 payload 목록
+
+        Returns:
+            [(date, source_file, payload), ...]
+        """
+        self.ensure_synced()
+        query = 'SELECT * FROM jongga_dates'
+        params: Tuple[Any, ...] = ()
+        if with_signals_only:
+            query += ' WHERE signal_count > 0'
+        query += ' ORDER BY date DESC'
+        if limit > 0:
+            query += ' LIMIT ?'
+            params = (limit,)
+        return [
+            (row['date'], row['source_file'], self._build_payload(row))
+            for row in self.db.query(query, params)
+        ]
+
+    def latest_with_signals(self) -> Optional[Tuple[str, Optional[str], dict]]:
+        """시그널이 1개 이상인 가장 최근 날짜의 (date, source_file, payload)"""
+        payloads = self.load_payloads(limit=1, with_signals_only=True)
+        return payloads[0] if payloads else None
+
+    def signal_history(self, tickers: Iterable[str], start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """종목별 날짜 교차 조회 (최신순) - 각 항목에 date가 포함된 시그널 dict"""
+        self.ensure_synced()
+        codes = [str(t).strip().zfill(6) for t in tickers]
+        if not codes:
+            return []
+        query = f"SELECT date, payload FROM jongga_signals WHERE ticker IN ({','.join('?' * len(codes))})"
+        params: List[Any] = list(codes)
+        if start:
+            query += ' AND date >= ?'
+            params.append(start)
+        if end:
+            query += ' AND date <= ?'
+            params.append(end)
+        results = []
+        for row in self.db.query(query + ' ORDER BY date DESC, position', params):
+            signal = json.loads(row['payload'])
+            signal.setdefault('date', row['date'])
+            results.append(signal)
+        return results
+
+
+_archives: Dict[str, JonggaArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_archive(data_dir: Optional[str] = None) -> JonggaArchive:
+    key = os.path.abspath(data_dir or FILE_PATHS.DATA_DIR)
+    with _archives_lock:
+        if key not in _archives:
+            _archives[key] = JonggaArchive(key)
+        return _archives[key]
+
+
+def archive_result_file(path: str) -> None:
+    """결과 파일 저장 직후 호출 - 실패해도 저장 흐름은 계속된다."""
+    try:
+        get_archive(os.path.dirname(os.path.abspath(path))).record_file(path)
+    except Exception as e:
+        logger.warning(f"[JonggaArchive] 기록 실패 {path}: {e}")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+종가베팅 V2 실행 체크포인트 (data/jongga_checkpoint.db, SQLite)
+
+- (target_date, market) 실행마다 단계별 종목 결과를 끝나는 즉시 기록한다.
+    phase1: 종목 상세/차트/수급/VCP 수집 결과 (점수는 복원 후 다시 계산)
+    phase2: 뉴스 목록 (빈 목록 = 뉴스 없음으로 확정)
+    phase3: 종목별 LLM 분석 결과
+- 크래시/중단 요청/워커 타임아웃 뒤 같은 실행을 다시 돌리면(resume) 기록된 종목은
+  수집/LLM 호출을 건너뛰고 남은 작업만 수행한다. 실패(예외)는 기록하지 않으므로 다시 시도된다.
+- phase1 기록에는 후보의 지문(종가, 거래대금, 등락률)을 함께 남긴다. 이어서 실행할 때 현재 후보와
+  지문이 다르면 (장중 재실행 등) 그 종목의 모든 단계 기록을 버리고 다시 수집/분석한다.
+- 시장 하나가 끝까지 완료되면 해당 실행의 기록을 지운다. KEEP_DAYS가 지난 미완료 기록도 정리한다.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from engine.models import ChartData, NewsItem, StockData, SupplyData
+from engine.sqlite_db import get_database
+from engine.utils import NumpyEncoder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'jongga_checkpoint.db'
+)
+KEEP_DAYS = 7
+
+STAGE_PHASE1 = 'phase1'
+STAGE_PHASE2 = 'phase2'
+STAGE_PHASE3 = 'phase3'
+
+# _collect_stock이 StockData에 덧붙이는 속성
+_STOCK_EXTRA_ATTRS = ('vcp_score', 'contraction_ratio')
+# _collect_stock이 채우는 속성 (복원 대상. 나머지 시세 필드는 현재 후보 값을 유지)
+_COLLECTED_STOCK_ATTRS = ('high_52w', 'low_52w') + _STOCK_EXTRA_ATTRS
+# 기록이 같은 후보에서 나왔는지 확인하는 필드
+_FINGERPRINT_FIELDS = ('close', 'trading_value', 'change_pct')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jongga_checkpoint (
+    run_key TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    stock_code TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (run_key, stage, stock_code)
+);
+CREATE INDEX IF NOT EXISTS idx_jongga_checkpoint_updated ON jongga_checkpoint (updated_at);
+"""
+
+
+# =============================================================================
+# 직렬화
+# =============================================================================
+def _dump_stock(stock: StockData) -> Dict:
+    data = asdict(stock)
+    for attr in _STOCK_EXTRA_ATTRS:
+        if hasattr(stock, attr):
+            data[attr] = getattr(stock, attr)
+    return data
+
+
+def stock_fingerprint(stock: StockData) -> list:
+    return [float(getattr(stock, name, 0) or 0) for name in _FINGERPRINT_FIELDS]
+
+
+def matches_candidate(stock: StockData, data: Dict) -> bool:
+    """phase1 기록이 현재 후보와 같은 시세에서 수집됐는지 (지문 없는 기록은 불일치)"""
+    return data.get('fingerprint') == stock_fingerprint(stock)
+
+
+def restore_stock(stock: StockData, data: Dict) -> None:
+    """수집 단계에서 채운 값만 후보 StockData에 복원한다 (객체 동일성 유지, 시세는 현재 값 유지)"""
+    for key in _COLLECTED_STOCK_ATTRS:
+        if key in data:
+            setattr(stock, key, data[key])
+
+
+def dump_collected(item: Dict) -> Dict:
+    """Phase1 _collect_stock 결과 → JSON 호환 dict"""
+    charts = item.get('charts')
+    supply = item.get('supply')
+    return {
+        'stock': _dump_stock(item['stock']),
+        'fingerprint': stock_fingerprint(item['stock']),
+        'charts': None if charts is None else {
+            'opens': charts.open_array.tolist(),
+            'highs': charts.high_array.tolist(),
+            'lows': charts.low_array.tolist(),
+            'closes': charts.close_array.tolist(),
+            'volumes': charts.volume_array.tolist(),
+            'dates': list(charts.dates),
+        },
+        'supply': None if supply is None else asdict(supply),
+        'vcp': item.get('vcp'),
+    }
+
+
+def load_collected(stock: StockData, data: Dict) -> Dict:
+    """dump_collected 역변환 (stock은 후보 객체에 값만 복원)"""
+    restore_stock(stock, data.get('stock') or {})
+    charts = data.get('charts')
+    supply = data.get('supply')
+    return {
+        'stock': stock,
+        'charts': ChartData(**charts) if charts is not None else None,
+        'supply': SupplyData(**supply) if supply is not None else None,
+        'vcp': data.get('vcp'),
+    }
+
+
+def dump_news(news_list) -> list:
+    rows = []
+    for news in news_list or []:
+        row = asdict(news)
+        if row.get('published_at'):
+            row['published_at'] = row['published_at'].isoformat()
+        rows.append(row)
+    return rows
+
+
+def load_news(rows) -> list:
+    news_list = []
+    for row in rows or []:
+        row = dict(row)
+        if row.get('published_at'):
+            row['published_at'] = datetime.fromisoformat(row['published_at'])
+        news_list.append(NewsItem(**row))
+    return news_list
+
+
+# =============================================================================
+# 체크포인트
+# =============================================================================
+class RunCheckpoint:
+    """실행 1건((target_date, market))의 단계별 종목 기록"""
+
+    def __init__(self, target_date: str, market: str, path: Optional[str] = None):
+        self.run_key = f"{target_date}:{market}"
+        self.path = path or os.getenv('JONGGA_CHECKPOINT_PATH', DEFAULT_CHECKPOINT_PATH)
+        self.db = get_database(self.path)
+        self.db.connection().executescript(_SCHEMA)
+        self.restored = {STAGE_PHASE1: 0, STAGE_PHASE2: 0, STAGE_PHASE3: 0}
+        # 후보와 지문이 달라 버린 종목 (이후 단계도 복원하지 않음)
+        self.discarded: set = set()
+
+    @classmethod
+    def open(cls, target_date: str, market: str, resume: bool = True,
+             path: Optional[str] = None) -> 'RunCheckpoint':
+        """
+        실행 체크포인트 열기
+
+        Args:
+            resume: False면 이전 기록을 지우고 새로 시작
+        """
+        checkpoint = cls(target_date, market, path)
+        checkpoint.prune()
+        if not resume:
+            checkpoint.clear()
+        else:
+            counts = checkpoint.counts()
+            if any(counts.values()):
+                logger.info(f"[Checkpoint] {checkpoint.run_key} 이어서 실행: {counts}")
+        return checkpoint
+
+    def load(self, stage: str) -> Dict[str, Any]:
+        """단계 기록 전체 {종목코드: payload}"""
+        rows = self.db.query(
+            'SELECT stock_code, payload FROM jongga_checkpoint WHERE run_key = ? AND stage = ?',
+            (self.run_key, stage),
+        )
+        return {row['stock_code']: json.loads(row['payload']) for row in rows}
+
+    def save(self, stage: str, stock_code: str, payload: Any) -> None:
+        try:
+            self.db.execute(
+                'INSERT OR REPLACE INTO jongga_checkpoint (run_key, stage, stock_code, payload, updated_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (self.run_key, stage, str(stock_code),
+                 json.dumps(payload, ensure_ascii=False, cls=NumpyEncoder), time.time()),
+            )
+        except Exception as e:
+            # 기록 실패는 실행을 막지 않는다 (이어하기만 불가)
+            logger.warning(f"[Checkpoint] 저장 실패 ({self.run_key}/{stage}/{stock_code}): {e}")
+
+    def discard(self, stock_code: str) -> None:
+        """종목의 모든 단계 기록 삭제 (이번 실행에서 다시 수집/분석)"""
+        self.discarded.add(str(stock_code))
+        try:
+            self.db.execute(
+                'DELETE FROM jongga_checkpoint WHERE run_key = ? AND stock_code = ?',
+                (self.run_key, str(stock_code)),
+            )
+        except Exception as e:
+            logger.warning(f"[Checkpoint] 삭제 실패 ({self.run_key}/{stock_code}): {e}")
+
+    def counts(self) -> Dict[str, int]:
+        rows = self.db.query(
+            'SELECT stage, COUNT(*) AS n FROM jongga_checkpoint WHERE run_key = ? GROUP BY stage',
+            (self.run_key,),
+        )
+        return {row['stage']: row['n'] for row in rows}
+
+    def clear(self) -> None:
+        self.db.execute('DELETE FROM jongga_checkpoint WHERE run_key = ?', (self.run_key,))
+
+    def complete(self) -> None:
+        """실행 완료 - 기록 삭제"""
+        if any(self.restored.values()):
+            logger.info(f"[Checkpoint] {self.run_key} 완료 (복원된 종목: {self.restored})")
+        self.clear()
+
+    def prune(self) -> None:
+        self.db.execute(
+            'DELETE FROM jongga_checkpoint WHERE updated_at < ?',
+            (time.time() - KEEP_DAYS * 86400,),
+        )
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+종가베팅 결과 등급 재산정 작업 (규칙 버전 단위)
+
+- 등급 임계값(SignalConfig / PRICE_CHANGE)으로 규칙 버전 해시를 만들고,
+  jongga_v2_results_*.json / jongga_v2_latest.json을 버전당 1회만 재산정하여 제자리에 저장한다.
+- 재산정 결과(grade, by_grade, 정렬)와 규칙 버전은 payload의 'grading' 필드에 함께 기록된다.
+- 매니페스트(jongga_rescore_manifest.json)에 (규칙 버전, size, mtime_ns)를 남겨
+  이미 최신인 파일은 열지 않고 건너뛴다.
+- 조회 API는 재산정하지 않고 저장된 결과만 읽는다 (write-on-read 제거).
+"""
+
+import fcntl
+import glob
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from engine.config import SignalConfig
+from engine.constants import FILE_PATHS, PRICE_CHANGE
+from engine.grade_classifier import GradeClassifier, GRADE_BY_CODE
+from engine.data_catalog import record_file
+from engine.jongga_archive import archive_result_file, date_from_results_filename
+from engine.utils import NumpyEncoder
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'jongga_rescore_manifest.json'
+RESULTS_PATTERN = FILE_PATHS.JONGGA_RESULTS_TEMPLATE.format(date='*')
+# 규칙이 아닌 재산정 방식 자체가 바뀌면 올린다
+RESCORE_SCHEMA = 1
+_GRADE_KEYS = ("S", "A", "B", "C", "D")
+_GRADE_PRIORITY = {"S": 3, "A": 2, "B": 1}
+
+
+def grade_rules_version(config: Optional[SignalConfig] = None) -> str:
+    """등급 판정 임계값으로 만든 규칙 버전 (임계값이 바뀌면 자동으로 달라짐)"""
+    config = config or SignalConfig()
+    rules = {
+        'schema': RESCORE_SCHEMA,
+        'trading_value': [config.trading_value_s, config.trading_value_a, config.trading_value_b],
+        'min_score': [config.min_s_grade, config.min_a_grade, config.min_b_grade],
+        'change_pct_min': PRICE_CHANGE.MIN,
+    }
+    digest = hashlib.sha1(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()
+    return f"grade-{digest[:12]}"
+
+
+def _signal_sort_key(signal: dict) -> tuple:
+    """Grade(S>A>B) 우선, 이후 점수 내림차순"""
+    grade_value = _GRADE_PRIORITY.get(str(signal.get("grade", "")).strip().upper(), 0)
+    raw_score = signal.get("score", 0)
+    score_value = raw_score.get("total", 0) if isinstance(raw_score, dict) else raw_score
+    try:
+        numeric_score = float(score_value or 0)
+    except Exception:
+        numeric_score = 0
+    return grade_value, numeric_score
+
+
+def _grade_columns(signals: List[dict]):
+    """시그널 리스트 -> (행 인덱스, 거래대금, 등락률, 총점, 양매수) 열. 값이 깨진 시그널은 제외."""
+    rows, trading_value, change_pct, total, dual_buy = [], [], [], [], []
+    for i, sig in enumerate(signals):
+        if not isinstance(sig, dict):
+            continue
+        try:
+            score = sig.get("score") or {}
+            score_details = sig.get("score_details") or {}
+            tv = float(sig.get("trading_value", 0) or 0)
+            change = float(sig.get("change_pct", 0) or 0)
+            score_total = int((score.get("total") if isinstance(score, dict) else score) or 0)
+            foreign_net_buy = float(score_details.get("foreign_net_buy", 0) or 0)
+            inst_net_buy = float(score_details.get("inst_net_buy", 0) or 0)
+        except Exception:
+            continue
+        rows.append(i)
+        trading_value.append(tv)
+        change_pct.append(change)
+        total.append(score_total)
+        dual_buy.append(foreign_net_buy > 0 and inst_net_buy > 0)
+    return (
+        rows,
+        np.array(trading_value, dtype=np.float64),
+        np.array(change_pct, dtype=np.float64),
+        np.array(total, dtype=np.int64),
+        np.array(dual_buy, dtype=bool),
+    )
+
+
+def rescore_payload(data: dict, config: Optional[SignalConfig] = None, rules_version: Optional[str] = None) -> bool:
+    """
+    종가베팅 payload의 signals grade / by_grade / 정렬을 현재 규칙으로 재산정 (in-place)
+
+    Returns:
+        payload 변경 여부 (grading 메타데이터 갱신 포함)
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("signals"), list):
+        return False
+
+    signals = data["signals"]
+    rules_version = rules_version or grade_rules_version(config)
+    changed = False
+
+    rows, trading_value, change_pct, total, dual_buy = _grade_columns(signals)
+    if rows:
+        codes = GradeClassifier(config).classify_batch(trading_value, change_pct, total, dual_buy)
+        for row, code in zip(rows, codes.tolist()):
+            grade = GRADE_BY_CODE[code]
+            new_grade = grade.value if grade else "D"
+            if str(signals[row].get("grade", "")).strip().upper() != new_grade:
+                signals[row]["grade"] = new_grade
+                changed = True
+
+    grade_count = dict.fromkeys(_GRADE_KEYS, 0)
+    for sig in signals:
+        if isinstance(sig, dict):
+            grade = str(sig.get("grade", "D")).strip().upper()
+            grade_count[grade] = grade_count.get(grade, 0) + 1
+
+    # 기존 by_grade의 숫자 값은 유지하되 집계된 등급으로 덮어쓴다
+    new_by_grade = dict.fromkeys(_GRADE_KEYS, 0)
+    prev_by_grade = data.get("by_grade")
+    if isinstance(prev_by_grade, dict):
+        for key in _GRADE_KEYS:
+            value = prev_by_grade.get(key)
+            if isinstance(value, (int, float)):
+                new_by_grade[key] = int(value)
+    for key, count in grade_count.items():
+        if key in new_by_grade or count > 0:
+            new_by_grade[key] = count
+    if data.get("by_grade") != new_by_grade:
+        data["by_grade"] = new_by_grade
+        changed = True
+
+    order = sorted(range(len(signals)), key=lambda i: _signal_sort_key(signals[i]) if isinstance(signals[i], dict) else (0, 0), reverse=True)
+    if order != list(range(len(signals))):
+        data["signals"] = [signals[i] for i in order]
+        changed = True
+
+    grading = data.get("grading") if isinstance(data.get("grading"), dict) else {}
+    if changed or grading.get("rules_version") != rules_version:
+        data["grading"] = {'rules_version': rules_version, 'rescored_at': datetime.now().isoformat()}
+        changed = True
+
+    return changed
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
+    os.replace(tmp_path, path)
+
+
+def _load_manifest(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except Exception:
+        return {}
+
+
+def run_rescore_job(data_dir: Optional[str] = None, force: bool = False, config: Optional[SignalConfig] = None) -> Dict[str, Any]:
+    """
+    모든 종가베팅 결과 파일을 현재 규칙 버전으로 재산정
+
+    Args:
+        data_dir: 데이터 디렉토리 (기본: FILE_PATHS.DATA_DIR)
+        force: 매니페스트/버전과 무관하게 전체 재산정
+
+    Returns:
+        {'rules_version', 'scanned', 'rescored', 'skipped', 'failed'}
+    """
+    data_dir = data_dir or FILE_PATHS.DATA_DIR
+    rules_version = grade_rules_version(config)
+    summary = {'rules_version': rules_version, 'scanned': 0, 'rescored': 0, 'skipped': 0, 'failed': 0}
+    if not os.path.isdir(data_dir):
+        return summary
+
+    manifest_path = os.path.join(data_dir, MANIFEST_FILENAME)
+    paths = sorted(glob.glob(os.path.join(data_dir, RESULTS_PATTERN)))
+    latest_path = os.path.join(data_dir, FILE_PATHS.JONGGA_LATEST)
+    if os.path.exists(latest_path):
+        paths.append(latest_path)
+
+    # 워커/스크립트가 동시에 실행해도 한 번만 처리되도록 파일 락 안에서 수행
+    with open(manifest_path + '.lock', 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            manifest = _load_manifest(manifest_path)
+            entries = manifest.get('files', {}) if manifest.get('rules_version') == rules_version else {}
+            next_entries: Dict[str, Dict[str, Any]] = {}
+
+            for path in paths:
+                name = os.path.basename(path)
+                summary['scanned'] += 1
+                try:
+                    stat = os.stat(path)
+                    entry = entries.get(name)
+                    if not force and entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+                        next_entries[name] = entry
+                        summary['skipped'] += 1
+                        continue
+
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+
+                    current = (data.get('grading') or {}).get('rules_version') if isinstance(data, dict) else None
+                    if (force or current != rules_version) and rescore_payload(data, config, rules_version):
+                        _write_json_atomic(path, data)
+                        if date_from_results_filename(path):
+                            archive_result_file(path)
+                        else:
+                            record_file(path)  # jongga_v2_latest.json (데이터 상태 API)
+                        summary['rescored'] += 1
+                        stat = os.stat(path)
+                    else:
+                        summary['skipped'] += 1
+
+                    next_entries[name] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+                except Exception as e:
+                    summary['failed'] += 1
+                    logger.warning(f"[Rescore] {name} 재산정 실패: {e}")
+
+            _write_json_atomic(manifest_path, {
+                'rules_version': rules_version,
+                'updated_at': datetime.now().isoformat(),
+                'files': next_entries,
+            })
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    if summary['rescored'] or summary['failed']:
+        logger.info(
+            f"[Rescore] {rules_version}: {summary['rescored']} rescored, "
+            f"{summary['skipped']} up-to-date, {summary['failed']} failed"
+        )
+    return summary
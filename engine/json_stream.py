@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+증분 JSON 배열 파서 (LLM 스트리밍 응답용)
+
+- feed()로 받은 텍스트 조각을 이어 붙이며, 최상위 배열의 객체 원소가 닫히는 즉시 반환한다.
+- 배열 앞의 설명 문장/코드 블록 표시(```json)는 건너뛴다. '['는 뒤에 '{' 또는 ']'가 올 때만
+  배열 시작으로 본다 (프롬프트를 따라 쓴 "[입력 데이터]" 같은 텍스트 무시).
+- 원소 하나가 깨져 있어도 그 원소만 버리고(errors 증가) 나머지 원소는 유지한다.
+- 문자열 안의 줄바꿈 등 제어 문자는 허용한다 (json.loads strict=False).
+"""
+
+import json
+from typing import Any, List, Tuple
+
+
+class JsonArrayStream:
+    """최상위 JSON 배열의 객체 원소를 스트리밍으로 추출"""
+
+    def __init__(self):
+        self._buf = ''
+        self._pos = 0          # 다음에 검사할 _buf 인덱스
+        self._start = None     # 진행 중인 원소의 시작 인덱스
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.started = False
+        self.finished = False
+        self.errors = 0
+
+    def feed(self, text: str) -> List[Any]:
+        """텍스트 조각 추가 → 이번에 완성된 원소 목록"""
+        if self.finished or not text:
+            return []
+
+        buf = self._buf + text
+        n = len(buf)
+        i = self._pos
+        out: List[Any] = []
+
+        while i < n and not self.finished:
+            c = buf[i]
+
+            if not self.started:
+                if c == '[':
+                    j = i + 1
+                    while j < n and buf[j].isspace():
+                        j += 1
+                    if j == n:
+                        break  # 다음 조각을 봐야 판단 가능
+                    if buf[j] in '{]':
+                        self.started = True
+                        i = j
+                        continue
+                i += 1
+                continue
+
+            if self._start is None:
+                # 원소 사이 (쉼표/공백/잡음 무시)
+                if c == '{':
+                    self._start = i
+                    self._depth = 1
+                elif c == ']':
+                    self.finished = True
+                i += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+            elif c == '"':
+                self._in_string = True
+            elif c in '{[':
+                self._depth += 1
+            elif c in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        out.append(json.loads(buf[self._start:i + 1], strict=False))
+                    except json.JSONDecodeError:
+                        self.errors += 1
+                    self._start = None
+            i += 1
+
+        # 처리 끝난 앞부분은 버린다
+        keep = self._start if self._start is not None else i
+        self._buf = buf[keep:]
+        self._pos = i - keep
+        if self._start is not None:
+            self._start = 0
+        return out
+
+    def close(self) -> None:
+        """입력 종료. 닫히지 않은 원소가 남아 있으면 오류로 센다."""
+        if self._start is not None:
+            self.errors += 1
+            self._start = None
+        self._buf = ''
+        self._pos = 0
+
+    @property
+    def complete(self) -> bool:
+        """배열이 정상적으로 닫혔고 버린 원소가 없음"""
+        return self.finished and self.errors == 0
+
+
+def parse_json_array(text: str) -> Tuple[List[Any], JsonArrayStream]:
+    """전체 텍스트를 한 번에 파싱 → (원소 목록, 파서 상태)"""
+    parser = JsonArrayStream()
+    items = parser.feed(text)
+    parser.close()
+    return items, parser
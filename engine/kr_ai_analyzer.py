@@ -10,6 +10,7 @@ Created: 2024-12-01
 Refactored: 2025-02-11 (Phase 4)
 """
 import os
+import json
 import logging
 from typing import Dict, Optional, List
 from datetime import datetime
@@ -30,6 +31,7 @@ from engine.constants import (
     NEWS_COLLECTION,
     FILE_PATHS,
 )
+from engine.llm_cache import get_llm_cache
 from engine.models import NewsItem
 
 logger = logging.getLogger(__name__)
@@ -267,7 +269,8 @@ class KrAiAnalyzer:
     def analyze_stock(
         self,
         ticker: str,
-        news_items: Optional[List[Dict]] = None
+        news_items: Optional[List[Dict]] = None,
+        use_cache: bool = True
     ) -> Dict:
         """
         종목 AI 분석
@@ -275,6 +278,7 @@ class KrAiAnalyzer:
         Args:
             ticker: 종목 코드
             news_items: (Optional) 사전 수집된 뉴스 리스트
+            use_cache: False면 LLM 결과 캐시를 건너뛰고 다시 분석 (강제 재분석)
 
         Returns:
             분석 결과 딕셔너리
@@ -293,10 +297,10 @@ class KrAiAnalyzer:
                 news_list = self._convert_to_news_items(news_items)
 
             # 3. Gemini 분석
-            gemini_result = self.gemini_strategy.analyze(stock_info, news_list)
+            gemini_result = self._analyze_with_cache('gemini', self.gemini_strategy, stock_info, news_list, use_cache)
 
             # 4. GPT 분석
-            gpt_result = self.gpt_strategy.analyze(stock_info, news_list)
+            gpt_result = self._analyze_with_cache('gpt', self.gpt_strategy, stock_info, news_list, use_cache)
 
             # 5. 결과 통합
             result = {
@@ -319,6 +323,45 @@ class KrAiAnalyzer:
             logger.error(f"종목 분석 실패 ({ticker}): {e}")
             return {"error": str(e)}
 
+    def _analyze_with_cache(
+        self,
+        provider: str,
+        strategy: AIStrategy,
+        stock_info: Dict,
+        news_list: List[NewsItem],
+        use_cache: bool
+    ) -> Optional[Dict]:
+        """
+        전략 분석 결과를 LLM 결과 캐시로 감싼다
+
+        프롬프트 대신 분석 입력(종목 정보 + 뉴스 제목/출처)을 키로 사용한다.
+        """
+        cache = get_llm_cache()
+        if cache is None or not strategy.is_available:
+            return strategy.analyze(stock_info, news_list)
+
+        prompt = json.dumps({
+            'stock': stock_info,
+            'news': [[n.title, n.source, n.weight] for n in news_list],
+        }, ensure_ascii=False, sort_keys=True, default=str)
+        model = type(strategy).__name__
+
+        if use_cache:
+            try:
+                cached = cache.get(provider, model, prompt)
+                if cached:
+                    return cached
+            except Exception as e:
+                logger.warning(f"[LLM Cache] 조회 실패 ({provider}): {e}")
+
+        result = strategy.analyze(stock_info, news_list)
+        if result:
+            try:
+                cache.put(provider, model, prompt, result)
+            except Exception as e:
+                logger.warning(f"[LLM Cache] 저장 실패 ({provider}): {e}")
+        return result
+
     def _get_stock_info(self, ticker: str) -> Optional[Dict]:
         """
         종목 기본 정보 조회 (실제 데이터 우선)
@@ -442,7 +485,8 @@ class KrAiAnalyzer:
     def analyze_multiple_stocks(
         self,
         tickers: List[str],
-        news_map: Optional[Dict] = None
+        news_map: Optional[Dict] = None,
+        use_cache: bool = True
     ) -> Dict:
         """
         여러 종목 분석 (배치)
@@ -450,6 +494,7 @@ class KrAiAnalyzer:
         Args:
             tickers: 종목 코드 리스트
             news_map: (Optional) 종목별 뉴스 맵 {ticker: news_items}
+            use_cache: False면 LLM 결과 캐시를 건너뛰고 다시 분석 (강제 재분석)
 
         Returns:
             분석 결과 딕셔너리
@@ -468,7 +513,7 @@ class KrAiAnalyzer:
 
                 # 미리 수집된 뉴스 사용
                 news = news_map.get(ticker) if news_map else None
-                result = self.analyze_stock(ticker, news_items=news)
+                result = self.analyze_stock(ticker, news_items=news, use_cache=use_cache)
 
                 if result and 'error' not in result:
                     results['signals'].append(result)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+무거운 외부 라이브러리 지연 import
+
+    pd = lazy_import('pandas')
+
+모듈 로드 시점에는 대리 객체만 만들고, 첫 속성 접근(pd.read_csv 등) 때 실제로 import한다.
+라우트/서비스 모듈 import만으로 pandas 등이 로드되어 워커 기동과 CLI 시작이 느려지는 것을 막는다.
+모듈 수준에서 속성을 평가하는 코드(함수 시그니처 어노테이션 등)가 있으면
+`from __future__ import annotations`를 함께 쓴다.
+"""
+
+import importlib
+import sys
+import threading
+import types
+
+
+class LazyModule(types.ModuleType):
+    """첫 속성 접근 시 실제 모듈로 위임하는 대리 모듈"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+        self.__dict__['_lazy_lock'] = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_target']
+        if module is None:
+            with self.__dict__['_lazy_lock']:
+                module = self.__dict__['_lazy_target']
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__['_lazy_target'] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazy_target'] is not None else 'not loaded'
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """이미 로드된 모듈이면 그대로, 아니면 LazyModule 반환"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
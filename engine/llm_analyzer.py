@@ -13,17 +13,17 @@ import logging
 import time
 import json
 import re
-from typing import List, Dict, Optional, Callable, Any
+import threading
+from typing import AsyncIterator, List, Dict, Optional, Callable, Any, Tuple
 import asyncio
 import random
 from abc import ABC, abstractmethod
 
-try:
-    from google import genai
-except ImportError:
-    genai = None
-
 from engine.config import app_config
+from engine.json_stream import JsonArrayStream, parse_json_array
+from engine.llm_cache import cached_llm_call, get_llm_cache
+from engine.llm_scheduler import estimate_tokens, get_llm_scheduler
+from engine.metrics import inc, observe, timer
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +51,10 @@ class RetryConfig:
     ]
 
 
+class BatchParseError(ValueError):
+    """배치 응답을 JSON 배열로 파싱하지 못함 (청크를 나눠 재시도할 수 있음)"""
+
+
 GEMINI_RETRY_MODEL_CHAIN = [
     "gemini-2.0-flash-lite",
     "gemini-2.5-flash-lite",
@@ -60,6 +64,18 @@ GEMINI_RETRY_MODEL_CHAIN = [
 ]
 
 
+def _record_llm_usage(provider: str, model: str, attempt: int, prompt_tokens: Optional[int],
+                      completion_tokens: Optional[int], estimated_tokens: int) -> None:
+    """LLM 응답 1건의 모델/폴백/토큰 메트릭 기록 (usage가 없으면 추정 토큰만)"""
+    if attempt:
+        inc('llm_fallback_total', provider=provider, model=model)
+    if prompt_tokens is None and completion_tokens is None:
+        inc('llm_tokens_total', estimated_tokens, provider=provider, model=model, kind='estimated')
+        return
+    inc('llm_tokens_total', prompt_tokens or 0, provider=provider, model=model, kind='prompt')
+    inc('llm_tokens_total', completion_tokens or 0, provider=provider, model=model, kind='completion')
+
+
 class LLMRetryStrategy(ABC):
     """LLM 재시도 전략 인터페이스"""
 
@@ -78,6 +94,80 @@ class LLMRetryStrategy(ABC):
         """모델명 반환 (추상 메서드)"""
         pass
 
+    async def execute_stream(
+        self,
+        prompt: str,
+        timeout: float,
+        model: str
+    ) -> AsyncIterator[str]:
+        """LLM 스트리밍 호출 (기본: 전체 응답을 한 번에 전달)"""
+        yield await self.execute(prompt, timeout, model)
+
+
+def _close_iterator(iterator) -> None:
+    """SDK 스트림/제너레이터 닫기 (HTTP 응답 해제). 다른 스레드에서 실행 중인 제너레이터면 무시"""
+    close = getattr(iterator, 'close', None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception:
+        pass
+
+
+async def _iterate_in_thread(open_stream: Callable, extract_text: Callable, idle_timeout: float) -> AsyncIterator[str]:
+    """
+    동기 스트리밍 SDK 이터레이터를 별도 스레드에서 돌리며 텍스트 조각을 비동기로 전달
+
+    idle_timeout: 조각 사이 최대 대기 시간 (전체 응답 시간이 아님)
+    소비 측이 중간에 멈추면(타임아웃, 취소, aclose) stop 이벤트로 워커가 조각마다 멈추고,
+    SDK 이터레이터를 닫아 남은 응답을 계속 받지 않는다.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    streams = []
+
+    def _put(item):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            pass  # 소비 측 루프가 이미 종료됨
+
+    def _worker():
+        iterator = None
+        try:
+            iterator = open_stream()
+            streams.append(iterator)
+            for chunk in iterator:
+                if stop.is_set():
+                    break
+                text = extract_text(chunk)
+                if text:
+                    _put(('data', text))
+            _put(('done', None))
+        except BaseException as e:
+            if not stop.is_set():
+                _put(('error', e))
+        finally:
+            if iterator is not None:
+                _close_iterator(iterator)
+
+    threading.Thread(target=_worker, daemon=True).start()
+    try:
+        while True:
+            kind, value = await asyncio.wait_for(queue.get(), timeout=idle_timeout)
+            if kind == 'data':
+                yield value
+            elif kind == 'error':
+                raise value
+            else:
+                return
+    finally:
+        stop.set()
+        for iterator in streams:
+            _close_iterator(iterator)
+
 
 class GeminiRetryStrategy(LLMRetryStrategy):
     """Gemini 재시도 전략"""
@@ -99,18 +189,79 @@ class GeminiRetryStrategy(LLMRetryStrategy):
                 contents=prompt
             )
 
-        return await self._call_with_retry(_call_gemini, timeout)
+        return await self._call_with_retry(_call_gemini, timeout, estimate_tokens(prompt))
+
+    async def execute_stream(self, prompt: str, timeout: float, model: str) -> AsyncIterator[str]:
+        """
+        Gemini 스트리밍 호출
 
-    async def _call_with_retry(self, call_fn: Callable, timeout: float) -> str:
-        """Gemini 재시도 로직"""
+        첫 조각을 받기 전 실패하면 execute()와 같은 방식으로 다음 모델로 넘어가고,
+        일부를 이미 전달한 뒤 실패하면 (중복 방지를 위해) 그대로 예외를 던진다.
+        """
         total_models = len(self._model_chain)
+        scheduler = get_llm_scheduler()
+        tokens = estimate_tokens(prompt)
 
         for attempt, current_model in enumerate(self._model_chain):
             self._current_model = current_model
+            emitted = False
             try:
-                resp = await asyncio.wait_for(
-                    asyncio.to_thread(call_fn),
-                    timeout=timeout
+                # 스트리밍은 소비 측 처리 시간까지 포함된다
+                with timer('llm_attempt_seconds', provider='gemini', model=current_model, mode='stream'):
+                    async with scheduler.slot('gemini', current_model, tokens):
+                        stream = _iterate_in_thread(
+                            lambda: self.client.models.generate_content_stream(model=current_model, contents=prompt),
+                            lambda chunk: getattr(chunk, 'text', None),
+                            timeout,
+                        )
+                        try:
+                            async for text in stream:
+                                emitted = True
+                                yield text
+                        finally:
+                            await stream.aclose()  # 소비 측이 멈추면 워커 스레드도 바로 정지
+                _record_llm_usage('gemini', current_model, attempt, None, None, tokens)
+                return
+
+            except Exception as e:
+                if emitted or attempt >= total_models - 1:
+                    raise
+
+                inc('llm_retries_total', provider='gemini', model=current_model)
+                next_model = self._model_chain[attempt + 1]
+                wait_time = min(
+                    (RetryConfig.BASE_WAIT * (2 ** attempt)) + random.uniform(0.5, 1.5),
+                    RetryConfig.MAX_WAIT
+                )
+                logger.warning(
+                    f"[GEMINI] 스트리밍 실패({type(e).__name__})로 모델 전환: {current_model} -> {next_model} "
+                    f"(대기 {wait_time:.1f}s, {attempt + 1}/{total_models})"
+                )
+                await asyncio.sleep(wait_time)
+
+    async def _call_with_retry(self, call_fn: Callable, timeout: float, tokens: int = 0) -> str:
+        """Gemini 재시도 로직 (모델별 호출은 LLM 스케줄러의 레이트 리밋/동시성 제어를 받음)"""
+        total_models = len(self._model_chain)
+        scheduler = get_llm_scheduler()
+
+        for attempt, current_model in enumerate(self._model_chain):
+            self._current_model = current_model
+            if attempt:
+                inc('llm_retries_total', provider='gemini', model=self._model_chain[attempt - 1])
+            try:
+                with timer('llm_attempt_seconds', provider='gemini', model=current_model, mode='call'):
+                    async with scheduler.slot('gemini', current_model, tokens):
+                        resp = await asyncio.wait_for(
+                            asyncio.to_thread(call_fn),
+                            timeout=timeout
+                        )
+
+                usage = getattr(resp, 'usage_metadata', None)
+                _record_llm_usage(
+                    'gemini', current_model, attempt,
+                    getattr(usage, 'prompt_token_count', None),
+                    getattr(usage, 'candidates_token_count', None),
+                    tokens,
                 )
 
                 # 응답 모델 버전 로깅 (디버그 전용, _current_model은 덮어쓰지 않음)
@@ -187,9 +338,20 @@ class ZAIRetryStrategy(LLMRetryStrategy):
                 temperature=0.1
             )
 
-        response = await asyncio.wait_for(
-            asyncio.to_thread(_call_zai),
-            timeout=timeout
+        tokens = estimate_tokens(prompt)
+        with timer('llm_attempt_seconds', provider='zai', model=self.model, mode='call'):
+            async with get_llm_scheduler().slot('zai', self.model, tokens):
+                response = await asyncio.wait_for(
+                    asyncio.to_thread(_call_zai),
+                    timeout=timeout
+                )
+
+        usage = getattr(response, 'usage', None)
+        _record_llm_usage(
+            'zai', self.model, 0,
+            getattr(usage, 'prompt_tokens', None),
+            getattr(usage, 'completion_tokens', None),
+            tokens,
         )
 
         # OpenAI 응답에서 텍스트 추출
@@ -197,6 +359,37 @@ class ZAIRetryStrategy(LLMRetryStrategy):
             return response.choices[0].message.content
         return ""
 
+    async def execute_stream(self, prompt: str, timeout: float, model: str) -> AsyncIterator[str]:
+        """Z.ai 스트리밍 호출 (stream=True)"""
+        messages = [
+            {"role": "system", "content": "당신은 주식 투자 전문가입니다."},
+            {"role": "user", "content": prompt}
+        ]
+
+        def _open_stream():
+            return self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.1,
+                stream=True
+            )
+
+        def _extract(chunk):
+            if not chunk.choices:
+                return None
+            return getattr(chunk.choices[0].delta, 'content', None)
+
+        tokens = estimate_tokens(prompt)
+        with timer('llm_attempt_seconds', provider='zai', model=self.model, mode='stream'):
+            async with get_llm_scheduler().slot('zai', self.model, tokens):
+                stream = _iterate_in_thread(_open_stream, _extract, timeout)
+                try:
+                    async for text in stream:
+                        yield text
+                finally:
+                    await stream.aclose()
+        _record_llm_usage('zai', self.model, 0, None, None, tokens)
+
     def get_model_name(self) -> str:
         return self.model
 
@@ -281,7 +474,9 @@ class LLMAnalyzer:
 
     def _create_gemini_client(self, api_key: str) -> None:
         """Create Gemini client"""
-        if genai is None:
+        try:
+            from google import genai  # 무거운 SDK라 실제 클라이언트 생성 시점에 로드
+        except ImportError:
             logger.error("google-genai package missing")
             return
 
@@ -332,12 +527,14 @@ class LLMAnalyzer:
     async def analyze_news_sentiment(
         self,
         stock_name: str,
-        news_items: List[Dict]
+        news_items: List[Dict],
+        use_cache: bool = True
     ) -> Optional[Dict]:
         """
         뉴스 감성 분석 (단일 종목)
 
         Refactored to use retry strategy.
+        use_cache=False면 LLM 결과 캐시를 건너뛰고 다시 호출한다 (강제 재분석).
         """
         if not self.client or not news_items:
             return None
@@ -345,14 +542,18 @@ class LLMAnalyzer:
         try:
             prompt = self._build_sentiment_prompt(stock_name, news_items)
 
-            response_content = await self._execute_llm_call(
-                prompt=prompt,
-                timeout=app_config.LLM_API_TIMEOUT
-            )
+            async def _call():
+                response_content = await self._execute_llm_call(
+                    prompt=prompt,
+                    timeout=app_config.LLM_API_TIMEOUT
+                )
+                return self._parse_json_response(
+                    response_text=response_content,
+                    stock_name=stock_name
+                )
 
-            return self._parse_json_response(
-                response_text=response_content,
-                stock_name=stock_name
+            return await cached_llm_call(
+                self.provider, self._cache_model_name(), prompt, _call, use_cache=use_cache
             )
 
         except Exception as e:
@@ -362,39 +563,120 @@ class LLMAnalyzer:
     async def analyze_news_batch(
         self,
         items: List[Dict],
-        market_status: Dict = None
+        market_status: Dict = None,
+        use_cache: bool = True,
+        raise_parse_errors: bool = False
     ) -> Dict[str, Dict]:
         """
         뉴스 + 심층 데이터 일괄 분석 (Batch Processing)
 
         Refactored to use retry strategy.
+        use_cache=False면 LLM 결과 캐시를 건너뛰고 다시 호출한다 (강제 재분석).
+        raise_parse_errors=True면 응답 파싱 실패 시 빈 결과 대신 BatchParseError를 던진다.
         """
         if not self.client or not items:
             return {}
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             prompt = self._build_batch_prompt(items, market_status)
 
-            response_content = await self._execute_llm_call(
-                prompt=prompt,
-                timeout=app_config.ANALYSIS_LLM_API_TIMEOUT
-            )
+            complete = [True]
+
+            async def _call():
+                response_content = await self._execute_llm_call(
+                    prompt=prompt,
+                    timeout=app_config.ANALYSIS_LLM_API_TIMEOUT
+                )
+                results_list, complete[0] = self._parse_batch_elements(response_content, strict=True)
+                return self._build_result_map(results_list)
 
-            results_list = self._parse_batch_response(
-                response_text=response_content
+            # 깨진 원소를 버린 부분 결과는 캐시하지 않는다
+            return await cached_llm_call(
+                self.provider, self._cache_model_name(), prompt, _call, use_cache=use_cache,
+                should_cache=lambda result: bool(result) and complete[0]
             )
 
-            return self._build_result_map(results_list)
+        except BatchParseError:
+            if raise_parse_errors:
+                raise
+            return {}
 
         except Exception as e:
             logger.error(f"{self.provider} 배치 분석 실패: {e}")
             return {}
         finally:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
+            observe('llm_batch_seconds', elapsed, provider=self.provider, mode='call')
             logger.info(f"[{self.provider.upper()}] Batch Analysis ({len(items)} stocks): {elapsed:.2f}s")
 
+    async def stream_news_batch(
+        self,
+        items: List[Dict],
+        market_status: Dict = None,
+        use_cache: bool = True
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        뉴스 + 심층 데이터 일괄 분석 (스트리밍 모드)
+
+        모델 출력을 스트리밍으로 받아 종목 객체가 닫히는 즉시 (종목명, 결과)를 내보낸다.
+        깨진 원소는 건너뛰고, 유효한 원소가 하나도 없으면 BatchParseError를 던진다.
+        이미 내보낸 결과는 이후 호출 오류와 무관하게 유효하다.
+        """
+        if not self.client or not items:
+            return
+
+        prompt = self._build_batch_prompt(items, market_status)
+        model_name = self._cache_model_name()
+        cache = get_llm_cache()
+
+        if cache is not None and use_cache:
+            try:
+                cached = await asyncio.to_thread(cache.get, self.provider, model_name, prompt)
+            except Exception as e:
+                logger.warning(f"[LLM Cache] 조회 실패 ({self.provider}): {e}")
+                cached = None
+            if cached:
+                for name, result in cached.items():
+                    yield name, result
+                return
+
+        if not self._retry_strategy:
+            raise RuntimeError("Retry strategy not initialized")
+
+        start_time = time.perf_counter()
+        parser = JsonArrayStream()
+        results: Dict[str, Dict] = {}
+        received_text = False
+
+        async for text in self._retry_strategy.execute_stream(
+            prompt, app_config.ANALYSIS_LLM_API_TIMEOUT, model_name
+        ):
+            received_text = received_text or bool(text.strip())
+            for element in parser.feed(text):
+                for name, result in self._build_result_map([element]).items():
+                    if name not in results:
+                        results[name] = result
+                        yield name, result
+        parser.close()
+
+        elapsed = time.perf_counter() - start_time
+        observe('llm_batch_seconds', elapsed, provider=self.provider, mode='stream')
+        logger.info(
+            f"[{self.provider.upper()}] Streaming Batch ({len(items)} stocks): "
+            f"{len(results)} results, {parser.errors} malformed, {elapsed:.2f}s"
+        )
+
+        if not results and received_text and not parser.complete:
+            raise BatchParseError(f"유효한 배치 원소 없음 (malformed={parser.errors})")
+
+        if cache is not None and results and parser.complete:
+            try:
+                await asyncio.to_thread(cache.put, self.provider, model_name, prompt, results)
+            except Exception as e:
+                logger.warning(f"[LLM Cache] 저장 실패 ({self.provider}): {e}")
+
     async def generate_market_summary(self, signals: List[Dict]) -> str:
         """
         최종 시장 요약 리포트 생성
@@ -536,6 +818,10 @@ Format: {{"score": 2, "reason": "종합적인 요약 이유"}}
     # Private Methods - Execution
     # ========================================================================
 
+    def _cache_model_name(self) -> str:
+        """캐시 키용 모델명 (설정된 모델 기준 - 폴백 체인에서 실제 응답한 모델과 무관)"""
+        return getattr(self._retry_strategy, 'model', None) or "unknown"
+
     async def _execute_llm_call(
         self,
         prompt: str,
@@ -556,7 +842,8 @@ Format: {{"score": 2, "reason": "종합적인 요약 이유"}}
         )
 
         try:
-            return await self._retry_strategy.execute(prompt, timeout, model_name)
+            with timer('llm_request_seconds', provider=self.provider):
+                return await self._retry_strategy.execute(prompt, timeout, model_name)
 
         except asyncio.TimeoutError:
             logger.error(
@@ -601,18 +888,28 @@ Format: {{"score": 2, "reason": "종합적인 요약 이유"}}
             logger.debug(f"Raw: {result_text}")
             return None
 
-    def _parse_batch_response(self, response_text: str) -> List[Dict]:
-        """배치 JSON 응답 파싱"""
-        result_text = response_text.strip()
+    def _parse_batch_response(self, response_text: str, strict: bool = False) -> List[Dict]:
+        """배치 JSON 응답 파싱 (strict=True면 유효한 원소가 없을 때 BatchParseError)"""
+        return self._parse_batch_elements(response_text, strict)[0]
 
-        json_match = re.search(r'\[.*\]', result_text, re.DOTALL)
-        json_str = json_match.group(0) if json_match else result_text
+    def _parse_batch_elements(self, response_text: str, strict: bool = False) -> Tuple[List[Dict], bool]:
+        """
+        배치 JSON 배열의 원소 단위 파싱
 
-        try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as je:
-            logger.error(f"배치 JSON 파싱 실패: {je}")
-            return []
+        깨진 원소는 버리고 나머지는 유지한다.
+
+        Returns:
+            (원소 목록, 배열이 온전했는지 여부)
+        """
+        elements, parser = parse_json_array(response_text or "")
+        if parser.errors:
+            logger.warning(f"배치 JSON 원소 {parser.errors}개 파싱 실패 (유효 {len(elements)}개 유지)")
+
+        if not elements and not parser.complete and (response_text or "").strip():
+            logger.error(f"배치 JSON 파싱 실패: 유효한 원소 없음 (malformed={parser.errors})")
+            if strict:
+                raise BatchParseError(f"유효한 배치 원소 없음 (malformed={parser.errors})")
+        return elements, parser.complete
 
     def _build_result_map(self, results_list: List[Dict]) -> Dict[str, Dict]:
         """결과 매핑 생성"""
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 분석 결과 캐시 (내용 주소 기반, SQLite)
+
+- 키: sha256(provider, model, 정규화된 프롬프트). 프롬프트 입력(뉴스 제목, 점수, 시장 상황)이
+  같으면 재실행/재분석/스케줄러 재시도에서도 API를 다시 호출하지 않는다.
+- 성공한 결과(JSON 직렬화 가능한 값)만 저장한다.
+- TTL(LLM_CACHE_TTL_HOURS)이 지난 항목은 무시/삭제하고, 항목 수가
+  LLM_CACHE_MAX_ENTRIES를 넘으면 마지막 사용 시각이 오래된 것부터 지운다.
+- 강제 재분석은 호출부에서 use_cache=False로 우회한다 (결과는 새 값으로 갱신됨).
+- get_or_call의 SQLite 조회/저장은 이벤트 루프를 막지 않도록 asyncio.to_thread로 실행한다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from engine.config import app_config
+from engine.sqlite_db import get_database
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'llm_cache.db'
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at);
+"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """줄 단위 공백 정리 + 빈 줄 제거 (들여쓰기/개행 차이로 키가 달라지지 않도록)"""
+    lines = (' '.join(line.split()) for line in str(prompt).strip().splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def make_cache_key(provider: str, model: str, prompt: str) -> str:
+    raw = '\x00'.join([str(provider).lower(), str(model), normalize_prompt(prompt)])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class LLMResultCache:
+    """LLM 결과 영구 캐시"""
+
+    def __init__(self, path: str, ttl_sec: float, max_entries: int):
+        self.path = path
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self.db = get_database(path)
+        self._schema_ready = False
+        self._lock = threading.Lock()
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with self._lock:
+            if not self._schema_ready:
+                self.db.connection().executescript(_SCHEMA)
+                self._schema_ready = True
+
+    def get(self, provider: str, model: str, prompt: str) -> Optional[Any]:
+        self._ensure_schema()
+        key = make_cache_key(provider, model, prompt)
+        row = self.db.query_one('SELECT value, created_at FROM llm_cache WHERE key = ?', (key,))
+        if row is None:
+            return None
+
+        now = time.time()
+        if self.ttl_sec and now - row['created_at'] > self.ttl_sec:
+            self.db.execute('DELETE FROM llm_cache WHERE key = ?', (key,))
+            return None
+
+        self.db.execute('UPDATE llm_cache SET accessed_at = ?, hits = hits + 1 WHERE key = ?', (now, key))
+        return json.loads(row['value'])
+
+    def put(self, provider: str, model: str, prompt: str, value: Any) -> None:
+        self._ensure_schema()
+        key = make_cache_key(provider, model, prompt)
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        with self.db.transaction() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO llm_cache (key, provider, model, value, created_at, accessed_at, hits) '
+                'VALUES (?, ?, ?, ?, ?, ?, 0)',
+                (key, str(provider).lower(), str(model), payload, now, now),
+            )
+            self._prune(conn, now)
+
+    def _prune(self, conn, now: float) -> None:
+        if self.ttl_sec:
+            conn.execute('DELETE FROM llm_cache WHERE created_at < ?', (now - self.ttl_sec,))
+        if self.max_entries:
+            conn.execute(
+                'DELETE FROM llm_cache WHERE key IN ('
+                'SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        self._ensure_schema()
+        self.db.execute('DELETE FROM llm_cache')
+
+    def stats(self) -> dict:
+        self._ensure_schema()
+        row = self.db.query_one('SELECT COUNT(*) AS entries, COALESCE(SUM(hits), 0) AS hits FROM llm_cache')
+        return {'entries': row['entries'], 'hits': row['hits']}
+
+    async def get_or_call(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        call: Callable[[], Awaitable[Any]],
+        use_cache: bool = True,
+        should_cache: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """
+        캐시 조회 후 없으면 call() 실행, should_cache(결과)가 참이면 저장
+
+        Args:
+            use_cache: False면 조회를 건너뛰고 항상 호출 (강제 재분석). 결과는 저장한다.
+            should_cache: 저장 여부 판단 (기본: truthy. 부분 결과 등은 호출부에서 제외)
+        """
+        if use_cache:
+            try:
+                cached = await asyncio.to_thread(self.get, provider, model, prompt)
+            except Exception as e:
+                logger.warning(f"[LLM Cache] 조회 실패 ({provider}): {e}")
+                cached = None
+            if cached:
+                logger.debug(f"[LLM Cache] hit ({provider}/{model})")
+                return cached
+
+        result = await call()
+        if should_cache(result):
+            try:
+                await asyncio.to_thread(self.put, provider, model, prompt, result)
+            except Exception as e:
+                logger.warning(f"[LLM Cache] 저장 실패 ({provider}): {e}")
+        return result
+
+
+_cache: Optional[LLMResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResultCache]:
+    """프로세스 공유 캐시 (LLM_CACHE_ENABLED=false면 None)"""
+    global _cache
+    if not app_config.LLM_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResultCache(
+                os.getenv('LLM_CACHE_PATH', DEFAULT_CACHE_PATH),
+                ttl_sec=app_config.LLM_CACHE_TTL_HOURS * 3600,
+                max_entries=app_config.LLM_CACHE_MAX_ENTRIES,
+            )
+        return _cache
+
+
+async def cached_llm_call(
+    provider: str,
+    model: str,
+    prompt: str,
+    call: Callable[[], Awaitable[Any]],
+    use_cache: bool = True,
+    should_cache: Callable[[Any], bool] = bool,
+) -> Any:
+    """get_llm_cache().get_or_call() 단축 (캐시 비활성 시 그대로 호출)"""
+    cache = get_llm_cache()
+    if cache is None:
+        return await call()
+    return await cache.get_or_call(provider, model, prompt, call, use_cache=use_cache, should_cache=should_cache)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 호출 스케줄러 (provider/model별 레이트 리밋 + 적응형 동시성)
+
+- provider/model마다 RPM/TPM 토큰 버킷을 두고, 버킷이 비면 필요한 만큼만 기다린다.
+  (고정 request_delay 대신 실제 쿼터에 맞춰 처리량이 정해진다)
+- 동시 호출 수는 ANALYSIS_LLM_CONCURRENCY에서 시작해 AIMD로 조정한다: 성공하면 천천히 늘리고(+1/limit),
+  429/503 계열 오류면 절반으로 줄이고 버킷을 비운다.
+- 대기열은 우선순위 큐다. llm_priority(PRIORITY_INTERACTIVE) 안에서 시작한 호출
+  (사용자 재분석 등)은 대기 중인 대량 분석보다 먼저 슬롯을 받는다.
+- 이벤트 루프/스레드가 달라도(라우트마다 new_event_loop, 스케줄러 스레드) 한 프로세스 안에서
+  같은 예산을 공유한다. 상태는 threading.Lock으로 보호하고, 깨우기는 call_soon_threadsafe를 쓴다.
+
+한도 설정: LLM_RATE_LIMITS 환경변수(JSON)
+    {"gemini": {"rpm": 15, "tpm": 1000000}, "gemini/gemini-2.5-flash": {"rpm": 10}}
+    "provider/model" 항목이 "provider" 항목보다 우선한다.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from engine.config import app_config
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 10
+
+DEFAULT_RATE_LIMITS: Dict[str, Dict[str, Optional[float]]] = {
+    'gemini': {'rpm': 15, 'tpm': 1_000_000},
+    'gpt': {'rpm': 500, 'tpm': 30_000},
+    'perplexity': {'rpm': 50, 'tpm': None},
+    'zai': {'rpm': 60, 'tpm': None},
+}
+FALLBACK_RATE_LIMIT = {'rpm': 60, 'tpm': None}
+
+THROTTLE_MARKERS = ('429', 'resource_exhausted', 'resource exhausted', 'quota', '503', 'overloaded', 'unavailable')
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar('llm_priority', default=PRIORITY_BULK)
+
+
+@contextmanager
+def llm_priority(priority: int) -> Iterator[None]:
+    """이 블록에서 시작한 LLM 호출의 우선순위 (작을수록 먼저). 하위 Task/to_thread에도 전파된다."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def estimate_tokens(text: str, expected_output: int = 1000) -> int:
+    """대략적인 토큰 수 (한글 위주 프롬프트 기준 2글자 ≈ 1토큰 + 예상 출력)"""
+    return len(text or '') // 2 + expected_output
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    if isinstance(error, asyncio.TimeoutError):
+        return False
+    message = str(error).lower()
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+
+class TokenBucket:
+    """초당 rate만큼 채워지는 버킷. 부족분은 예약(음수 잔고)하고 기다릴 시간을 돌려준다."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = float(per_minute) / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # 한 번에 capacity보다 큰 요청도 영원히 막히지 않도록 capacity로 자른다
+        self.tokens -= min(amount, self.capacity)
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def drain(self, now: float) -> None:
+        self.tokens = min(self.tokens, 0.0)
+        self.updated = now
+
+
+class _Waiter:
+    __slots__ = ('loop', 'future', 'granted', 'cancelled')
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future):
+        self.loop = loop
+        self.future = future
+        self.granted = False
+        self.cancelled = False
+
+
+def _wake(waiter: _Waiter) -> None:
+    if not waiter.future.done():
+        waiter.future.set_result(None)
+
+
+class ProviderLimiter:
+    """provider/model 1개의 동시성(AIMD) + RPM/TPM 예산"""
+
+    def __init__(self, key: str, rpm: Optional[float], tpm: Optional[float],
+                 initial_limit: float, max_limit: float):
+        self.key = key
+        self.rpm = TokenBucket(rpm) if rpm else None
+        self.tpm = TokenBucket(tpm) if tpm else None
+        self.limit = float(initial_limit)
+        self.max_limit = float(max_limit)
+        self.in_flight = 0
+        self.last_decrease = 0.0
+        self._waiters: list = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self.stats = {'calls': 0, 'throttled': 0, 'waited_sec': 0.0}
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < max(1, int(self.limit))
+
+    async def _acquire_slot(self, priority: int) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._has_capacity():
+                self.in_flight += 1
+                return
+            waiter = _Waiter(loop, loop.create_future())
+            heapq.heappush(self._waiters, (priority, next(self._seq), waiter))
+        try:
+            await waiter.future
+        except BaseException:
+            with self._lock:
+                waiter.cancelled = True
+                granted = waiter.granted
+            if granted:
+                self._release_slot()
+            raise
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._grant_waiters()
+
+    def _grant_waiters(self) -> None:
+        # self._lock 보유 상태에서 호출
+        while self._waiters and self._has_capacity():
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.cancelled:
+                continue
+            waiter.granted = True
+            self.in_flight += 1
+            try:
+                waiter.loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # 대기하던 루프가 이미 닫힘 - 슬롯 반환
+                waiter.granted = False
+                self.in_flight -= 1
+
+    def _reserve_budget(self, tokens: int) -> float:
+        now = time.monotonic()
+        with self._lock:
+            wait = self.rpm.reserve(1, now) if self.rpm else 0.0
+            if self.tpm:
+                wait = max(wait, self.tpm.reserve(tokens, now))
+        return wait
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.limit = min(self.max_limit, self.limit + 1.0 / max(self.limit, 1.0))
+            self._grant_waiters()
+
+    def on_throttle(self, started_at: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.stats['throttled'] += 1
+            # 감소 이전에 시작된 호출의 실패는 같은 혼잡으로 보고 한 번만 줄인다
+            if started_at < self.last_decrease:
+                return
+            self.limit = max(1.0, self.limit / 2)
+            self.last_decrease = now
+            if self.rpm:
+                self.rpm.drain(now)
+            if self.tpm:
+                self.tpm.drain(now)
+        logger.warning(f"[LLM Scheduler] {self.key} 레이트 리밋 감지 → 동시성 {self.limit:.1f}로 축소")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'limit': round(self.limit, 2),
+                'in_flight': self.in_flight,
+                'waiting': sum(1 for _, _, w in self._waiters if not w.cancelled),
+                **self.stats,
+            }
+
+
+class CallSlot:
+    """slot() 블록 안에서 호출 결과를 보고하는 핸들"""
+
+    def __init__(self, limiter: ProviderLimiter, started_at: float):
+        self._limiter = limiter
+        self._started_at = started_at
+        self._reported = False
+
+    def throttled(self) -> None:
+        """예외가 아닌 응답(예: HTTP 429)으로 레이트 리밋을 받은 경우 호출"""
+        if not self._reported:
+            self._reported = True
+            self._limiter.on_throttle(self._started_at)
+
+
+class LLMScheduler:
+    """프로세스 공유 LLM 호출 스케줄러"""
+
+    def __init__(self, rate_limits: Optional[Dict[str, Dict]] = None,
+                 initial_limit: Optional[float] = None, max_limit: Optional[float] = None):
+        self.rate_limits = {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}
+        self.initial_limit = initial_limit or app_config.ANALYSIS_LLM_CONCURRENCY
+        self.max_limit = max_limit or int(os.getenv('LLM_MAX_CONCURRENCY', '8'))
+        self._limiters: Dict[Tuple[str, str], ProviderLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, provider: str, model: str) -> ProviderLimiter:
+        key = (str(provider).lower(), str(model))
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limits = (self.rate_limits.get(f"{key[0]}/{key[1]}")
+                          or self.rate_limits.get(key[0])
+                          or FALLBACK_RATE_LIMIT)
+                limiter = ProviderLimiter(
+                    f"{key[0]}/{key[1]}", limits.get('rpm'), limits.get('tpm'),
+                    initial_limit=min(self.initial_limit, self.max_limit), max_limit=self.max_limit,
+                )
+                self._limiters[key] = limiter
+            return limiter
+
+    @asynccontextmanager
+    async def slot(self, provider: str, model: str, tokens: int = 0, priority: Optional[int] = None):
+        """
+        LLM 호출 1회 구간
+
+        동시성 슬롯(우선순위 순) → RPM/TPM 예산 순으로 확보한 뒤 블록을 실행한다.
+        블록에서 발생한 429/503 계열 예외는 동시성 축소로 반영된 뒤 그대로 전파된다.
+        """
+        limiter = self.limiter(provider, model)
+        priority = _priority.get() if priority is None else priority
+        queued_at = time.monotonic()
+        await limiter._acquire_slot(priority)
+        try:
+            wait = limiter._reserve_budget(tokens)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            started_at = time.monotonic()
+            with limiter._lock:
+                limiter.stats['calls'] += 1
+                limiter.stats['waited_sec'] += started_at - queued_at
+            handle = CallSlot(limiter, started_at)
+            try:
+                yield handle
+            except BaseException as e:
+                if not handle._reported and is_throttle_error(e):
+                    handle.throttled()
+                raise
+            else:
+                if not handle._reported:
+                    limiter.on_success()
+        finally:
+            limiter._release_slot()
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.key: limiter.snapshot() for limiter in limiters}
+
+
+def _load_rate_limits() -> Dict[str, Dict]:
+    raw = os.getenv('LLM_RATE_LIMITS', '').strip()
+    if not raw:
+        return {}
+    try:
+        parsed = json.loads(raw)
+        return parsed if isinstance(parsed, dict) else {}
+    except json.JSONDecodeError as e:
+        logger.warning(f"[LLM Scheduler] LLM_RATE_LIMITS 파싱 실패, 기본값 사용: {e}")
+        return {}
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """프로세스 공유 스케줄러"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler(_load_rate_limits())
+        return _scheduler
@@ -10,12 +10,16 @@ import logging
 import pandas as pd
 import numpy as np
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta
 from typing import Dict, Tuple, Optional, Any
 
 # Import GlobalDataFetcher from data_sources module
 from engine.data_sources import GlobalDataFetcher, DataSourceManager
 from engine.utils import NumpyEncoder
+from engine.data_catalog import get_catalog
 
 # Config Import
 try:
@@ -34,9 +38,88 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# analyze() 입력 스냅샷 캐시 (프로세스 공유): key -> (fetched_at, inputs)
+_INPUT_SNAPSHOTS: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+_INPUT_SNAPSHOT_LOCK = threading.Lock()
+
+# 진행 중인 히스토리 백그라운드 재계산 (data_dir 절대경로)
+_HISTORY_REBUILDS: set = set()
+_HISTORY_REBUILD_LOCK = threading.Lock()
+
+# 네트워크 입력 수집용 공유 풀 (호출마다 만들지 않음). 타임아웃된 작업은 끝날 때까지 워커 하나를 점유하지만
+# 워커 수가 고정되어 있어 호출이 반복돼도 스레드가 계속 늘어나지 않는다.
+# 로컬 CSV(가격/수급)는 풀에 넣지 않고 호출 스레드에서 읽는다 (풀이 밀려도 타임아웃되지 않도록).
+_FETCH_MAX_WORKERS = 8
+_FETCH_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_FETCH_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_fetch_executor() -> ThreadPoolExecutor:
+    global _FETCH_EXECUTOR
+    if _FETCH_EXECUTOR is None:
+        with _FETCH_EXECUTOR_LOCK:
+            if _FETCH_EXECUTOR is None:
+                _FETCH_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=_FETCH_MAX_WORKERS, thread_name_prefix='market-gate'
+                )
+    return _FETCH_EXECUTOR
+
+
+class _SourceTask:
+    """
+    공유 풀에 제출한 소스 작업
+
+    실행 타임아웃은 제출 시점이 아니라 실행 시작 시점부터 잰다 (앞선 호출의 작업에 밀려 대기한 시간 제외).
+    대기열 대기는 제출 시점부터 따로 같은 타임아웃까지만 허용한다.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, fn, *args):
+        self.started = threading.Event()
+        self.submitted_at = time.monotonic()
+        self.started_at = 0.0
+        self.future = executor.submit(self._run, fn, args)
+
+    def _run(self, fn, args):
+        self.started_at = time.monotonic()
+        self.started.set()
+        return fn(*args)
+
+    def result(self, timeout: float) -> Any:
+        """제출 후 timeout 안에 시작하지 못하면 취소, 시작했으면 시작 시점부터 timeout까지 기다린다"""
+        if not self.started.wait(max(0.0, timeout - (time.monotonic() - self.submitted_at))):
+            self.future.cancel()
+            raise FuturesTimeoutError()
+        remaining = timeout - (time.monotonic() - self.started_at)
+        return self.future.result(timeout=max(0.0, remaining))
+
+    def cancel(self) -> bool:
+        return self.future.cancel()
+
+
 class MarketGate:
     """시장 상태 분석기 (신호등) - KODEX 200 + 환율 + 수급"""
 
+    HISTORY_FILE = 'market_gate_history.csv'
+    HISTORY_COLUMNS = [
+        'date', 'close', 'total_score', 'is_gate_open', 'color',
+        'trend_score', 'rsi_score', 'macd_score', 'vol_score', 'rs_score',
+        'rsi', 'macd', 'rs_diff',
+    ]
+
+    # 데이터 소스별 타임아웃 (초) - 초과 시 기본값으로 대체하고 부분 결과로 분석
+    FETCH_TIMEOUTS = {
+        'price': 30.0,
+        'benchmark': 15.0,
+        'usd_krw': 15.0,
+        'supply': 15.0,
+        'global': 30.0,
+        'sector': 30.0,
+    }
+
+    # 가격 데이터와 동시에 받기 위해 벤치마크는 기준일에서 이 기간만큼 미리 조회한다
+    # (RS는 마지막 행의 20거래일 수익률만 쓰므로 120일이면 충분. 부족하면 가격 구간으로 다시 조회)
+    BENCHMARK_LOOKBACK_DAYS = 120
+
     def __init__(self, data_dir: str = 'data'):
         self.data_dir = data_dir
         self.kodex_ticker = '069500' # KODEX 200
@@ -93,33 +176,178 @@ class MarketGate:
             logger.warning(f"Benchmark fetch failed: {e}")
             return pd.DataFrame()
 
-    def analyze(self, target_date: str = None) -> Dict[str, Any]:
-        """시장 상태 분석 실행 (target_date: YYYY-MM-DD)"""
+    def _price_date_range(self, df: pd.DataFrame) -> Tuple[str, str]:
+        """가격 데이터의 시작/종료일 (YYYY-MM-DD) - 벤치마크 조회 구간"""
+        start_dt = df.iloc[0]['date']
+        end_dt = df.iloc[-1]['date']
+        
+        # str conversion if datetime
+        if isinstance(start_dt, datetime): start_dt = start_dt.strftime("%Y-%m-%d")
+        if isinstance(end_dt, datetime): end_dt = end_dt.strftime("%Y-%m-%d")
+        else: start_dt = str(start_dt)[:10]; end_dt = str(end_dt)[:10] # pandas timestamp
+        return start_dt, end_dt
+
+    def _benchmark_range(self, target_date: Optional[str]) -> Tuple[str, str]:
+        """가격 데이터 없이 정할 수 있는 벤치마크 조회 구간 (YYYY-MM-DD)"""
+        try:
+            end = pd.Timestamp(target_date).to_pydatetime() if target_date else datetime.now()
+        except (ValueError, TypeError):
+            end = datetime.now()
+        start = end - timedelta(days=self.BENCHMARK_LOOKBACK_DAYS)
+        return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _benchmark_covers(requested: Tuple[str, str], price_df: pd.DataFrame) -> bool:
+        """미리 조회한 구간이 마지막 행의 20거래일 RS 계산에 필요한 가격 날짜를 모두 포함하는지"""
+        dates = price_df['date'].astype(str).str[:10]
+        needed_start = dates.iloc[max(0, len(dates) - 21)]
+        return requested[0] <= needed_start and dates.iloc[-1] <= requested[1]
+
+    def _snapshot_key(self, target_date: Optional[str]) -> tuple:
+        """입력 스냅샷 키 - 로컬 CSV가 갱신되면 자동으로 무효화된다."""
+        mtimes = []
+        for name in ('daily_prices.csv', 'all_institutional_trend_data.csv'):
+            path = os.path.join(self.data_dir, name)
+            mtimes.append(os.path.getmtime(path) if os.path.exists(path) else 0.0)
+        return (os.path.abspath(self.data_dir), target_date or 'latest', *mtimes)
+
+    def _snapshot_ttl(self) -> float:
+        try:
+            from engine.config import app_config
+            return app_config.MARKET_GATE_UPDATE_INTERVAL_MINUTES * 60
+        except Exception:
+            return 30 * 60
+
+    def _collect_source(self, name: str, task: _SourceTask, default: Any, status: Dict[str, str]) -> Any:
+        """소스별 타임아웃 내 결과 수집 (실패/초과 시 기본값)"""
+        try:
+            result = task.result(self.FETCH_TIMEOUTS[name])
+            status[name] = 'ok'
+            return result
+        except FuturesTimeoutError:
+            logger.warning(f"Market Gate 입력 수집 타임아웃: {name} ({self.FETCH_TIMEOUTS[name]}s)")
+            status[name] = 'timeout'
+        except Exception as e:
+            logger.warning(f"Market Gate 입력 수집 실패: {name} ({e})")
+            status[name] = 'error'
+        return default
+
+    @staticmethod
+    def _load_local_source(name: str, fn, default: Any, status: Dict[str, str], *args, **kwargs) -> Any:
+        """로컬 CSV 소스를 호출 스레드에서 읽는다 (실패 시 기본값)"""
+        try:
+            result = fn(*args, **kwargs)
+            status[name] = 'ok'
+            return result
+        except Exception as e:
+            logger.warning(f"Market Gate 입력 수집 실패: {name} ({e})")
+            status[name] = 'error'
+            return default
+
+    def _fetch_inputs(self, target_date: str = None, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        분석 입력(가격/벤치마크/환율/수급/글로벌/섹터) 동시 수집.
+        네트워크 소스를 먼저 공유 풀에 제출하고, 그동안 호출 스레드에서 로컬 가격/수급 CSV를 읽는다.
+        가격 CSV가 비어 있을 때의 pykrx 조회와 KIS 실시간 수급만 네트워크 소스처럼 풀에서 실행한다.
+        """
+        cache_key = self._snapshot_key(target_date)
+        if use_cache:
+            with _INPUT_SNAPSHOT_LOCK:
+                cached = _INPUT_SNAPSHOTS.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self._snapshot_ttl():
+                logger.debug("Market Gate 입력 스냅샷 재사용")
+                return self._copy_inputs(cached[1])
+
+        fetched_at = time.monotonic()
+        status: Dict[str, str] = {}
+        executor = _get_fetch_executor()
+        bench_range = self._benchmark_range(target_date)
+        tasks = {
+            'benchmark': _SourceTask(executor, self._fetch_benchmark_data, *bench_range),
+            'usd_krw': _SourceTask(executor, self._get_usd_krw),
+            'global': _SourceTask(executor, self._get_global_data, target_date),
+            # KOSPI 200 섹터 값은 수집 후 글로벌 지수로 동기화 (아래)
+            'sector': _SourceTask(executor, self._get_sector_data, target_date),
+        }
+        if self._supply_realtime_available():
+            tasks['supply_realtime'] = _SourceTask(executor, self._load_supply_realtime)
+
+        price_df = self._load_local_source('price', self._load_price_data, pd.DataFrame(), status,
+                                           target_date, fallback=False)
+        if price_df.empty:
+            tasks['price'] = _SourceTask(executor, self._load_price_data, target_date)
+            price_df = self._collect_source('price', tasks['price'], pd.DataFrame(), status)
+        supply_data = self._load_local_source('supply', self._load_supply_data, {}, status, realtime=False)
+        if 'supply_realtime' in tasks:
+            # 실시간 수급 실패/초과는 CSV 값으로 대체 (소스 상태에는 반영하지 않음)
+            realtime = self._collect_source('supply', tasks['supply_realtime'], None, {})
+            if realtime:
+                supply_data = realtime
+
+        bench_df = self._collect_source('benchmark', tasks['benchmark'], pd.DataFrame(), status)
+        if not price_df.empty and not self._benchmark_covers(bench_range, price_df):
+            # 가격 데이터가 기준일보다 한참 오래된 경우 등 - 가격 구간으로 다시 조회
+            bench_task = _SourceTask(executor, self._fetch_benchmark_data, *self._price_date_range(price_df))
+            bench_df = self._collect_source('benchmark', bench_task, pd.DataFrame(), status)
+
+        inputs = {
+            'price_df': price_df,
+            'bench_df': bench_df,
+            'usd_krw': self._collect_source('usd_krw', tasks['usd_krw'], 1350.0, status),
+            'supply_data': supply_data,
+            'global_data': self._collect_source('global', tasks['global'], {}, status),
+            'sector_data': self._collect_source('sector', tasks['sector'], {}, status),
+            'source_status': status,
+        }
+        # 타임아웃된 작업은 취소를 시도하고 (이미 실행 중이면 공유 풀에서 끝날 때까지 둔다) 기다리지 않는다
+        for task in tasks.values():
+            task.cancel()
+
+        kospi_indices = (inputs['global_data'] or {}).get('indices', {}).get('kospi', {})
+        if 'KOSPI 200' in inputs['sector_data'] and 'change_pct' in kospi_indices:
+            inputs['sector_data']['KOSPI 200'] = kospi_indices['change_pct']
+
+        # 모든 소스가 정상일 때만 스냅샷 저장 (부분 결과는 다음 호출에서 재시도)
+        if all(v == 'ok' for v in status.values()):
+            with _INPUT_SNAPSHOT_LOCK:
+                _INPUT_SNAPSHOTS[cache_key] = (fetched_at, self._copy_inputs(inputs))
+
+        return inputs
+
+    @staticmethod
+    def _copy_inputs(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """_calculate_indicators가 DataFrame을 변경하므로 스냅샷은 복사본으로 주고받는다."""
+        import copy
+        copied = copy.deepcopy({k: v for k, v in inputs.items() if not isinstance(v, pd.DataFrame)})
+        for k, v in inputs.items():
+            if isinstance(v, pd.DataFrame):
+                copied[k] = v.copy()
+        return copied
+
+    def analyze(self, target_date: str = None, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        시장 상태 분석 실행 (target_date: YYYY-MM-DD)
+        use_cache=False면 입력 스냅샷을 무시하고 모든 소스를 다시 수집한다.
+        """
         try:
+            inputs = self._fetch_inputs(target_date, use_cache=use_cache)
+
             # 1. 기술적 지표 (KODEX 200)
-            df = self._load_price_data(target_date)
+            df = inputs['price_df']
             if df.empty:
                 return self._default_result("가격 데이터 부족")
             
-            # Benchmark (KOSPI) Load for RS
-            start_dt = df.iloc[0]['date']
-            end_dt = df.iloc[-1]['date']
-            
-            # str conversion if datetime
-            if isinstance(start_dt, datetime): start_dt = start_dt.strftime("%Y-%m-%d")
-            if isinstance(end_dt, datetime): end_dt = end_dt.strftime("%Y-%m-%d")
-            else: start_dt = str(start_dt)[:10]; end_dt = str(end_dt)[:10] # pandas timestamp
-            
-            bench_df = self._fetch_benchmark_data(start_dt, end_dt)
+            # Benchmark (KOSPI) for RS
+            bench_df = inputs['bench_df']
             
             df = self._calculate_indicators(df, bench_df)
             current_tech = df.iloc[-1]
             
             # 2. 거시 지표 (환율) - Display Purpose Only (Score Excluded)
-            usd_krw = self._get_usd_krw()
+            usd_krw = inputs['usd_krw']
             
             # 3. 수급 지표 (외인/기관) - Display Purpose Only (Score Excluded)
-            supply_data = self._load_supply_data()
+            supply_data = inputs['supply_data']
             
             # --- 점수 산출 (Total 100 - Technical Only) ---
             
@@ -166,8 +394,8 @@ class MarketGate:
                 color = "RED"
 
             # 4. 글로벌 데이터 (지수, 원자재, 크립토)
-            global_data = self._get_global_data(target_date)
-            sector_data = self._get_sector_data(target_date, global_data=global_data)
+            global_data = inputs['global_data']
+            sector_data = inputs['sector_data']
 
             # KOSPI/KOSDAQ 실제 지수 사용 (없으면 ETF 값 Fallback)
             real_kospi = global_data.get('indices', {}).get('kospi', {})
@@ -211,7 +439,8 @@ class MarketGate:
                         "signal": "Bullish" if v > 0.5 else "Bearish" if v < -0.5 else "Neutral"
                     }
                     for k, v in sector_data.items()
-                ]
+                ],
+                "source_status": inputs['source_status']
             }
 
         except Exception as e:
@@ -290,7 +519,8 @@ class MarketGate:
             # self.sectors 사용
             
             # [2026-02-06] 실시간 지수 동기화를 위해 전역 지수 데이터 확보
-            # 이 함수는 analyze() 내에서 _get_global_data() 다음에 호출됨이 보장되어야 함
+            # analyze()에서는 글로벌 데이터와 동시 수집되므로 global_data 없이 호출되고,
+            # KOSPI 200 값은 _fetch_inputs()에서 수집 후 동기화된다.
             
             today = datetime.now().strftime("%Y%m%d")
             # 최근 5일 데이터 조회 (안전하게)
@@ -337,8 +567,8 @@ class MarketGate:
             logger.warning(f"Sector data error: {e}")
             return {}
 
-    def _load_price_data(self, target_date: str = None) -> pd.DataFrame:
-        """KODEX 200 데이터 로드 및 날짜 필터링 (Fallback: pykrx)"""
+    def _load_price_data(self, target_date: str = None, fallback: bool = True) -> pd.DataFrame:
+        """KODEX 200 데이터 로드 및 날짜 필터링 (Fallback: pykrx, fallback=False면 CSV만)"""
         df = pd.DataFrame()
         filepath = os.path.join(self.data_dir, 'daily_prices.csv')
         
@@ -354,7 +584,7 @@ class MarketGate:
                 logger.error(f"CSV 로드 실패: {e}")
         
         # 2. [Fallback] 데이터가 없으면 pykrx 조회
-        if df.empty:
+        if df.empty and fallback:
             logger.debug("CSV에 KODEX 200 데이터 없음. pykrx 조회 시도...")
             try:
                 from pykrx import stock
@@ -440,6 +670,7 @@ class MarketGate:
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(result, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
+            get_catalog(self.data_dir).record(filepath)
             logger.debug(f"Market Gate 저장 완료: {filepath}")
         except Exception as e:
             logger.error(f"Market Gate 저장 실패: {e}")
@@ -452,6 +683,7 @@ class MarketGate:
             try:
                 with open(latest_path, 'w', encoding='utf-8') as f:
                     json.dump(result, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
+                get_catalog(self.data_dir).record(latest_path)
             except Exception as e:
                 logger.error(f"최신 Market Gate 갱신 실패: {e}")
                 
@@ -524,21 +756,31 @@ class MarketGate:
             logger.warning(f"환율 조회 실패 (기본값 사용): {e}")
             return 1350.0
 
-    def _load_supply_data(self) -> Dict:
-        """최근 수급 데이터 로드 (실시간 KIS 지원)"""
+    def _supply_realtime_available(self) -> bool:
+        return bool(self.kis and os.getenv("KIS_APP_KEY"))
+
+    def _load_supply_realtime(self) -> Dict:
+        """KIS 실시간 수급 (장중 실시간성 확보, 실패/미확보 시 빈 dict)"""
+        try:
+            # KOSPI(0001) 시장 전체 수급 기준
+            kis_data = self.kis.get_market_investor_trend("0001")
+            if kis_data and kis_data.get('foreign_buy') != 0:
+                logger.info(f"KIS 실시간 수급 데이터 확보: Foreign={kis_data['foreign_buy']}")
+                return {
+                    "foreign_buy": kis_data['foreign_buy'],
+                    "inst_buy": kis_data['inst_buy']
+                }
+        except Exception as e:
+            logger.warning(f"KIS 실시간 수급 로드 실패: {e}")
+        return {}
+
+    def _load_supply_data(self, realtime: bool = True) -> Dict:
+        """최근 수급 데이터 로드 (실시간 KIS 지원, realtime=False면 CSV만)"""
         # 1. 먼저 KIS 실시간 데이터 시도 (장중 실시간성 확보)
-        if self.kis and os.getenv("KIS_APP_KEY"):
-            try:
-                # KOSPI(0001) 시장 전체 수급 기준
-                kis_data = self.kis.get_market_investor_trend("0001")
-                if kis_data and kis_data.get('foreign_buy') != 0:
-                    logger.info(f"KIS 실시간 수급 데이터 확보: Foreign={kis_data['foreign_buy']}")
-                    return {
-                        "foreign_buy": kis_data['foreign_buy'],
-                        "inst_buy": kis_data['inst_buy']
-                    }
-            except Exception as e:
-                logger.warning(f"KIS 실시간 수급 로드 실패: {e}")
+        if realtime and self._supply_realtime_available():
+            kis_data = self._load_supply_realtime()
+            if kis_data:
+                return kis_data
 
         # 2. Fallback: 기존 CSV 파일 로드
         filepath = os.path.join(self.data_dir, 'all_institutional_trend_data.csv')
@@ -664,6 +906,122 @@ class MarketGate:
         else:
             return 0
 
+    def _score_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        _score_trend/_score_rsi/_score_macd/_score_volume/_score_rs 의 벡터화 버전.
+        _calculate_indicators 결과 전체 행을 한 번에 채점한다 (행 단위 결과와 동일).
+        """
+        rsi = df['rsi'].to_numpy(dtype=float)
+        rs = (df['rs_diff'] if 'rs_diff' in df.columns else pd.Series(0.0, index=df.index)).to_numpy(dtype=float)
+        vol_ma20 = df['vol_ma20'].to_numpy(dtype=float)
+
+        scores = pd.DataFrame(index=df.index)
+        scores['trend_score'] = np.where(df['ma20'].to_numpy() > df['ma60'].to_numpy(), 25, 0)
+        scores['rsi_score'] = np.select(
+            [(rsi >= 50) & (rsi <= 70), rsi > 70, rsi < 30], [25, 10, 15], default=5
+        )
+        scores['macd_score'] = np.where(df['macd'].to_numpy() > df['signal'].to_numpy(), 20, 0)
+        scores['vol_score'] = np.where((vol_ma20 > 0) & (df['volume'].to_numpy() > vol_ma20), 15, 0)
+        scores['rs_score'] = np.select([rs > 2.0, rs >= 0, rs >= -2.0], [15, 10, 5], default=0)
+        scores = scores.astype(np.int8)
+
+        total = scores.sum(axis=1).clip(upper=100).astype(np.int16)
+        scores['total_score'] = total
+        scores['is_gate_open'] = total >= 40
+        scores['color'] = np.select([total >= 70, total >= 40], ['GREEN', 'YELLOW'], default='RED')
+        return scores
+
+    def build_history(self, start_date: str = None, end_date: str = None, save: bool = True) -> pd.DataFrame:
+        """
+        일별 Market Gate 점수 시계열을 한 번에 계산한다 (백테스트/히스토리 조회용).
+        지표가 모두 과거 데이터만 사용하므로 날짜별 analyze() 반복과 기술 점수가 동일하다.
+        """
+        df = self._load_price_data(end_date)
+        if df.empty:
+            return pd.DataFrame(columns=self.HISTORY_COLUMNS)
+
+        start_dt, end_dt = self._price_date_range(df)
+        bench_df = self._fetch_benchmark_data(start_dt, end_dt)
+        df = self._calculate_indicators(df.reset_index(drop=True), bench_df)
+
+        history = pd.concat([df[['date']].astype(str), self._score_frame(df)], axis=1)
+        history['close'] = df['close'].round(2)
+        history['rsi'] = df['rsi'].round(2)
+        history['macd'] = df['macd'].round(2)
+        history['rs_diff'] = df['rs_diff'].round(2)
+        history['date'] = history['date'].str[:10]
+        if start_date:
+            history = history[history['date'] >= start_date]
+        history = history[self.HISTORY_COLUMNS].reset_index(drop=True)
+
+        if save:
+            path = os.path.join(self.data_dir, self.HISTORY_FILE)
+            try:
+                history.to_csv(path, index=False)
+                get_catalog(self.data_dir).record_dataframe(path, history)
+                logger.info(f"Market Gate 히스토리 저장: {path} ({len(history)} rows)")
+            except Exception as e:
+                logger.error(f"Market Gate 히스토리 저장 실패: {e}")
+        return history
+
+    def history_is_stale(self) -> bool:
+        """히스토리 테이블이 없거나 daily_prices.csv보다 오래됐는지"""
+        path = os.path.join(self.data_dir, self.HISTORY_FILE)
+        prices_path = os.path.join(self.data_dir, 'daily_prices.csv')
+        return not os.path.exists(path) or (
+            os.path.exists(prices_path) and os.path.getmtime(prices_path) > os.path.getmtime(path)
+        )
+
+    def load_history(self, rebuild_if_stale: bool = False) -> pd.DataFrame:
+        """
+        저장된 히스토리 테이블 로드
+        rebuild_if_stale=True면 오래된 경우 동기로 재계산한다 (벤치마크 네트워크 조회 포함 - 웹 요청에서는 쓰지 말 것)
+        """
+        if rebuild_if_stale and self.history_is_stale():
+            return self.build_history()
+        path = os.path.join(self.data_dir, self.HISTORY_FILE)
+        if not os.path.exists(path):
+            return pd.DataFrame(columns=self.HISTORY_COLUMNS)
+        return pd.read_csv(path, dtype={'date': str})
+
+    def rebuild_history_in_background(self) -> bool:
+        """
+        히스토리 재계산을 백그라운드 스레드로 시작 (같은 data_dir은 동시에 하나만)
+        이미 실행 중이면 False
+        """
+        key = os.path.abspath(self.data_dir)
+        with _HISTORY_REBUILD_LOCK:
+            if key in _HISTORY_REBUILDS:
+                return False
+            _HISTORY_REBUILDS.add(key)
+
+        def _run():
+            try:
+                self.build_history()
+            except Exception as e:
+                logger.error(f"Market Gate 히스토리 백그라운드 재계산 실패: {e}")
+            finally:
+                with _HISTORY_REBUILD_LOCK:
+                    _HISTORY_REBUILDS.discard(key)
+
+        threading.Thread(target=_run, name='market-gate-history', daemon=True).start()
+        return True
+
+    def get_gate_state(self, date: str, history: pd.DataFrame = None) -> Optional[Dict[str, Any]]:
+        """특정 날짜(YYYY-MM-DD)의 Gate 상태 - 해당일 데이터가 없으면 직전 거래일 기준"""
+        if history is None:
+            history = self.load_history()
+        if history.empty:
+            return None
+        idx = history['date'].searchsorted(date, side='right') - 1
+        if idx < 0:
+            return None
+        row = history.iloc[int(idx)]
+        return {
+            k: (v.item() if hasattr(v, 'item') else v)
+            for k, v in row.to_dict().items()
+        }
+
     def _score_macro(self, usd_krw: float) -> Tuple[int, str]:
         """환율 점수 및 상태 (15점 + Penalty)"""
         status = "SAFE"
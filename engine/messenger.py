@@ -10,13 +10,9 @@ Created: 2024-12-01
 Refactored: 2025-02-11 (Phase 4)
 """
 import os
-import smtplib
 import logging
-import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from engine.messenger_formatters import (
     MessageData,
@@ -25,6 +21,7 @@ from engine.messenger_formatters import (
     DiscordFormatter,
     EmailFormatter,
 )
+from engine.notification_dispatcher import Delivery, get_dispatcher
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -85,10 +82,21 @@ class MessageSender:
     def __init__(self, config: MessengerConfig):
         self.config = config
 
-    def send(self, data: MessageData) -> bool:
-        """메시지 발송 (서브클래스에서 구현)"""
+    def build(self, data: MessageData) -> Optional[Delivery]:
+        """발송 단위 생성 (서브클래스에서 구현, 설정 누락 시 None)"""
         raise NotImplementedError
 
+    def send(self, data: MessageData) -> bool:
+        """단일 채널 동기 발송"""
+        try:
+            delivery = self.build(data)
+            if delivery is None:
+                return False
+            return get_dispatcher().send([delivery]).get(delivery.channel, False)
+        except Exception as e:
+            logger.error(f"{type(self).__name__} 발송 중 오류: {e}")
+            return False
+
 
 class TelegramSender(MessageSender):
     """텔레그램 발송기"""
@@ -97,36 +105,19 @@ class TelegramSender(MessageSender):
         super().__init__(config)
         self.formatter = TelegramFormatter()
 
-    def send(self, data: MessageData) -> bool:
-        """텔레그램 메시지 발송"""
+    def build(self, data: MessageData) -> Optional[Delivery]:
+        """텔레그램 메시지 구성"""
         if not self.config.telegram_token or not self.config.telegram_chat_id:
             logger.warning("Telegram 설정이 누락되어 발송을 건너뜁니다.")
-            return False
-
-        try:
-            # 포맷팅
-            message_text = self.formatter.format(data)
-
-            # 발송
-            url = f"https://api.telegram.org/bot{self.config.telegram_token}/sendMessage"
-            payload = {
-                "chat_id": self.config.telegram_chat_id,
-                "text": message_text,
-                "parse_mode": "HTML",
-                "disable_web_page_preview": True
-            }
-
-            resp = requests.post(url, json=payload)
-            if not resp.ok:
-                logger.error(f"Telegram 발송 실패 결과: {resp.text}")
-                return False
-
-            logger.info("Telegram 알림 발송 성공")
-            return True
+            return None
 
-        except Exception as e:
-            logger.error(f"Telegram 발송 중 오류: {e}")
-            return False
+        payload = {
+            "chat_id": self.config.telegram_chat_id,
+            "text": self.formatter.format(data),
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True
+        }
+        return Delivery('telegram', [{'json': payload}], label=data.title)
 
 
 class DiscordSender(MessageSender):
@@ -136,28 +127,13 @@ class DiscordSender(MessageSender):
         super().__init__(config)
         self.formatter = DiscordFormatter()
 
-    def send(self, data: MessageData) -> bool:
-        """디스코드 메시지 발송"""
+    def build(self, data: MessageData) -> Optional[Delivery]:
+        """디스코드 메시지 구성"""
         if not self.config.discord_url:
             logger.warning("Discord 설정이 누락되어 발송을 건너뜁니다.")
-            return False
-
-        try:
-            # 포맷팅
-            payload = self.formatter.format(data)
-
-            # 발송
-            resp = requests.post(self.config.discord_url, json=payload)
-            if not resp.ok:
-                logger.error(f"Discord 발송 실패 결과: {resp.text}")
-                return False
+            return None
 
-            logger.info("Discord 알림 발송 성공")
-            return True
-
-        except Exception as e:
-            logger.error(f"Discord 발송 중 오류: {e}")
-            return False
+        return Delivery('discord', [{'json': self.formatter.format(data)}], label=data.title)
 
 
 class EmailSender(MessageSender):
@@ -167,39 +143,21 @@ class EmailSender(MessageSender):
         super().__init__(config)
         self.formatter = EmailFormatter()
 
-    def send(self, data: MessageData) -> bool:
-        """이메일 발송"""
+    def build(self, data: MessageData) -> Optional[Delivery]:
+        """이메일 구성"""
         if not self.config.smtp_user or not self.config.smtp_password:
             logger.warning("SMTP 설정이 누락되어 발송을 건너뜁니다.")
-            return False
+            return None
 
         if not self.config.email_recipients:
             logger.warning("수신자 이메일(EMAIL_RECIPIENTS)이 설정되지 않았습니다.")
-            return False
-
-        try:
-            # 포맷팅
-            html_body = self.formatter.format(data)
-
-            # 이메일 구성
-            msg = MIMEMultipart()
-            msg['From'] = self.config.smtp_user
-            msg['To'] = ", ".join(self.config.email_recipients)
-            msg['Subject'] = data.title
-            msg.attach(MIMEText(html_body, 'html'))
+            return None
 
-            # 발송
-            with smtplib.SMTP(self.config.smtp_host, self.config.smtp_port) as server:
-                server.starttls()
-                server.login(self.config.smtp_user, self.config.smtp_password)
-                server.send_message(msg)
-
-            logger.info(f"이메일 발송 성공: {', '.join(self.config.email_recipients)}")
-            return True
-
-        except Exception as e:
-            logger.error(f"이메일 발송 중 오류: {e}")
-            return False
+        return Delivery('email', [{
+            'subject': data.title,
+            'html': self.formatter.format(data),
+            'recipients': self.config.email_recipients,
+        }], label=data.title)
 
 
 # =============================================================================
@@ -214,6 +172,8 @@ class Messenger:
     - Sender classes extracted (TelegramSender, DiscordSender, EmailSender)
     - Configuration extracted to MessengerConfig
     - Reduced from 455 lines to ~200 lines
+
+    채널 발송은 NotificationDispatcher로 동시에 처리되며, 실패분은 Outbox에서 재시도된다.
     """
 
     def __init__(self, config: Optional[MessengerConfig] = None):
@@ -232,46 +192,57 @@ class Messenger:
             'email': EmailSender(self.config),
         }
 
-    def send_screener_result(self, result) -> None:
+    def _dispatch(self, deliveries: List[Delivery], wait: bool) -> Dict[str, bool]:
+        if not deliveries:
+            logger.warning("메신저 알림을 발송할 채널이 없습니다.")
+            return {}
+        return get_dispatcher().send(deliveries, wait=wait)
+
+    def send_screener_result(self, result, wait: bool = True) -> Dict[str, bool]:
         """
         스크리너 결과 발송
 
         Args:
             result: ScreeningResult 객체
+            wait: False면 발송 예약 후 즉시 반환
+
+        Returns:
+            채널별 발송 성공 여부 (wait=False면 빈 dict)
         """
         if self.config.disabled:
             logger.info("메신저 알림이 비활성화되어 있습니다.")
-            return
+            return {}
 
         # Skip if no signals found (prevent empty notification spam)
         signals = getattr(result, 'signals', [])
         if not signals or len(signals) == 0:
             logger.info("[Notification] 발송할 시그널 없음 (0개) - 알림 스킵")
-            return
+            return {}
 
         try:
             # 메시지 데이터 빌드
             message_data = MessageDataBuilder.build(result)
 
-            # 활성화된 채널에 발송
-            sent_count = 0
+            # 활성화된 채널 동시 발송
+            deliveries = []
             for channel in self.config.channels:
                 if channel in self.senders:
-                    if self.senders[channel].send(message_data):
-                        sent_count += 1
-
-            if sent_count == 0:
-                logger.warning("메신저 알림을 발송할 채널이 없습니다.")
+                    delivery = self.senders[channel].build(message_data)
+                    if delivery is not None:
+                        deliveries.append(delivery)
+            return self._dispatch(deliveries, wait)
 
         except Exception as e:
             logger.error(f"메신저 알림 발송 중 전체 오류: {e}")
+            return {}
 
     def send_custom_message(
         self,
         title: str,
         message: str,
-        channels: Optional[List[str]] = None
-    ) -> None:
+        channels: Optional[List[str]] = None,
+        wait: bool = True
+    ) -> Dict[str, bool]:
         """
         커스텀 메시지 발송
 
@@ -279,55 +250,58 @@ class Messenger:
             title: 메시지 제목
             message: 메시지 내용
             channels: (Optional) 발송할 채널 리스트 (기본: 설정된 전체 채널)
+            wait: False면 발송 예약 후 즉시 반환
         """
         if self.config.disabled:
             logger.info("메신저 알림이 비활성화되어 있습니다.")
-            return
+            return {}
 
         target_channels = channels or self.config.channels
 
+        deliveries = []
         for channel in target_channels:
             if channel == 'telegram':
-                self._send_telegram_custom(title, message)
+                delivery = self._telegram_custom_delivery(title, message)
             elif channel == 'discord':
-                self._send_discord_custom(title, message)
-
-    def _send_telegram_custom(self, title: str, message: str) -> None:
-        """텔레그램 커스텀 메시지 발송"""
-        if not self.config.telegram_token or not self.config.telegram_chat_id:
-            return
+                delivery = self._discord_custom_delivery(title, message)
+            else:
+                continue
+            if delivery is not None:
+                deliveries.append(delivery)
 
         try:
-            url = f"https://api.telegram.org/bot{self.config.telegram_token}/sendMessage"
-            payload = {
-                "chat_id": self.config.telegram_chat_id,
-                "text": f"<b>{title}</b>\n\n{message}",
-                "parse_mode": "HTML",
-                "disable_web_page_preview": True
-            }
-            requests.post(url, json=payload)
-            logger.info("Telegram 커스텀 알림 발송 성공")
+            return self._dispatch(deliveries, wait)
         except Exception as e:
-            logger.error(f"Telegram 커스텀 발송 중 오류: {e}")
+            logger.error(f"커스텀 알림 발송 중 오류: {e}")
+            return {}
 
-    def _send_discord_custom(self, title: str, message: str) -> None:
-        """디스코드 커스텀 메시지 발송"""
-        if not self.config.discord_url:
-            return
+    def _telegram_custom_delivery(self, title: str, message: str) -> Optional[Delivery]:
+        """텔레그램 커스텀 메시지 구성"""
+        if not self.config.telegram_token or not self.config.telegram_chat_id:
+            return None
 
-        try:
-            payload = {
-                "username": "Closing Bet Bot",
-                "embeds": [{
-                    "title": title,
-                    "description": message,
-                    "color": 0x00ff00,
-                }]
-            }
-            requests.post(self.config.discord_url, json=payload)
-            logger.info("Discord 커스텀 알림 발송 성공")
-        except Exception as e:
-            logger.error(f"Discord 커스텀 발송 중 오류: {e}")
+        payload = {
+            "chat_id": self.config.telegram_chat_id,
+            "text": f"<b>{title}</b>\n\n{message}",
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True
+        }
+        return Delivery('telegram', [{'json': payload}], label=title)
+
+    def _discord_custom_delivery(self, title: str, message: str) -> Optional[Delivery]:
+        """디스코드 커스텀 메시지 구성"""
+        if not self.config.discord_url:
+            return None
+
+        payload = {
+            "username": "Closing Bet Bot",
+            "embeds": [{
+                "title": title,
+                "description": message,
+                "color": 0x00ff00,
+            }]
+        }
+        return Delivery('discord', [{'json': payload}], label=title)
 
 
 # =============================================================================
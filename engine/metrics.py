@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+경량 계측 (카운터 + 히스토그램, Prometheus 텍스트 출력)
+
+    from engine.metrics import timer, timed, inc
+
+    with timer('collector_request_seconds', collector='toss', op='investor_trend'):
+        ...
+
+    @timed('pipeline_phase_seconds', phase='phase1')
+    async def execute(...): ...
+
+    inc('llm_retries_total', provider='gemini', model=model)
+
+- 히스토그램은 고정 버킷 누적 개수 + 합계 + 개수만 보관하므로 관측 횟수와 무관하게 메모리가 일정하다.
+- timer/timed는 예외가 나도 소요 시간을 기록하고, `<이름>_errors_total` 카운터를 함께 올린다.
+- 값은 프로세스별로 집계된다 (Gunicorn 워커마다 따로). 스크레이프한 워커의 값만 보인다.
+- 라벨 값에는 종목 코드/URL처럼 종류가 끝없이 늘어나는 값을 넣지 않는다 (file_label, url_route 사용).
+"""
+
+import asyncio
+import functools
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+# 초 단위 기본 버킷 (CSV 로드 수 ms ~ LLM 배치 수십 초)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+# /api/admin/metrics 출력용 설명 (없는 이름은 HELP 없이 출력)
+METRIC_HELP = {
+    'collector_request_seconds': '외부 데이터 수집 요청 소요 시간 (collector, op, source)',
+    'collector_retries_total': '외부 데이터 수집 재시도 횟수',
+    'collector_responses_total': '외부 데이터 수집 응답 상태별 횟수',
+    'llm_request_seconds': 'LLM 호출 소요 시간 (폴백 포함 전체)',
+    'llm_attempt_seconds': 'LLM 모델별 단일 시도 소요 시간',
+    'llm_retries_total': 'LLM 재시도(다음 모델로 전환) 횟수',
+    'llm_fallback_total': '폴백 모델이 최종 응답한 횟수',
+    'llm_tokens_total': 'LLM 토큰 사용량 (kind=prompt|completion|estimated)',
+    'llm_batch_seconds': 'LLM 배치 분석 소요 시간 (캐시 적중 포함)',
+    'data_load_seconds': 'CSV/JSON 데이터 파일 로드 소요 시간',
+    'pipeline_phase_seconds': '종가베팅 파이프라인 단계별 소요 시간',
+    'pipeline_chunk_seconds': 'Phase 3 LLM 청크별 소요 시간',
+    'http_request_seconds': 'API 요청 처리 시간 (route 템플릿 기준)',
+}
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> _LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+
+def _errors_name(name: str) -> str:
+    base = name[:-len('_seconds')] if name.endswith('_seconds') else name
+    return f"{base}_errors_total"
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'counts', 'total', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """스레드 안전한 프로세스 단위 메트릭 저장소"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[_LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[_LabelKey, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram(self._buckets)
+            hist.observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """{'counters': {이름: {라벨: 값}}, 'histograms': {이름: {라벨: {count, sum}}}} (테스트/디버그용)"""
+        with self._lock:
+            return {
+                'counters': {
+                    name: {key: value for key, value in series.items()}
+                    for name, series in self._counters.items()
+                },
+                'histograms': {
+                    name: {key: {'count': h.count, 'sum': h.total} for key, h in series.items()}
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines = []
+        with self._lock:
+            for name in sorted(self._counters):
+                lines.extend(_header(name, 'counter'))
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+            for name in sorted(self._histograms):
+                lines.extend(_header(name, 'histogram'))
+                for key, hist in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(hist.buckets, hist.counts):
+                        cumulative += count
+                        le = _format_labels(key + (('le', _format_value(bound)),))
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(key + (('le', '+Inf'),))} {hist.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(hist.total)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+def _header(name: str, kind: str) -> Iterable[str]:
+    if name in METRIC_HELP:
+        yield f"# HELP {name} {METRIC_HELP[name]}"
+    yield f"# TYPE {name} {kind}"
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(key: _LabelKey) -> str:
+    if not key:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in key) + '}'
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    return _registry
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    _registry.inc(name, value, **labels)
+
+
+def observe(name: str, seconds: float, **labels) -> None:
+    _registry.observe(name, seconds, **labels)
+
+
+def render_prometheus() -> str:
+    return _registry.render_prometheus()
+
+
+class timer:
+    """
+    소요 시간을 히스토그램에 기록하는 컨텍스트 매니저
+
+    `with timer(...) as t:` 블록이 끝난 뒤 t.elapsed(초)로 기존 로그 출력에도 쓸 수 있다.
+    블록 안에서 t.labels['source'] = 'csv'처럼 라벨을 바꾸면 기록 시점 값이 사용된다.
+    """
+
+    __slots__ = ('name', 'labels', 'elapsed', '_started')
+
+    def __init__(self, name: str, **labels):
+        self.name = name
+        self.labels = labels
+        self.elapsed = 0.0
+        self._started = 0.0
+
+    def __enter__(self) -> 'timer':
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.elapsed = time.perf_counter() - self._started
+        _registry.observe(self.name, self.elapsed, **self.labels)
+        # 취소/중단 요청은 오류로 집계하지 않는다
+        if exc_type is not None and issubclass(exc_type, Exception) and exc_type is not asyncio.CancelledError:
+            _registry.inc(_errors_name(self.name), **self.labels)
+        return False
+
+
+def timed(name: str, **labels):
+    """함수 실행 시간을 기록하는 데코레이터 (동기/async 함수 모두 지원)"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with timer(name, **labels):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name, **labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# =============================================================================
+# 라벨 정규화
+# =============================================================================
+_DATE_IN_NAME = re.compile(r'\d{8}')
+_CODE_IN_PATH = re.compile(r'/A?\d{6}(?=/|$)')
+
+
+def file_label(path: str) -> str:
+    """데이터 파일 라벨 (파일명만, 날짜 부분은 * 처리: jongga_v2_results_*.json)"""
+    return _DATE_IN_NAME.sub('*', os.path.basename(path))
+
+
+def url_route(url: str, prefix: Optional[str] = None) -> str:
+    """URL → 라벨용 경로 (쿼리 제거, 종목 코드는 {code})"""
+    path = url.split('://', 1)[-1]
+    path = path[path.find('/'):] if '/' in path else '/'
+    path = path.split('?', 1)[0]
+    if prefix and path.startswith(prefix):
+        path = path[len(prefix):] or '/'
+    return _CODE_IN_PATH.sub('/{code}', path)
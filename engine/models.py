@@ -3,6 +3,8 @@ from typing import List, Optional, Dict, Any
 from enum import Enum
 from datetime import datetime, date
 
+import numpy as np
+
 class Grade(Enum):
     S = "S"
     A = "A"
@@ -30,14 +32,144 @@ class StockData:
     high_52w: float = 0
     low_52w: float = 0
 
-@dataclass
+class SeriesView:
+    """
+    NumPy 배열을 감싸는 list 호환 뷰
+
+    - 인덱싱은 Python 스칼라, 슬라이싱은 list를 반환 (기존 list 기반 코드 호환)
+    - 인덱스 대입은 원본 배열에 그대로 반영된다
+    - np.asarray(view)는 복사 없이 원본 배열을 반환한다
+    """
+    __slots__ = ('_array',)
+
+    def __init__(self, array: np.ndarray):
+        self._array = array
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __bool__(self) -> bool:
+        return len(self._array) > 0
+
+    def __iter__(self):
+        return iter(self._array.tolist())
+
+    def __getitem__(self, key):
+        value = self._array[key]
+        return value.tolist() if isinstance(value, np.ndarray) else value.item()
+
+    def __setitem__(self, key, value) -> None:
+        self._array[key] = value
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SeriesView):
+            other = other.tolist()
+        try:
+            return self.tolist() == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __array__(self, dtype=None, copy=None):
+        return self._array if dtype is None else self._array.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+    def tolist(self) -> list:
+        return self._array.tolist()
+
+
+def _as_price_array(values) -> np.ndarray:
+    return np.ascontiguousarray(np.asarray(values if values is not None else [], dtype=np.float64).reshape(-1))
+
+
+def _as_volume_array(values) -> np.ndarray:
+    arr = np.asarray(values if values is not None else []).reshape(-1)
+    # 정수 거래량은 int64 유지 (합계/평균 결과가 기존 list 연산과 동일), 결측치가 섞이면 float64
+    if arr.dtype.kind not in 'iu':
+        arr = arr.astype(np.float64)
+    return np.ascontiguousarray(arr)
+
+
 class ChartData:
-    opens: List[float] = field(default_factory=list)
-    highs: List[float] = field(default_factory=list)
-    lows: List[float] = field(default_factory=list)
-    closes: List[float] = field(default_factory=list)
-    volumes: List[int] = field(default_factory=list)
-    dates: List[str] = field(default_factory=list)
+    """
+    일봉 OHLCV (연속 NumPy 배열 저장)
+
+    opens/highs/lows/closes/volumes는 기존 list 인터페이스와 호환되는 SeriesView,
+    *_array 속성은 벡터화 계산용 원본 배열을 반환한다.
+    """
+    __slots__ = ('open_array', 'high_array', 'low_array', 'close_array', 'volume_array', 'dates')
+
+    def __init__(
+        self,
+        opens=None,
+        highs=None,
+        lows=None,
+        closes=None,
+        volumes=None,
+        dates: Optional[List[Any]] = None,
+    ):
+        self.open_array = _as_price_array(opens)
+        self.high_array = _as_price_array(highs)
+        self.low_array = _as_price_array(lows)
+        self.close_array = _as_price_array(closes)
+        self.volume_array = _as_volume_array(volumes)
+        self.dates = list(dates) if dates is not None else []
+
+    @property
+    def opens(self) -> SeriesView:
+        return SeriesView(self.open_array)
+
+    @opens.setter
+    def opens(self, values) -> None:
+        self.open_array = _as_price_array(values)
+
+    @property
+    def highs(self) -> SeriesView:
+        return SeriesView(self.high_array)
+
+    @highs.setter
+    def highs(self, values) -> None:
+        self.high_array = _as_price_array(values)
+
+    @property
+    def lows(self) -> SeriesView:
+        return SeriesView(self.low_array)
+
+    @lows.setter
+    def lows(self, values) -> None:
+        self.low_array = _as_price_array(values)
+
+    @property
+    def closes(self) -> SeriesView:
+        return SeriesView(self.close_array)
+
+    @closes.setter
+    def closes(self, values) -> None:
+        self.close_array = _as_price_array(values)
+
+    @property
+    def volumes(self) -> SeriesView:
+        return SeriesView(self.volume_array)
+
+    @volumes.setter
+    def volumes(self, values) -> None:
+        self.volume_array = _as_volume_array(values)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ChartData):
+            return NotImplemented
+        return (
+            np.array_equal(self.open_array, other.open_array)
+            and np.array_equal(self.high_array, other.high_array)
+            and np.array_equal(self.low_array, other.low_array)
+            and np.array_equal(self.close_array, other.close_array)
+            and np.array_equal(self.volume_array, other.volume_array)
+            and self.dates == other.dates
+        )
+
+    def __repr__(self) -> str:
+        return f"ChartData(len={len(self.close_array)}, dates={self.dates[:1]}..{self.dates[-1:]})"
 
 @dataclass
 class SupplyData:
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+알림 동시 발송 + 재시도 Outbox
+
+- 전용 백그라운드 이벤트 루프 1개에서 httpx.AsyncClient(커넥션 풀)를 재사용하여
+  Discord / Telegram / Slack / Email 채널을 동시에 발송한다 (채널 내 분할 메시지는 순서대로).
+- 실패한 발송은 data/notification_outbox.db(SQLite)에 남은 요청만 저장하고
+  지수 백오프로 재시도한다. 웹훅 URL/토큰/SMTP 비밀번호는 저장하지 않고 발송 시점에 환경변수에서 읽는다.
+- send(wait=False)는 즉시 반환하므로 스케줄러 체인이 느린 웹훅에 묶이지 않는다.
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import random
+import smtplib
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import closing
+from dataclasses import dataclass, field
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP_CHANNELS = ('discord', 'telegram', 'slack')
+DEFAULT_OUTBOX_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'notification_outbox.db'
+)
+
+_OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel TEXT NOT NULL,
+    requests TEXT NOT NULL,
+    label TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt_at);
+"""
+
+
+@dataclass
+class Delivery:
+    """
+    채널 1개 분량 발송 단위
+
+    Attributes:
+        channel: discord | telegram | slack | email
+        requests: HTTP 채널은 [{'json': {...}}, ...] (순서대로 전송),
+                  email은 [{'subject', 'html', 'recipients'}]
+        label: 로그용 설명
+    """
+    channel: str
+    requests: List[Dict[str, Any]] = field(default_factory=list)
+    label: str = ''
+
+
+class DeliveryError(Exception):
+    """
+    발송 실패 (sent_count까지는 전송 완료)
+
+    retryable=False(설정 누락, 4xx 등)는 재시도해도 실패하므로 Outbox에 넣지 않는다.
+    """
+
+    def __init__(self, message: str, sent_count: int = 0, retryable: bool = False):
+        super().__init__(message)
+        self.sent_count = sent_count
+        self.retryable = retryable
+
+
+def _http_endpoint(channel: str) -> Optional[str]:
+    """발송 시점 환경변수에서 엔드포인트 해석 (Outbox에는 비밀값을 저장하지 않음)"""
+    if channel == 'discord':
+        return os.getenv('DISCORD_WEBHOOK_URL') or None
+    if channel == 'slack':
+        return os.getenv('SLACK_WEBHOOK_URL') or None
+    if channel == 'telegram':
+        token = os.getenv('TELEGRAM_BOT_TOKEN')
+        return f"https://api.telegram.org/bot{token}/sendMessage" if token else None
+    return None
+
+
+def _send_email_sync(request: Dict[str, Any], timeout: float) -> None:
+    smtp_user = os.getenv('SMTP_USER')
+    smtp_password = os.getenv('SMTP_PASSWORD')
+    recipients = request.get('recipients') or []
+    if not smtp_user or not smtp_password or not recipients:
+        raise DeliveryError("SMTP 설정이 불완전합니다.")
+
+    msg = MIMEMultipart()
+    msg['From'] = smtp_user
+    msg['To'] = ', '.join(recipients)
+    msg['Subject'] = request.get('subject', '')
+    msg.attach(MIMEText(request.get('html', ''), 'html'))
+
+    smtp_port = int(os.getenv('SMTP_PORT', '587') or 587)
+    with smtplib.SMTP(os.getenv('SMTP_HOST') or 'smtp.gmail.com', smtp_port, timeout=timeout) as server:
+        server.starttls()
+        server.login(smtp_user, smtp_password)
+        server.send_message(msg)
+
+
+class NotificationOutbox:
+    """실패 발송 보관소 (SQLite, 프로세스 간 공유)"""
+
+    def __init__(self, path: str, base_delay: float = 30.0, max_delay: float = 3600.0, max_attempts: int = 8):
+        self.path = path
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if not self._schema_ready:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_OUTBOX_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def backoff(self, attempts: int) -> float:
+        """attempts회 실패 후 다음 재시도까지 대기 (지수 증가 + 10% 지터, 상한 max_delay)"""
+        delay = min(self.max_delay, self.base_delay * (2 ** max(0, attempts - 1)))
+        return delay * random.uniform(0.9, 1.1)
+
+    def enqueue(self, delivery: Delivery, error: str) -> int:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            cur = conn.execute(
+                'INSERT INTO outbox (channel, requests, label, attempts, next_attempt_at, last_error, created_at) '
+                'VALUES (?, ?, ?, 1, ?, ?, ?)',
+                (delivery.channel, json.dumps(delivery.requests, ensure_ascii=False), delivery.label,
+                 now + self.backoff(1), error[:500], now),
+            )
+            return cur.lastrowid
+
+    def claim_due(self, limit: int = 20, lease: float = 120.0) -> List[Dict[str, Any]]:
+        """재시도 시각이 지난 항목을 lease 동안 선점 (다른 워커와 중복 발송 방지)"""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                rows = conn.execute(
+                    "SELECT * FROM outbox WHERE status = 'pending' AND next_attempt_at <= ? "
+                    'ORDER BY next_attempt_at LIMIT ?',
+                    (now, limit),
+                ).fetchall()
+                conn.executemany(
+                    'UPDATE outbox SET next_attempt_at = ? WHERE id = ?',
+                    [(now + lease, row['id']) for row in rows],
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        return [dict(row) for row in rows]
+
+    def complete(self, item_id: int) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute('DELETE FROM outbox WHERE id = ?', (item_id,))
+
+    def reschedule(self, item: Dict[str, Any], remaining: List[Dict[str, Any]], error: str,
+                   retryable: bool = True) -> None:
+        """재발송 실패 - 남은 요청만 남기고 백오프 (시도 한도 초과/재시도 불가 오류면 dead)"""
+        attempts = item['attempts'] + 1
+        status = 'dead' if attempts >= self.max_attempts or not retryable else 'pending'
+        with closing(self._connect()) as conn:
+            conn.execute(
+                'UPDATE outbox SET requests = ?, attempts = ?, next_attempt_at = ?, last_error = ?, status = ? WHERE id = ?',
+                (json.dumps(remaining, ensure_ascii=False), attempts, time.time() + self.backoff(attempts),
+                 error[:500], status, item['id']),
+            )
+        if status == 'dead':
+            logger.error(f"[Outbox] {item['channel']} 발송 {attempts}회 실패 - 재시도 중단: {error}")
+
+
+class NotificationDispatcher:
+    """채널 동시 발송기 (전용 이벤트 루프 스레드 + 공유 HTTP 커넥션 풀)"""
+
+    def __init__(
+        self,
+        outbox: Optional[NotificationOutbox] = None,
+        http_timeout: float = 10.0,
+        retry_interval: float = 30.0,
+    ):
+        self.outbox = outbox or NotificationOutbox(os.getenv('NOTIFICATION_OUTBOX_PATH', DEFAULT_OUTBOX_PATH))
+        self.http_timeout = http_timeout
+        self.retry_interval = retry_interval
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop_pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self._pending: set = set()
+        self._retry_task = None
+
+    # ------------------------------------------------------------------
+    # 이벤트 루프
+    # ------------------------------------------------------------------
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        # fork 이후 자식 프로세스는 부모의 루프 스레드를 물려받지 못하므로 새로 띄운다
+        if self._loop_pid == os.getpid() and self._loop is not None:
+            return self._loop
+        with self._start_lock:
+            if self._loop_pid != os.getpid() or self._loop is None:
+                loop = asyncio.new_event_loop()
+
+                def create_client():
+                    self._client = httpx.AsyncClient(
+                        timeout=self.http_timeout,
+                        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                    )
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    loop.run_forever()
+
+                # 클라이언트 생성(SSL 컨텍스트 로드)은 루프 스레드의 첫 콜백으로 - 호출자(워커 기동)를 막지 않고,
+                # 이후 제출된 코루틴보다 먼저 실행된다 (루프 시작 전이라 call_soon 사용 가능)
+                loop.call_soon(create_client)
+                threading.Thread(target=run, name='notification-dispatcher', daemon=True).start()
+                self._loop, self._loop_pid, self._retry_task = loop, os.getpid(), None
+        return self._loop
+
+    def submit(self, deliveries: List[Delivery]) -> Future:
+        """발송 예약 - concurrent.futures.Future[Dict[channel, bool]] 반환"""
+        future = asyncio.run_coroutine_threadsafe(self._send_all(deliveries), self._ensure_loop())
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def send(self, deliveries: List[Delivery], wait: bool = True, timeout: Optional[float] = None) -> Dict[str, bool]:
+        """
+        채널 동시 발송
+
+        Args:
+            deliveries: 채널별 Delivery 목록
+            wait: False면 예약만 하고 즉시 빈 dict 반환 (실패분은 Outbox로 재시도)
+            timeout: wait=True일 때 최대 대기 시간
+
+        Returns:
+            채널별 발송 성공 여부
+        """
+        if not deliveries:
+            return {}
+        future = self.submit(deliveries)
+        if not wait:
+            return {}
+        return future.result(timeout)
+
+    def flush(self, timeout: float = 15.0) -> None:
+        """진행 중인 발송 완료 대기 (프로세스 종료 전)"""
+        deadline = time.monotonic() + timeout
+        for future in list(self._pending):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                future.result(remaining)
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # 발송
+    # ------------------------------------------------------------------
+    async def _send_all(self, deliveries: List[Delivery]) -> Dict[str, bool]:
+        outcomes = await asyncio.gather(*(self._deliver(d) for d in deliveries))
+        results: Dict[str, bool] = {}
+        for delivery, ok in zip(deliveries, outcomes):
+            results[delivery.channel] = results.get(delivery.channel, True) and ok
+        return results
+
+    async def _deliver(self, delivery: Delivery) -> bool:
+        """발송 1건 - 실패 시 남은 요청을 Outbox에 저장"""
+        try:
+            await self._send_requests(delivery.channel, delivery.requests)
+            logger.info(f"[Notifier] {delivery.channel} 발송 성공{f' ({delivery.label})' if delivery.label else ''}")
+            return True
+        except Exception as e:
+            sent = getattr(e, 'sent_count', 0)
+            remaining = delivery.requests[sent:]
+            logger.error(f"[Notifier] {delivery.channel} 발송 실패: {e}")
+            # 설정 누락/4xx 등 재시도해도 실패할 오류는 Outbox에 넣지 않는다
+            if remaining and (not isinstance(e, DeliveryError) or e.retryable):
+                try:
+                    await asyncio.to_thread(
+                        self.outbox.enqueue, Delivery(delivery.channel, remaining, delivery.label), str(e)
+                    )
+                    logger.info(f"[Outbox] {delivery.channel} 재시도 대기열 등록 ({len(remaining)}건)")
+                except Exception as outbox_error:
+                    logger.error(f"[Outbox] 등록 실패: {outbox_error}")
+            return False
+
+    async def _send_requests(self, channel: str, requests: List[Dict[str, Any]]) -> None:
+        if channel == 'email':
+            for i, request in enumerate(requests):
+                try:
+                    await asyncio.to_thread(_send_email_sync, request, self.http_timeout * 3)
+                except DeliveryError:
+                    raise
+                except Exception as e:
+                    raise DeliveryError(f"email: {e}", i, retryable=True)
+            return
+
+        if channel not in HTTP_CHANNELS:
+            raise DeliveryError(f"알 수 없는 채널: {channel}")
+        url = _http_endpoint(channel)
+        if not url:
+            raise DeliveryError(f"{channel} 엔드포인트가 설정되지 않았습니다.")
+
+        for i, request in enumerate(requests):
+            try:
+                response = await self._client.post(url, json=request.get('json'))
+                if response.status_code == 429:
+                    # Discord/Slack rate limit - 안내된 시간만큼 1회 대기 후 재전송
+                    retry_after = _retry_after_seconds(response)
+                    if retry_after is None or retry_after > 10:
+                        raise DeliveryError(f"{channel} rate limited", i, retryable=True)
+                    await asyncio.sleep(retry_after)
+                    response = await self._client.post(url, json=request.get('json'))
+                if response.status_code >= 500 or response.status_code == 429:
+                    raise DeliveryError(f"{channel} HTTP {response.status_code}", i, retryable=True)
+                if response.status_code >= 400:
+                    # 요청 자체가 잘못된 경우(4xx)는 재시도해도 실패하므로 Outbox에 넣지 않음
+                    raise DeliveryError(f"{channel} HTTP {response.status_code}: {response.text[:200]}", i)
+            except DeliveryError:
+                raise
+            except httpx.HTTPError as e:
+                raise DeliveryError(f"{channel} {type(e).__name__}: {e}", i, retryable=True)
+
+    # ------------------------------------------------------------------
+    # Outbox 재시도
+    # ------------------------------------------------------------------
+    async def retry_due(self) -> int:
+        """재시도 시각이 된 Outbox 항목 재발송 (반환: 성공 건수)"""
+        items = await asyncio.to_thread(self.outbox.claim_due)
+        succeeded = 0
+
+        async def retry(item):
+            nonlocal succeeded
+            requests = json.loads(item['requests'])
+            try:
+                await self._send_requests(item['channel'], requests)
+            except Exception as e:
+                remaining = requests[getattr(e, 'sent_count', 0):]
+                retryable = not isinstance(e, DeliveryError) or e.retryable
+                await asyncio.to_thread(self.outbox.reschedule, item, remaining, str(e), retryable)
+                return
+            await asyncio.to_thread(self.outbox.complete, item['id'])
+            succeeded += 1
+            logger.info(f"[Outbox] {item['channel']} 재발송 성공 (시도 {item['attempts'] + 1}회)")
+
+        await asyncio.gather(*(retry(item) for item in items))
+        return succeeded
+
+    async def _retry_loop(self) -> None:
+        while True:
+            try:
+                await self.retry_due()
+            except Exception as e:
+                logger.warning(f"[Outbox] 재시도 처리 오류: {e}")
+            await asyncio.sleep(self.retry_interval)
+
+    def start_retry_worker(self) -> None:
+        """Outbox 주기 재시도 시작 (스케줄러 워커에서 1회 호출)"""
+        loop = self._ensure_loop()
+        if self._retry_task is None:
+            self._retry_task = asyncio.run_coroutine_threadsafe(self._retry_loop(), loop)
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    try:
+        if response.headers.get('Retry-After'):
+            return float(response.headers['Retry-After'])
+        body = response.json()
+        if isinstance(body, dict):
+            if 'retry_after' in body:
+                return float(body['retry_after'])
+            if isinstance(body.get('parameters'), dict) and 'retry_after' in body['parameters']:
+                return float(body['parameters']['retry_after'])
+    except Exception:
+        pass
+    return None
+
+
+_dispatcher: Optional[NotificationDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> NotificationDispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = NotificationDispatcher()
+                atexit.register(_dispatcher.flush)
+    return _dispatcher
@@ -12,6 +12,8 @@ import logging
 from typing import Any, Optional, Dict, List, Union
 from datetime import datetime
 
+from engine.metrics import file_label, timer
+
 logger = logging.getLogger(__name__)
 
 
@@ -134,12 +136,13 @@ def load_csv_file(
         return pd.DataFrame()
 
     try:
-        return pd.read_csv(
-            filepath,
-            dtype=dtype,
-            usecols=usecols,
-            low_memory=low_memory
-        )
+        with timer('data_load_seconds', kind='csv', file=file_label(filepath)):
+            return pd.read_csv(
+                filepath,
+                dtype=dtype,
+                usecols=usecols,
+                low_memory=low_memory
+            )
     except Exception as e:
         logger.error(f"Failed to load CSV {filepath}: {e}")
         return pd.DataFrame()
@@ -163,8 +166,9 @@ def load_json_file(filepath: str) -> dict:
         return {}
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with timer('data_load_seconds', kind='json', file=file_label(filepath)):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in {filepath}: {e}")
         return {}
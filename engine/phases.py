@@ -9,15 +9,29 @@ SignalGenerator의 단계별 로직을 분리하여 독립적인 클래스로 
 Reference: PART_01.md documentation
 """
 import logging
-import time
 import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+import inspect
+from typing import List, Dict, Optional, Any, AsyncIterator, Callable
 from datetime import date, datetime
 
 from engine.models import StockData, Signal, ScoreDetail, ChartData, Grade, SignalStatus
 from engine.scorer import Scorer
-from engine.llm_analyzer import LLMAnalyzer
+from engine.config import app_config
+from engine.llm_analyzer import BatchParseError, LLMAnalyzer
+from engine.llm_scheduler import estimate_tokens
+from engine.metrics import timer
+from engine.jongga_checkpoint import (
+    RunCheckpoint,
+    STAGE_PHASE1,
+    STAGE_PHASE2,
+    STAGE_PHASE3,
+    dump_collected,
+    dump_news,
+    load_collected,
+    load_news,
+    matches_candidate,
+)
 from engine.constants import (
     TRADING_VALUES,
     PRICE_CHANGE,
@@ -41,9 +55,14 @@ class BasePhase(ABC):
     모든 Phase의 기본 클래스
     """
 
+    # 체크포인트에 종목 결과를 기록하는 단계 (None이면 기록하지 않음)
+    checkpoint_stage: Optional[str] = None
+
     def __init__(self, name: str):
         self.name = name
         self.stats = {"processed": 0, "passed": 0, "failed": 0}
+        self.checkpoint: Optional[RunCheckpoint] = None
+        self._saved: Dict[str, Any] = {}
 
     @abstractmethod
     async def execute(self, *args, **kwargs) -> Any:
@@ -55,6 +74,26 @@ class BasePhase(ABC):
         if shared_state.STOP_REQUESTED:
             raise ScreeningStoppedError(f"User requested stop during {self.name}")
 
+    def set_checkpoint(self, checkpoint: Optional[RunCheckpoint]) -> None:
+        """실행 체크포인트 연결 (기록된 종목 결과를 미리 읽어 둔다)"""
+        self.checkpoint = checkpoint
+        self._saved = {}
+        if checkpoint is not None and self.checkpoint_stage:
+            self._saved = checkpoint.load(self.checkpoint_stage)
+
+    def _restore(self, stock_code: str) -> Optional[Any]:
+        """체크포인트에 기록된 종목 결과 (없거나 버린 종목이면 None)"""
+        saved = self._saved.get(stock_code)
+        if saved is not None and stock_code in self.checkpoint.discarded:
+            return None
+        if saved is not None:
+            self.checkpoint.restored[self.checkpoint_stage] += 1
+        return saved
+
+    def _record(self, stock_code: str, payload: Any) -> None:
+        if self.checkpoint is not None and self.checkpoint_stage:
+            self.checkpoint.save(self.checkpoint_stage, stock_code, payload)
+
     def get_stats(self) -> Dict[str, int]:
         """통계 정보 반환"""
         return self.stats.copy()
@@ -74,6 +113,8 @@ class Phase1Analyzer(BasePhase):
     - 등급 미달 사전 차단
     """
 
+    checkpoint_stage = STAGE_PHASE1
+
     def __init__(
         self,
         collector,
@@ -108,16 +149,15 @@ class Phase1Analyzer(BasePhase):
             필터링된 후보 리스트 (dict 형태)
         """
         self.stats["processed"] += len(candidates)
-        results = []
+        collected = []
 
         for i, stock in enumerate(candidates):
             self._check_stop_requested()
 
             try:
-                result = await self._analyze_stock(stock)
-                if result:
-                    results.append(result)
-                    self.stats["passed"] += 1
+                item = await self._collect_or_restore(stock)
+                if item:
+                    collected.append(item)
                 else:
                     self.stats["failed"] += 1
 
@@ -129,6 +169,10 @@ class Phase1Analyzer(BasePhase):
                 logger.debug(f"Phase 1 analysis failed for {stock.name}: {e}")
                 self.stats["failed"] += 1
 
+        results = self._score_items(collected)
+        self.stats["passed"] += len(results)
+        self.stats["failed"] += len(collected) - len(results)
+
         logger.info(
             f"[Phase 1] Complete: {self.stats['passed']} passed, "
             f"{self.stats['failed']} failed (Drops: TV={self.drop_stats['low_trading_value']}, "
@@ -137,15 +181,53 @@ class Phase1Analyzer(BasePhase):
 
         return results
 
-    async def _analyze_stock(self, stock: StockData) -> Optional[Dict]:
+    async def analyze_stock(self, stock: StockData) -> Optional[Dict]:
         """
-        개별 종목 분석
+        종목 1개 분석 (스트리밍 파이프라인용, execute()와 같은 통계를 갱신)
+
+        Returns:
+            통과한 후보 dict 또는 None
+        """
+        self._check_stop_requested()
+        self.stats["processed"] += 1
+
+        try:
+            item = await self._collect_or_restore(stock)
+        except Exception as e:
+            logger.debug(f"Phase 1 analysis failed for {stock.name}: {e}")
+            item = None
+
+        results = self._score_items([item]) if item else []
+        if results:
+            self.stats["passed"] += 1
+            return results[0]
+        self.stats["failed"] += 1
+        return None
+
+    async def _collect_or_restore(self, stock: StockData) -> Optional[Dict]:
+        """체크포인트에 수집 결과가 있으면 복원, 없거나 후보와 지문이 다르면 수집 후 기록"""
+        saved = self._saved.get(stock.code)
+        if saved is not None and not matches_candidate(stock, saved):
+            logger.info(f"[Checkpoint] {stock.name}: 기록 이후 시세가 달라 다시 수집")
+            self.checkpoint.discard(stock.code)
+        saved = self._restore(stock.code)
+        if saved is not None:
+            return load_collected(stock, saved)
+
+        item = await self._collect_stock(stock)
+        if item:
+            self._record(stock.code, dump_collected(item))
+        return item
+
+    async def _collect_stock(self, stock: StockData) -> Optional[Dict]:
+        """
+        개별 종목 데이터 수집 (상세/차트/수급/VCP)
 
         Args:
             stock: 종목 데이터
 
         Returns:
-            분석 결과 dict 또는 None (필터링됨)
+            수집 결과 dict 또는 None (수집 실패)
         """
         try:
             # 1. 상세 정보 조회
@@ -160,24 +242,19 @@ class Phase1Analyzer(BasePhase):
             # 3. 수급 데이터
             supply = await self.collector.get_supply_data(stock.code)
 
-            # 4. Pre-Score 계산 (뉴스/LLM 없음)
-            pre_score, _, score_details = self.scorer.calculate(
-                stock, charts, [], supply, None
-            )
-
             # [NEW] VCP 패턴 분석
             vcp_data = None
             try:
                 import pandas as pd
                 from engine.vcp import detect_vcp_pattern
                 
-                if charts and len(charts.closes) >= 60:
+                if charts and len(charts.close_array) >= 60:
                     df = pd.DataFrame({
-                        'open': charts.opens,
-                        'high': charts.highs,
-                        'low': charts.lows,
-                        'close': charts.closes,
-                        'volume': charts.volumes,
+                        'open': charts.open_array,
+                        'high': charts.high_array,
+                        'low': charts.low_array,
+                        'close': charts.close_array,
+                        'volume': charts.volume_array,
                         'date': charts.dates
                     })
                     # 날짜 형식 변환 (YYYYMMDD -> datetime)
@@ -195,38 +272,71 @@ class Phase1Analyzer(BasePhase):
             except Exception as e:
                 logger.debug(f"VCP analysis failed for {stock.name}: {e}")
 
-            # 5. 필터 조건 검증
-            trading_value = getattr(stock, 'trading_value', 0)
+            return {
+                'stock': stock,
+                'charts': charts,
+                'supply': supply,
+                'vcp': vcp_data
+            }
+
+        except Exception as e:
+            logger.debug(f"Analysis error for {stock.name}: {e}")
+            self.drop_stats["other"] += 1
+            return None
+
+    def _score_items(self, items: List[Dict]) -> List[Dict]:
+        """
+        수집된 종목 Pre-Score 일괄 계산 (뉴스/LLM 없음) 및 필터 조건 검증
+
+        Args:
+            items: _collect_stock 결과 리스트
 
-            # 필터 1: 거래대금
+        Returns:
+            필터링된 후보 리스트
+        """
+        # 필터 1: 거래대금
+        eligible = []
+        for item in items:
+            stock = item['stock']
+            trading_value = getattr(stock, 'trading_value', 0)
             if trading_value < self.trading_value_min:
                 self.drop_stats["low_trading_value"] += 1
                 logger.debug(f"[Drop] {stock.name}: Trading value {trading_value // 100_000_000}B < {self.trading_value_min // 100_000_000}B")
-                return None
+                continue
+            eligible.append(item)
+
+        if not eligible:
+            return []
 
-            # 필터 2: 등급 미달 사전 차단
-            temp_grade = self.scorer.determine_grade(
-                stock, pre_score, score_details, supply, charts, allow_no_news=True
+        try:
+            scored = self.scorer.score_candidates(
+                [item['stock'] for item in eligible],
+                [item['charts'] for item in eligible],
+                [item['supply'] for item in eligible],
+                allow_no_news=True
             )
+        except Exception as e:
+            logger.warning(f"Phase 1 batch scoring failed: {e}")
+            self.drop_stats["other"] += len(eligible)
+            return []
 
+        # 필터 2: 등급 미달 사전 차단
+        results = []
+        for item, (pre_score, _, score_details, temp_grade) in zip(eligible, scored):
             if not temp_grade:
                 self.drop_stats["grade_fail"] += 1
-                return None
-
-            return {
-                'stock': stock,
-                'charts': charts,
-                'supply': supply,
+                continue
+            results.append({
+                'stock': item['stock'],
+                'charts': item['charts'],
+                'supply': item['supply'],
                 'pre_score': pre_score,
                 'score_details': score_details,
                 'temp_grade': temp_grade,
-                'vcp': vcp_data
-            }
+                'vcp': item['vcp']
+            })
 
-        except Exception as e:
-            logger.debug(f"Analysis error for {stock.name}: {e}")
-            self.drop_stats["other"] += 1
-            return None
+        return results
 
     def get_drop_stats(self) -> Dict[str, int]:
         """탈락 통계 반환"""
@@ -244,6 +354,8 @@ class Phase2NewsCollector(BasePhase):
     - 뉴스 없는 종목 제외
     """
 
+    checkpoint_stage = STAGE_PHASE2
+
     def __init__(self, news_collector, max_news_per_stock: int = 3):
         super().__init__("Phase2: News Collection")
         self.news_collector = news_collector
@@ -263,40 +375,60 @@ class Phase2NewsCollector(BasePhase):
         Returns:
             뉴스가 추가된 리스트
         """
-        self.stats["processed"] += len(items)
         results = []
 
         for item in items:
-            self._check_stop_requested()
+            result = await self.collect_news(item)
+            if result:
+                results.append(result)
 
-            try:
-                stock = item['stock']
+        logger.info(
+            f"[Phase 2] Complete: {self.stats['passed']} with news, "
+            f"{self.no_news_count} without news"
+        )
+
+        return results
+
+    async def collect_news(self, item: Dict) -> Optional[Dict]:
+        """
+        종목 1개 뉴스 수집
+
+        Returns:
+            뉴스가 추가된 item 또는 None (뉴스 없음/실패)
+        """
+        self._check_stop_requested()
+        self.stats["processed"] += 1
+
+        try:
+            stock = item['stock']
+            saved = self._restore(stock.code)
+            if saved is not None:
+                news_list = load_news(saved)
+            else:
                 news_list = await self.news_collector.get_stock_news(
                     stock.code,
                     self.max_news_per_stock,
                     stock.name
                 )
-
+                # 빈 결과는 기록하지 않는다 (일시적 수집 실패가 재개 후에도 '뉴스 없음'으로 굳지 않도록)
                 if news_list:
-                    item['news'] = news_list
-                    results.append(item)
-                    self.stats["passed"] += 1
-                    logger.debug(f"[News] {stock.name}: {len(news_list)} collected")
-                else:
-                    self.no_news_count += 1
-                    self.stats["failed"] += 1
-                    logger.debug(f"[No News] {stock.name}")
+                    self._record(stock.code, dump_news(news_list))
 
-            except Exception as e:
-                logger.debug(f"News collection failed: {e}")
-                self.stats["failed"] += 1
+            if news_list:
+                item['news'] = news_list
+                self.stats["passed"] += 1
+                logger.debug(f"[News] {stock.name}: {len(news_list)} collected")
+                return item
 
-        logger.info(
-            f"[Phase 2] Complete: {self.stats['passed']} with news, "
-            f"{self.no_news_count} without news"
-        )
+            self.no_news_count += 1
+            self.stats["failed"] += 1
+            logger.debug(f"[No News] {stock.name}")
 
-        return results
+        except Exception as e:
+            logger.debug(f"News collection failed: {e}")
+            self.stats["failed"] += 1
+
+        return None
 
     def get_no_news_count(self) -> int:
         """뉴스 없는 종목 수 반환"""
@@ -311,29 +443,33 @@ class Phase3LLMAnalyzer(BasePhase):
     3단계: 배치 LLM 분석
 
     - 뉴스가 있는 종목을 LLM으로 일괄 분석
-    - 청크 단위로 병렬 처리
-    - Rate Limit 방지를 위한 지연 시간 적용
+    - 종목별 예상 토큰으로 청크를 채워(토큰 예산 + 최대 종목 수) 병렬 처리
+    - 응답 파싱에 실패한 청크는 반으로 나눠 재시도
+    - on_result를 주면 응답을 스트리밍으로 받아 종목 결과가 완성되는 즉시 전달
+    - 체크포인트에 결과가 있는 종목은 다시 분석하지 않음
+    - 동시성/Rate Limit은 provider별 LLM 스케줄러가 실제 쿼터에 맞춰 제어 (engine.llm_scheduler)
     """
 
+    checkpoint_stage = STAGE_PHASE3
+
     def __init__(
         self,
         llm_analyzer: LLMAnalyzer,
         chunk_size: int = None,
-        concurrency: int = None,
-        request_delay: float = None
+        token_budget: int = None
     ):
         super().__init__("Phase3: LLM Analysis")
         self.llm_analyzer = llm_analyzer
 
         # Thresholds from constants
         self.chunk_size = chunk_size or LLM_THRESHOLD.CHUNK_SIZE_ANALYSIS
-        self.concurrency = concurrency or LLM_THRESHOLD.CONCURRENCY_ANALYSIS
-        self.request_delay = request_delay or LLM_THRESHOLD.REQUEST_DELAY
+        self.token_budget = token_budget or app_config.ANALYSIS_LLM_CHUNK_TOKEN_BUDGET
 
     async def execute(
         self,
         items: List[Dict],
-        market_status: Dict = None
+        market_status: Dict = None,
+        on_result: Optional[Callable[[str, Dict], Any]] = None
     ) -> Dict[str, Dict]:
         """
         LLM 배치 분석 실행
@@ -341,6 +477,8 @@ class Phase3LLMAnalyzer(BasePhase):
         Args:
             items: Phase 2 결과 리스트 (뉴스 포함)
             market_status: Market Gate 상태
+            on_result: 종목 결과 콜백 (종목명, 결과). 주면 스트리밍 모드로 동작하며
+                코루틴 함수도 가능
 
         Returns:
             {종목명: {score, action, confidence, reason}} 형태의 dict
@@ -351,46 +489,38 @@ class Phase3LLMAnalyzer(BasePhase):
             logger.info("[Phase 3] Skipped: No LLM client or items")
             return {}
 
-        # Split into chunks
-        chunks = self._create_chunks(items, self.chunk_size)
-        total_chunks = len(chunks)
-
-        logger.info(f"[Phase 3] Processing {len(items)} items in {total_chunks} chunks...")
-
-        # Process chunks with concurrency control
-        semaphore = asyncio.Semaphore(self.concurrency)
+        # 체크포인트에 결과가 있는 종목은 제외
         results = {}
+        pending = []
+        for item in items:
+            saved = self._restore(item['stock'].code)
+            if saved is not None:
+                results[item['stock'].name] = saved
+                self.stats["passed"] += 1
+                if on_result is not None:
+                    outcome = on_result(item['stock'].name, saved)
+                    if inspect.isawaitable(outcome):
+                        await outcome
+            else:
+                pending.append(item)
 
-        async def process_chunk(chunk_idx: int, chunk_data: List[Dict]) -> Dict:
-            async with semaphore:
-                self._check_stop_requested()
-
-                start = time.time()
-                logger.info(f"[LLM Batch] Chunk {chunk_idx}/{total_chunks} ({len(chunk_data)} stocks)...")
-
-                try:
-                    chunk_result = await self.llm_analyzer.analyze_news_batch(
-                        chunk_data,
-                        market_status
-                    )
-
-                    # Rate limit delay
-                    if self.request_delay > 0:
-                        await asyncio.sleep(self.request_delay)
+        # Split into chunks
+        chunks = self._create_chunks(
+            pending, self.chunk_size, self.token_budget,
+            base_tokens=self._estimate_base_tokens(market_status) if self.token_budget else 0
+        )
+        total_chunks = len(chunks)
 
-                    elapsed = time.time() - start
-                    logger.info(f"[LLM Batch] Chunk {chunk_idx} done in {elapsed:.2f}s")
-                    self.stats["passed"] += len(chunk_result)
-                    return chunk_result
+        logger.info(
+            f"[Phase 3] Processing {len(pending)} items in {total_chunks} chunks"
+            f" ({len(results)} restored from checkpoint)..."
+        )
 
-                except Exception as e:
-                    logger.warning(f"[LLM Batch] Chunk {chunk_idx} error: {e}")
-                    self.stats["failed"] += len(chunk_data)
-                    return {}
+        # 동시성/호출 간격은 LLM 스케줄러가 결정 (청크는 모두 제출하고 슬롯 순서대로 실행)
 
         # Run all chunks
         tasks = [
-            process_chunk(i, chunk)
+            self._process_chunk(str(i), chunk, market_status, on_result, total_chunks)
             for i, chunk in enumerate(chunks, 1)
         ]
 
@@ -408,9 +538,245 @@ class Phase3LLMAnalyzer(BasePhase):
 
         return results
 
-    def _create_chunks(self, items: List[Any], size: int) -> List[List[Any]]:
-        """리스트를 청크로 분할"""
-        return [items[i:i + size] for i in range(0, len(items), size)]
+    async def execute_stream(
+        self,
+        items: AsyncIterator[Dict],
+        market_status: Dict,
+        on_item: Callable[[Dict, Optional[Dict]], Any]
+    ) -> Dict[str, Dict]:
+        """
+        LLM 배치 분석 (스트리밍 파이프라인용)
+
+        도착하는 종목을 execute()와 같은 기준으로 청크에 채우고, 청크가 차는 즉시 분석을 시작한다.
+        on_item(item, 결과 또는 None)은 종목마다 정확히 한 번 호출된다 (결과가 도착하는 즉시,
+        결과가 없는 종목은 청크가 끝난 뒤 None으로).
+
+        Returns:
+            {종목명: 결과} 형태의 dict
+        """
+        use_llm = bool(self.llm_analyzer.client)
+        results: Dict[str, Dict] = {}
+        tasks: List[asyncio.Task] = []
+        current: List[Dict] = []
+        base_tokens = self._estimate_base_tokens(market_status) if self.token_budget and use_llm else 0
+        current_tokens = base_tokens
+
+        async def notify(item: Dict, result: Optional[Dict]) -> None:
+            outcome = on_item(item, result)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+        async def run_chunk(chunk_idx: int, chunk_data: List[Dict]) -> None:
+            by_name = {item['stock'].name: item for item in chunk_data}
+            pending = dict(by_name)
+
+            async def on_result(name: str, result: Dict) -> None:
+                item = pending.pop(name, None)
+                if item is not None:
+                    await notify(item, result)
+
+            chunk_result = await self._process_chunk(str(chunk_idx), chunk_data, market_status, on_result)
+            results.update(chunk_result)
+            for item in pending.values():
+                await notify(item, None)
+
+        def dispatch() -> None:
+            nonlocal current, current_tokens
+            if current:
+                tasks.append(asyncio.create_task(run_chunk(len(tasks) + 1, current)))
+                current, current_tokens = [], base_tokens
+
+        try:
+            async for item in items:
+                self.stats["processed"] += 1
+                if not use_llm:
+                    await notify(item, None)
+                    continue
+
+                saved = self._restore(item['stock'].code)
+                if saved is not None:
+                    results[item['stock'].name] = saved
+                    self.stats["passed"] += 1
+                    await notify(item, saved)
+                    continue
+
+                tokens = self._estimate_item_tokens(item) if self.token_budget else 0
+                if current and (
+                    len(current) >= self.chunk_size
+                    or (self.token_budget and current_tokens + tokens > self.token_budget)
+                ):
+                    dispatch()
+                current.append(item)
+                current_tokens += tokens
+                if len(current) >= self.chunk_size:
+                    dispatch()
+
+            dispatch()
+            if tasks:
+                await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if not use_llm:
+            logger.info("[Phase 3] Skipped: No LLM client")
+        else:
+            logger.info(
+                f"[Phase 3] Complete: {len(results)} stocks analyzed in {len(tasks)} chunks, "
+                f"{self.stats['failed']} failed"
+            )
+        return results
+
+    async def _process_chunk(
+        self,
+        label: str,
+        chunk_data: List[Dict],
+        market_status: Dict,
+        on_result: Optional[Callable[[str, Dict], Any]] = None,
+        total_chunks: int = 0
+    ) -> Dict:
+        """청크 1개 분석 + 통계 갱신 (실패한 청크는 빈 결과)"""
+        self._check_stop_requested()
+
+        of_total = f"/{total_chunks}" if total_chunks else ""
+        logger.info(f"[LLM Batch] Chunk {label}{of_total} ({len(chunk_data)} stocks)...")
+
+        codes = {item['stock'].name: item['stock'].code for item in chunk_data}
+
+        def record(name: str, result: Dict) -> None:
+            if name in codes:
+                self._record(codes[name], result)
+
+        try:
+            with timer('pipeline_chunk_seconds', mode='stream' if on_result is not None else 'call') as chunk_timer:
+                if on_result is not None:
+                    def on_result_recorded(name: str, result: Dict) -> Any:
+                        record(name, result)
+                        return on_result(name, result)
+
+                    chunk_result = await self._stream_chunk(label, chunk_data, market_status, on_result_recorded)
+                else:
+                    chunk_result = await self._analyze_chunk(label, chunk_data, market_status)
+                    for name, result in chunk_result.items():
+                        record(name, result)
+
+            logger.info(f"[LLM Batch] Chunk {label} done in {chunk_timer.elapsed:.2f}s")
+            self.stats["passed"] += len(chunk_result)
+            return chunk_result
+
+        except Exception as e:
+            logger.warning(f"[LLM Batch] Chunk {label} error: {e}")
+            self.stats["failed"] += len(chunk_data)
+            return {}
+
+    async def _analyze_chunk(self, label: str, chunk_data: List[Dict], market_status: Dict) -> Dict:
+        """청크 분석. 응답 파싱 실패 시 반으로 나눠 재시도 (1종목 청크는 포기)"""
+        try:
+            return await self.llm_analyzer.analyze_news_batch(
+                chunk_data,
+                market_status,
+                raise_parse_errors=True
+            )
+        except BatchParseError:
+            if len(chunk_data) <= 1:
+                logger.warning(f"[LLM Batch] Chunk {label} 응답 파싱 실패 (1종목) - 건너뜀")
+                return {}
+
+        mid = len(chunk_data) // 2
+        logger.warning(
+            f"[LLM Batch] Chunk {label} 응답 파싱 실패 → "
+            f"{mid}/{len(chunk_data) - mid}종목으로 나눠 재시도"
+        )
+        left, right = await asyncio.gather(
+            self._analyze_chunk(f"{label}a", chunk_data[:mid], market_status),
+            self._analyze_chunk(f"{label}b", chunk_data[mid:], market_status),
+        )
+        return {**left, **right}
+
+    async def _stream_chunk(
+        self,
+        label: str,
+        chunk_data: List[Dict],
+        market_status: Dict,
+        on_result: Callable[[str, Dict], Any]
+    ) -> Dict:
+        """
+        청크 스트리밍 분석
+
+        완성된 종목 결과를 바로 on_result로 넘긴다. 유효한 원소가 하나도 없으면 반으로 나눠 재시도하고,
+        도중에 호출이 실패하면 이미 받은 결과만 남기고 나머지 종목은 실패로 둔다.
+        """
+        results: Dict[str, Dict] = {}
+        try:
+            async for name, result in self.llm_analyzer.stream_news_batch(chunk_data, market_status):
+                results[name] = result
+                outcome = on_result(name, result)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            return results
+        except BatchParseError:
+            if len(chunk_data) <= 1:
+                logger.warning(f"[LLM Batch] Chunk {label} 응답 파싱 실패 (1종목) - 건너뜀")
+                return {}
+        except Exception as e:
+            if not results:
+                raise
+            logger.warning(f"[LLM Batch] Chunk {label} 스트리밍 중단 ({len(results)}종목 수신 후): {e}")
+            return results
+
+        mid = len(chunk_data) // 2
+        logger.warning(
+            f"[LLM Batch] Chunk {label} 응답 파싱 실패 → "
+            f"{mid}/{len(chunk_data) - mid}종목으로 나눠 재시도"
+        )
+        left, right = await asyncio.gather(
+            self._stream_chunk(f"{label}a", chunk_data[:mid], market_status, on_result),
+            self._stream_chunk(f"{label}b", chunk_data[mid:], market_status, on_result),
+        )
+        return {**left, **right}
+
+    def _estimate_item_tokens(self, item: Dict) -> int:
+        """종목 1개가 배치 프롬프트에 더하는 예상 토큰 (입력 텍스트 + 예상 출력)"""
+        try:
+            text = self.llm_analyzer._build_stocks_text([item])
+        except Exception:
+            text = ''
+        return estimate_tokens(text, expected_output=LLM_THRESHOLD.OUTPUT_TOKENS_PER_STOCK)
+
+    def _estimate_base_tokens(self, market_status: Dict = None) -> int:
+        """종목이 없는 배치 프롬프트(지시문 + 시장 상황)의 예상 토큰. 청크마다 한 번씩 붙는다."""
+        try:
+            text = self.llm_analyzer._build_batch_prompt([], market_status)
+        except Exception:
+            text = ''
+        return estimate_tokens(text, expected_output=0)
+
+    def _create_chunks(
+        self, items: List[Any], size: int, token_budget: int = 0, base_tokens: int = 0
+    ) -> List[List[Any]]:
+        """
+        리스트를 청크로 분할
+
+        token_budget이 있으면 프롬프트 기본 토큰(base_tokens)에 종목별 예상 토큰을 순서대로 채워 넣고,
+        예산이나 size를 넘기 전에 새 청크를 시작한다. (예산보다 큰 종목 1개는 단독 청크)
+        """
+        if not token_budget:
+            return [items[i:i + size] for i in range(0, len(items), size)]
+
+        chunks: List[List[Any]] = []
+        current: List[Any] = []
+        current_tokens = base_tokens
+        for item in items:
+            tokens = self._estimate_item_tokens(item)
+            if current and (len(current) >= size or current_tokens + tokens > token_budget):
+                chunks.append(current)
+                current, current_tokens = [], base_tokens
+            current.append(item)
+            current_tokens += tokens
+        if current:
+            chunks.append(current)
+        return chunks
 
 
 # =============================================================================
@@ -461,41 +827,87 @@ class Phase4SignalFinalizer(BasePhase):
         self.stats["processed"] += len(items)
         signals = []
 
-        for item in items:
-            self._check_stop_requested()
+        # 최종 점수/등급 일괄 계산 (실패 시 종목별 계산으로 대체)
+        try:
+            scored = self.scorer.score_candidates(
+                [item['stock'] for item in items],
+                [item['charts'] for item in items],
+                [item['supply'] for item in items],
+                news=[item.get('news', []) for item in items],
+                llm_results=[llm_results.get(item['stock'].name) for item in items]
+            )
+        except Exception as e:
+            logger.warning(f"Phase 4 batch scoring failed, falling back to per-stock: {e}")
+            scored = [None] * len(items)
 
-            try:
-                signal = await self._create_signal(
-                    item,
-                    llm_results,
-                    target_date
-                )
+        for item, item_score in zip(items, scored):
+            signal = await self._finalize_item(item, llm_results, target_date, item_score)
+            if signal:
+                signals.append(signal)
 
-                if signal:
-                    grade_val = getattr(signal.grade, 'value', signal.grade)
-                    signals.append(signal)
-                    self._update_grade_stats(grade_val)
-                    self.stats["passed"] += 1
-                else:
-                    self.stats["failed"] += 1
+        self.log_summary(len(signals))
+        return signals
 
-            except Exception as e:
-                logger.info(f"[Error Phase4] Signal creation failed for {item['stock'].name}: {e}")
-                self.stats["failed"] += 1
+    async def finalize(
+        self,
+        item: Dict,
+        llm_result: Optional[Dict],
+        target_date: date
+    ) -> Optional[Signal]:
+        """
+        종목 1개 최종 시그널 생성 (스트리밍 파이프라인용, execute()와 같은 통계를 갱신)
+
+        Returns:
+            Signal 객체 또는 None (등급 미달/실패)
+        """
+        self.stats["processed"] += 1
+        llm_results = {item['stock'].name: llm_result} if llm_result else {}
+        return await self._finalize_item(item, llm_results, target_date)
 
+    def log_summary(self, signal_count: int) -> None:
         logger.info(
-            f"[Phase 4] Complete: {len(signals)} signals created "
+            f"[Phase 4] Complete: {signal_count} signals created "
             f"(S:{self.final_stats['S']}, A:{self.final_stats['A']}, "
             f"B:{self.final_stats['B']})"
         )
 
-        return signals
+    async def _finalize_item(
+        self,
+        item: Dict,
+        llm_results: Dict[str, Dict],
+        target_date: date,
+        item_score: Optional[tuple] = None
+    ) -> Optional[Signal]:
+        """시그널 생성 + 통계 갱신"""
+        self._check_stop_requested()
+
+        try:
+            signal = await self._create_signal(
+                item,
+                llm_results,
+                target_date,
+                item_score
+            )
+
+            if signal:
+                grade_val = getattr(signal.grade, 'value', signal.grade)
+                self._update_grade_stats(grade_val)
+                self.stats["passed"] += 1
+            else:
+                self.stats["failed"] += 1
+            return signal
+
+        except Exception as e:
+            logger.info(f"[Error Phase4] Signal creation failed for {item['stock'].name}: {e}")
+            self.stats["failed"] += 1
+            return None
 
     async def _create_signal(
         self,
         item: Dict,
         llm_results: Dict[str, Dict],
-        target_date: date
+        target_date: date,
+        item_score: Optional[tuple] = None
     ) -> Optional[Signal]:
         """
         시그널 생성
@@ -504,6 +916,7 @@ class Phase4SignalFinalizer(BasePhase):
             item: 종목 데이터 dict
             llm_results: LLM 분석 결과 맵
             target_date: 대상 날짜
+            item_score: score_candidates 결과 (없으면 단건 계산)
 
         Returns:
             Signal 객체 또는 None
@@ -514,21 +927,18 @@ class Phase4SignalFinalizer(BasePhase):
         supply = item['supply']
         llm_result = llm_results.get(stock.name)
 
-        # 최종 점수 계산
-        score, checklist, score_details = self.scorer.calculate(
-            stock, charts, news, supply, llm_result
-        )
+        # 최종 점수 계산 및 등급 판정
+        if item_score is None:
+            item_score = self.scorer.score_candidates(
+                [stock], [charts], [supply], news=[news], llm_results=[llm_result]
+            )[0]
+        score, checklist, score_details, grade = item_score
 
         # AI 분석 결과 보존
         if llm_result:
             score_details['ai_evaluation'] = llm_result
             score.ai_evaluation = llm_result
 
-        # 등급 판정
-        grade = self.scorer.determine_grade(
-            stock, score, score_details, supply, charts
-        )
-
         # [NEW] VCP 데이터 추가 (Frontend 표시용)
         vcp_data = item.get('vcp')
         if vcp_data:
@@ -597,11 +1007,16 @@ class Phase4SignalFinalizer(BasePhase):
 # =============================================================================
 # Pipeline Orchestrator
 # =============================================================================
+_END_OF_STREAM = object()
+
+
 class SignalGenerationPipeline:
     """
     시그널 생성 파이프라인
 
-    모든 Phase를 순차적으로 실행하고 결과를 집계합니다.
+    기본 모드는 모든 Phase를 순차적으로 실행하고 결과를 집계합니다.
+    streaming=True면 Phase 사이를 크기 제한 큐로 연결해 종목 단위로 흘려보냅니다.
+    (Phase 1 통과 즉시 뉴스 수집, 청크가 차는 즉시 LLM 분석, 결과 도착 즉시 최종 시그널 생성)
     """
 
     def __init__(
@@ -609,12 +1024,21 @@ class SignalGenerationPipeline:
         phase1: Phase1Analyzer,
         phase2: Phase2NewsCollector,
         phase3: Phase3LLMAnalyzer,
-        phase4: Phase4SignalFinalizer
+        phase4: Phase4SignalFinalizer,
+        streaming: bool = False,
+        queue_size: int = 32
     ):
         self.phase1 = phase1
         self.phase2 = phase2
         self.phase3 = phase3
         self.phase4 = phase4
+        self.streaming = streaming
+        self.queue_size = queue_size
+
+    def set_checkpoint(self, checkpoint: Optional[RunCheckpoint]) -> None:
+        """모든 Phase에 실행 체크포인트 연결 (None이면 해제)"""
+        for phase in (self.phase1, self.phase2, self.phase3, self.phase4):
+            phase.set_checkpoint(checkpoint)
 
     async def execute(
         self,
@@ -635,17 +1059,22 @@ class SignalGenerationPipeline:
         """
         target_date = target_date or date.today()
 
+        if self.streaming:
+            return await self._execute_streaming(candidates, market_status, target_date)
+
         # Phase 1: Base Analysis
         logger.info("=" * 60)
         logger.info("[Pipeline] Phase 1: Base Analysis & Pre-Screening")
-        phase1_results = await self.phase1.execute(candidates)
+        with timer('pipeline_phase_seconds', phase='phase1', mode='sequential'):
+            phase1_results = await self.phase1.execute(candidates)
 
         if not phase1_results:
             raise NoCandidatesError("All", "No candidates passed Phase 1")
 
         # Phase 2: News Collection
         logger.info("[Pipeline] Phase 2: News Collection")
-        phase2_results = await self.phase2.execute(phase1_results)
+        with timer('pipeline_phase_seconds', phase='phase2', mode='sequential'):
+            phase2_results = await self.phase2.execute(phase1_results)
 
         if not phase2_results:
             raise AllCandidatesFilteredError(
@@ -655,18 +1084,110 @@ class SignalGenerationPipeline:
 
         # Phase 3: LLM Batch Analysis
         logger.info("[Pipeline] Phase 3: LLM Batch Analysis")
-        llm_results = await self.phase3.execute(phase2_results, market_status)
+        with timer('pipeline_phase_seconds', phase='phase3', mode='sequential'):
+            llm_results = await self.phase3.execute(phase2_results, market_status)
 
         # Phase 4: Signal Finalization
         logger.info("[Pipeline] Phase 4: Signal Finalization")
-        signals = await self.phase4.execute(
-            phase2_results,
-            llm_results,
-            target_date
-        )
+        with timer('pipeline_phase_seconds', phase='phase4', mode='sequential'):
+            signals = await self.phase4.execute(
+                phase2_results,
+                llm_results,
+                target_date
+            )
 
         return signals
 
+    async def _execute_streaming(
+        self,
+        candidates: List[StockData],
+        market_status: Optional[Dict],
+        target_date: date
+    ) -> List[Signal]:
+        """
+        스트리밍 모드 실행
+
+        각 Phase가 별도 Task로 동시에 돌고, 한 단계가 실패(중단 요청 포함)하면 나머지를 취소하고 예외를 전파한다.
+        시그널 순서는 순차 모드와 같도록 후보 순서로 정렬해 반환한다.
+        """
+        logger.info("=" * 60)
+        logger.info(f"[Pipeline] Streaming mode: {len(candidates)} candidates")
+
+        to_news: asyncio.Queue = asyncio.Queue(self.queue_size)
+        to_llm: asyncio.Queue = asyncio.Queue(self.queue_size)
+        to_final: asyncio.Queue = asyncio.Queue(self.queue_size)
+        order = {id(stock): i for i, stock in enumerate(candidates)}
+        counts = {"phase1": 0, "phase2": 0}
+        finalized: List[tuple] = []  # (후보 순번, Signal)
+
+        async def drain(queue: asyncio.Queue) -> AsyncIterator[Any]:
+            while True:
+                value = await queue.get()
+                if value is _END_OF_STREAM:
+                    return
+                yield value
+
+        async def run_phase1() -> None:
+            for stock in candidates:
+                item = await self.phase1.analyze_stock(stock)
+                if item:
+                    counts["phase1"] += 1
+                    await to_news.put(item)
+            await to_news.put(_END_OF_STREAM)
+            logger.info(f"[Phase 1] Complete: {counts['phase1']} passed")
+
+        async def run_phase2() -> None:
+            async for item in drain(to_news):
+                result = await self.phase2.collect_news(item)
+                if result:
+                    counts["phase2"] += 1
+                    await to_llm.put(result)
+            await to_llm.put(_END_OF_STREAM)
+            logger.info(f"[Phase 2] Complete: {counts['phase2']} with news")
+
+        async def run_phase3() -> None:
+            async def on_item(item: Dict, llm_result: Optional[Dict]) -> None:
+                await to_final.put((item, llm_result))
+
+            await self.phase3.execute_stream(drain(to_llm), market_status, on_item)
+            await to_final.put(_END_OF_STREAM)
+
+        async def run_phase4() -> None:
+            async for item, llm_result in drain(to_final):
+                signal = await self.phase4.finalize(item, llm_result, target_date)
+                if signal:
+                    finalized.append((order.get(id(item['stock']), 0), signal))
+            self.phase4.log_summary(len(finalized))
+
+        async def timed_phase(phase: str, run: Callable) -> None:
+            # 단계가 동시에 돌기 때문에 각 값은 시작부터 마지막 종목 처리까지의 구간이다
+            with timer('pipeline_phase_seconds', phase=phase, mode='streaming'):
+                await run()
+
+        tasks = [
+            asyncio.create_task(timed_phase('phase1', run_phase1)),
+            asyncio.create_task(timed_phase('phase2', run_phase2)),
+            asyncio.create_task(timed_phase('phase3', run_phase3)),
+            asyncio.create_task(timed_phase('phase4', run_phase4)),
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception():
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if not counts["phase1"]:
+            raise NoCandidatesError("All", "No candidates passed Phase 1")
+        if not counts["phase2"]:
+            raise AllCandidatesFilteredError(counts["phase1"], "No candidates with news")
+
+        finalized.sort(key=lambda pair: pair[0])
+        return [signal for _, signal in finalized]
+
     def get_pipeline_stats(self) -> Dict[str, Dict]:
         """파이프라인 전체 통계"""
         return {
@@ -4,23 +4,313 @@
 Engine - Scorer (12점 점수 시스템)
 
 Refactored to use GradeClassifier module for grade determination logic.
+Batch API (calculate_batch / determine_grades) scores N candidates in one pass;
+calculate() / determine_grade() are single-row wrappers around it.
 
 Created: 2024-12-01
 Refactored: 2025-02-11 (Phase 4)
 """
 import logging
 import re
-from typing import Optional, List, Dict
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from engine.models import (
     StockData, ScoreDetail, ChecklistDetail, ChartData, SupplyData, Grade, NewsItem
 )
 from engine.config import config, SignalConfig
 from engine.constants import VOLUME, PRICE_CHANGE, TRADING_VALUES
-from engine.grade_classifier import FilterValidator, GradeClassifier
+from engine.grade_classifier import FilterValidator, GradeClassifier, GRADE_BY_CODE, GRADE_CODE_NONE
 
 logger = logging.getLogger(__name__)
 
+BOLLINGER_WINDOW = 20
+BOLLINGER_LOOKBACK = 20
+# 배치 차트 행렬 폭: MA60 합계에 필요한 최근 60일 (볼린저 39일, 거래량 21일, 고가 10일 포함)
+BATCH_CHART_WINDOW = 60
+
+
+# ============================================================================
+# NumPy 지표 커널
+# - 합계는 Python sum()과 같은 좌->우 누적 순서로 계산하여 기존 점수와 비트 단위로 동일하다
+#   (np.sum의 pairwise 합산은 마지막 자리 오차로 임계값 비교 결과가 달라질 수 있음)
+# - 차트 행렬은 오른쪽 정렬 + 왼쪽 0 패딩: 0을 더해도 합계가 변하지 않으므로
+#   "보유 구간만 합산"하던 기존 slice 동작과 같은 값을 낸다
+# ============================================================================
+
+def _sequential_row_sums(matrix: np.ndarray) -> np.ndarray:
+    """마지막 축 방향 순차 합계 (행 단위 벡터화)"""
+    if matrix.shape[-1] == 0:
+        return np.zeros(matrix.shape[:-1], dtype=matrix.dtype)
+    total = matrix[..., 0].copy()
+    for k in range(1, matrix.shape[-1]):
+        total += matrix[..., k]
+    return total
+
+
+def _bollinger_band_widths(closes: np.ndarray, window: int = BOLLINGER_WINDOW, count: int = BOLLINGER_LOOKBACK):
+    """
+    최근 count개 이동 구간의 볼린저 밴드 (2σ)
+
+    Args:
+        closes: (N, W) 종가 행렬, W >= window + count - 1
+
+    Returns:
+        (band_width, avg, upper) 각 (N, count) - 열 0이 오늘을 끝으로 하는 구간, 1이 어제...
+    """
+    recent = closes[:, -(window + count - 1):]
+    windows = sliding_window_view(recent, window, axis=1)[:, ::-1, :]
+
+    avg = _sequential_row_sums(windows) / window
+    variance = _sequential_row_sums((windows - avg[..., None]) ** 2) / window
+    std_dev = np.sqrt(variance)
+
+    upper = avg + (std_dev * 2)
+    lower = avg - (std_dev * 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        band_width = (upper - lower) / avg
+    return band_width, avg, upper
+
+
+def _tail_matrix(series: Sequence[Optional[np.ndarray]], width: int, dtype) -> np.ndarray:
+    """종목별 1차원 배열의 최근 width개를 오른쪽 정렬한 (N, width) 행렬"""
+    matrix = np.zeros((len(series), width), dtype=dtype)
+    for row, values in enumerate(series):
+        if values is None:
+            continue
+        k = min(width, len(values))
+        if k:
+            matrix[row, width - k:] = values[-k:]
+    return matrix
+
+
+@dataclass
+class ScoringBatch:
+    """
+    N개 종목 배치 입력 (열 단위)
+
+    차트 행렬은 (N, BATCH_CHART_WINDOW) 오른쪽 정렬, chart_length는 실제 일수.
+    news_score는 텍스트 기반 계산이므로 호출 측에서 _score_news 결과(또는 저장된 점수)를 넘긴다.
+    """
+    trading_value: np.ndarray
+    change_pct: np.ndarray
+    close: np.ndarray
+    high_52w: np.ndarray
+    volume: np.ndarray
+    foreign_buy_5d: np.ndarray
+    inst_buy_5d: np.ndarray
+    has_supply: np.ndarray
+    news_score: np.ndarray
+    has_charts: np.ndarray
+    chart_length: np.ndarray
+    opens: np.ndarray
+    highs: np.ndarray
+    lows: np.ndarray
+    closes: np.ndarray
+    volumes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.trading_value)
+
+    @classmethod
+    def from_items(
+        cls,
+        stocks: Sequence[StockData],
+        charts: Optional[Sequence[Optional[ChartData]]] = None,
+        supplies: Optional[Sequence[Optional[SupplyData]]] = None,
+        news_scores: Optional[Sequence[int]] = None,
+    ) -> "ScoringBatch":
+        n = len(stocks)
+        charts = list(charts) if charts is not None else [None] * n
+        supplies = list(supplies) if supplies is not None else [None] * n
+        width = BATCH_CHART_WINDOW
+
+        # 정수 거래량은 int64 유지 (기존 정수 합계와 동일), 하나라도 실수면 float64
+        volume_dtype = np.int64
+        if any(c is not None and c.volume_array.dtype.kind == 'f' for c in charts):
+            volume_dtype = np.float64
+
+        return cls(
+            trading_value=np.array([s.trading_value for s in stocks]),
+            change_pct=np.array([s.change_pct for s in stocks], dtype=np.float64),
+            close=np.array([s.close for s in stocks], dtype=np.float64),
+            high_52w=np.array([s.high_52w for s in stocks], dtype=np.float64),
+            volume=np.array([s.volume for s in stocks]),
+            foreign_buy_5d=np.array([sup.foreign_buy_5d if sup else 0 for sup in supplies]),
+            inst_buy_5d=np.array([sup.inst_buy_5d if sup else 0 for sup in supplies]),
+            has_supply=np.array([sup is not None for sup in supplies], dtype=bool),
+            news_score=np.array(news_scores if news_scores is not None else [0] * n, dtype=np.int64),
+            has_charts=np.array([c is not None for c in charts], dtype=bool),
+            chart_length=np.array([len(c.close_array) if c is not None else 0 for c in charts], dtype=np.int64),
+            opens=_tail_matrix([c.open_array if c is not None else None for c in charts], width, np.float64),
+            highs=_tail_matrix([c.high_array if c is not None else None for c in charts], width, np.float64),
+            lows=_tail_matrix([c.low_array if c is not None else None for c in charts], width, np.float64),
+            closes=_tail_matrix([c.close_array if c is not None else None for c in charts], width, np.float64),
+            volumes=_tail_matrix([c.volume_array if c is not None else None for c in charts], width, volume_dtype),
+        )
+
+
+@dataclass
+class BatchScores:
+    """calculate_batch 결과 (모든 필드 (N,) 배열)"""
+    news: np.ndarray
+    volume: np.ndarray
+    chart: np.ndarray
+    candle: np.ndarray
+    timing: np.ndarray
+    supply: np.ndarray
+    base: np.ndarray
+    bonus: np.ndarray
+    total: np.ndarray
+    volume_bonus: np.ndarray
+    candle_bonus: np.ndarray
+    limit_up_bonus: np.ndarray
+    volume_ratio: np.ndarray
+    is_new_high: np.ndarray
+    is_breakout: np.ndarray
+    ma_aligned: np.ndarray
+    supply_positive: np.ndarray
+    is_limit_up: np.ndarray
+
+
+def _score_volume_batch(trading_value: np.ndarray, config: SignalConfig) -> np.ndarray:
+    """거래대금 점수 (0-3점)"""
+    return np.select(
+        [
+            trading_value >= config.trading_value_s,
+            trading_value >= config.trading_value_a,
+            trading_value >= config.trading_value_b,
+        ],
+        [3, 2, 1],
+        default=0,
+    )
+
+
+def _score_chart_batch(batch: ScoringBatch):
+    """
+    차트패턴 점수 (0-2점)
+
+    Returns:
+        (score, is_new_high, is_breakout, ma_aligned) 각 (N,) 배열
+    """
+    length = batch.chart_length
+
+    # 52주 고가 돌파
+    is_new_high = batch.has_charts & (batch.high_52w > 0) & (batch.close > batch.high_52w)
+
+    # 이평선 정배열 (60일 미만이면 기존과 동일하게 보유 구간 합계 / 60 - 0 패딩이 이를 재현)
+    ma20 = _sequential_row_sums(batch.closes[:, -20:]) / 20
+    ma60 = _sequential_row_sums(batch.closes[:, -60:]) / 60
+    ma_aligned = (length >= 20) & (ma20 > ma60) & (batch.close > ma20)
+
+    # 돌파 확인 (최근 5일 고가 돌파)
+    is_breakout = (length >= 10) & (batch.highs[:, -5:].max(axis=1) > batch.highs[:, -10:-5].max(axis=1))
+
+    score = np.minimum(2, is_new_high.astype(np.int64) + ma_aligned)
+    return score, is_new_high, is_breakout, ma_aligned
+
+
+def _score_candle_batch(batch: ScoringBatch) -> np.ndarray:
+    """캔들형태 점수 (0-1점): 최근 5개 중 오늘 이전 4개 + 오늘 (기존 loop: i=1..4)"""
+    opens = batch.opens[:, -4:]
+    highs = batch.highs[:, -4:]
+    lows = batch.lows[:, -4:]
+    closes = batch.closes[:, -4:]
+
+    # 장대양봉: 상승폭이 하락폭보다 2배 이상 + 윗꼬리 짧음
+    body_size = closes - opens
+    is_long_body = (body_size > 0) & (np.abs(body_size) > np.abs(lows - highs) * 2)
+    upper_shadow = highs - np.maximum(opens, closes)
+
+    hit = np.any(is_long_body & (upper_shadow < body_size * 0.3), axis=1)
+    return ((batch.chart_length >= 5) & hit).astype(np.int64)
+
+
+def _score_timing_batch(batch: ScoringBatch) -> np.ndarray:
+    """기간조정 점수 (0-1점): 볼린저밴드 수축 및 횡보 후 돌파"""
+    length = batch.chart_length
+    band_width, avg, upper = _bollinger_band_widths(batch.closes)
+
+    # 구간 i(0 = 오늘)는 보유 일수 안에 들어올 때만 유효, 평균 0 구간은 제외
+    offsets = np.arange(BOLLINGER_LOOKBACK)
+    valid = offsets[None, :] <= (length[:, None] - BOLLINGER_WINDOW)
+    counted = valid & (avg > 0)
+
+    # 오늘 기준 상단 돌파 여부 확인
+    is_breakout = (length >= BOLLINGER_WINDOW) & (batch.closes[:, -1] > upper[:, 0])
+
+    # 수축 (Contraction): 유효 구간 순번 1~5 = 어제부터 5일간, 6~ = 그 이전
+    rank = np.cumsum(counted, axis=1) - 1
+    count = counted.sum(axis=1)
+    recent = counted & (rank >= 1) & (rank <= 5)
+    past = counted & (rank >= 6)
+    recent_bw_avg = _sequential_row_sums(np.where(recent, band_width, 0.0)) / 5
+    past_bw_avg = _sequential_row_sums(np.where(past, band_width, 0.0)) / np.maximum(count - 6, 1)
+
+    is_contracted = (recent_bw_avg < past_bw_avg * 0.8) | (recent_bw_avg < 0.15)
+
+    # 횡보 후 돌파
+    return ((count >= 10) & is_contracted & is_breakout).astype(np.int64)
+
+
+def _score_supply_batch(batch: ScoringBatch):
+    """수급 점수 (0-2점)
+
+    수급 기준:
+    - 외국인+기관 5일순매수 합계가 거래대금 대비 5% 이상: 1점
+    - 외국인+기관 5일순매수 합계가 거래대금 대비 10% 이상: 2점
+    """
+    eligible = batch.has_supply & (batch.trading_value > 0)
+    total_buy_5d = np.maximum(0, batch.foreign_buy_5d) + np.maximum(0, batch.inst_buy_5d)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        supply_ratio = (total_buy_5d / np.where(eligible, batch.trading_value, 1)) * 100
+
+    score = np.where(eligible, np.select([supply_ratio >= 10, supply_ratio >= 5], [2, 1], default=0), 0)
+    return score, score > 0
+
+
+def _volume_ratio_batch(batch: ScoringBatch) -> np.ndarray:
+    """거래량 배수 (오늘 거래량 / 어제까지 최대 20일 평균, 소수 둘째 자리 반올림)"""
+    length = batch.chart_length
+    volumes = batch.volumes
+
+    # Toss 데이터 등으로 stock.volume이 업데이트되었을 수 있으므로 차트 마지막 값보다 우선 사용
+    today_vol = np.where(batch.volume > 0, batch.volume, volumes[:, -1])
+
+    lookback = np.minimum(20, length - 1)
+    usable = (length >= 2) & (lookback > 0)
+    # 평균은 과거 데이터(어제까지)로 계산 - lookback 이전 열은 0 패딩이므로 합계에 영향 없음
+    avg_vol = _sequential_row_sums(volumes[:, -21:-1]) / np.where(usable, lookback, 1)
+    usable &= avg_vol > 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        raw = today_vol / np.where(usable, avg_vol, 1)
+    # np.round는 Python round()와 반올림 결과가 다를 수 있어 원소별 round 사용
+    return np.array([round(float(r), 2) if ok else 0.0 for r, ok in zip(raw, usable)], dtype=np.float64)
+
+
+def _bonus_batch(volume_ratio: np.ndarray, chart_score: np.ndarray, is_limit_up: np.ndarray):
+    """가산점 계산 (최대 7점)
+
+    분배:
+    - 거래량 급증: 최대 5점
+      (2배: 1점, 3배: 2점, 4배: 3점, 5배: 4점, 6배 이상: 5점)
+    - 장대양봉: 최대 1점
+    - 상한가: 최대 1점
+    """
+    volume_bonus = np.select(
+        [volume_ratio >= 6, volume_ratio >= 5, volume_ratio >= 4, volume_ratio >= 3, volume_ratio >= 2],
+        [5, 4, 3, 2, 1],
+        default=0,
+    )
+    candle_bonus = (chart_score >= 1).astype(np.int64)
+    limit_up_bonus = is_limit_up.astype(np.int64)
+    bonus = np.minimum(7, volume_bonus + candle_bonus + limit_up_bonus)
+    return bonus, volume_bonus, candle_bonus, limit_up_bonus
+
 
 class Scorer:
     """
@@ -30,6 +320,10 @@ class Scorer:
     - Grade determination logic extracted to GradeClassifier
     - Filter validation extracted to FilterValidator
     - determine_grade() method simplified from 111 to ~30 lines
+
+    Batch:
+    - calculate_batch() / determine_grades()가 후보 N개를 열 단위로 한 번에 계산
+    - calculate() / determine_grade()는 1행 배치 래퍼
     """
 
     def __init__(self, config: SignalConfig = None):
@@ -46,6 +340,123 @@ class Scorer:
         self.filter_validator = FilterValidator(self.config)
         self.grade_classifier = GradeClassifier(self.config)
 
+    # ========================================================================
+    # Batch API
+    # ========================================================================
+
+    def calculate_batch(self, batch: ScoringBatch) -> BatchScores:
+        """
+        N개 종목 점수 일괄 계산 (뉴스 점수는 batch.news_score 사용)
+
+        Args:
+            batch: ScoringBatch
+
+        Returns:
+            BatchScores
+        """
+        news = batch.news_score
+        volume = _score_volume_batch(batch.trading_value, self.config)
+        chart, is_new_high, is_breakout, ma_aligned = _score_chart_batch(batch)
+        candle = _score_candle_batch(batch)
+        timing = _score_timing_batch(batch)
+        supply, supply_positive = _score_supply_batch(batch)
+
+        base = news + volume + chart + candle + timing + supply
+
+        volume_ratio = _volume_ratio_batch(batch)
+        # 상한가(상한가 직전 포함) 여부
+        is_limit_up = batch.change_pct >= PRICE_CHANGE.LIMIT
+        bonus, volume_bonus, candle_bonus, limit_up_bonus = _bonus_batch(volume_ratio, chart, is_limit_up)
+
+        return BatchScores(
+            news=news,
+            volume=volume,
+            chart=chart,
+            candle=candle,
+            timing=timing,
+            supply=supply,
+            base=base,
+            bonus=bonus,
+            total=base + bonus,
+            volume_bonus=volume_bonus,
+            candle_bonus=candle_bonus,
+            limit_up_bonus=limit_up_bonus,
+            volume_ratio=volume_ratio,
+            is_new_high=is_new_high,
+            is_breakout=is_breakout,
+            ma_aligned=ma_aligned,
+            supply_positive=supply_positive,
+            is_limit_up=is_limit_up,
+        )
+
+    def determine_grades(
+        self,
+        batch: ScoringBatch,
+        news_scores,
+        total_scores,
+        allow_no_news: bool = False
+    ) -> np.ndarray:
+        """
+        N개 종목 등급 일괄 판정
+
+        Args:
+            batch: ScoringBatch (거래대금/등락률/마지막 캔들/수급)
+            news_scores: 종목별 뉴스 점수 (LLM 반영 후 값)
+            total_scores: 종목별 총점
+            allow_no_news: 뉴스 없음 허용 여부
+
+        Returns:
+            등급 코드 배열 (GRADE_BY_CODE 인덱스, 0 = 탈락)
+        """
+        passed = self.filter_validator.validate_batch(
+            trading_value=batch.trading_value,
+            change_pct=batch.change_pct,
+            news_score=np.asarray(news_scores),
+            last_open=batch.opens[:, -1],
+            last_close=batch.closes[:, -1],
+            last_high=batch.highs[:, -1],
+            has_candle=batch.has_charts & (batch.chart_length >= 1),
+            allow_no_news=allow_no_news
+        )
+        dual_buy = batch.has_supply & (batch.foreign_buy_5d > 0) & (batch.inst_buy_5d > 0)
+        codes = self.grade_classifier.classify_batch(
+            trading_value=batch.trading_value,
+            change_pct=batch.change_pct,
+            total_score=np.asarray(total_scores),
+            dual_buy=dual_buy
+        )
+        return np.where(passed, codes, GRADE_CODE_NONE).astype(np.int8)
+
+    def score_candidates(
+        self,
+        stocks: Sequence[StockData],
+        charts: Sequence[Optional[ChartData]],
+        supplies: Sequence[Optional[SupplyData]],
+        news: Optional[Sequence[Optional[List[NewsItem]]]] = None,
+        llm_results: Optional[Sequence[Optional[Dict]]] = None,
+        allow_no_news: bool = False
+    ) -> List[tuple]:
+        """
+        calculate() + determine_grade()의 배치 버전
+
+        Returns:
+            종목별 (ScoreDetail, ChecklistDetail, Dict, Optional[Grade]) 리스트
+        """
+        if not stocks:
+            return []
+        batch, rows = self._calculate_rows(stocks, charts, supplies, news, llm_results)
+        codes = self.determine_grades(
+            batch,
+            [score.news for score, _, _ in rows],
+            [score.total for score, _, _ in rows],
+            allow_no_news=allow_no_news
+        )
+        return [row + (GRADE_BY_CODE[code],) for row, code in zip(rows, codes.tolist())]
+
+    # ========================================================================
+    # Per-stock API (1행 배치 래퍼)
+    # ========================================================================
+
     def calculate(
         self,
         stock: StockData,
@@ -67,65 +478,8 @@ class Scorer:
         Returns:
             (ScoreDetail, ChecklistDetail, Dict) 튜플
         """
-        score = ScoreDetail()
-        checklist = ChecklistDetail()
-
-        # 1. 뉴스/재료 (0-3점)
-        score.news, checklist.has_news, checklist.news_sources, score.llm_reason = \
-            self._score_news(news, llm_result, stock)
-
-        # 2. 거래대금 (0-3점)
-        score.volume = self._score_volume(stock)
-
-        # 3. 차트패턴 (0-2점)
-        score.chart, checklist.is_new_high, checklist.is_breakout, checklist.ma_aligned = \
-            self._score_chart(stock, charts)
-
-        # 4. 캔들형태 (0-1점)
-        score.candle = self._score_candle(charts)
-
-        # 5. 기간조정 (0-1점)
-        score.timing = self._score_timing(stock, charts)
-
-        # 6. 수급 (0-2점)
-        score.supply, checklist.supply_positive = self._score_supply(stock.trading_value, supply)
-
-        # 기본 점수 계산
-        base_score = (
-            score.news + score.volume + score.chart +
-            score.candle + score.timing + score.supply
-        )
-
-        # 거래량 배수 계산
-        volume_ratio = self._calculate_volume_ratio(stock, charts)
-
-        # 상한가(상한가 직전 포함) 여부
-        is_limit_up = stock.change_pct >= PRICE_CHANGE.LIMIT
-
-        # 가산점 계산 (V2 Logic)
-        bonus_score, bonus_breakdown = self._calculate_bonus(
-            volume_ratio,
-            score.chart,
-            is_limit_up
-        )
-
-        # 총점 계산
-        score.total = base_score + bonus_score
-
-        # 상세 내역
-        details = self._build_score_details(
-            stock,
-            supply,
-            score,
-            base_score,
-            bonus_score,
-            volume_ratio,
-            bonus_breakdown,
-            checklist.is_new_high,
-            is_limit_up
-        )
-
-        return score, checklist, details
+        _, rows = self._calculate_rows([stock], [charts], [supply], [news], [llm_result])
+        return rows[0]
 
     def determine_grade(
         self,
@@ -139,11 +493,6 @@ class Scorer:
         """
         최종 등급 판정 (S/A/B)
 
-        Refactored (Phase 4):
-        - Filter validation delegated to FilterValidator
-        - Grade classification delegated to GradeClassifier
-        - Simplified from 111 lines to ~30 lines
-
         Args:
             stock: 종목 데이터
             score: 점수 상세
@@ -155,27 +504,96 @@ class Scorer:
         Returns:
             Grade 객체 또는 None
         """
-        # 1. 필터링 검증
-        filter_result = self.filter_validator.validate(
-            stock=stock,
-            score=score,
-            score_details=score_details,
-            supply=supply,
-            charts=charts,
-            allow_no_news=allow_no_news
-        )
+        batch = ScoringBatch.from_items([stock], [charts], [supply])
+        code = int(self.determine_grades(batch, [score.news], [score.total], allow_no_news)[0])
+
+        if code == GRADE_CODE_NONE and logger.isEnabledFor(logging.DEBUG):
+            filter_result = self.filter_validator.validate(
+                stock=stock,
+                score=score,
+                score_details=score_details,
+                supply=supply,
+                charts=charts,
+                allow_no_news=allow_no_news
+            )
+            reason = filter_result.reason or f"점수 미달 (Score={score.total})"
+            logger.debug(f"  -> [Drop] {reason}")
+
+        return GRADE_BY_CODE[code]
+
+    def _calculate_rows(
+        self,
+        stocks: Sequence[StockData],
+        charts: Sequence[Optional[ChartData]],
+        supplies: Sequence[Optional[SupplyData]],
+        news: Optional[Sequence[Optional[List[NewsItem]]]] = None,
+        llm_results: Optional[Sequence[Optional[Dict]]] = None
+    ) -> tuple:
+        """뉴스 점수(텍스트)는 종목별로, 나머지는 배치로 계산하여 종목별 결과 객체로 펼친다."""
+        n = len(stocks)
+        news = news if news is not None else [None] * n
+        llm_results = llm_results if llm_results is not None else [None] * n
 
-        if not filter_result.passed:
-            logger.debug(f"  -> [Drop] {filter_result.reason}")
-            return None
+        # 1. 뉴스/재료 (0-3점)
+        news_results = [
+            self._score_news(items, llm_result, stock)
+            for stock, items, llm_result in zip(stocks, news, llm_results)
+        ]
+
+        batch = ScoringBatch.from_items(stocks, charts, supplies, [r[0] for r in news_results])
+        scores = self.calculate_batch(batch)
+
+        columns = {
+            name: getattr(scores, name).tolist()
+            for name in (
+                'volume', 'chart', 'candle', 'timing', 'supply', 'base', 'bonus', 'total',
+                'volume_bonus', 'candle_bonus', 'limit_up_bonus', 'volume_ratio',
+                'is_new_high', 'is_breakout', 'ma_aligned', 'supply_positive', 'is_limit_up',
+            )
+        }
 
-        # 2. 등급 판정
-        return self.grade_classifier.classify(
-            stock=stock,
-            score=score,
-            score_details=score_details,
-            supply=supply
-        )
+        rows = []
+        for i, (stock, supply) in enumerate(zip(stocks, supplies)):
+            news_score, has_news, sources, llm_reason = news_results[i]
+            score = ScoreDetail(
+                news=news_score,
+                volume=columns['volume'][i],
+                chart=columns['chart'][i],
+                candle=columns['candle'][i],
+                timing=columns['timing'][i],
+                supply=columns['supply'][i],
+                llm_reason=llm_reason,
+            )
+            score.total = columns['total'][i]
+
+            checklist = ChecklistDetail(
+                has_news=has_news,
+                is_new_high=columns['is_new_high'][i],
+                is_breakout=columns['is_breakout'][i],
+                ma_aligned=columns['ma_aligned'][i],
+                supply_positive=columns['supply_positive'][i],
+                news_sources=sources,
+            )
+
+            bonus_breakdown = {
+                "volume": columns['volume_bonus'][i],
+                "candle": columns['candle_bonus'][i],
+                "limit_up": columns['limit_up_bonus'][i]
+            }
+            details = self._build_score_details(
+                stock,
+                supply,
+                score,
+                columns['base'][i],
+                columns['bonus'][i],
+                columns['volume_ratio'][i],
+                bonus_breakdown,
+                checklist.is_new_high,
+                columns['is_limit_up'][i]
+            )
+            rows.append((score, checklist, details))
+
+        return batch, rows
 
     # ========================================================================
     # Private Methods - Scoring
@@ -272,92 +690,19 @@ class Scorer:
             return 1
         return 0
 
-    def _score_volume(self, stock: StockData) -> int:
-        """거래대금 점수 (0-3점)"""
-        if stock.trading_value >= self.config.trading_value_s:
-            return 3
-        elif stock.trading_value >= self.config.trading_value_a:
-            return 2
-        elif stock.trading_value >= self.config.trading_value_b:
-            return 1
-        else:
-            return 0
+    # 단일 종목 점수 항목 (1행 배치 래퍼)
+    @staticmethod
+    def _single_batch(stock: Optional[StockData], charts: Optional[ChartData]) -> ScoringBatch:
+        stock = stock or StockData(code='', name='', market='')
+        return ScoringBatch.from_items([stock], [charts])
 
     def _score_candle(self, charts: Optional[ChartData]) -> int:
         """캔들형태 점수 (0-1점)"""
-        if not charts:
-            return 0
-
-        recent_candles = 5
-        if len(charts.lows) < recent_candles or len(charts.closes) < recent_candles:
-            return 0
-
-        last_lows = charts.lows[-recent_candles:]
-        last_highs = charts.highs[-recent_candles:]
-        last_closes = charts.closes[-recent_candles:]
-        last_opens = charts.opens[-recent_candles:]
-
-        # 장대양봉: 상승폭이 하락폭보다 2배 이상
-        for i in range(1, recent_candles):
-            body_size = last_closes[i] - last_opens[i]
-            if body_size > 0 and abs(body_size) > abs(last_lows[i] - last_highs[i]) * 2:
-                # 윗꼬리 짧음 확인
-                upper_shadow = last_highs[i] - max(last_opens[i], last_closes[i])
-                if upper_shadow < body_size * 0.3:
-                    return 1
-
-        return 0
+        return int(_score_candle_batch(self._single_batch(None, charts))[0])
 
     def _score_timing(self, stock: StockData, charts: Optional[ChartData]) -> int:
         """기간조정 점수 (0-1점): 볼린저밴드 수축 및 횡보 후 돌파"""
-        if not charts or len(charts.closes) < 20:
-            return 0
-
-        import math
-
-        closes = charts.closes
-        band_widths = []
-        is_breakout = False
-
-        # 최근 20일간의 Band Width 계산
-        for i in range(20):
-            end_idx = len(closes) - i
-            start_idx = end_idx - 20
-
-            if start_idx < 0:
-                break
-
-            window = closes[start_idx:end_idx]
-            avg = sum(window) / 20
-            variance = sum([(x - avg) ** 2 for x in window]) / 20
-            std_dev = math.sqrt(variance)
-
-            upper = avg + (std_dev * 2)
-            lower = avg - (std_dev * 2)
-
-            if avg > 0:
-                bw = (upper - lower) / avg
-                band_widths.append(bw)
-
-            # 오늘(i=0) 기준 상단 돌파 여부 확인
-            if i == 0:
-                if closes[-1] > upper:
-                    is_breakout = True
-
-        if len(band_widths) < 10:
-            return 0
-
-        # 수축 (Contraction)
-        recent_bw_avg = sum(band_widths[1:6]) / 5  # 어제부터 5일간
-        past_bw_avg = sum(band_widths[6:]) / len(band_widths[6:])  # 그 이전
-
-        is_contracted = (recent_bw_avg < past_bw_avg * 0.8) or (recent_bw_avg < 0.15)
-
-        # 횡보 후 돌파
-        if is_contracted and is_breakout:
-            return 1
-
-        return 0
+        return int(_score_timing_batch(self._single_batch(stock, charts))[0])
 
     def _score_chart(
         self,
@@ -367,117 +712,12 @@ class Scorer:
         """차트패턴 점수 (0-2점)"""
         if not charts:
             return 0, False, False, False
-
-        score = 0
-        is_new_high = False
-        is_breakout = False
-        ma_aligned = False
-
-        # 52주 고가 돌파
-        if stock.high_52w > 0 and stock.close > stock.high_52w:
-            is_new_high = True
-            score += 1
-
-        # 이평선 정배열
-        if len(charts.closes) >= 20:
-            closes = charts.closes
-            ma20 = sum(closes[-20:]) / 20
-            ma60 = sum(closes[-60:]) / 60
-
-            if ma20 > ma60 and stock.close > ma20:
-                ma_aligned = True
-                score += 1
-
-        # 돌파 확인 (최근 5일 고가 돌파)
-        if len(charts.highs) >= 10:
-            recent_high = max(charts.highs[-10:-5])
-            recent_5_high = max(charts.highs[-5:])
-            if recent_5_high > recent_high:
-                is_breakout = True
-
-        return min(2, score), is_new_high, is_breakout, ma_aligned
-
-    def _score_supply(self, trading_value: float, supply: Optional[SupplyData]) -> tuple[int, bool]:
-        """수급 점수 (0-2점)
-
-        수급 기준:
-        - 외국인+기관 5일순매수 합계가 거래대금 대비 5% 이상: 1점
-        - 외국인+기관 5일순매수 합계가 거래대금 대비 10% 이상: 2점
-        """
-        if not supply or trading_value <= 0:
-            return 0, False
-
-        total_buy_5d = max(0, supply.foreign_buy_5d) + max(0, supply.inst_buy_5d)
-        supply_ratio = (total_buy_5d / trading_value) * 100
-
-        if supply_ratio >= 10:
-            return 2, True
-        if supply_ratio >= 5:
-            return 1, True
-        return 0, False
+        score, is_new_high, is_breakout, ma_aligned = _score_chart_batch(self._single_batch(stock, charts))
+        return int(score[0]), bool(is_new_high[0]), bool(is_breakout[0]), bool(ma_aligned[0])
 
     def _calculate_volume_ratio(self, stock: StockData, charts: Optional[ChartData]) -> float:
         """거래량 배수 계산"""
-        volume_ratio = 0.0
-
-        if charts and len(charts.volumes) >= 2:
-            # Toss 데이터 등으로 stock.volume이 업데이트되었을 수 있으므로
-            # charts.volumes[-1] 대신 stock.volume을 우선 사용
-            today_vol = stock.volume if stock.volume > 0 else charts.volumes[-1]
-
-            lookback = min(20, len(charts.volumes) - 1)
-            if lookback > 0:
-                # 평균은 과거 데이터(어제까지)로 계산
-                avg_vol = sum(charts.volumes[-lookback-1:-1]) / lookback
-                if avg_vol > 0:
-                    volume_ratio = round(today_vol / avg_vol, 2)
-
-        return volume_ratio
-
-    def _calculate_bonus(
-        self,
-        volume_ratio: float,
-        chart_score: int,
-        is_limit_up: bool = False
-    ) -> tuple[int, Dict[str, int]]:
-        """가산점 계산 (최대 7점)
-
-        분배:
-        - 거래량 급증: 최대 5점
-          (2배: 1점, 3배: 2점, 4배: 3점, 5배: 4점, 6배 이상: 5점)
-        - 장대양봉: 최대 1점
-        - 상한가: 최대 1점
-        """
-        bonus = 0
-
-        volume_bonus = 0
-        if volume_ratio >= 6:
-            volume_bonus = 5
-        elif volume_ratio >= 5:
-            volume_bonus = 4
-        elif volume_ratio >= 4:
-            volume_bonus = 3
-        elif volume_ratio >= 3:
-            volume_bonus = 2
-        elif volume_ratio >= 2:
-            volume_bonus = 1
-        bonus += volume_bonus
-
-        candle_bonus = 0
-        if chart_score >= 1:
-            candle_bonus = 1
-        bonus += candle_bonus
-
-        limit_up_bonus = 1 if is_limit_up else 0
-        bonus += limit_up_bonus
-
-        bonus_breakdown = {
-            "volume": volume_bonus,
-            "candle": candle_bonus,
-            "limit_up": limit_up_bonus
-        }
-
-        return min(7, bonus), bonus_breakdown
+        return float(_volume_ratio_batch(self._single_batch(stock, charts))[0])
 
     def _build_score_details(
         self,
@@ -1,9 +1,10 @@
 
-import sqlite3
 import os
 import logging
 from datetime import datetime
 
+from engine.sqlite_db import get_database
+
 # 데이터 디렉토리 확보
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -15,22 +16,19 @@ logger = logging.getLogger(__name__)
 
 class UsageTracker:
     def __init__(self):
+        self.db = get_database(DB_PATH)
         self._init_db()
 
     def _init_db(self):
         """DB 초기화"""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute('''
+            self.db.execute('''
                 CREATE TABLE IF NOT EXISTS api_usage (
                     email TEXT PRIMARY KEY,
                     count INTEGER DEFAULT 0,
                     last_used_at TEXT
                 )
             ''')
-            conn.commit()
-            conn.close()
         except Exception as e:
             logger.error(f"Usage DB Initialization Error: {e}")
 
@@ -44,28 +42,24 @@ class UsageTracker:
             return False
 
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            
-            # 현재 사용량 조회
-            cursor.execute('SELECT count FROM api_usage WHERE email = ?', (email,))
-            result = cursor.fetchone()
-            
-            current_count = result[0] if result else 0
-            
-            if current_count >= MAX_FREE_USAGE:
-                conn.close()
-                return False
-            
-            # 사용량 증가 또는 신규 등록
-            now = datetime.now().isoformat()
-            if result:
-                cursor.execute('UPDATE api_usage SET count = count + 1, last_used_at = ? WHERE email = ?', (now, email))
-            else:
-                cursor.execute('INSERT INTO api_usage (email, count, last_used_at) VALUES (?, 1, ?)', (email, now))
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                
+                # 현재 사용량 조회
+                cursor.execute('SELECT count FROM api_usage WHERE email = ?', (email,))
+                result = cursor.fetchone()
+                
+                current_count = result[0] if result else 0
+                
+                if current_count >= MAX_FREE_USAGE:
+                    return False
                 
-            conn.commit()
-            conn.close()
+                # 사용량 증가 또는 신규 등록
+                now = datetime.now().isoformat()
+                if result:
+                    cursor.execute('UPDATE api_usage SET count = count + 1, last_used_at = ? WHERE email = ?', (now, email))
+                else:
+                    cursor.execute('INSERT INTO api_usage (email, count, last_used_at) VALUES (?, 1, ?)', (email, now))
             return True
             
         except Exception as e:
@@ -76,11 +70,7 @@ class UsageTracker:
     def get_usaage(self, email: str) -> int:
         """현재 사용량 조회"""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute('SELECT count FROM api_usage WHERE email = ?', (email,))
-            result = cursor.fetchone()
-            conn.close()
+            result = self.db.query_one('SELECT count FROM api_usage WHERE email = ?', (email,))
             return result[0] if result else 0
         except:
             return 0
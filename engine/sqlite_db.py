@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공용 SQLite 접근 계층
+
+- DB 파일당 SQLiteDatabase 1개, 스레드(+프로세스)당 연결 1개를 재사용한다.
+  연결마다 prepared statement 캐시(cached_statements)가 있으므로 같은 SQL은 재컴파일되지 않는다.
+- 스레드가 끝나면 그 스레드의 연결을 닫는다 (스레드 로컬 핸들 해제 시 + 새 연결을 열 때 종료된 스레드 정리).
+  요청마다 스레드를 만드는 서버/백그라운드 작업에서도 연결(파일 디스크립터)이 쌓이지 않는다.
+- WAL + synchronous=NORMAL: 읽기와 쓰기가 서로 막지 않고, 커밋마다 fsync하지 않는다.
+- busy_timeout + BEGIN IMMEDIATE 재시도: gunicorn 워커/스레드가 동시에 쓰더라도
+  'database is locked'를 호출자에게 바로 던지지 않는다.
+- 연결은 autocommit 모드(isolation_level=None)이며, 여러 문장을 묶을 때는 transaction()을 쓴다.
+"""
+
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUSY_TIMEOUT_MS = 10_000
+DEFAULT_PRAGMAS = (
+    ('synchronous', 'NORMAL'),
+    ('temp_store', 'MEMORY'),
+    ('cache_size', -8000),  # 8MB (음수 = KiB 단위)
+)
+STATEMENT_CACHE_SIZE = 256
+BEGIN_RETRIES = 5
+
+
+def _is_busy_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return isinstance(error, sqlite3.OperationalError) and ('locked' in message or 'busy' in message)
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+class _ConnectionHandle:
+    """스레드 로컬에 보관하는 연결 핸들 (스레드 종료로 해제되면 finalize가 연결을 닫는다)"""
+
+    __slots__ = ('conn', 'pid', '__weakref__')
+
+    def __init__(self, conn: sqlite3.Connection, pid: int):
+        self.conn = conn
+        self.pid = pid
+
+
+class SQLiteDatabase:
+    """SQLite DB 1개에 대한 스레드별 연결 풀"""
+
+    def __init__(self, path: str, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+                 pragmas: Iterable = DEFAULT_PRAGMAS):
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.pragmas = tuple(pragmas)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # 연결 -> (소유 스레드 weakref, 연 프로세스 pid)
+        self._connections: Dict[sqlite3.Connection, Tuple[weakref.ref, int]] = {}
+        self._wal_ready = False
+
+    # ------------------------------------------------------------------
+    # 연결
+    # ------------------------------------------------------------------
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (없으면 생성). 호출자가 close()하지 않는다."""
+        handle = getattr(self._local, 'handle', None)
+        # fork된 자식 프로세스는 부모 연결을 쓰지 않고 새로 연다
+        if handle is not None and handle.pid == os.getpid():
+            return handle.conn
+        conn = self._open()
+        handle = _ConnectionHandle(conn, os.getpid())
+        weakref.finalize(handle, self._release, conn)
+        self._local.handle = handle
+        return conn
+
+    @property
+    def open_connections(self) -> int:
+        """이 프로세스에서 열려 있는 연결 수 (모니터링/테스트용)"""
+        pid = os.getpid()
+        with self._lock:
+            return sum(1 for _, owner_pid in self._connections.values() if owner_pid == pid)
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """소유 스레드가 끝난 연결 닫기 (다른 프로세스에서 연 연결은 목록에서만 제거)"""
+        with self._lock:
+            owner = self._connections.pop(conn, None)
+        if owner is not None and owner[1] == os.getpid():
+            _close_quietly(conn)
+
+    def _prune_dead_threads(self) -> None:
+        with self._lock:
+            dead = [
+                conn for conn, (thread_ref, _) in self._connections.items()
+                if thread_ref() is None or not thread_ref().is_alive()
+            ]
+        for conn in dead:
+            self._release(conn)
+
+    def _open(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._prune_dead_threads()
+        # 종료된 스레드의 연결을 다른 스레드(정리 시점)에서 닫을 수 있도록 check_same_thread=False
+        # (사용은 여전히 소유 스레드만 한다)
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout_ms / 1000,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f'PRAGMA busy_timeout = {int(self.busy_timeout_ms)}')
+        if not self._wal_ready:
+            # journal_mode는 DB 파일에 영구 저장되므로 프로세스당 1회만 확인
+            mode = conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+            if str(mode).lower() != 'wal':
+                logger.warning(f"[SQLite] WAL 전환 실패 ({self.path}): {mode}")
+            self._wal_ready = True
+        for name, value in self.pragmas:
+            conn.execute(f'PRAGMA {name} = {value}')
+        with self._lock:
+            self._connections[conn] = (weakref.ref(threading.current_thread()), os.getpid())
+        return conn
+
+    def close_all(self) -> None:
+        """이 프로세스에서 연 연결 정리 (테스트/종료 시)"""
+        pid = os.getpid()
+        with self._lock:
+            connections, self._connections = self._connections, {}
+        for conn, (_, owner_pid) in connections.items():
+            if owner_pid == pid:
+                _close_quietly(conn)
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    @contextmanager
+    def transaction(self, immediate: bool = True) -> Iterator[sqlite3.Connection]:
+        """
+        여러 문장을 하나의 트랜잭션으로 실행
+
+        Args:
+            immediate: BEGIN IMMEDIATE로 시작 (읽고-판단하고-쓰는 작업에서 쓰기 잠금을 먼저 확보)
+        """
+        conn = self.connection()
+        if conn.in_transaction:
+            # 중첩 호출은 바깥 트랜잭션에 합류
+            yield conn
+            return
+
+        begin = 'BEGIN IMMEDIATE' if immediate else 'BEGIN'
+        for attempt in range(BEGIN_RETRIES):
+            try:
+                conn.execute(begin)
+                break
+            except sqlite3.OperationalError as e:
+                if not _is_busy_error(e) or attempt == BEGIN_RETRIES - 1:
+                    raise
+                time.sleep(0.05 * (2 ** attempt) * random.uniform(0.5, 1.5))
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        else:
+            conn.execute('COMMIT')
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """단일 문장 실행 (autocommit)"""
+        return self.connection().execute(sql, params)
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        with self.transaction() as conn:
+            conn.executemany(sql, rows)
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        return self.connection().execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        return self.connection().execute(sql, params).fetchone()
+
+
+_databases: Dict[str, SQLiteDatabase] = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(path: str, **kwargs) -> SQLiteDatabase:
+    """DB 파일 경로별 공유 인스턴스"""
+    key = os.path.abspath(path)
+    with _databases_lock:
+        if key not in _databases:
+            _databases[key] = SQLiteDatabase(key, **kwargs)
+        return _databases[key]
@@ -8,6 +8,8 @@ import requests
 from typing import Dict, Optional
 from datetime import datetime
 
+from engine.metrics import inc, timer, url_route
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,32 +39,38 @@ class TossCollector:
         import time
         max_retries = 3
         retry_delay = 1
-        
-        for attempt in range(max_retries):
-            try:
-                if method.upper() == 'POST':
-                    response = self.session.post(url, json=json_data or {}, timeout=10)
-                else:
-                    response = self.session.get(url, timeout=10)
-                
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429: # Rate Limit
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-                else:
-                    # 400 에러 등은 데이터 부재 상황일 수 있으므로 DEBUG로 처리
-                    if response.status_code not in [404, 400]:
-                         logger.warning(f"토스증권 API 상세 오류: {url} - {response.status_code}")
+        op = url_route(url, prefix='/api')
+
+        with timer('collector_request_seconds', collector='toss', op=op):
+            for attempt in range(max_retries):
+                if attempt:
+                    inc('collector_retries_total', collector='toss', op=op)
+                try:
+                    if method.upper() == 'POST':
+                        response = self.session.post(url, json=json_data or {}, timeout=10)
+                    else:
+                        response = self.session.get(url, timeout=10)
+
+                    inc('collector_responses_total', collector='toss', op=op, status=response.status_code)
+                    if response.status_code == 200:
+                        return response.json()
+                    elif response.status_code == 429: # Rate Limit
+                        time.sleep(retry_delay * (attempt + 1))
+                        continue
                     else:
-                         logger.debug(f"토스증권 API 데이터 없음 (Skip): {url} - {response.status_code}")
+                        # 400 에러 등은 데이터 부재 상황일 수 있으므로 DEBUG로 처리
+                        if response.status_code not in [404, 400]:
+                             logger.warning(f"토스증권 API 상세 오류: {url} - {response.status_code}")
+                        else:
+                             logger.debug(f"토스증권 API 데이터 없음 (Skip): {url} - {response.status_code}")
+                        return None
+                except Exception as e:
+                    if attempt < max_retries - 1:
+                        time.sleep(retry_delay * (attempt + 1))
+                        continue
+                    inc('collector_responses_total', collector='toss', op=op, status='error')
+                    logger.error(f"토스증권 API 최종 실패: {url} - {e}")
                     return None
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-                logger.error(f"토스증권 API 최종 실패: {url} - {e}")
-                return None
         return None
     
     def get_stock_info(self, code: str) -> Optional[Dict]:
@@ -7,11 +7,9 @@ class NumpyEncoder(json.JSONEncoder):
     Numpy 데이터 타입과 Date/Time 객체를 JSON으로 직렬화하기 위한 인코더
     """
     def default(self, obj):
-        if isinstance(obj, (np.int_, np.intc, np.intp, np.int8,
-                            np.int16, np.int32, np.int64, np.uint8,
-                            np.uint16, np.uint32, np.uint64)):
+        if isinstance(obj, np.integer):
             return int(obj)
-        elif isinstance(obj, (np.float_, np.float16, np.float32, np.float64)):
+        elif isinstance(obj, np.floating):  # np.float_는 NumPy 2.0에서 제거됨
             return float(obj)
         elif isinstance(obj, (np.bool_,)):
             return bool(obj)
@@ -11,9 +11,12 @@ import asyncio
 import httpx
 import random
 from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
 
 from engine.config import app_config
+from engine.constants import AI_ANALYSIS
+from engine.llm_cache import cached_llm_call
+from engine.llm_scheduler import estimate_tokens, get_llm_scheduler
+from engine.metrics import inc, timer
 
 logger = logging.getLogger(__name__)
 
@@ -106,13 +109,14 @@ class VCPMultiAIAnalyzer:
         base_delay = 2
         model_chain = list(GEMINI_RETRY_MODEL_CHAIN)
         max_retries = len(model_chain) - 1
+        scheduler = get_llm_scheduler()
 
         for attempt, current_model in enumerate(model_chain):
             try:
                 prompt = self._build_vcp_prompt(stock_name, stock_data)
-                
-                start = time.time()
-                
+                if attempt:
+                    inc('llm_retries_total', provider='gemini', model=model_chain[attempt - 1])
+
                 # Gemini API 호출 (동기 호출을 executor로 실행)
                 def _call():
                     response = self.gemini_client.models.generate_content(
@@ -121,10 +125,11 @@ class VCPMultiAIAnalyzer:
                     )
                     return response.text
 
-                response_text = await asyncio.to_thread(_call)
-                
-                elapsed = time.time() - start
-                logger.debug(f"[Gemini] {stock_name} 분석 완료 ({current_model}, {elapsed:.2f}s)")
+                with timer('llm_attempt_seconds', provider='gemini', model=current_model, mode='call') as t:
+                    async with scheduler.slot('gemini', current_model, estimate_tokens(prompt, 500)):
+                        response_text = await asyncio.to_thread(_call)
+
+                logger.debug(f"[Gemini] {stock_name} 분석 완료 ({current_model}, {t.elapsed:.2f}s)")
                 
                 # JSON 파싱
                 result = self._parse_json_response(response_text)
@@ -175,8 +180,6 @@ class VCPMultiAIAnalyzer:
             prompt = self._build_vcp_prompt(stock_name, stock_data)
             model = app_config.VCP_GPT_MODEL
             
-            start = time.time()
-            
             # GPT API 호출 (동기 호출을 executor로 실행)
             def _call():
                 response = self.gpt_client.chat.completions.create(
@@ -190,12 +193,11 @@ class VCPMultiAIAnalyzer:
                 )
                 return response.choices[0].message.content
             
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as executor:
-                response_text = await loop.run_in_executor(executor, _call)
-            
-            elapsed = time.time() - start
-            logger.debug(f"[GPT] {stock_name} 분석 완료 ({elapsed:.2f}s)")
+            with timer('llm_attempt_seconds', provider='gpt', model=model, mode='call') as t:
+                async with get_llm_scheduler().slot('gpt', model, estimate_tokens(prompt, 500)):
+                    response_text = await asyncio.to_thread(_call)
+
+            logger.debug(f"[GPT] {stock_name} 분석 완료 ({t.elapsed:.2f}s)")
             
             # JSON 파싱
             result = self._parse_json_response(response_text)
@@ -240,8 +242,44 @@ class VCPMultiAIAnalyzer:
         
         return None
     
-    async def analyze_stock(self, stock_name: str, stock_data: Dict) -> Dict:
-        """단일 종목 멀티 AI 분석 (Gemini + GPT/Perplexity 동시 실행 - 병렬 처리)"""
+    def _cache_model_name(self, provider: str) -> str:
+        """캐시 키용 provider별 모델명"""
+        if provider == 'gemini':
+            return GEMINI_RETRY_MODEL_CHAIN[0]
+        if provider == 'gpt':
+            return app_config.VCP_GPT_MODEL
+        return app_config.VCP_PERPLEXITY_MODEL
+
+    @staticmethod
+    def _is_cacheable_result(result) -> bool:
+        """
+        캐시에 저장할 결과인지 판별 - action이 BUY/SELL/HOLD이고 reason이 실질적인 내용일 때만.
+        (정규식 폴백으로 건진 JSON은 reason이 없거나 action이 엉뚱할 수 있어 재분석 때 다시 호출해야 한다)
+        """
+        if not isinstance(result, dict):
+            return False
+        action = str(result.get('action') or '').strip().upper()
+        reason = str(result.get('reason') or '').strip()
+        return action in AI_ANALYSIS.VALID_ACTIONS and reason.lower() not in AI_ANALYSIS.INVALID_REASONS
+
+    def _cached_analysis(self, provider: str, analyze, stock_name: str, stock_data: Dict, use_cache: bool):
+        """provider 분석 코루틴을 LLM 결과 캐시로 감싼다 (프롬프트가 같으면 재호출하지 않음)"""
+        prompt = self._build_vcp_prompt(stock_name, stock_data)
+        return cached_llm_call(
+            provider,
+            self._cache_model_name(provider),
+            prompt,
+            lambda: analyze(stock_name, stock_data),
+            use_cache=use_cache,
+            should_cache=self._is_cacheable_result,
+        )
+
+    async def analyze_stock(self, stock_name: str, stock_data: Dict, use_cache: bool = True) -> Dict:
+        """
+        단일 종목 멀티 AI 분석 (Gemini + GPT/Perplexity 동시 실행 - 병렬 처리)
+
+        use_cache=False면 LLM 결과 캐시를 건너뛰고 다시 호출한다 (강제 재분석).
+        """
         results = {
             'ticker': stock_data.get('ticker', ''),
             'stock_name': stock_name,
@@ -256,7 +294,7 @@ class VCPMultiAIAnalyzer:
         
         # 1. Gemini (Primary)
         if 'gemini' in self.providers:
-            tasks.append(self._analyze_with_gemini(stock_name, stock_data))
+            tasks.append(self._cached_analysis('gemini', self._analyze_with_gemini, stock_name, stock_data, use_cache))
             providers_map.append('gemini')
         
         # 2. Second Provider (GPT or Perplexity)
@@ -264,10 +302,10 @@ class VCPMultiAIAnalyzer:
         
         if second_provider == 'perplexity' and ('perplexity' in self.providers or 'gpt' in self.providers): # Fallback logic in init suggests checking list
              if not self.perplexity_disabled:
-                 tasks.append(self._analyze_with_perplexity(stock_name, stock_data))
+                 tasks.append(self._cached_analysis('perplexity', self._analyze_with_perplexity, stock_name, stock_data, use_cache))
                  providers_map.append('perplexity')
         elif second_provider == 'gpt' and ('gpt' in self.providers or 'openai' in self.providers):
-             tasks.append(self._analyze_with_gpt(stock_name, stock_data))
+             tasks.append(self._cached_analysis('gpt', self._analyze_with_gpt, stock_name, stock_data, use_cache))
              providers_map.append('gpt')
         
         if not tasks:
@@ -321,15 +359,17 @@ class VCPMultiAIAnalyzer:
                     ],
                     "temperature": 0.2
                 }
-                
-                
-                start = time.time()
-                
-                async with httpx.AsyncClient(timeout=60.0) as client:
-                    response = await client.post(url, headers=headers, json=payload)
+
+                with timer('llm_attempt_seconds', provider='perplexity', model=model, mode='call') as t:
+                    async with get_llm_scheduler().slot('perplexity', model, estimate_tokens(prompt, 500)) as slot:
+                        async with httpx.AsyncClient(timeout=60.0) as client:
+                            response = await client.post(url, headers=headers, json=payload)
+                        if response.status_code in (429, 503):
+                            slot.throttled()
                 
                 if response.status_code == 429:
                     if attempt < max_retries:
+                        inc('llm_retries_total', provider='perplexity', model=model)
                         delay = base_delay * (2 ** attempt) + (random.randint(0, 1000) / 1000)
                         logger.warning(f"[Perplexity] {stock_name} 429 Error. Retrying in {delay:.2f}s... ({attempt+1}/{max_retries})")
                         await asyncio.sleep(delay)
@@ -349,8 +389,7 @@ class VCPMultiAIAnalyzer:
                 response_json = response.json()
                 response_text = response_json['choices'][0]['message']['content']
                 
-                elapsed = time.time() - start
-                logger.debug(f"[Perplexity] {stock_name} 분석 완료 ({elapsed:.2f}s)")
+                logger.debug(f"[Perplexity] {stock_name} 분석 완료 ({t.elapsed:.2f}s)")
                 
                 # JSON 파싱
                 result = self._parse_json_response(response_text)
@@ -365,28 +404,23 @@ class VCPMultiAIAnalyzer:
                 return None
         return None
     
-    async def analyze_batch(self, stocks: List[Dict]) -> Dict[str, Dict]:
+    async def analyze_batch(self, stocks: List[Dict], use_cache: bool = True) -> Dict[str, Dict]:
         """여러 종목 일괄 분석 (완전 병렬 처리 + 진행률 로그)"""
         results = {}
         total = len(stocks)
-        concurrency = getattr(app_config, 'ANALYSIS_LLM_CONCURRENCY', 2)
-        logger.info(f"VCP AI 일괄 분석 시작: 총 {total}개 종목 (Concurrency: {concurrency})")
-        
-        # 동시 실행 제한 (Rate Limit 고려)
-        sem = asyncio.Semaphore(concurrency) 
+        logger.info(f"VCP AI 일괄 분석 시작: 총 {total}개 종목")
         
+        # 동시 실행/Rate Limit은 provider별 LLM 스케줄러가 제어 (engine.llm_scheduler)
         async def _bounded_analyze(stock, idx):
-            async with sem:
-                ticker = stock.get('ticker', '')
-                name = stock.get('name', ticker)
-                # logger.info(f"[{idx+1}/{total}] {name} AI 분석 시작...") # 너무 많으면 생략
-                try:
-                    res = await self.analyze_stock(name, stock)
-                    logger.info(f"✅ [{idx+1}/{total}] {name} AI 분석 완료") # 진행 상황 가시화
-                    return ticker, res
-                except Exception as e:
-                    logger.error(f"❌ [{idx+1}/{total}] {name} 분석 실패: {e}")
-                    return ticker, None
+            ticker = stock.get('ticker', '')
+            name = stock.get('name', ticker)
+            try:
+                res = await self.analyze_stock(name, stock, use_cache=use_cache)
+                logger.info(f"✅ [{idx+1}/{total}] {name} AI 분석 완료") # 진행 상황 가시화
+                return ticker, res
+            except Exception as e:
+                logger.error(f"❌ [{idx+1}/{total}] {name} 분석 실패: {e}")
+                return ticker, None
 
         # Task 생성
         tasks = [_bounded_analyze(stocks[i], i) for i in range(total)]
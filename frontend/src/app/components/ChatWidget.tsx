@@ -349,28 +349,6 @@ export default function ChatWidget() {
                       return newMsgs;
                     });
                   }
-                  if (data.answer_clear) {
-                    setMessages(prev => {
-                      const newMsgs = [...prev];
-                      const lastMsg = newMsgs[newMsgs.length - 1];
-                      newMsgs[newMsgs.length - 1] = {
-                        ...lastMsg,
-                        parts: [""]
-                      };
-                      return newMsgs;
-                    });
-                  }
-                  if (data.reasoning_clear) {
-                    setMessages(prev => {
-                      const newMsgs = [...prev];
-                      const lastMsg = newMsgs[newMsgs.length - 1];
-                      newMsgs[newMsgs.length - 1] = {
-                        ...lastMsg,
-                        reasoning: ""
-                      };
-                      return newMsgs;
-                    });
-                  }
 
                   const answerDelta = typeof data.answer_chunk === 'string' ? data.answer_chunk : data.chunk;
                   if (typeof answerDelta === 'string' && answerDelta.length > 0) {
@@ -2,7 +2,7 @@
 
 import { useEffect, useState, useCallback, useRef } from 'react';
 import Modal from '@/app/components/Modal';
-import { fetchAPI } from '@/lib/api';
+import { fetchAPI, subscribeProgress, waitForProgress } from '@/lib/api';
 import { useAdmin } from '@/hooks/useAdmin';
 
 // Tooltip 컴포넌트
@@ -101,6 +101,7 @@ export default function DataStatusPage() {
   const [updateItems, setUpdateItems] = useState<UpdateItem[]>([]);
   const [updateProgress, setUpdateProgress] = useState<string>('');
   const pollingRef = useRef<NodeJS.Timeout | null>(null);
+  const streamRef = useRef<(() => void) | null>(null);
 
   // ADMIN 권한 체크
   const { isAdmin, isLoading: isAdminLoading } = useAdmin();
@@ -126,55 +127,89 @@ export default function DataStatusPage() {
     }
   }, []);
 
-  // 업데이트 상태만 폴링 (가벼움)
-  const pollUpdateStatus = useCallback(async () => {
-    try {
-      const status: UpdateStatusResponse = await fetchAPI('/api/system/update-status');
+  // 폴링/스트림 구독 중지
+  const stopPolling = useCallback(() => {
+    if (pollingRef.current) {
+      clearInterval(pollingRef.current);
+      pollingRef.current = null;
+    }
+    if (streamRef.current) {
+      streamRef.current();
+      streamRef.current = null;
+    }
+  }, []);
 
-      // 로컬 updating 상태를 우선시하되, 백엔드가 실행 중이고 로컬이 아니면 동기화 (선택적)
-      // 여기서는 handleUpdateAll이 클라이언트 주도이므로 백엔드 isRunning을 강제로 반영하지 않음
-      // 다만 개별 업데이트나 다른 세션에서의 업데이트 감지를 위해 참고할 수는 있음.
-      // 하지만 현재 문제 해결을 위해 handleUpdateAll 실행 중에는 백엔드 상태에 의해 updating이 덮어써지지 않도록 주의.
+  // 업데이트 상태 반영 (폴링 응답 / SSE 이벤트 공통)
+  const applyUpdateStatus = useCallback((status: UpdateStatusResponse) => {
+    // 로컬 updating 상태를 우선시하되, 백엔드가 실행 중이고 로컬이 아니면 동기화 (선택적)
+    // 여기서는 handleUpdateAll이 클라이언트 주도이므로 백엔드 isRunning을 강제로 반영하지 않음
+    // 다만 개별 업데이트나 다른 세션에서의 업데이트 감지를 위해 참고할 수는 있음.
+    // 하지만 현재 문제 해결을 위해 handleUpdateAll 실행 중에는 백엔드 상태에 의해 updating이 덮어써지지 않도록 주의.
 
-      // 로컬에서 updating 중이라도 백엔드 상태와 동기화
+    // 로컬에서 updating 중이라도 백엔드 상태와 동기화
 
 
-      setUpdating(status.isRunning);
+    setUpdating(status.isRunning);
 
-      // 상태가 있으면 무조건 표시 (완료 후에도 결과 확인 가능하도록)
-      if (status.items && status.items.length > 0) {
-        setUpdateItems(status.items);
-      }
+    // 상태가 있으면 무조건 표시 (완료 후에도 결과 확인 가능하도록)
+    if (status.items && status.items.length > 0) {
+      setUpdateItems(status.items);
+    }
 
-      setUpdateProgress(status.isRunning && status.currentItem ? `${status.currentItem} 업데이트 중...` : '');
+    setUpdateProgress(status.isRunning && status.currentItem ? `${status.currentItem} 업데이트 중...` : '');
 
-      // 완료되면 폴링 중지 및 데이터 새로고침
-      if (!status.isRunning && pollingRef.current) {
-        clearInterval(pollingRef.current);
-        pollingRef.current = null;
+    const watching = pollingRef.current || streamRef.current;
 
-        // 백엔드 파일 시스템 저장이 완료될 때까지 약간의 지연 시간을 둠 (정합성 보장)
-        setTimeout(async () => {
-          await loadData();
-          setUpdating(false);
-          setUpdatingItem(null);
-          setUpdateItems([]); // [Fix] 업데이트 완료/중단 시 상단 진행바 UI 초기화
-        }, 1000);
-      } else if (status.isRunning && !pollingRef.current) {
-        // 실행 중인데 폴링이 없으면 시작 (페이지 마운트 대응)
-        startPolling();
-      }
+    // 완료되면 폴링/구독 중지 및 데이터 새로고침
+    if (!status.isRunning && watching) {
+      stopPolling();
+
+      // 백엔드 파일 시스템 저장이 완료될 때까지 약간의 지연 시간을 둠 (정합성 보장)
+      setTimeout(async () => {
+        await loadData();
+        setUpdating(false);
+        setUpdatingItem(null);
+        setUpdateItems([]); // [Fix] 업데이트 완료/중단 시 상단 진행바 UI 초기화
+      }, 1000);
+    } else if (status.isRunning && !watching) {
+      // 실행 중인데 폴링이 없으면 시작 (페이지 마운트 대응)
+      startPolling();
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [loadData, stopPolling]);
 
+  // 업데이트 상태만 폴링 (가벼움) - SSE 미지원/실패 시 폴백
+  const pollUpdateStatus = useCallback(async () => {
+    try {
+      const status: UpdateStatusResponse = await fetchAPI('/api/system/update-status');
+      applyUpdateStatus(status);
     } catch (error) {
       console.error('Failed to poll update status:', error);
     }
-  }, [loadData, updating, updateItems.length]);
+  }, [applyUpdateStatus]);
 
-  // 폴링 시작
+  // 진행 상태 구독 시작 (SSE 우선, 실패 시 500ms 폴링)
   const startPolling = useCallback(() => {
-    if (pollingRef.current) return;
-    pollingRef.current = setInterval(pollUpdateStatus, 500);
-  }, [pollUpdateStatus]);
+    if (pollingRef.current || streamRef.current) return;
+
+    const fallbackToPolling = () => {
+      streamRef.current = null;
+      if (!pollingRef.current) {
+        pollingRef.current = setInterval(pollUpdateStatus, 500);
+      }
+    };
+
+    const unsubscribe = subscribeProgress(
+      ['update'],
+      (_channel, data) => applyUpdateStatus(data as UpdateStatusResponse),
+      fallbackToPolling
+    );
+    if (unsubscribe) {
+      streamRef.current = unsubscribe;
+    } else {
+      fallbackToPolling();
+    }
+  }, [pollUpdateStatus, applyUpdateStatus]);
 
   useEffect(() => {
     setLoading(true);
@@ -184,9 +219,7 @@ export default function DataStatusPage() {
     pollUpdateStatus();
 
     return () => {
-      if (pollingRef.current) {
-        clearInterval(pollingRef.current);
-      }
+      stopPolling();
     };
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []); // 마운트 시 한 번만 실행 (의존성 배열 비움)
@@ -214,26 +247,13 @@ export default function DataStatusPage() {
       try {
         const data: any = await fetchAPI('/api/kr/jongga-v2/status');
 
-        // 백엔드에서 실행 중이면 스피너 복구 및 폴링 시작
+        // 백엔드에서 실행 중이면 스피너 복구 후 완료 이벤트 대기 (SSE, 실패 시 long-poll)
         if (data.isRunning) {
           setUpdatingItem('AI Jongga V2');
-
-          // 폴링 재개 로직
-          const poll = async () => {
-            let completed = false;
-            while (!completed) {
-              await new Promise(r => setTimeout(r, 2000));
-              try {
-                const statusData: any = await fetchAPI('/api/kr/jongga-v2/status');
-                if (!statusData.isRunning) {
-                  completed = true;
-                  setUpdatingItem(null);
-                  await loadData();
-                }
-              } catch (e) { console.error("Poll fail", e); completed = true; }
-            }
-          };
-          poll();
+          await waitForProgress('jongga_v2', (s: any) => !s.isRunning, { signal: controller.signal });
+          if (controller.signal.aborted) return;
+          setUpdatingItem(null);
+          await loadData();
         }
 
       } catch (e) {
@@ -241,7 +261,9 @@ export default function DataStatusPage() {
       }
     };
 
+    const controller = new AbortController();
     checkRunningStatus();
+    return () => controller.abort();
   }, [loadData]);
 
   // VCP Status Check added to checkRunningStatus logic (merged for better readability if needed, but separate is fine)
@@ -251,26 +273,10 @@ export default function DataStatusPage() {
         const status: any = await fetchAPI('/api/kr/signals/status');
         if (status.running) {
           setUpdatingItem('VCP Signals');
-
-          // Poll VCP
-          const poll = async () => {
-            let running = true;
-            while (running) {
-              await new Promise(r => setTimeout(r, 2000));
-              try {
-                const newStatus: any = await fetchAPI('/api/kr/signals/status');
-                if (!newStatus.running) {
-                  running = false;
-                  setUpdatingItem(null);
-                  await loadData();
-                }
-              } catch (e) {
-                console.error("Poll VCP fail", e);
-                running = false;
-              }
-            }
-          };
-          poll();
+          await waitForProgress('vcp', (s: any) => !s.running, { signal: controller.signal });
+          if (controller.signal.aborted) return;
+          setUpdatingItem(null);
+          await loadData();
         }
       } catch (e) {
         console.error("Failed to check VCP status:", e);
@@ -278,9 +284,11 @@ export default function DataStatusPage() {
     };
 
     // Only run if not already updating something
+    const controller = new AbortController();
     if (!updatingItem) {
       checkVcpStatus();
     }
+    return () => controller.abort();
   }, []); // Run once on mount
 
   // 현재 선택된 날짜 (실시간 모드면 빈 문자열, 아니면 선택된 날짜)
@@ -1,7 +1,7 @@
 'use client';
 
 import React, { useState, useEffect, useCallback, useRef } from 'react';
-import { fetchAPI } from '@/lib/api';
+import { fetchAPI, waitForProgress } from '@/lib/api';
 import Modal from '@/app/components/Modal';
 import BuyStockModal from '@/app/components/BuyStockModal';
 import VCPCriteriaModal from '@/app/components/VCPCriteriaModal';
@@ -1466,39 +1466,26 @@ function DataStatusBox({ updatedAt, analyzingGemini, setAnalyzingGemini }: {
     setCurrentUpdatedAt(updatedAt);
   }, [updatedAt]);
 
-  const pollStatus = useCallback(() => {
-    const interval = setInterval(async () => {
-      try {
-        // 변경: 상태 전용 엔드포인트 폴링
-        const res: any = await fetchAPI('/api/kr/jongga-v2/status');
-        const data = res; // fetchAPI returns JSON directly
-
-        if (data) {
-          // 실행 중이면 계속 폴링
-          if (data.is_running) {
-            if (!updating) setUpdating(true); // 강제 상태 동기화
-          } else {
-            // 실행 끝남 (is_running: false)
-            // 만약 내가 '업데이트 중'이라고 알고 있었다면 -> 완료 처리
-            if (updating) {
-              clearInterval(interval);
-              setUpdating(false);
-              // 데이터 리프레시 (리로드 대신 fetch)
-              window.location.reload();
-            }
-          }
-        }
-      } catch (error) {
-        console.error('Polling error:', error);
-      }
-    }, 2000); // 2초마다 체크 (반응성 향상)
+  // 엔진 완료 대기 (진행 이벤트 SSE, 실패 시 long-poll) - 완료되면 데이터 새로고침
+  const waitRef = useRef<AbortController | null>(null);
+  useEffect(() => () => waitRef.current?.abort(), []);
 
-    // 5분 후에는 폴링 중단 (안전장치)
-    setTimeout(() => {
-      clearInterval(interval);
-      if (updating) setUpdating(false);
-    }, 350000);
-  }, [updating]);
+  const waitForEngine = useCallback(async () => {
+    if (waitRef.current) return;
+    const controller = new AbortController();
+    waitRef.current = controller;
+    setUpdating(true);
+
+    // 6분 후에는 대기 중단 (안전장치)
+    const done = await waitForProgress('jongga_v2', (s: any) => !s.isRunning, {
+      signal: controller.signal,
+      timeoutMs: 350000,
+    });
+    waitRef.current = null;
+    if (controller.signal.aborted) return;
+    setUpdating(false);
+    if (done) window.location.reload();
+  }, []);
 
   if (!updatedAt && !updating && !analyzingGemini) return <StatBox label="Data Status" value={0} customValue="LOADING..." />;
 
@@ -1535,12 +1522,12 @@ function DataStatusBox({ updatedAt, analyzingGemini, setAnalyzingGemini }: {
       // It returns data directly and throws error with status attached if possible.
 
       console.log('Engine started in background');
-      pollStatus();
+      waitForEngine();
 
     } catch (error: any) {
       if (error.status === 409) {
         console.log('Engine is already running.');
-        pollStatus();
+        waitForEngine();
       } else {
         console.error('업데이트 요청 중 오류 발생', error);
         setUpdating(false);
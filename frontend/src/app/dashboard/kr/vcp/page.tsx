@@ -1,7 +1,7 @@
 'use client';
 
 import { useEffect, useState } from 'react';
-import { krAPI, KRSignal, KRAIAnalysis, KRMarketGate, AIRecommendation } from '@/lib/api';
+import { krAPI, KRSignal, KRAIAnalysis, KRMarketGate, AIRecommendation, fetchAPI, waitForProgress } from '@/lib/api';
 import StockChart from './StockChart';
 import BuyStockModal from '@/app/components/BuyStockModal';
 import ConfirmationModal from '@/app/components/ConfirmationModal';
@@ -444,29 +444,22 @@ export default function VCPSignalsPage() {
   // 새로고침/재방문 시 실행 상태 복구
   const checkRunningStatus = async () => {
     try {
-      const status = await krAPI.getVCPStatus();
+      const status: any = await fetchAPI('/api/kr/signals/status');
       if (status.running) {
         setScreenerRunning(true);
         setScreenerMessage(`🔄 ${status.message} (재개됨)`);
 
-        // 폴링 재시작
-        const pollInterval = setInterval(async () => {
-          try {
-            const s = await krAPI.getVCPStatus();
-            if (s.running) {
-              setScreenerMessage(`🔄 ${s.message} (${s.progress || 0}%)`);
-            } else {
-              clearInterval(pollInterval);
-              setScreenerMessage('✅ 업데이트 완료! 데이터 로딩...');
-              await loadSignals();
-              await loadMarketGate();
-              setScreenerRunning(false);
-              setTimeout(() => setScreenerMessage(null), 3500);
-            }
-          } catch (e) {
-            console.error(e);
-          }
-        }, 2000);
+        // 진행 이벤트 구독 (SSE, 실패 시 long-poll)
+        await waitForProgress('vcp', (s: any) => !s.running, {
+          onUpdate: (s: any) => {
+            if (s.running) setScreenerMessage(`🔄 ${s.message} (${s.progress || 0}%)`);
+          },
+        });
+        setScreenerMessage('✅ 업데이트 완료! 데이터 로딩...');
+        await loadSignals();
+        await loadMarketGate();
+        setScreenerRunning(false);
+        setTimeout(() => setScreenerMessage(null), 3500);
       }
     } catch (e) {
       console.error("Failed to check status:", e);
@@ -813,28 +806,6 @@ export default function VCPSignalsPage() {
                       return newMsgs;
                     });
                   }
-                  if (data.answer_clear) {
-                    setChatHistory(prev => {
-                      const newMsgs = [...prev];
-                      const lastMsg = newMsgs[newMsgs.length - 1];
-                      newMsgs[newMsgs.length - 1] = {
-                        ...lastMsg,
-                        content: ""
-                      };
-                      return newMsgs;
-                    });
-                  }
-                  if (data.reasoning_clear) {
-                    setChatHistory(prev => {
-                      const newMsgs = [...prev];
-                      const lastMsg = newMsgs[newMsgs.length - 1];
-                      newMsgs[newMsgs.length - 1] = {
-                        ...lastMsg,
-                        reasoning: ""
-                      };
-                      return newMsgs;
-                    });
-                  }
 
                   const answerDelta = typeof data.answer_chunk === 'string' ? data.answer_chunk : data.chunk;
                   if (typeof answerDelta === 'string' && answerDelta.length > 0) {
@@ -947,65 +918,44 @@ export default function VCPSignalsPage() {
                 await krAPI.runVCPScreener();
                 setScreenerMessage('🔄 분석 시작...');
 
-                // [ROBUST FIX] 백엔드가 /signals/run 응답 전에 status='running'으로 설정하므로
-                // sawRunning을 즉시 true로 설정 (이전 stale 상태 구분 불필요)
-                let sawRunning = true;
-                let pollCount = 0;
-                const MAX_POLLS = 150; // 5분 (2초 * 150 = 300초) 안전 타임아웃
-
-                const pollInterval = setInterval(async () => {
-                  pollCount++;
-
-                  // 안전 타임아웃: 5분 초과 시 강제 종료
-                  if (pollCount > MAX_POLLS) {
-                    clearInterval(pollInterval);
-                    setScreenerMessage('⏰ 시간 초과 - 백그라운드에서 계속 진행 중일 수 있습니다.');
-                    setScreenerRunning(false);
-                    setTimeout(() => setScreenerMessage(null), 7000);
-                    return;
-                  }
+                // 백엔드가 /signals/run 응답 전에 status='running'으로 설정하므로
+                // 첫 스냅샷부터 실행 중 상태로 본다. 5분 안전 타임아웃.
+                const status: any = await waitForProgress('vcp', (s: any) => !s.running && s.status !== 'running', {
+                  timeoutMs: 300000,
+                  onUpdate: (s: any) => {
+                    if (s.status === 'running' || s.running) {
+                      setScreenerMessage(`🔄 ${s.message} (${s.progress || 0}%)`);
+                    }
+                  },
+                });
+
+                if (!status) {
+                  setScreenerMessage('⏰ 시간 초과 - 백그라운드에서 계속 진행 중일 수 있습니다.');
+                  setScreenerRunning(false);
+                  setTimeout(() => setScreenerMessage(null), 7000);
+                } else if (status.status === 'success') {
+                  setScreenerMessage('✅ 데이터 로딩 중...');
 
+                  // 데이터 새로고침
                   try {
-                    const status = await krAPI.getVCPStatus();
-
-                    if (status.status === 'running' || status.running) {
-                      setScreenerMessage(`🔄 ${status.message} (${status.progress || 0}%)`);
-                    } else if (status.status === 'success') {
-                      clearInterval(pollInterval);
-                      setScreenerMessage('✅ 데이터 로딩 중...');
-
-                      // 데이터 새로고침
-                      try {
-                        await loadSignals();
-                        await loadMarketGate();
-                      } catch (loadErr) {
-                        console.error("Data load error:", loadErr);
-                      }
-
-                      setScreenerMessage('✅ 업데이트 완료!');
-                      setScreenerRunning(false);
-                      setTimeout(() => setScreenerMessage(null), 5000);
-                    } else if (status.status === 'error') {
-                      clearInterval(pollInterval);
-                      setScreenerMessage(`❌ 오류: ${status.message}`);
-                      setScreenerRunning(false);
-                      setTimeout(() => setScreenerMessage(null), 7000);
-                    } else {
-                      // IDLE 등 예외적 상태
-                      if (!status.running && sawRunning) {
-                        clearInterval(pollInterval);
-                        setScreenerRunning(false);
-                        setScreenerMessage(null);
-                      }
-                    }
-                  } catch (err) {
-                    console.error("Polling error:", err);
-                    // 네트워크 에러가 반복되면 종료
-                    if (pollCount > 5) {
-                      // 5회 이상 연속 에러 시에만 카운트 (일시적 에러는 무시)
-                    }
+                    await loadSignals();
+                    await loadMarketGate();
+                  } catch (loadErr) {
+                    console.error("Data load error:", loadErr);
                   }
-                }, 2000); // 2초마다 확인
+
+                  setScreenerMessage('✅ 업데이트 완료!');
+                  setScreenerRunning(false);
+                  setTimeout(() => setScreenerMessage(null), 5000);
+                } else if (status.status === 'error') {
+                  setScreenerMessage(`❌ 오류: ${status.message}`);
+                  setScreenerRunning(false);
+                  setTimeout(() => setScreenerMessage(null), 7000);
+                } else {
+                  // IDLE 등 예외적 상태
+                  setScreenerRunning(false);
+                  setScreenerMessage(null);
+                }
 
               } catch (e: any) {
                 setScreenerMessage(`❌ 오류: ${e.message || '요청 실패'}`);
@@ -101,6 +101,107 @@ export async function fetchPostAPI<T>(
 }
 
 // KR Market API Types
+export type ProgressChannel = 'update' | 'jongga_v2' | 'vcp';
+
+/**
+ * 진행 상태 SSE 구독 (/api/system/progress/stream)
+ * - 서버가 주기적으로 연결을 닫으면 EventSource가 자동 재연결
+ * - 영구 실패(CLOSED) 시 onFailure 호출 → 호출 측에서 폴링으로 폴백
+ * - EventSource 미지원 환경이면 null 반환
+ */
+export function subscribeProgress(
+  channels: ProgressChannel[],
+  onEvent: (channel: ProgressChannel, data: any) => void,
+  onFailure?: () => void
+): (() => void) | null {
+  if (typeof window === 'undefined' || typeof EventSource === 'undefined') return null;
+
+  const source = new EventSource(`${API_BASE}/api/system/progress/stream?channels=${channels.join(',')}`);
+  channels.forEach((channel) => {
+    source.addEventListener(channel, (e) => {
+      try {
+        onEvent(channel, JSON.parse((e as MessageEvent).data));
+      } catch { /* ignore malformed event */ }
+    });
+  });
+  source.onerror = () => {
+    if (source.readyState === EventSource.CLOSED) {
+      source.close();
+      onFailure?.();
+    }
+  };
+
+  return () => source.close();
+}
+
+interface ProgressPollResponse {
+  seq: number;
+  events: { seq: number; channel: ProgressChannel; data: any }[];
+  retry_after?: number; // 서버 대기 슬롯이 없을 때 다음 요청까지 기다릴 시간 (초)
+}
+
+/**
+ * 채널 상태가 isDone을 만족할 때까지 대기 (상태 폴링 대체)
+ * - SSE 우선, 연결 실패/서버 스트림 한도 초과(503) 시 long-poll(/api/system/progress)로 폴백
+ * - long-poll도 같은 서버 슬롯을 쓰며, 슬롯이 없으면 서버가 준 retry_after만큼 쉬었다가 다시 요청
+ * - 첫 이벤트는 현재 상태 스냅샷이므로 이미 끝난 작업이면 바로 resolve
+ * - timeoutMs 경과 또는 signal abort 시 null로 resolve
+ */
+export function waitForProgress<T = any>(
+  channel: ProgressChannel,
+  isDone: (data: T) => boolean,
+  options: { onUpdate?: (data: T) => void; signal?: AbortSignal; timeoutMs?: number } = {}
+): Promise<T | null> {
+  return new Promise((resolve) => {
+    let finished = false;
+    let unsubscribe: (() => void) | null = null;
+    let timer: ReturnType<typeof setTimeout> | null = null;
+
+    const finish = (data: T | null) => {
+      if (finished) return;
+      finished = true;
+      unsubscribe?.();
+      if (timer) clearTimeout(timer);
+      resolve(data);
+    };
+    const handle = (data: T) => {
+      if (finished) return;
+      options.onUpdate?.(data);
+      if (isDone(data)) finish(data);
+    };
+
+    const longPoll = async () => {
+      let since: number | null = null;
+      while (!finished) {
+        try {
+          const query = since === null ? '' : `&since=${since}&timeout=25`;
+          const res = await fetchAPI<ProgressPollResponse>(
+            `/api/system/progress?channels=${channel}${query}`,
+            { timeout: 35000 }
+          );
+          since = res.seq;
+          res.events.forEach((event) => handle(event.data));
+          if (res.retry_after && !finished) {
+            await new Promise((r) => setTimeout(r, res.retry_after! * 1000));
+          }
+        } catch {
+          await new Promise((r) => setTimeout(r, 2000));
+        }
+      }
+    };
+
+    if (options.signal?.aborted) return finish(null);
+    options.signal?.addEventListener('abort', () => finish(null));
+    if (options.timeoutMs) timer = setTimeout(() => finish(null), options.timeoutMs);
+
+    unsubscribe = subscribeProgress([channel], (_channel, data) => handle(data), () => {
+      unsubscribe = null;
+      longPoll();
+    });
+    if (!unsubscribe) longPoll();
+  });
+}
+
 export interface KRSignal {
   ticker: string;
   name: string;
@@ -246,8 +347,6 @@ export const krAPI = {
   reanalyzeVCPFailedAI: (target_date?: string) =>
     fetchPostAPI<any>('/api/kr/signals/reanalyze-failed-ai', { target_date }, { timeout: 240000 }),
 
-  getVCPStatus: () => fetchAPI<{ running: boolean; status: string; message: string; progress: number }>('/api/kr/signals/status'),
-
   // Market Gate 개별 업데이트
   updateMarketGate: (target_date?: string) =>
     fetchPostAPI<any>('/api/kr/market-gate/update', { target_date }, { timeout: 30000 }),
@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+핫패스 오프라인 벤치마크 (합성 KOSPI+KOSDAQ 데이터)
+
+scripts/bench_universe.py로 만든 합성 데이터 위에서 주요 경로를 시나리오별로 측정한다.
+네트워크 수집기(Toss 수급, FDR/yfinance 환율·지수, pykrx 섹터, KIS)는 로컬 대체 구현으로 바꾼다.
+
+- 시나리오마다 새 프로세스에서 실행 (import/캐시/RSS가 서로 섞이지 않도록)
+- 시간: 준비 단계 제외, --repeat 회 실행의 중앙값/최솟값
+  (기본 데이터에서는 누적성과/백테스트 헬퍼가 수 분 걸리므로 기본 1회, 반복 측정은 --quick과 함께)
+- 메모리: 최대 RSS (ru_maxrss)와 준비 단계 대비 증가분
+- 기준선: --save-baseline으로 저장, 이후 실행의 최솟값이 --tolerance 이상 느려지면 REGRESSION (종료 코드 1)
+
+Usage:
+    python scripts/bench_hotpaths.py                          # 기본 데이터(2,500종목 x 500일), 전체 시나리오
+    python scripts/bench_hotpaths.py --quick --repeat 3       # 300종목 x 250일
+    python scripts/bench_hotpaths.py vcp scorer --repeat 5
+    python scripts/bench_hotpaths.py --save-baseline          # 현재 결과를 기준선으로 저장
+    python scripts/bench_hotpaths.py --json
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import bench_universe
+
+DEFAULT_BASELINE = os.path.join(PROJECT_ROOT, 'data', 'bench', 'baseline.json')
+DEFAULT_TOLERANCE = 0.20     # 기준선 대비 20% 이상 느리면 회귀
+NOISE_FLOOR_MS = 10.0        # 이보다 작은 차이는 회귀로 보지 않음
+RESULT_PREFIX = 'BENCH_RESULT '
+
+# 워커 프로세스에서 비워 둘 API 키 (실수로 외부 호출이 나가지 않도록)
+_NETWORK_ENV_KEYS = (
+    'GOOGLE_API_KEY', 'GEMINI_API_KEY', 'ZAI_API_KEY', 'OPENAI_API_KEY', 'PERPLEXITY_API_KEY',
+    'KIS_APP_KEY', 'KIS_APP_SECRET',
+)
+
+
+# =============================================================================
+# 로컬 대체 구현 (네트워크 수집기)
+# =============================================================================
+class LocalTossCollector:
+    """TossCollector.get_investor_trend 대체 - 합성 수급 CSV에서 같은 응답 형식으로 반환"""
+
+    def __init__(self, supply_df, price_df, days: int = 5):
+        import pandas as pd
+
+        merged = pd.merge(
+            supply_df.groupby('ticker').tail(days),
+            price_df[['date', 'ticker', 'close']],
+            on=['date', 'ticker'], how='left',
+        )
+        self._trends = {}
+        for ticker, rows in merged.groupby('ticker'):
+            rows = rows.sort_values('date', ascending=False)  # 토스 응답은 최신이 먼저
+            close = rows['close'].fillna(0).to_numpy()
+            foreign_volume = (rows['foreign_buy'].to_numpy() / close.clip(min=1)).round()
+            inst_volume = (rows['inst_buy'].to_numpy() / close.clip(min=1)).round()
+            self._trends[ticker] = {
+                'foreign': float((foreign_volume * close).sum()),
+                'institution': float((inst_volume * close).sum()),
+                'individual': float(-((foreign_volume + inst_volume) * close).sum()),
+                'days': days,
+                'details': [
+                    {'netForeignerBuyVolume': int(f), 'netInstitutionBuyVolume': int(i), 'close': float(c)}
+                    for f, i, c in zip(foreign_volume, inst_volume, close)
+                ],
+            }
+
+    def get_investor_trend(self, code: str, days: int = 5):
+        return self._trends.get(code)
+
+
+def offline_market_gate(data_dir: str):
+    """MarketGate + 외부 소스 대체 (환율/글로벌 지수/섹터/KOSPI 벤치마크/KIS)"""
+    import pandas as pd
+    from engine.market_gate import MarketGate
+
+    gate = MarketGate(data_dir=data_dir)
+    gate.kis = None
+
+    prices = pd.read_csv(os.path.join(data_dir, 'daily_prices.csv'), dtype={'ticker': str},
+                         usecols=['date', 'ticker', 'close'])
+    kodex = prices[prices['ticker'] == gate.kodex_ticker]
+    bench_df = pd.DataFrame({'date': kodex['date'].to_numpy(), 'bench_close': kodex['close'].to_numpy() / 13.0})
+    global_data = {
+        'indices': {'kospi': {'value': 2650.5, 'change_pct': 0.8}, 'kosdaq': {'value': 870.2, 'change_pct': -0.3}},
+        'commodities': {'us_gold': {'value': 2900.0, 'change_pct': 0.2}},
+        'crypto': {'btc': {'value': 95000.0, 'change_pct': 1.1}},
+        'usd_krw': {'value': 1385.0, 'change_pct': 0.1},
+    }
+
+    gate._get_usd_krw = lambda: 1385.0
+    gate._get_global_data = lambda target_date=None: json.loads(json.dumps(global_data))
+    gate._get_sector_data = lambda target_date=None, global_data=None: {name: 0.5 for name in gate.sectors}
+    gate._fetch_benchmark_data = lambda start_date, end_date: bench_df.copy()
+    return gate
+
+
+def _clear_market_gate_snapshots() -> None:
+    from engine import market_gate
+    with market_gate._INPUT_SNAPSHOT_LOCK:
+        market_gate._INPUT_SNAPSHOTS.clear()
+
+
+# =============================================================================
+# 시나리오 (준비 후 측정 대상 callable 반환)
+# =============================================================================
+def _read_prices(data_dir: str, **kwargs):
+    import pandas as pd
+    return pd.read_csv(os.path.join(data_dir, 'daily_prices.csv'), dtype={'ticker': str}, **kwargs)
+
+
+def _read_supply(data_dir: str):
+    import pandas as pd
+    return pd.read_csv(os.path.join(data_dir, 'all_institutional_trend_data.csv'), dtype={'ticker': str})
+
+
+def _load_jongga_payloads(data_dir: str) -> list:
+    payloads = []
+    for filename in sorted(os.listdir(data_dir), reverse=True):
+        if filename.startswith('jongga_v2_results_') and filename.endswith('.json'):
+            path = os.path.join(data_dir, filename)
+            with open(path, encoding='utf-8') as f:
+                payloads.append((path, json.load(f)))
+    return payloads
+
+
+def scenario_csv_load(ctx):
+    """daily_prices + 수급 CSV 로드 (스크리너/라우트 공통 입력)"""
+    data_dir = ctx['data_dir']
+
+    def run():
+        import pandas as pd
+        prices = _read_prices(data_dir)
+        prices['date'] = pd.to_datetime(prices['date'])
+        supply = _read_supply(data_dir)
+        supply['date'] = pd.to_datetime(supply['date'])
+        return len(prices) + len(supply)
+    return run
+
+
+def scenario_screener(ctx):
+    """SmartMoneyScreener.run_screening (CSV 로드 + Market Gate + 종목 분석)"""
+    import engine.screener as screener_module
+
+    screener_module.BASE_DIR = ctx['root']
+    toss = LocalTossCollector(_read_supply(ctx['data_dir']), _read_prices(ctx['data_dir']))
+    gate = offline_market_gate(ctx['data_dir'])
+    max_stocks = ctx['screen_stocks']
+    screener_module.SmartMoneyScreener()  # 생성자 내부 지연 import(pykrx 등)는 측정에서 제외
+
+    def run():
+        _clear_market_gate_snapshots()
+        screener = screener_module.SmartMoneyScreener()
+        screener.market_gate = gate
+        screener.toss_collector = toss
+        return len(screener.run_screening(max_stocks=max_stocks))
+    return run
+
+
+def scenario_vcp(ctx):
+    """detect_vcp_pattern - 전 종목 일봉"""
+    import pandas as pd
+    from engine.vcp import detect_vcp_pattern
+
+    prices = _read_prices(ctx['data_dir'])
+    prices['date'] = pd.to_datetime(prices['date'])  # 스크리너/Phase1과 같은 입력 형식
+    frames = [(ticker, frame.sort_values('date')) for ticker, frame in prices.groupby('ticker')]
+
+    def run():
+        return sum(1 for ticker, frame in frames if detect_vcp_pattern(frame, ticker, ticker).is_vcp)
+    return run
+
+
+def _scoring_inputs(ctx):
+    """거래대금 상위 후보의 StockData/ChartData/SupplyData/뉴스/LLM 결과"""
+    import pandas as pd
+    from engine.models import ChartData, NewsItem, StockData, SupplyData
+
+    data_dir = ctx['data_dir']
+    prices = _read_prices(data_dir)
+    supply = _read_supply(data_dir)
+    names = pd.read_csv(os.path.join(data_dir, 'korean_stocks_list.csv'), dtype={'ticker': str}).set_index('ticker')
+
+    last_date = prices['date'].max()
+    top = prices[prices['date'] == last_date].nlargest(ctx['candidates'], 'trading_value')['ticker']
+    by_ticker = dict(tuple(prices[prices['ticker'].isin(top)].groupby('ticker')))
+    supply_5d = supply[supply['ticker'].isin(top)].groupby('ticker').tail(5).groupby('ticker').sum(numeric_only=True)
+
+    stocks, charts, supplies, news, llm_results = [], [], [], [], []
+    for code in top:
+        frame = by_ticker[code].sort_values('date')
+        recent = frame.tail(60)
+        last, prev = frame.iloc[-1], frame.iloc[-2]
+        stocks.append(StockData(
+            code=code, name=names.loc[code, 'name'], market=names.loc[code, 'market'],
+            close=float(last['close']), change_pct=round((last['close'] / prev['close'] - 1) * 100, 2),
+            trading_value=float(last['trading_value']), volume=int(last['volume']),
+            high_52w=float(frame['high'].tail(250).max()), low_52w=float(frame['low'].tail(250).min()),
+        ))
+        charts.append(ChartData(
+            opens=recent['open'].to_numpy(), highs=recent['high'].to_numpy(), lows=recent['low'].to_numpy(),
+            closes=recent['close'].to_numpy(), volumes=recent['volume'].to_numpy(), dates=recent['date'].tolist(),
+        ))
+        row = supply_5d.loc[code] if code in supply_5d.index else None
+        supplies.append(SupplyData(
+            foreign_buy_5d=int(row['foreign_buy']) if row is not None else 0,
+            inst_buy_5d=int(row['inst_buy']) if row is not None else 0,
+        ))
+        news.append([NewsItem(title=f"{code} 뉴스 {k}", source='벤치뉴스', url='#') for k in range(3)])
+        llm_results.append({'score': len(stocks) % 4, 'reason': '합성 LLM 결과'})
+    return stocks, charts, supplies, news, llm_results
+
+
+def scenario_scorer(ctx):
+    """Scorer.calculate + determine_grade - 후보별 호출"""
+    from engine.scorer import Scorer
+
+    scorer = Scorer()
+    inputs = list(zip(*_scoring_inputs(ctx)))
+
+    def run():
+        graded = 0
+        for stock, chart, supply, items, llm in inputs:
+            score, _, details = scorer.calculate(stock, chart, items, supply, llm)
+            graded += scorer.determine_grade(stock, score, details, supply, chart) is not None
+        return graded
+    return run
+
+
+def scenario_scorer_batch(ctx):
+    """Scorer.score_candidates - 후보 전체 배치"""
+    from engine.scorer import Scorer
+
+    scorer = Scorer()
+    stocks, charts, supplies, news, llm_results = _scoring_inputs(ctx)
+
+    def run():
+        rows = scorer.score_candidates(stocks, charts, supplies, news, llm_results)
+        return sum(1 for row in rows if row[-1] is not None)
+    return run
+
+
+def scenario_market_gate(ctx):
+    """MarketGate.analyze (입력 스냅샷 미사용, 외부 소스 대체)"""
+    gate = offline_market_gate(ctx['data_dir'])
+
+    def run():
+        return gate.analyze(use_cache=False)['total_score']
+    return run
+
+
+def scenario_cumulative(ctx):
+    """/closing-bet/cumulative 헬퍼 (가격 정규화 + trade 레코드 + KPI)"""
+    from datetime import datetime
+    # app.routes는 블루프린트를 지연 로드하므로 헬퍼 import만으로는 kr_market/common이 로드되지 않는다
+    # (페이퍼 트레이딩 DB, 동기화 스레드 없음 - scripts/test_response_cache.py에서 확인)
+    from app.routes.kr_market_helpers import (
+        _aggregate_cumulative_kpis,
+        _build_cumulative_trade_record,
+        _extract_stats_date_from_results_filename,
+        _prepare_cumulative_price_dataframe,
+    )
+
+    raw_price_df = _read_prices(ctx['data_dir'])
+    payloads = _load_jongga_payloads(ctx['data_dir'])
+
+    def run():
+        price_df = _prepare_cumulative_price_dataframe(raw_price_df)
+        trades = []
+        for filepath, data in payloads:
+            stats_date = _extract_stats_date_from_results_filename(filepath, fallback_date=data.get('date', ''))
+            for signal in data.get('signals', []):
+                trade = _build_cumulative_trade_record(signal, stats_date, price_df)
+                if trade:
+                    trades.append(trade)
+        return _aggregate_cumulative_kpis(trades, price_df, datetime.now())['totalSignals']
+    return run
+
+
+def scenario_backtest(ctx):
+    """/backtest-summary 헬퍼 (최신가 맵 + 종가베팅/VCP 시나리오 수익률)"""
+    import pandas as pd
+    from app.routes.kr_market_helpers import (
+        _build_latest_price_map,
+        _calculate_jongga_backtest_stats,
+        _calculate_vcp_backtest_stats,
+    )
+
+    data_dir = ctx['data_dir']
+    price_df = _read_prices(data_dir, usecols=['date', 'ticker', 'close', 'high', 'low'])
+    history = [payload for _, payload in _load_jongga_payloads(data_dir)[:30]]
+    candidates = history[0]['signals'] if history else []
+    vcp_df = pd.read_csv(os.path.join(data_dir, 'signals_log.csv'), dtype={'ticker': str})
+
+    def run():
+        price_map = _build_latest_price_map(price_df)
+        jongga = _calculate_jongga_backtest_stats([dict(c) for c in candidates], history, price_map, price_df)
+        vcp = _calculate_vcp_backtest_stats(vcp_df, price_map, price_df)
+        return jongga['count'] + vcp['count']
+    return run
+
+
+def scenario_chatbot_context(ctx):
+    """챗봇 요청 payload 조립 (시장/종가베팅/VCP/관심종목 상세 컨텍스트)"""
+    from pathlib import Path
+    import pandas as pd
+    import chatbot.core as chatbot_core
+
+    data_dir = Path(ctx['data_dir'])
+    chatbot_core.DATA_DIR = data_dir
+    signals_log = pd.read_csv(data_dir / 'signals_log.csv', dtype={'ticker': str})
+    vcp_stocks = signals_log.tail(20).to_dict('records')
+
+    bot = chatbot_core.KRStockChatbot(
+        'bench_user', api_key='', data_fetcher=lambda: {'vcp_stocks': vcp_stocks, 'sector_scores': {}},
+    )
+    watchlist = list(bot.stock_map)[1:6]
+    messages = [
+        '오늘 시장 시황 어때?',
+        '종가베팅 추천 종목 알려줘',
+        'VCP 수급 좋은 종목 추천해줘',
+        '내 관심종목 상세 분석해줘',
+    ]
+
+    def run():
+        size = 0
+        for message in messages:
+            _, parts = bot._build_chat_payload(message, 'bench-session', bot.current_model_name,
+                                               None, watchlist, None)
+            size += len(parts[-1])
+        return size
+    return run
+
+
+SCENARIOS = {
+    'csv_load': scenario_csv_load,
+    'screener': scenario_screener,
+    'vcp': scenario_vcp,
+    'scorer': scenario_scorer,
+    'scorer_batch': scenario_scorer_batch,
+    'market_gate': scenario_market_gate,
+    'cumulative': scenario_cumulative,
+    'backtest': scenario_backtest,
+    'chatbot_context': scenario_chatbot_context,
+}
+
+
+# =============================================================================
+# 워커 (시나리오 1개 = 프로세스 1개)
+# =============================================================================
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_worker(name: str, ctx: dict, repeat: int) -> dict:
+    logging.basicConfig(level=logging.ERROR)
+    os.chdir(ctx['root'])  # 상대 경로('data')를 쓰는 모듈이 합성 데이터를 보도록
+
+    run = SCENARIOS[name](ctx)
+    setup_rss = _peak_rss_mb()
+
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        'scenario': name,
+        'median_ms': round(statistics.median(timings), 1),
+        'min_ms': round(min(timings), 1),
+        'runs': repeat,
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+        'rss_growth_mb': round(_peak_rss_mb() - setup_rss, 1),
+        'result': result if isinstance(result, (int, float, str)) else None,
+    }
+
+
+def _spawn(name: str, args, root: str) -> dict:
+    env = dict(os.environ, SCHEDULER_ENABLED='false', PYTHONPATH=PROJECT_ROOT)
+    for key in _NETWORK_ENV_KEYS:
+        env.pop(key, None)
+    cmd = [
+        sys.executable, os.path.abspath(__file__), '--worker', name, '--root', root,
+        '--repeat', str(args.repeat), '--screen-stocks', str(args.screen_stocks),
+        '--candidates', str(args.candidates),
+    ]
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    tail = (proc.stderr.strip().splitlines() or ['(no output)'])[-1]
+    return {'scenario': name, 'error': tail}
+
+
+# =============================================================================
+# 기준선
+# =============================================================================
+def load_baseline(path: str, key: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f).get(key, {})
+
+
+def save_baseline(path: str, key: str, reports: list) -> None:
+    data = {}
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    data[key] = {r['scenario']: r for r in reports if 'error' not in r}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def compare(report: dict, base: dict, tolerance: float) -> str:
+    """기준선 대비 상태 문자열 (REGRESSION / faster / ok / new)"""
+    if not base:
+        return 'new'
+    # 최솟값(best-of-N)이 중앙값보다 스케줄링 잡음에 덜 흔들린다
+    delta = report['min_ms'] - base['min_ms']
+    ratio = delta / base['min_ms'] if base['min_ms'] else 0.0
+    report['baseline_ms'] = base['min_ms']
+    report['delta_pct'] = round(ratio * 100, 1)
+    if delta > NOISE_FLOOR_MS and ratio > tolerance:
+        return 'REGRESSION'
+    if -delta > NOISE_FLOOR_MS and -ratio > tolerance:
+        return 'faster'
+    return 'ok'
+
+
+# =============================================================================
+# main
+# =============================================================================
+def main() -> int:
+    parser = argparse.ArgumentParser(description='핫패스 오프라인 벤치마크')
+    parser.add_argument('scenarios', nargs='*', help=f"실행할 시나리오 (기본: 전체) {list(SCENARIOS)}")
+    parser.add_argument('--quick', action='store_true', help='작은 데이터 (300종목 x 250일)')
+    parser.add_argument('--tickers', type=int, default=None, help='종목 수')
+    parser.add_argument('--days', type=int, default=None, help='거래일 수')
+    parser.add_argument('--seed', type=int, default=bench_universe.DEFAULT_SEED)
+    parser.add_argument('--root', default=None, help='합성 데이터 디렉토리 (기본: data/bench/<key>)')
+    parser.add_argument('--repeat', type=int, default=1, help='시나리오별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--screen-stocks', type=int, default=200, help='run_screening max_stocks')
+    parser.add_argument('--candidates', type=int, default=300, help='Scorer 후보 수')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='기준선 파일')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준선으로 저장')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='회귀 판정 비율 (0.2 = 20%%)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    parser.add_argument('--worker', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        ctx = {
+            'root': args.root, 'data_dir': os.path.join(args.root, 'data'),
+            'screen_stocks': args.screen_stocks, 'candidates': args.candidates,
+        }
+        print(RESULT_PREFIX + json.dumps(run_worker(args.worker, ctx, max(1, args.repeat))), flush=True)
+        return 0
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+
+    tickers = args.tickers or (300 if args.quick else bench_universe.DEFAULT_TICKERS)
+    days = args.days or (250 if args.quick else bench_universe.DEFAULT_DAYS)
+    end_date = bench_universe.DEFAULT_END_DATE
+    root = args.root or bench_universe.default_root(tickers, days, end_date, args.seed)
+
+    meta = bench_universe.ensure_universe(root, tickers, days, end_date, args.seed)
+    key = f"{meta['key']}_r{args.screen_stocks}_c{args.candidates}"
+    baseline = load_baseline(args.baseline, key)
+
+    reports = []
+    for name in args.scenarios or list(SCENARIOS):
+        if not args.json:
+            print(f"  running {name} ...", file=sys.stderr, flush=True)
+        report = _spawn(name, args, root)
+        if 'error' not in report:
+            report['status'] = compare(report, baseline.get(name, {}), args.tolerance)
+        reports.append(report)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, key, reports)
+
+    if args.json:
+        print(json.dumps({'universe': meta, 'reports': reports}, indent=2, ensure_ascii=False))
+    else:
+        print(f"\nuniverse: {meta['tickers']:,} tickers x {meta['days']} days ({meta['price_rows']:,} price rows)")
+        print(f"{'scenario':<16} {'median(ms)':>11} {'min(ms)':>9} {'peak RSS':>9} {'+RSS':>7} {'base min':>10}  status")
+        print('-' * 80)
+        for r in reports:
+            if 'error' in r:
+                print(f"{r['scenario']:<16} ERROR {r['error']}")
+                continue
+            base = f"{r['baseline_ms']:.1f}" if 'baseline_ms' in r else '-'
+            delta = f" ({r['delta_pct']:+.1f}%)" if 'delta_pct' in r else ''
+            print(f"{r['scenario']:<16} {r['median_ms']:>11.1f} {r['min_ms']:>9.1f} {r['peak_rss_mb']:>8.0f}M "
+                  f"{r['rss_growth_mb']:>6.0f}M {base:>10}  {r['status']}{delta}")
+        if args.save_baseline:
+            print(f"\n기준선 저장: {args.baseline} [{key}]")
+
+    failed = any('error' in r or r.get('status') == 'REGRESSION' for r in reports)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+콜드 스타트 import 시간 벤치마크 (python -X importtime 기반)
+
+대상 모듈마다 새 인터프리터를 띄워 `import <모듈>`만 실행하고
+- 전체 import 시간 (importtime 누적값, 여러 번 실행한 중앙값)
+- 누적 시간이 큰 최상위 패키지
+- 로드된 무거운 의존성 (pandas, google-genai, pykrx, yfinance, FinanceDataReader, openai)
+을 출력한다. 무거운 의존성은 실제 사용 시점에 로드되어야 하므로 기본 대상에서는 보이지 않는 것이 정상이다.
+
+Usage:
+    python scripts/bench_startup.py
+    python scripts/bench_startup.py app.routes.kr_market engine.market_gate --runs 5 --top 10
+    python scripts/bench_startup.py --json
+    python scripts/bench_startup.py --max-ms 800   # 초과 시 종료 코드 1 (CI용)
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_TARGETS = [
+    'app',                # gunicorn 워커: flask_app → app (라우트는 create_app에서 로드)
+    'app.routes.kr_market',  # KR 블루프린트 (app.routes 패키지는 블루프린트를 지연 로드)
+    'services.scheduler', # create_app에서 시작하는 스케줄러
+    'engine.market_gate', # scripts/verify_market_gate.py
+    'engine.generator',   # 종가베팅 스크리너 CLI
+]
+
+HEAVY_MODULES = ['pandas', 'google.genai', 'pykrx', 'yfinance', 'FinanceDataReader', 'openai']
+
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+def parse_importtime(stderr: str) -> dict:
+    """-X importtime 출력 → {모듈명: (self_us, cumulative_us, depth)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+    return modules
+
+
+def run_once(target: str) -> dict:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='0', SCHEDULER_ENABLED='false')
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {target}'],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ['']
+        raise RuntimeError(f"import {target} 실패: {tail[0]}")
+
+    modules = parse_importtime(proc.stderr)
+    total_us = modules.get(target, (0, 0, 0))[1]
+    return {'wall_ms': wall_ms, 'import_ms': total_us / 1000, 'modules': modules}
+
+
+def bench(target: str, runs: int, top: int) -> dict:
+    results = [run_once(target) for _ in range(runs)]
+    modules = results[-1]['modules']
+
+    # 최상위 패키지(점 없는 이름)별 누적 시간 (가장 큰 것부터)
+    packages = sorted(
+        ((name, cumulative) for name, (_, cumulative, _) in modules.items()
+         if '.' not in name and name != target),
+        key=lambda pair: pair[1], reverse=True,
+    )
+    return {
+        'target': target,
+        'runs': runs,
+        'import_ms': round(statistics.median(r['import_ms'] for r in results), 1),
+        'wall_ms': round(statistics.median(r['wall_ms'] for r in results), 1),
+        'module_count': len(modules),
+        'heavy_loaded': [name for name in HEAVY_MODULES if name in modules],
+        'top_packages': [(name, round(us / 1000, 1)) for name, us in packages[:top]],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='콜드 스타트 import 시간 벤치마크')
+    parser.add_argument('targets', nargs='*', default=DEFAULT_TARGETS, help='import할 모듈 (기본: 주요 진입점)')
+    parser.add_argument('--runs', type=int, default=3, help='대상별 실행 횟수 (중앙값 사용)')
+    parser.add_argument('--top', type=int, default=8, help='출력할 상위 패키지 수')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    parser.add_argument('--max-ms', type=float, default=None, help='import 시간 상한 (초과 시 종료 코드 1)')
+    args = parser.parse_args()
+
+    reports = []
+    for target in args.targets:
+        try:
+            reports.append(bench(target, max(1, args.runs), args.top))
+        except RuntimeError as e:
+            reports.append({'target': target, 'error': str(e)})
+
+    if args.json:
+        print(json.dumps(reports, indent=2, ensure_ascii=False))
+    else:
+        print(f"{'target':<22} {'import(ms)':>10} {'wall(ms)':>9} {'modules':>8}  heavy deps loaded")
+        print('-' * 78)
+        for report in reports:
+            if 'error' in report:
+                print(f"{report['target']:<22} ERROR {report['error']}")
+                continue
+            heavy = ', '.join(report['heavy_loaded']) or '-'
+            print(f"{report['target']:<22} {report['import_ms']:>10.1f} {report['wall_ms']:>9.1f} "
+                  f"{report['module_count']:>8}  {heavy}")
+            packages = ', '.join(f"{name} {ms:.0f}" for name, ms in report['top_packages'])
+            print(f"{'':<22} top: {packages}")
+
+    failed = any('error' in report for report in reports)
+    if args.max_ms is not None:
+        slow = [r['target'] for r in reports if 'error' not in r and r['import_ms'] > args.max_ms]
+        if slow:
+            print(f"\n[FAIL] import 시간 {args.max_ms:.0f}ms 초과: {', '.join(slow)}", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
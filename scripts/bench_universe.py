@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성 시장 데이터 (KOSPI + KOSDAQ)
+
+실제 수집 파일과 같은 형식/컬럼으로 <root>/data 아래에 생성한다.
+    korean_stocks_list.csv, daily_prices.csv, all_institutional_trend_data.csv,
+    signals_log.csv, jongga_v2_results_YYYYMMDD.json, jongga_v2_latest.json,
+    market_gate.json, kr_ai_analysis.json
+
+- 같은 (종목 수, 거래일 수, 종료일, seed)면 항상 같은 데이터가 만들어진다 (기준선 비교용).
+- KODEX 200(069500)을 포함하므로 MarketGate가 로컬 CSV만으로 동작한다.
+- 일부 종목은 고점 부근 변동성 수축(VCP 유사) 구간으로 끝나도록 만들어 점수 분기가 고르게 실행된다.
+
+Usage:
+    python scripts/bench_universe.py                      # 2,500종목 x 500거래일
+    python scripts/bench_universe.py --tickers 300 --days 250 --root /tmp/bench
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_TICKERS = 2500
+DEFAULT_DAYS = 500          # 약 2년
+DEFAULT_END_DATE = '2026-02-27'
+DEFAULT_SEED = 42
+KOSPI_RATIO = 0.35          # 실제 상장 종목 비율 (KOSPI ~950 / KOSDAQ ~1,700)
+KODEX_200 = '069500'
+JONGGA_HISTORY_DAYS = 60
+SIGNALS_PER_DAY = 10
+
+# 생성 로직이 바뀌면 올린다 (같은 키의 기존 데이터/기준선과 섞이지 않도록)
+GENERATOR_VERSION = 1
+META_FILE = 'universe.json'
+_NAME_PREFIXES = ['가상전자', '모의바이오', '합성화학', '시험제약', '벤치반도체', '샘플엔터', '테스트건설', '예시금융']
+_THEMES = ['반도체', '2차전지', 'AI', '바이오', '조선', '방산', '로봇', '엔터']
+
+
+def universe_key(tickers: int, days: int, end_date: str, seed: int) -> str:
+    return f"u{tickers}x{days}_{end_date.replace('-', '')}_s{seed}_v{GENERATOR_VERSION}"
+
+
+def default_root(tickers: int, days: int, end_date: str, seed: int) -> str:
+    return os.path.join(PROJECT_ROOT, 'data', 'bench', universe_key(tickers, days, end_date, seed))
+
+
+# =============================================================================
+# 생성
+# =============================================================================
+def _make_stocks(n: int, rng: np.random.Generator) -> pd.DataFrame:
+    n_kospi = max(1, int(round(n * KOSPI_RATIO)))
+    codes = [f"{10_000 + i * 37:06d}" for i in range(n)]
+    if KODEX_200 not in codes:
+        codes[0] = KODEX_200
+    rows = []
+    for i, code in enumerate(codes):
+        market = 'KOSPI' if i < n_kospi else 'KOSDAQ'
+        name = 'KODEX 200' if code == KODEX_200 else f"{_NAME_PREFIXES[i % len(_NAME_PREFIXES)]}{i:04d}"
+        rows.append({'ticker': code, 'name': name, 'market': market, 'sector': _THEMES[i % len(_THEMES)]})
+    return pd.DataFrame(rows)
+
+
+def _make_ohlcv(stocks: pd.DataFrame, dates: pd.DatetimeIndex, rng: np.random.Generator):
+    """(N, D) OHLCV 행렬 - 종목별 추세/변동성이 다른 기하 브라운 운동"""
+    n, d = len(stocks), len(dates)
+    is_kosdaq = (stocks['market'] == 'KOSDAQ').to_numpy()
+
+    drift = rng.normal(0.0003, 0.0008, size=(n, 1))
+    vol = np.where(is_kosdaq, rng.uniform(0.02, 0.045, n), rng.uniform(0.01, 0.025, n))[:, None]
+    returns = drift + vol * rng.standard_normal((n, d))
+
+    # 약 10%는 상승 추세 후 마지막 구간 변동성/거래량 수축 (VCP 유사)
+    vcp_like = rng.random(n) < 0.10
+    returns[vcp_like, -15:] *= 0.25
+    returns[vcp_like, -60:-15] += 0.002
+
+    start_price = np.exp(rng.uniform(np.log(1_000), np.log(300_000), size=(n, 1)))
+    closes = np.maximum(np.round(start_price * np.exp(np.cumsum(returns, axis=1))), 10.0)
+
+    prev_close = np.concatenate([closes[:, :1], closes[:, :-1]], axis=1)
+    opens = np.round(prev_close * (1 + rng.normal(0, 0.005, size=(n, d))))
+    body_high = np.maximum(opens, closes)
+    body_low = np.minimum(opens, closes)
+    range_vol = np.repeat(vol, d, axis=1)
+    range_vol[vcp_like, -10:] *= 0.3
+    highs = np.round(body_high * (1 + np.abs(rng.normal(0, 0.6, size=(n, d))) * range_vol))
+    lows = np.maximum(np.round(body_low * (1 - np.abs(rng.normal(0, 0.6, size=(n, d))) * range_vol)), 1.0)
+
+    base_volume = np.exp(rng.uniform(np.log(20_000), np.log(5_000_000), size=(n, 1)))
+    volumes = np.round(base_volume * rng.lognormal(0, 0.5, size=(n, d))).astype(np.int64)
+    volumes[vcp_like, -5:] //= 2
+    # 마지막 날 일부 종목 거래량 급증 (거래대금/거래량 점수 분기)
+    spike = rng.random(n) < 0.05
+    volumes[spike, -1] *= rng.integers(3, 8, size=int(spike.sum()))
+
+    return opens, highs, lows, closes, volumes, vcp_like
+
+
+def _long_frame(stocks: pd.DataFrame, dates: pd.DatetimeIndex, columns: dict) -> pd.DataFrame:
+    """(N, D) 행렬들 → date/ticker 정렬된 long 형식 (수집 파일과 같은 행 순서)"""
+    n, d = len(stocks), len(dates)
+    frame = {
+        'date': np.tile(dates.strftime('%Y-%m-%d').to_numpy(), n),
+        'ticker': np.repeat(stocks['ticker'].to_numpy(), d),
+    }
+    for name, matrix in columns.items():
+        frame[name] = matrix.reshape(-1)
+    return pd.DataFrame(frame).sort_values(['date', 'ticker'], kind='stable').reset_index(drop=True)
+
+
+def _make_signal_payloads(stocks, dates, closes, rng) -> list:
+    """최근 JONGGA_HISTORY_DAYS 거래일의 종가베팅 결과 payload"""
+    payloads = []
+    grades = np.array(['S', 'A', 'B'])
+    history_start = max(0, len(dates) - JONGGA_HISTORY_DAYS)
+    for day in range(history_start, len(dates)):
+        picks = rng.choice(len(stocks), size=min(SIGNALS_PER_DAY, len(stocks)), replace=False)
+        signals = []
+        for idx in picks:
+            row = stocks.iloc[idx]
+            price = float(closes[idx, day])
+            score = int(rng.integers(6, 13))
+            signals.append({
+                'stock_code': row['ticker'],
+                'stock_name': row['name'],
+                'market': row['market'],
+                'grade': str(grades[min(2, max(0, 12 - score) // 2)]),
+                'entry_price': price,
+                'current_price': price,
+                'change_pct': round(float(rng.uniform(2, 15)), 2),
+                'trading_value': float(price * rng.integers(100_000, 5_000_000)),
+                'score': {'total': score, 'news': int(rng.integers(0, 4)), 'llm_reason': '합성 데이터 분석 사유'},
+                'themes': [row['sector']],
+                'news_items': [
+                    {'title': f"{row['name']} 관련 뉴스 {k + 1}", 'source': '벤치뉴스', 'url': '#',
+                     'published_at': dates[day].strftime('%Y-%m-%d')}
+                    for k in range(3)
+                ],
+            })
+        payloads.append({
+            'date': dates[day].strftime('%Y-%m-%d'),
+            'updated_at': dates[day].strftime('%Y-%m-%dT16:00:00'),
+            'total_candidates': len(signals),
+            'filtered_count': len(signals),
+            'signals': signals,
+        })
+    return payloads
+
+
+def _make_signals_log(stocks, dates, closes, rng) -> pd.DataFrame:
+    """VCP 시그널 로그 (최근 120거래일, 하루 5건)"""
+    rows = []
+    for day in range(max(0, len(dates) - 120), len(dates)):
+        for idx in rng.choice(len(stocks), size=min(5, len(stocks)), replace=False):
+            entry = float(closes[idx, day])
+            rows.append({
+                'signal_date': dates[day].strftime('%Y-%m-%d'),
+                'ticker': stocks.iloc[idx]['ticker'],
+                'name': stocks.iloc[idx]['name'],
+                'foreign_5d': int(rng.integers(-5, 20) * 1_000_000_000),
+                'inst_5d': int(rng.integers(-5, 20) * 1_000_000_000),
+                'score': round(float(rng.uniform(50, 95)), 1),
+                'contraction_ratio': round(float(rng.uniform(0.3, 0.9)), 2),
+                'entry_price': entry,
+                'current_price': float(closes[idx, -1]),
+                'status': 'OPEN',
+                'exit_price': None,
+                'exit_date': None,
+                'return_pct': None,
+                'hold_days': len(dates) - 1 - day,
+                'vcp_score': int(rng.integers(0, 11)),
+            })
+    return pd.DataFrame(rows)
+
+
+def _sector_entry(name: str, change_pct: float) -> dict:
+    """MarketGate.analyze()의 sectors 항목 형식"""
+    signal = 'Bullish' if change_pct > 0.5 else 'Bearish' if change_pct < -0.5 else 'Neutral'
+    return {'name': name, 'change_pct': change_pct, 'signal': signal}
+
+
+def _write_json(path: str, payload) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+
+def generate(root: str, tickers: int = DEFAULT_TICKERS, days: int = DEFAULT_DAYS,
+             end_date: str = DEFAULT_END_DATE, seed: int = DEFAULT_SEED) -> dict:
+    """합성 데이터 생성 후 메타 정보 반환"""
+    started = time.perf_counter()
+    data_dir = os.path.join(root, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    stocks = _make_stocks(tickers, rng)
+    dates = pd.bdate_range(end=end_date, periods=days)
+    opens, highs, lows, closes, volumes, vcp_like = _make_ohlcv(stocks, dates, rng)
+
+    prices = _long_frame(stocks, dates, {
+        'open': opens, 'high': highs, 'low': lows, 'close': closes,
+        'volume': volumes, 'trading_value': closes * volumes,
+    })
+    # 수급: 거래대금의 일부를 순매수로 (외국인/기관 독립), 원 단위 정수
+    # 약 10%는 꾸준히 순매수되는 종목 (수급 점수/연속 매수 분기)
+    flow_scale = closes * volumes * 0.08
+    accumulated = (rng.random(len(stocks)) < 0.10)[:, None]
+    flow_mean = np.where(accumulated, 0.8, 0.02)
+    flow_std = np.where(accumulated, 0.4, 1.0)
+    supply = _long_frame(stocks, dates, {
+        'foreign_buy': np.round(flow_scale * rng.normal(flow_mean, flow_std, size=closes.shape)).astype(np.int64),
+        'inst_buy': np.round(flow_scale * rng.normal(flow_mean * 0.7, flow_std, size=closes.shape)).astype(np.int64),
+    })
+
+    stocks.to_csv(os.path.join(data_dir, 'korean_stocks_list.csv'), index=False, encoding='utf-8-sig')
+    prices.to_csv(os.path.join(data_dir, 'daily_prices.csv'), index=False, encoding='utf-8-sig')
+    supply.to_csv(os.path.join(data_dir, 'all_institutional_trend_data.csv'), index=False, encoding='utf-8-sig')
+    _make_signals_log(stocks, dates, closes, rng).to_csv(
+        os.path.join(data_dir, 'signals_log.csv'), index=False, encoding='utf-8-sig')
+
+    payloads = _make_signal_payloads(stocks, dates, closes, rng)
+    for payload in payloads:
+        _write_json(os.path.join(data_dir, f"jongga_v2_results_{payload['date'].replace('-', '')}.json"), payload)
+    _write_json(os.path.join(data_dir, 'jongga_v2_latest.json'), payloads[-1])
+
+    last_date = dates[-1].strftime('%Y-%m-%d')
+    _write_json(os.path.join(data_dir, 'market_gate.json'), {
+        'kospi_close': 2650.5, 'kospi_change': 0.8, 'kosdaq_close': 870.2, 'kosdaq_change_pct': -0.3,
+        'usd_krw': 1385.0, 'total_score': 62, 'is_gate_open': True, 'status': '중립 (Neutral)',
+        'color': 'YELLOW', 'gate_reason': '시장 양호 (Technical)', 'dataset_date': last_date,
+        'sectors': [_sector_entry(theme, round(float(rng.uniform(-2, 2)), 2)) for theme in _THEMES],
+    })
+    vcp_codes = stocks['ticker'][vcp_like].tolist()[:20]
+    _write_json(os.path.join(data_dir, 'kr_ai_analysis.json'), {
+        'generated_at': f"{last_date}T16:30:00",
+        'signals': [
+            {'ticker': code, 'name': stocks.set_index('ticker').loc[code, 'name'],
+             'gemini_recommendation': {'action': 'BUY', 'confidence': 80, 'reason': '변동성 수축 후 돌파 대기'}}
+            for code in vcp_codes
+        ],
+    })
+
+    meta = {
+        'key': universe_key(tickers, days, end_date, seed),
+        'tickers': tickers, 'days': days, 'end_date': end_date, 'seed': seed,
+        'price_rows': len(prices), 'jongga_days': len(payloads),
+        'generated_in_sec': round(time.perf_counter() - started, 1),
+    }
+    _write_json(os.path.join(root, META_FILE), meta)
+    return meta
+
+
+def ensure_universe(root: str, tickers: int, days: int, end_date: str, seed: int) -> dict:
+    """같은 설정의 데이터가 있으면 재사용, 없으면 생성"""
+    meta_path = os.path.join(root, META_FILE)
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('key') == universe_key(tickers, days, end_date, seed):
+            return meta
+    return generate(root, tickers, days, end_date, seed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='벤치마크용 합성 시장 데이터 생성')
+    parser.add_argument('--tickers', type=int, default=DEFAULT_TICKERS, help='종목 수')
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS, help='거래일 수')
+    parser.add_argument('--end-date', default=DEFAULT_END_DATE, help='마지막 거래일 (YYYY-MM-DD)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--root', default=None, help='출력 디렉토리 (기본: data/bench/<key>)')
+    args = parser.parse_args()
+
+    root = args.root or default_root(args.tickers, args.days, args.end_date, args.seed)
+    meta = generate(root, args.tickers, args.days, args.end_date, args.seed)
+    print(f"생성 완료: {root} ({meta['price_rows']:,} rows, {meta['generated_in_sec']}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,7 +13,7 @@ import pandas as pd
 import numpy as np
 import json
 import socket
-import yfinance as yf
+import importlib.util
 import time
 import random
 import logging
@@ -63,12 +63,8 @@ class NumpyEncoder(json.JSONEncoder):
             return obj.tolist()
         return super().default(obj)
 
-# yfinance for real market data
-try:
-    import yfinance as yf
-    YFINANCE_AVAILABLE = True
-except ImportError:
-    YFINANCE_AVAILABLE = False
+# yfinance for real market data (import는 실제 사용 시점에 - 스케줄러/CLI 기동 시간 단축)
+YFINANCE_AVAILABLE = importlib.util.find_spec('yfinance') is not None
 
 # 루트 디렉토리 설정
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -81,6 +77,7 @@ from engine.llm_analyzer import LLMAnalyzer
 from engine.market_gate import MarketGate
 from engine.position_sizer import PositionSizer
 from engine.models import Grade
+from engine.data_catalog import record_dataframe, record_file
 
 # =====================================================
 # 주말/휴일 처리를 위한 유틸리티 함수
@@ -170,6 +167,7 @@ def fetch_market_indices():
         symbols = list(ticker_map.values())
         
         # 안전한 다운로드 (스레드 비활성화)
+        import yfinance as yf
         data = yf.download(symbols, period="5d", progress=False, threads=False)
         
         # 데이터 추출 Helper
@@ -505,6 +503,7 @@ def create_korean_stocks_list():
             df = pd.DataFrame(all_data)
             file_path = os.path.join(BASE_DIR, 'data', 'korean_stocks_list.csv')
             df.to_csv(file_path, index=False, encoding='utf-8-sig')
+            record_dataframe(file_path, df)
             log(f"종목 목록 생성 완료: {file_path} ({len(df)} 종목)", "SUCCESS")
             return True
         else:
@@ -546,6 +545,7 @@ def create_korean_stocks_list():
         df = pd.DataFrame(data)
         file_path = os.path.join(BASE_DIR, 'data', 'korean_stocks_list.csv')
         df.to_csv(file_path, index=False, encoding='utf-8-sig')
+        record_dataframe(file_path, df)
         log(f"기본 종목 목록 생성 완료: {file_path} ({len(df)} 종목 - KOSPI 15개 + KOSDAQ 10개)", "SUCCESS")
         return True
 
@@ -724,6 +724,7 @@ def fetch_prices_yfinance(start_date, end_date, existing_df, file_path):
                 final_df = new_df
                 
             final_df.to_csv(file_path, index=False, encoding='utf-8-sig')
+            record_dataframe(file_path, final_df)
             log(f"yfinance 백업 수집 완료 ({len(final_df)}행)", "SUCCESS")
             
             # [Added] 데이터 가지치기
@@ -1010,6 +1011,7 @@ def create_daily_prices(target_date=None, force=False, lookback_days=5):
 
             log(f"데이터 저장 시작... ({file_path})", "INFO")
             final_df.to_csv(file_path, index=False, encoding='utf-8-sig')
+            record_dataframe(file_path, final_df)
             log(f"일별 가격 저장 완료: 총 {len(final_df)}행 (신규 {len(new_chunk_df)}행)", "INFO")
             
             # [Added] 데이터 가지치기 (최근 3년 유지)
@@ -1277,6 +1279,7 @@ def create_institutional_trend(target_date=None, force=False, lookback_days=7):
             # 정렬
             final_df = final_df.sort_values(['ticker', 'date'])
             final_df.to_csv(file_path, index=False, encoding='utf-8-sig')
+            record_dataframe(file_path, final_df)
             log(f"수급 데이터 업데이트 완료: 총 {len(final_df)}행 (신규 {len(new_data_list)}행)", "DEBUG")
             return True
         else:
@@ -1472,6 +1475,7 @@ def create_signals_log(target_date=None, run_ai=True):
                     kr_ai_path = os.path.join(BASE_DIR, 'data', 'kr_ai_analysis.json')
                     with open(kr_ai_path, 'w', encoding='utf-8') as f:
                         json.dump(kr_ai_data, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
+                    record_file(kr_ai_path)
                     
                     # 날짜별 히스토리도 저장
                     kr_ai_history_path = os.path.join(BASE_DIR, 'data', f'kr_ai_analysis_{date_str}.json')
@@ -1594,14 +1598,17 @@ def create_signals_log(target_date=None, run_ai=True):
                         df_combined = df_combined.sort_values(by=['signal_date', 'score'], ascending=[False, False])
                     
                     df_combined.to_csv(file_path, index=False, encoding='utf-8-sig')
+                    record_dataframe(file_path, df_combined)
                     # 해당 날짜 데이터 반환 (common.py 연동용) -> init_data.py에서는 True 반환해야 함
                     return True
                 except Exception as e:
                     log(f"기존 로그 병합 실패: {e}, 새로 생성합니다(덮어쓰기).", "WARNING")
                     df_new.to_csv(file_path, index=False, encoding='utf-8-sig')
+                    record_dataframe(file_path, df_new)
                     return True
             else:
                 df_new.to_csv(file_path, index=False, encoding='utf-8-sig')
+                record_dataframe(file_path, df_new)
                 return True
                 
             log(f"VCP 시그널 분석 완료: {len(signals)} 종목 감지 (누적 저장)", "SUCCESS")
@@ -1612,6 +1619,7 @@ def create_signals_log(target_date=None, run_ai=True):
             df = pd.DataFrame(columns=['ticker', 'name', 'signal_date', 'market', 'status', 'score', 'contraction_ratio', 'entry_price', 'foreign_5d', 'inst_5d'])
             file_path = os.path.join(BASE_DIR, 'data', 'signals_log.csv')
             df.to_csv(file_path, index=False, encoding='utf-8-sig')
+            record_dataframe(file_path, df)
             log("VCP 조건 충족 종목 없음 - 빈 결과 저장", "INFO")
             return True
             
@@ -1623,6 +1631,7 @@ def create_signals_log(target_date=None, run_ai=True):
         df = pd.DataFrame(columns=['ticker', 'name', 'signal_date', 'market', 'status', 'score', 'contraction_ratio', 'entry_price', 'foreign_5d', 'inst_5d'])
         file_path = os.path.join(BASE_DIR, 'data', 'signals_log.csv')
         df.to_csv(file_path, index=False, encoding='utf-8-sig')
+        record_dataframe(file_path, df)
         log("VCP 분석 오류 - 빈 결과 저장", "INFO")
         return False
 
@@ -1662,6 +1671,7 @@ def create_jongga_v2_latest():
             file_path = os.path.join(BASE_DIR, 'data', 'jongga_v2_latest.json')
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(output_data, f, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+            record_file(file_path)
                 
             log(f"종가베팅 V2 분석 완료: {len(signals_json)} 종목 (SignalGenerator)", "SUCCESS")
             return True
@@ -1762,6 +1772,7 @@ def create_market_gate(target_date=None):
         file_path = os.path.join(BASE_DIR, 'data', 'market_gate.json')
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(gate_data, f, indent=2, ensure_ascii=False)
+        record_file(file_path)
             
         # 날짜별 아카이브 저장
         if target_date:
@@ -1937,6 +1948,7 @@ def create_kr_ai_analysis(target_date=None):
             kr_ai_path = os.path.join(data_dir, 'kr_ai_analysis.json')
             with open(kr_ai_path, 'w', encoding='utf-8') as f:
                  json.dump(results, f, ensure_ascii=False, indent=2)
+            record_file(kr_ai_path)
             log(f"Frontend 데이터 동기화 완료: {kr_ai_path}", "SUCCESS")
                 
         return True
@@ -2040,8 +2052,8 @@ def create_kr_ai_analysis_with_key(target_dates=None, api_key=None):
         traceback.print_exc()
         return {'error': str(e)}
 
-def send_jongga_notification():
-    """종가베팅 V2 결과 알림 발송"""
+def send_jongga_notification(wait=True):
+    """종가베팅 V2 결과 알림 발송 (wait=False면 발송 예약 후 바로 반환)"""
     try:
         import json
         import os
@@ -2056,7 +2068,8 @@ def send_jongga_notification():
             log(f"종가베팅 결과 파일이 없습니다: {data_file}", "WARNING")
             messenger.send_custom_message(
                 title="⚠️ 종가베팅 알림 실패",
-                message=f"결과 파일을 찾지 못했습니다.\n경로: {data_file}"
+                message=f"결과 파일을 찾지 못했습니다.\n경로: {data_file}",
+                wait=wait
             )
             return
         
@@ -2183,15 +2196,16 @@ def send_jongga_notification():
                 trending_themes=file_data.get('trending_themes', [])
             )
             
-            messenger.send_screener_result(result)
-            log(f"알림 발송 완료: {len(signals)}개 신호", "SUCCESS")
+            messenger.send_screener_result(result, wait=wait)
+            log(f"알림 발송 {'완료' if wait else '예약'}: {len(signals)}개 신호", "SUCCESS")
         else:
             messenger.send_custom_message(
                 title=f"📊 종가베팅 ({date_str}) - 신호 없음",
                 message=(
                     f"{date_str} 종가베팅 분석이 완료되었습니다.\n"
                     "선별된 신호가 0건이라 상세 시그널은 없습니다."
-                )
+                ),
+                wait=wait
             )
             log("발송할 신호 없음 (0개) - 실행 결과 알림 발송", "INFO")
                 
@@ -2320,6 +2334,7 @@ def update_vcp_signals_recent_price():
         
         # 저장
         df.to_csv(file_path, index=False, encoding='utf-8-sig')
+        record_dataframe(file_path, df)
         log(f"VCP 시그널 가격 업데이트 완료: {updated_count}건 갱신", "SUCCESS")
         
         # kr_ai_analysis.json도 동기화 (선택 사항)
@@ -2354,6 +2369,7 @@ def update_kr_ai_analysis_prices(price_map):
         if updated:
             with open(kr_ai_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
+            record_file(kr_ai_path)
             log("kr_ai_analysis.json 가격 동기화 완료", "INFO")
             
     except Exception as e:
@@ -2391,6 +2407,7 @@ def prune_daily_prices(file_path, days_to_keep=1095):
         # 삭제된 데이터가 있을 경우만 저장
         if original_count > pruned_count:
             df_pruned.to_csv(file_path, index=False, encoding='utf-8-sig')
+            record_dataframe(file_path, df_pruned)
             deleted_count = original_count - pruned_count
             log(f"오래된 데이터 삭제 완료: {deleted_count}행 삭제 (기준일: {cutoff_date})", "SUCCESS")
         else:
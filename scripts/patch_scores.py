@@ -1,8 +1,15 @@
+import argparse
 import json
 import os
+import sys
 
-def patch_json_files():
-    data_dir = 'data'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.jongga_rescore import run_rescore_job
+
+
+def patch_json_files(data_dir='data'):
+    """score.total 누락 보정 (구버전 결과 파일)"""
     files_to_patch = ['jongga_v2_latest.json']
     
     # Add any jongga_v2_results_*.json files
@@ -50,4 +57,11 @@ def patch_json_files():
             print(f"Error patching {filename}: {e}")
 
 if __name__ == "__main__":
-    patch_json_files()
+    parser = argparse.ArgumentParser(description="종가베팅 결과 score.total 보정 + 등급 재산정")
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--force', action='store_true', help="규칙 버전과 무관하게 전체 재산정")
+    args = parser.parse_args()
+
+    patch_json_files(args.data_dir)
+    # total 보정 후 현재 등급 규칙 버전으로 재산정 (이미 최신인 파일은 건너뜀)
+    print(run_rescore_job(args.data_dir, force=args.force))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+chatbot.runtime_pool / 공유 HistoryManager 테스트
+
+- LRU 최대 개수, 유휴 TTL 축출 (idle_ttl=0이면 축출하지 않음)
+- 같은 키를 동시에 요청해도 인스턴스는 한 번만 생성되는지
+- 공유 HistoryManager에 여러 스레드가 동시에 써도 메시지가 유실되지 않는지
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot.runtime_pool import ChatbotRuntimePool, SharedChatbotAssets
+from chatbot.storage import HistoryManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction():
+    pool = ChatbotRuntimePool(factory=lambda key: object(), max_size=2, idle_ttl=0)
+    a = pool.get('a')
+    pool.get('b')
+    assert pool.get('a') is a  # a가 최근 사용
+    pool.get('c')              # 가장 오래된 b 축출
+    assert pool.keys() == ['a', 'c']
+
+
+def test_idle_ttl_eviction():
+    clock = FakeClock()
+    pool = ChatbotRuntimePool(factory=lambda key: object(), max_size=10, idle_ttl=60, clock=clock)
+    first = pool.get('a')
+    pool.get('b')
+    clock.now = 30
+    pool.get('b')
+    clock.now = 80  # a: 80초 유휴, b: 50초 유휴
+    pool.get('c')
+    assert pool.keys() == ['b', 'c']
+    assert pool.get('a') is not first
+
+
+def test_zero_idle_ttl_disables_eviction():
+    os.environ['CHATBOT_POOL_IDLE_TTL'] = '5'
+    try:
+        clock = FakeClock()
+        pool = ChatbotRuntimePool(factory=lambda key: object(), max_size=10, idle_ttl=0, clock=clock)
+        assert pool.idle_ttl == 0
+        pool.get('a')
+        clock.now = 10_000
+        pool.get('b')
+        assert pool.keys() == ['a', 'b']
+    finally:
+        del os.environ['CHATBOT_POOL_IDLE_TTL']
+
+
+def test_concurrent_get_creates_once():
+    created = []
+    lock = threading.Lock()
+
+    def factory(key):
+        time.sleep(0.05)
+        with lock:
+            created.append(key)
+        return object()
+
+    pool = ChatbotRuntimePool(factory=factory, max_size=10, idle_ttl=0)
+    results = {}
+
+    def worker(i):
+        results[i] = pool.get('same' if i % 2 else f'other-{i}')
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert created.count('same') == 1
+    assert len({id(results[i]) for i in range(1, 16, 2)}) == 1
+    assert len(created) == 1 + 8
+
+
+def test_shared_history_concurrent_writes():
+    with tempfile.TemporaryDirectory() as tmp:
+        assets = SharedChatbotAssets(Path(tmp))
+        histories = [assets.get_history(lambda: HistoryManager('u', data_dir=Path(tmp))) for _ in range(4)]
+        assert all(h is histories[0] for h in histories)
+
+        history = histories[0]
+        sessions = [history.create_session(owner_id=f'user{i}') for i in range(4)]
+
+        def chat(session_id):
+            for n in range(10):
+                history.add_message(session_id, 'user', f'질문 {n}')
+
+        threads = [threading.Thread(target=chat, args=(sid,)) for sid in sessions]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        reloaded = HistoryManager('u', data_dir=Path(tmp))
+        for sid in sessions:
+            assert len(reloaded.get_messages(sid)) == 10
+
+        assert history.update_session(sessions[0], lambda s: s.update(messages=[]))
+        assert reloaded.get_messages(sessions[0]) == []
+        assert not history.update_session('missing', lambda s: None)
+
+
+if __name__ == '__main__':
+    test_lru_eviction()
+    test_idle_ttl_eviction()
+    test_zero_idle_ttl_disables_eviction()
+    test_concurrent_get_creates_once()
+    test_shared_history_concurrent_writes()
+    print('OK')
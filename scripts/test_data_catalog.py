@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.data_catalog 테스트
+
+- writer가 기록한 항목은 조회 시 파일을 다시 읽지 않는지
+- 매니페스트 밖에서 바뀐 파일은 조회 시 1회 재계산하되 해시는 계산하지 않는지
+- 종가베팅 결과 저장 / Market Gate 저장이 쓰는 시점에 카탈로그를 갱신하는지
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import engine.data_catalog as data_catalog
+from engine.data_catalog import DataCatalog
+
+
+class CallCounter:
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.func(*args, **kwargs)
+
+
+def _patch(name):
+    counter = CallCounter(getattr(data_catalog, name))
+    setattr(data_catalog, name, counter)
+    return counter
+
+
+def _restore(*counters):
+    for name, counter in counters:
+        setattr(data_catalog, name, counter.func)
+
+
+def test_recorded_entry_is_served_without_rescan():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'signals_log.csv')
+        with open(path, 'w') as f:
+            f.write('ticker,signal_date\n005930,2026-02-26\n000660,2026-02-27\n')
+
+        catalog = DataCatalog(tmp)
+        entry = catalog.record(path)
+        assert entry['row_count'] == 2
+        assert entry['date_range'] == {'start': '2026-02-26', 'end': '2026-02-27'}
+        assert entry['sha256']
+
+        file_hash, scan_csv = _patch('_file_hash'), _patch('_scan_csv')
+        try:
+            assert DataCatalog(tmp).get(path)['row_count'] == 2
+            assert (file_hash.calls, scan_csv.calls) == (0, 0)
+        finally:
+            _restore(('_file_hash', file_hash), ('_scan_csv', scan_csv))
+
+
+def test_external_change_rescans_without_hash():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'market_gate.json')
+        with open(path, 'w') as f:
+            json.dump({'dataset_date': '2026-02-26'}, f)
+        catalog = DataCatalog(tmp)
+        catalog.record(path)
+
+        with open(path, 'w') as f:
+            json.dump({'dataset_date': '2026-02-27', 'note': 'changed'}, f)
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000))
+
+        file_hash = _patch('_file_hash')
+        try:
+            entry = catalog.get(path)
+            assert entry['date_range'] == {'start': '2026-02-27', 'end': '2026-02-27'}
+            assert entry['sha256'] is None
+            assert entry['size'] == os.path.getsize(path)
+            assert file_hash.calls == 0
+            # 재계산 결과도 매니페스트에 남아 다음 조회는 O(1)
+            scan_json = _patch('_scan_json')
+            try:
+                assert catalog.get(path) == entry
+                assert scan_json.calls == 0
+            finally:
+                _restore(('_scan_json', scan_json))
+        finally:
+            _restore(('_file_hash', file_hash))
+
+
+def test_writers_record_at_write_time():
+    from engine.generator import save_result_to_json
+    from engine.market_gate import MarketGate
+    from engine.models import ScreenerResult
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # save_result_to_json은 상대 경로 data/에 저장
+        try:
+            save_result_to_json(ScreenerResult(
+                date=date(2026, 2, 27), total_candidates=0, filtered_count=0, scanned_count=0,
+                signals=[], by_grade={}, by_market={}, processing_time_ms=0.0,
+                market_status={}, market_summary='', trending_themes=[],
+            ))
+            MarketGate(data_dir='data').save_analysis({'dataset_date': '2026-02-27', 'total_score': 50})
+
+            with open(os.path.join('data', data_catalog.CATALOG_FILENAME), encoding='utf-8') as f:
+                files = json.load(f)['files']
+            latest = files['jongga_v2_latest.json']
+            assert latest['row_count'] == 0
+            assert latest['date_range'] == {'start': '2026-02-27', 'end': '2026-02-27'}
+            assert latest['sha256']
+            assert files['market_gate.json']['sha256']
+            assert latest['mtime_ns'] == os.stat(os.path.join('data', 'jongga_v2_latest.json')).st_mtime_ns
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    test_recorded_entry_is_served_without_rescan()
+    test_external_change_rescans_without_hash()
+    test_writers_record_at_write_time()
+    print('OK')
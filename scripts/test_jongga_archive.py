@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.jongga_archive 테스트
+
+- 같은 날짜에 중복 종목이 있어도 원본 파일과 같은 순서/개수로 복원되는지
+- 같은 날짜 재기록 시 스냅샷 교체, 종목별 날짜 교차 조회
+- 결과 파일 백필 (새 파일/변경된 파일만), 이전 스키마(date, ticker 키) DB 재생성
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.jongga_archive import ARCHIVE_FILENAME, SCHEMA_VERSION, JonggaArchive
+from engine.sqlite_db import get_database
+
+
+def _payload(*codes, day='2026-02-27'):
+    return {
+        'date': day,
+        'by_grade': {'A': len(codes)},
+        'signals': [
+            {'stock_code': code, 'grade': 'A', 'score': {'total': 10 - i}, 'note': f'row{i}'}
+            for i, code in enumerate(codes)
+        ],
+    }
+
+
+def _write_result(tmp, day, payload):
+    path = os.path.join(tmp, f"jongga_v2_results_{day.replace('-', '')}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f)
+    return path
+
+
+def test_duplicate_tickers_are_kept_by_position():
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = JonggaArchive(tmp)
+        payload = _payload('005930', '000660', '005930')
+        assert archive.record_payload('2026-02-27', payload) == 3
+
+        assert archive.load_payload('2026-02-27') == payload
+        history = archive.signal_history(['5930'])
+        assert [s['note'] for s in history] == ['row0', 'row2']
+        assert archive.db is get_database(os.path.join(tmp, ARCHIVE_FILENAME))
+
+
+def test_rerecord_replaces_snapshot():
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = JonggaArchive(tmp)
+        archive.record_payload('2026-02-26', _payload('000660', day='2026-02-26'))
+        archive.record_payload('2026-02-27', _payload('005930', '000660'))
+        archive.record_payload('2026-02-27', _payload('035720'))
+
+        assert [s['stock_code'] for s in archive.load_payload('2026-02-27')['signals']] == ['035720']
+        assert [s['date'] for s in archive.signal_history(['000660'])] == ['2026-02-26']
+        assert archive.list_dates() == ['2026-02-27', '2026-02-26']
+
+
+def test_sync_files_backfills_new_and_changed_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_result(tmp, '2026-02-26', _payload('005930', day='2026-02-26'))
+        _write_result(tmp, '2026-02-27', _payload(day='2026-02-27'))
+
+        archive = JonggaArchive(tmp)
+        assert archive.sync_files() == 2
+        assert archive.sync_files() == 0
+        assert archive.list_dates(with_signals_only=True) == ['2026-02-26']
+
+        _write_result(tmp, '2026-02-26', _payload('005930', '005930', day='2026-02-26'))
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000))
+        assert archive.sync_files() == 1
+        assert len(archive.load_payload('2026-02-26')['signals']) == 2
+
+
+def test_old_schema_is_rebuilt_from_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, ARCHIVE_FILENAME)
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript("""
+                CREATE TABLE jongga_dates (date TEXT PRIMARY KEY, signal_count INTEGER NOT NULL, by_grade TEXT,
+                    summary TEXT NOT NULL, source_file TEXT, source_size INTEGER, source_mtime_ns INTEGER,
+                    updated_at TEXT NOT NULL);
+                CREATE TABLE jongga_signals (date TEXT NOT NULL, ticker TEXT NOT NULL, position INTEGER NOT NULL,
+                    grade TEXT, score_total REAL, payload TEXT NOT NULL, PRIMARY KEY (date, ticker));
+                INSERT INTO jongga_dates VALUES ('2020-01-01', 0, NULL, '{}', NULL, NULL, NULL, '');
+            """)
+        conn.close()
+        _write_result(tmp, '2026-02-27', _payload('005930', '005930'))
+
+        archive = JonggaArchive(tmp)
+        assert archive.list_dates() == ['2026-02-27']
+        assert len(archive.load_payload('2026-02-27')['signals']) == 2
+        assert archive.db.query_one('PRAGMA user_version')[0] == SCHEMA_VERSION
+
+
+if __name__ == '__main__':
+    test_duplicate_tickers_are_kept_by_position()
+    test_rerecord_replaces_snapshot()
+    test_sync_files_backfills_new_and_changed_files()
+    test_old_schema_is_rebuilt_from_files()
+    print('OK')
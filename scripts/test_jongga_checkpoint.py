@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.jongga_checkpoint 테스트
+
+- Phase1 수집 결과/뉴스가 기록 → 복원 후 같은 값인지
+- resume=False면 이전 기록을 지우는지
+- 후보 시세(지문)가 기록과 다르면 현재 후보 값을 유지하고 모든 단계 기록을 버리는지
+- Phase2 뉴스 수집이 빈 결과면 기록하지 않아, 재개 시 다시 수집하는지
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.jongga_checkpoint import (
+    RunCheckpoint,
+    STAGE_PHASE1,
+    STAGE_PHASE2,
+    STAGE_PHASE3,
+    dump_collected,
+    dump_news,
+    load_collected,
+    load_news,
+    matches_candidate,
+)
+from engine.models import ChartData, NewsItem, StockData, SupplyData
+from engine.phases import Phase1Analyzer, Phase2NewsCollector, Phase3LLMAnalyzer
+
+
+def test_roundtrip_and_reset():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'checkpoint.db')
+        stock = StockData(code='005930', name='삼성전자', market='KOSPI', close=70000,
+                          trading_value=5e11, change_pct=3.5, high_52w=80000)
+        stock.vcp_score = 12.5
+        item = {
+            'stock': stock,
+            'charts': ChartData(opens=[1, 2], highs=[2, 3], lows=[0, 1], closes=[1.5, 2.5],
+                                volumes=[100, 200], dates=['20260101', '20260102']),
+            'supply': SupplyData(foreign_buy_5d=10, inst_buy_5d=-5),
+            'vcp': {'score': 12.5, 'ratio': 0.4, 'is_vcp': True},
+        }
+        news = [NewsItem(title='수주', source='연합', url='u', published_at=datetime(2026, 1, 2, 9, 30))]
+
+        checkpoint = RunCheckpoint.open('2026-01-02', 'KOSPI', path=path)
+        checkpoint.save(STAGE_PHASE1, stock.code, dump_collected(item))
+        checkpoint.save(STAGE_PHASE2, stock.code, dump_news(news))
+
+        resumed = RunCheckpoint.open('2026-01-02', 'KOSPI', resume=True, path=path)
+        candidate = StockData(code='005930', name='삼성전자', market='KOSPI', close=70000,
+                              trading_value=5e11, change_pct=3.5)
+        assert matches_candidate(candidate, resumed.load(STAGE_PHASE1)[stock.code])
+        restored = load_collected(candidate, resumed.load(STAGE_PHASE1)[stock.code])
+        assert restored['stock'] is candidate
+        assert candidate.high_52w == 80000 and candidate.vcp_score == 12.5
+        assert restored['charts'] == item['charts']
+        assert restored['supply'] == item['supply']
+        assert load_news(resumed.load(STAGE_PHASE2)[stock.code]) == news
+
+        fresh = RunCheckpoint.open('2026-01-02', 'KOSPI', resume=False, path=path)
+        assert fresh.counts() == {}
+
+
+class StubCollector:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_stock_detail(self, code):
+        self.calls += 1
+        return {'high_52w': 90000}
+
+    async def get_chart_data(self, code, days):
+        return None
+
+    async def get_supply_data(self, code):
+        return None
+
+
+def test_stale_record_is_discarded():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'checkpoint.db')
+        recorded = StockData(code='005930', name='삼성전자', market='KOSPI', close=70000,
+                             trading_value=5e11, change_pct=3.5, high_52w=80000)
+        checkpoint = RunCheckpoint.open('2026-01-02', 'KOSPI', path=path)
+        checkpoint.save(STAGE_PHASE1, recorded.code, dump_collected({'stock': recorded}))
+        checkpoint.save(STAGE_PHASE3, recorded.code, {'score': 3})
+
+        # 장중 재실행: 같은 종목이지만 시세가 바뀜
+        live = StockData(code='005930', name='삼성전자', market='KOSPI', close=71000,
+                         trading_value=6e11, change_pct=4.9)
+        resumed = RunCheckpoint.open('2026-01-02', 'KOSPI', resume=True, path=path)
+        collector = StubCollector()
+        phase1 = Phase1Analyzer(collector, scorer=None)
+        phase3 = Phase3LLMAnalyzer(llm_analyzer=None, chunk_size=5, token_budget=1)
+        phase1.set_checkpoint(resumed)
+        phase3.set_checkpoint(resumed)
+
+        item = asyncio.run(phase1._collect_or_restore(live))
+        assert collector.calls == 1
+        assert item['stock'] is live
+        assert (live.close, live.trading_value, live.change_pct) == (71000, 6e11, 4.9)
+        assert live.high_52w == 90000
+        assert phase3._restore(live.code) is None
+        assert resumed.restored == {STAGE_PHASE1: 0, STAGE_PHASE2: 0, STAGE_PHASE3: 0}
+
+        # 새로 수집한 결과만 남는다
+        again = RunCheckpoint.open('2026-01-02', 'KOSPI', resume=True, path=path)
+        assert again.counts() == {STAGE_PHASE1: 1}
+        assert matches_candidate(live, again.load(STAGE_PHASE1)[live.code])
+
+
+class FlakyNews:
+    """첫 호출은 (일시적 실패로) 빈 결과, 이후에는 뉴스 1건"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_stock_news(self, code, limit, name):
+        self.calls += 1
+        if self.calls == 1:
+            return []
+        return [NewsItem(title=f'{name} 수주', source='연합', url='u')]
+
+
+def test_empty_news_is_not_recorded():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'checkpoint.db')
+        stock = StockData(code='005930', name='삼성전자', market='KOSPI', close=70000,
+                          trading_value=5e11, change_pct=3.5)
+        news = FlakyNews()
+
+        phase2 = Phase2NewsCollector(news)
+        phase2.set_checkpoint(RunCheckpoint.open('2026-01-02', 'KOSPI', path=path))
+        assert asyncio.run(phase2.collect_news({'stock': stock})) is None
+
+        # 재개: 빈 결과는 기록되지 않았으므로 다시 수집하고, 이번 결과는 기록된다
+        resumed = RunCheckpoint.open('2026-01-02', 'KOSPI', resume=True, path=path)
+        assert resumed.counts() == {}
+        phase2 = Phase2NewsCollector(news)
+        phase2.set_checkpoint(resumed)
+        item = asyncio.run(phase2.collect_news({'stock': stock}))
+        assert news.calls == 2
+        assert [n.title for n in item['news']] == ['삼성전자 수주']
+        assert RunCheckpoint.open('2026-01-02', 'KOSPI', resume=True, path=path).counts() == {STAGE_PHASE2: 1}
+
+
+if __name__ == '__main__':
+    test_roundtrip_and_reset()
+    test_stale_record_is_discarded()
+    test_empty_news_is_not_recorded()
+    print('OK')
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.jongga_rescore 테스트
+
+- rescore_payload가 예전 라우트의 종목별 재산정(_recalculate_jongga_grade(s) + _sort_jongga_signals)과
+  같은 grade / by_grade / 정렬을 내는지 (경계값, 양매수, PRICE_CHANGE.MIN, 깨진 값 포함)
+- run_rescore_job: 두 번째 실행은 변경 없는 파일을 건너뛰고, force는 매니페스트를 무시하며,
+  규칙 버전이 바뀌면 전체를 다시 산정하는지
+"""
+
+import copy
+import json
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.routes.kr_market_helpers import _sort_jongga_signals
+from engine.config import SignalConfig
+from engine.constants import PRICE_CHANGE
+from engine.jongga_rescore import grade_rules_version, rescore_payload, run_rescore_job
+
+TRILLION = 1_000_000_000_000
+
+
+# 삭제된 kr_market_helpers 구현 (비교 기준)
+def _legacy_grade(signal: dict) -> str:
+    try:
+        tv = float(signal.get("trading_value", 0) or 0)
+        change_pct = float(signal.get("change_pct", 0) or 0)
+        score = signal.get("score") or {}
+        score_total = int((score.get("total") if isinstance(score, dict) else score) or 0)
+        score_details = signal.get("score_details") or {}
+        foreign_net_buy = float(score_details.get("foreign_net_buy", 0) or 0)
+        inst_net_buy = float(score_details.get("inst_net_buy", 0) or 0)
+        has_dual_buy = foreign_net_buy > 0 and inst_net_buy > 0
+    except Exception:
+        return str(signal.get("grade", "")).strip().upper()
+
+    if tv >= 1_000_000_000_000 and score_total >= 10 and change_pct >= 3.0 and has_dual_buy:
+        return "S"
+    if tv >= 500_000_000_000 and score_total >= 8 and change_pct >= 3.0 and has_dual_buy:
+        return "A"
+    if tv >= 100_000_000_000 and score_total >= 6 and change_pct >= 3.0 and has_dual_buy:
+        return "B"
+    return "D"
+
+
+def _legacy_rescore(data: dict) -> dict:
+    data = copy.deepcopy(data)
+    grade_count = {"S": 0, "A": 0, "B": 0, "C": 0, "D": 0}
+    for sig in data["signals"]:
+        sig["grade"] = _legacy_grade(sig)
+        grade_count[sig["grade"]] = grade_count.get(sig["grade"], 0) + 1
+
+    new_by_grade = {"S": 0, "A": 0, "B": 0, "C": 0, "D": 0}
+    prev_by_grade = data.get("by_grade")
+    if isinstance(prev_by_grade, dict):
+        for key in new_by_grade:
+            if key in prev_by_grade:
+                value = prev_by_grade[key]
+                new_by_grade[key] = int(value) if isinstance(value, (int, float)) else 0
+    for key, count in grade_count.items():
+        if key in new_by_grade or count > 0:
+            new_by_grade[key] = count
+    data["by_grade"] = new_by_grade
+    _sort_jongga_signals(data["signals"])
+    return data
+
+
+def _signal(code, tv, change, total, foreign=1, inst=1, grade='B', score_as_dict=True):
+    return {
+        'stock_code': code,
+        'grade': grade,
+        'trading_value': tv,
+        'change_pct': change,
+        'score': {'total': total} if score_as_dict else total,
+        'score_details': {'foreign_net_buy': foreign, 'inst_net_buy': inst},
+    }
+
+
+def _edge_payload() -> dict:
+    m = PRICE_CHANGE.MIN
+    signals = [
+        _signal('s_exact', TRILLION, m, 10),                       # 모든 S 경계값 정확히
+        _signal('s_change_low', TRILLION, m - 0.01, 10),           # 등락률 미달 → D
+        _signal('s_no_dual', TRILLION, 5.0, 12, inst=0),           # 양매수 아님 → D
+        _signal('s_foreign_sell', TRILLION, 5.0, 12, foreign=-1),  # 외인 순매도 → D
+        _signal('a_exact', TRILLION // 2, m, 8, grade='S'),
+        _signal('a_score_low', TRILLION, 5.0, 9),                  # S 점수 미달 → A
+        _signal('b_exact', TRILLION // 10, m, 6, score_as_dict=False),
+        _signal('b_tv_low', TRILLION // 10 - 1, 5.0, 12),
+        _signal('score_none', TRILLION, 5.0, None),
+        _signal('missing', None, None, 7),
+        {'stock_code': 'broken', 'grade': 'A', 'trading_value': 'n/a', 'score': {'total': 9}},
+        {'stock_code': 'empty', 'grade': 'C'},
+    ]
+    return {'date': '2026-02-27', 'signals': signals, 'by_grade': {'S': 9, 'A': 'x', 'Z': 3}}
+
+
+def _random_payload(rng: random.Random) -> dict:
+    signals = []
+    for i in range(40):
+        signals.append(_signal(
+            f'{i:06d}',
+            rng.choice([0, 50, 100, 300, 500, 800, 1000, 2000]) * 1_000_000_000,
+            rng.choice([-1.0, 0.0, 2.99, 3.0, 3.01, 7.5, 15.0]),
+            rng.randint(0, 14),
+            foreign=rng.choice([-5, 0, 5]),
+            inst=rng.choice([-5, 0, 5]),
+            grade=rng.choice(['S', 'A', 'B', 'C', 'D']),
+        ))
+    return {'signals': signals, 'by_grade': {'S': 1, 'A': 2}}
+
+
+def _view(data: dict) -> tuple:
+    return [(s.get('stock_code'), s.get('grade')) for s in data['signals']], data['by_grade']
+
+
+def test_matches_removed_per_signal_logic():
+    payloads = [_edge_payload()] + [_random_payload(random.Random(seed)) for seed in range(20)]
+    for payload in payloads:
+        expected = _legacy_rescore(payload)
+        actual = copy.deepcopy(payload)
+        rescore_payload(actual)
+        assert _view(actual) == _view(expected)
+
+    grades = dict(_view(_legacy_rescore(_edge_payload()))[0])
+    assert grades['s_exact'] == 'S' and grades['a_exact'] == 'A' and grades['b_exact'] == 'B'
+    assert grades['a_score_low'] == 'A'
+    assert grades['s_change_low'] == grades['s_no_dual'] == grades['s_foreign_sell'] == 'D'
+    assert grades['broken'] == 'A'  # 값이 깨진 시그널은 그대로
+
+
+def test_rescore_is_idempotent():
+    payload = _edge_payload()
+    assert rescore_payload(payload)
+    assert not rescore_payload(payload)
+
+
+def _write_results(data_dir: str, days) -> dict:
+    paths = {}
+    for day in days:
+        path = os.path.join(data_dir, f'jongga_v2_results_{day}.json')
+        payload = _edge_payload()
+        payload['date'] = f'{day[:4]}-{day[4:6]}-{day[6:]}'
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        paths[day] = path
+    return paths
+
+
+def _grades(path: str) -> dict:
+    with open(path, encoding='utf-8') as f:
+        return {s['stock_code']: s['grade'] for s in json.load(f)['signals']}
+
+
+def test_job_skips_unchanged_files_and_honours_force():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_results(tmp, ['20260226', '20260227'])
+
+        first = run_rescore_job(tmp)
+        assert (first['scanned'], first['rescored'], first['skipped'], first['failed']) == (2, 2, 0, 0)
+        assert _grades(paths['20260227'])['s_change_low'] == 'D'
+
+        mtimes = {day: os.stat(path).st_mtime_ns for day, path in paths.items()}
+        second = run_rescore_job(tmp)
+        assert (second['rescored'], second['skipped']) == (0, 2)
+        assert {day: os.stat(path).st_mtime_ns for day, path in paths.items()} == mtimes
+
+        # 같은 크기/mtime으로 등급만 틀어 두면 매니페스트 기준으로는 건너뛰고, force만 다시 산정한다
+        path = paths['20260227']
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+        tampered = text.replace('"grade": "S"', '"grade": "D"', 1)
+        assert tampered != text and len(tampered) == len(text)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(tampered)
+        os.utime(path, ns=(mtimes['20260227'], mtimes['20260227']))
+
+        assert run_rescore_job(tmp)['rescored'] == 0
+        assert _grades(path)['s_exact'] == 'D'
+        forced = run_rescore_job(tmp, force=True)
+        assert forced['rescored'] == 1
+        assert _grades(path)['s_exact'] == 'S'
+
+
+def test_rules_version_bump_rescores_everything():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_results(tmp, ['20260226', '20260227'])
+        run_rescore_job(tmp)
+
+        stricter = SignalConfig()
+        stricter.min_s_grade = 11
+        assert grade_rules_version(stricter) != grade_rules_version()
+
+        summary = run_rescore_job(tmp, config=stricter)
+        assert summary['rescored'] == 2
+        assert summary['rules_version'] == grade_rules_version(stricter)
+        assert _grades(paths['20260227'])['s_exact'] == 'A'
+        assert run_rescore_job(tmp, config=stricter)['rescored'] == 0
+
+
+if __name__ == '__main__':
+    test_matches_removed_per_signal_logic()
+    test_rescore_is_idempotent()
+    test_job_skips_unchanged_files_and_honours_force()
+    test_rules_version_bump_rescores_everything()
+    print('OK')
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.json_stream 테스트
+
+- 조각 단위로 넣어도 원소가 닫히는 즉시 반환되는지
+- 깨진 원소 하나만 버리고 나머지는 유지하는지
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.json_stream import JsonArrayStream, parse_json_array
+
+
+def test_incremental_elements():
+    text = '분석 결과 [입력 데이터] 참고\n```json\n[{"name": "A", "reason": "괄호 ] 와 \\"따옴표\\" {"}, {"name": "B", "tags": [1, 2]}]\n```'
+    parser = JsonArrayStream()
+    seen = []
+    for i in range(0, len(text), 5):
+        seen.extend(item['name'] for item in parser.feed(text[i:i + 5]))
+    parser.close()
+    assert seen == ['A', 'B']
+    assert parser.complete
+
+
+def test_malformed_element_is_skipped():
+    items, parser = parse_json_array('[{"name": "A"}, {"name": B}, {"name": "C"}]')
+    assert [item['name'] for item in items] == ['A', 'C']
+    assert parser.errors == 1
+    assert not parser.complete
+
+
+def test_truncated_array():
+    items, parser = parse_json_array('[{"name": "A"}, {"name": "B", "rea')
+    assert [item['name'] for item in items] == ['A']
+    assert not parser.finished
+
+
+if __name__ == '__main__':
+    test_incremental_elements()
+    test_malformed_element_is_skipped()
+    test_truncated_array()
+    print('OK')
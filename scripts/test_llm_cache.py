@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.llm_cache.LLMResultCache 테스트
+
+- TTL이 지난 항목은 조회되지 않고 삭제되는지
+- max_entries를 넘으면 마지막 사용 시각이 오래된 항목부터 지워지는지
+- get_or_call(use_cache=False)가 조회를 건너뛰고 새 결과로 갱신하는지
+- 단일 종목 재분석(_analyze_stock)이 use_cache를 LLM 호출까지 전달하는지
+- VCP 분석은 BUY/SELL/HOLD action과 의미 있는 reason이 있는 결과만 캐시에 저장하는지
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.llm_cache import LLMResultCache
+
+
+def _make_cache(tmp: str, ttl_sec: float = 0, max_entries: int = 0) -> LLMResultCache:
+    return LLMResultCache(os.path.join(tmp, 'llm_cache.db'), ttl_sec=ttl_sec, max_entries=max_entries)
+
+
+def test_ttl_expiry():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _make_cache(tmp, ttl_sec=60)
+        cache.put('gemini', 'm', 'prompt', {'score': 1})
+        assert cache.get('gemini', 'm', 'prompt') == {'score': 1}
+
+        cache.db.execute('UPDATE llm_cache SET created_at = ?', (time.time() - 120,))
+        assert cache.get('gemini', 'm', 'prompt') is None
+        assert cache.stats()['entries'] == 0
+
+
+def test_lru_trim():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _make_cache(tmp, max_entries=2)
+        cache.put('gemini', 'm', 'a', 1)
+        cache.put('gemini', 'm', 'b', 2)
+        cache.db.execute('UPDATE llm_cache SET accessed_at = accessed_at - 10')
+        assert cache.get('gemini', 'm', 'a') == 1  # a가 최근 사용
+
+        cache.put('gemini', 'm', 'c', 3)            # 가장 오래 안 쓴 b 삭제
+        assert cache.stats()['entries'] == 2
+        assert cache.get('gemini', 'm', 'b') is None
+        assert cache.get('gemini', 'm', 'a') == 1
+        assert cache.get('gemini', 'm', 'c') == 3
+
+
+def test_get_or_call_bypass():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _make_cache(tmp)
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return {'n': len(calls)}
+
+        async def run():
+            first = await cache.get_or_call('gemini', 'm', 'p', call)
+            cached = await cache.get_or_call('gemini', 'm', 'p', call)
+            fresh = await cache.get_or_call('gemini', 'm', 'p', call, use_cache=False)
+            after = await cache.get_or_call('gemini', 'm', 'p', call)
+            return first, cached, fresh, after
+
+        first, cached, fresh, after = asyncio.run(run())
+        assert first == cached == {'n': 1}
+        assert fresh == {'n': 2}
+        assert after == {'n': 2}  # 우회한 호출 결과로 갱신
+        assert len(calls) == 2
+
+
+def test_single_stock_reanalysis_forwards_use_cache():
+    from engine.generator import SignalGenerator
+
+    seen = []
+
+    async def analyze_news_sentiment(name, news, use_cache=True):
+        seen.append(use_cache)
+        return {'score': 1}
+
+    async def get_stock_news(code, limit, name):
+        return [SimpleNamespace(title='뉴스', summary='요약')]
+
+    async def analyze_base(stock):
+        return {'charts': None, 'supply': None}
+
+    generator = SignalGenerator.__new__(SignalGenerator)
+    generator._analyze_base = analyze_base
+    generator._news = SimpleNamespace(get_stock_news=get_stock_news)
+    generator.llm_analyzer = SimpleNamespace(client=object(), analyze_news_sentiment=analyze_news_sentiment)
+    generator._create_final_signal = lambda *args, **kwargs: 'signal'
+
+    stock = SimpleNamespace(code='005930', name='삼성전자')
+    assert asyncio.run(generator._analyze_stock(stock, date.today(), use_cache=False)) == 'signal'
+    asyncio.run(generator._analyze_stock(stock, date.today()))
+    assert seen == [False, True]
+
+
+def test_vcp_analysis_caches_only_complete_results():
+    import engine.vcp_ai_analyzer as vcp_module
+    from engine.vcp_ai_analyzer import VCPMultiAIAnalyzer
+
+    analyzer = VCPMultiAIAnalyzer.__new__(VCPMultiAIAnalyzer)
+    stock = {'ticker': '005930', 'current_price': 70000}
+    responses = [
+        {'action': 'buy', 'confidence': 80},                             # 정규식 폴백: reason 없음
+        {'action': 'STRONG BUY', 'confidence': 80, 'reason': '돌파 임박'},  # 엉뚱한 action
+        {'action': 'HOLD', 'confidence': 60, 'reason': '분석 실패'},
+        {'action': 'BUY', 'confidence': 80, 'reason': '거래량 수축 후 돌파'},
+    ]
+    calls = []
+
+    async def analyze(name, data):
+        calls.append(name)
+        return responses[len(calls) - 1]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _make_cache(tmp)
+
+        async def cached_llm_call(provider, model, prompt, call, use_cache=True, should_cache=bool):
+            return await cache.get_or_call(provider, model, prompt, call, use_cache=use_cache, should_cache=should_cache)
+
+        original = vcp_module.cached_llm_call
+        vcp_module.cached_llm_call = cached_llm_call
+        try:
+            async def run():
+                return [
+                    await analyzer._cached_analysis('gemini', analyze, '삼성전자', stock, use_cache=True)
+                    for _ in range(5)
+                ]
+
+            results = asyncio.run(run())
+        finally:
+            vcp_module.cached_llm_call = original
+
+        assert len(calls) == 4  # 불완전한 결과 3번은 저장되지 않아 매번 다시 호출
+        assert results[4] == results[3] == responses[3]
+        assert cache.stats()['entries'] == 1
+
+
+if __name__ == '__main__':
+    test_ttl_expiry()
+    test_lru_trim()
+    test_get_or_call_bypass()
+    test_single_stock_reanalysis_forwards_use_cache()
+    test_vcp_analysis_caches_only_complete_results()
+    print('OK')
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.llm_scheduler 테스트
+
+- 429 오류 시 동시성 축소, 성공 시 증가 (AIMD)
+- 대기열에서 interactive 우선순위가 bulk보다 먼저 슬롯을 받는지
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.llm_scheduler import (
+    LLMScheduler,
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    llm_priority,
+)
+
+
+def test_aimd_limit_adjustment():
+    scheduler = LLMScheduler({'test': {'rpm': 6000, 'tpm': None}}, initial_limit=4, max_limit=8)
+
+    async def run():
+        try:
+            async with scheduler.slot('test', 'm'):
+                raise RuntimeError('429 RESOURCE_EXHAUSTED')
+        except RuntimeError:
+            pass
+        assert scheduler.limiter('test', 'm').limit == 2
+        for _ in range(3):
+            async with scheduler.slot('test', 'm'):
+                pass
+        assert scheduler.limiter('test', 'm').limit > 2
+
+    asyncio.run(run())
+
+
+def test_interactive_preempts_bulk_queue():
+    scheduler = LLMScheduler({'test': {'rpm': 6000, 'tpm': None}}, initial_limit=1, max_limit=1)
+    order = []
+
+    async def call(label):
+        async with scheduler.slot('test', 'm'):
+            order.append(label)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        with llm_priority(PRIORITY_BULK):
+            bulk = [asyncio.create_task(call(f'bulk{i}')) for i in range(3)]
+        await asyncio.sleep(0)
+        with llm_priority(PRIORITY_INTERACTIVE):
+            interactive = asyncio.create_task(call('interactive'))
+        await asyncio.gather(*bulk, interactive)
+
+    asyncio.run(run())
+    # bulk0이 이미 슬롯을 잡고 있고, 그다음은 interactive
+    assert order[:2] == ['bulk0', 'interactive']
+
+
+if __name__ == '__main__':
+    test_aimd_limit_adjustment()
+    test_interactive_preempts_bulk_queue()
+    print('OK')
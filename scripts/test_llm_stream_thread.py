@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.llm_analyzer._iterate_in_thread 테스트 (SDK 스트림을 대체)
+
+- 소비 측이 중간에 멈추면(aclose) 워커가 남은 조각을 더 읽지 않고 스트림을 닫는지
+- 조각 사이 idle_timeout 초과 시 TimeoutError와 함께 대기 중인 스트림을 닫아 워커가 끝나는지
+- 끝까지 읽으면 모든 조각을 순서대로 전달하는지
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.llm_analyzer import _iterate_in_thread
+
+
+class FakeStream:
+    """close()가 있는 동기 SDK 스트림 - stall_after 이후에는 close될 때까지 블록"""
+
+    def __init__(self, count: int, delay: float = 0.01, stall_after: int = None):
+        self.count = count
+        self.delay = delay
+        self.stall_after = stall_after
+        self.produced = 0
+        self.closed = threading.Event()
+        self.finished = threading.Event()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.stall_after is not None and self.produced >= self.stall_after:
+            self.closed.wait(5)
+        if self.closed.is_set() or self.produced >= self.count:
+            self.finished.set()
+            raise StopIteration
+        time.sleep(self.delay)
+        self.produced += 1
+        return f'c{self.produced}'
+
+    def close(self):
+        self.closed.set()
+
+
+def test_consumer_stop_halts_worker():
+    stream = FakeStream(count=1000)
+
+    async def run():
+        received = []
+        agen = _iterate_in_thread(lambda: stream, lambda chunk: chunk, idle_timeout=5)
+        async for text in agen:
+            received.append(text)
+            if len(received) == 2:
+                break
+        await agen.aclose()
+        return received
+
+    assert asyncio.run(run()) == ['c1', 'c2']
+    assert stream.closed.is_set()
+    time.sleep(0.05)
+    produced = stream.produced
+    time.sleep(0.1)
+    assert stream.produced == produced < 10  # 워커가 더 읽지 않음
+
+
+def test_idle_timeout_closes_stream():
+    stream = FakeStream(count=10, stall_after=1)
+
+    async def run():
+        received = []
+        try:
+            async for text in _iterate_in_thread(lambda: stream, lambda chunk: chunk, idle_timeout=0.2):
+                received.append(text)
+        except asyncio.TimeoutError:
+            return received
+        raise AssertionError('타임아웃이 나지 않음')
+
+    assert asyncio.run(run()) == ['c1']
+    assert stream.closed.is_set()
+    assert stream.finished.wait(2)  # 블록돼 있던 워커가 close로 풀려 종료
+
+
+def test_full_stream_in_order():
+    stream = FakeStream(count=5, delay=0)
+
+    async def run():
+        return [text async for text in _iterate_in_thread(lambda: stream, lambda chunk: chunk, idle_timeout=5)]
+
+    assert asyncio.run(run()) == ['c1', 'c2', 'c3', 'c4', 'c5']
+    assert stream.closed.is_set()
+
+
+if __name__ == '__main__':
+    test_consumer_stop_halts_worker()
+    test_idle_timeout_closes_stream()
+    test_full_stream_in_order()
+    print('OK')
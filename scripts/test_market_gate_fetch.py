@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MarketGate._fetch_inputs 테스트 (네트워크 없이 소스 함수를 대체)
+
+- 가격과 벤치마크가 동시에 수집되는지
+- 소스별 타임아웃 시 기본값/상태가 채워지고 전체 대기가 타임아웃을 넘지 않는지
+- 공유 풀이 밀려 있어도 로컬 CSV는 호출 스레드에서 읽혀 타임아웃되지 않고,
+  네트워크 소스 타임아웃은 제출이 아니라 실행 시작 시점부터 재는지
+- 입력 스냅샷 캐시 (재사용, use_cache=False, 부분 결과 미저장)
+- 공유 풀이라 타임아웃된 호출이 반복돼도 스레드가 늘지 않는지
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+import engine.market_gate as market_gate_module
+from engine.market_gate import MarketGate
+
+
+def _price_df(end: str = '2026-02-27', days: int = 80) -> pd.DataFrame:
+    dates = pd.bdate_range(end=end, periods=days)
+    return pd.DataFrame({
+        'date': dates.strftime('%Y-%m-%d'),
+        'close': range(10000, 10000 + days),
+        'volume': [1000] * days,
+    })
+
+
+def _make_gate(tmp: str, delays=None, price_end: str = '2026-02-27') -> MarketGate:
+    delays = delays or {}
+    gate = MarketGate(data_dir=tmp)
+    gate.kis = None
+    gate.FETCH_TIMEOUTS = {name: 0.5 for name in MarketGate.FETCH_TIMEOUTS}
+    gate.calls = {name: 0 for name in MarketGate.FETCH_TIMEOUTS}
+    gate.bench_ranges = []
+    gate.started_at = {}
+    lock = threading.Lock()
+
+    def source(name, value):
+        def fetch(*args, **kwargs):
+            with lock:
+                gate.calls[name] += 1
+                gate.started_at.setdefault(name, time.monotonic())
+            if name == 'benchmark':
+                gate.bench_ranges.append(args)
+            time.sleep(delays.get(name, 0))
+            return value() if callable(value) else value
+        return fetch
+
+    gate._load_price_data = source('price', lambda: _price_df(price_end))
+    gate._fetch_benchmark_data = source('benchmark', lambda: pd.DataFrame({'date': [], 'bench_close': []}))
+    gate._get_usd_krw = source('usd_krw', 1400.0)
+    gate._load_supply_data = source('supply', {'foreign_buy': 1})
+    gate._get_global_data = source('global', {'indices': {}})
+    gate._get_sector_data = source('sector', {'반도체': 1.0})
+    return gate
+
+
+def _reset_snapshots():
+    with market_gate_module._INPUT_SNAPSHOT_LOCK:
+        market_gate_module._INPUT_SNAPSHOTS.clear()
+
+
+def test_price_and_benchmark_run_concurrently():
+    _reset_snapshots()
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp, delays={'price': 0.3, 'benchmark': 0.3})
+        started = time.monotonic()
+        inputs = gate._fetch_inputs('2026-02-27', use_cache=False)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.5, elapsed
+        assert abs(gate.started_at['benchmark'] - gate.started_at['price']) < 0.1
+        assert gate.bench_ranges == [('2025-10-30', '2026-02-27')]
+        assert inputs['source_status'] == {name: 'ok' for name in MarketGate.FETCH_TIMEOUTS}
+
+
+def test_benchmark_refetched_when_prices_are_older_than_lookback():
+    _reset_snapshots()
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp, price_end='2025-06-30')
+        gate._fetch_inputs('2026-02-27', use_cache=False)
+        assert len(gate.bench_ranges) == 2
+        assert gate.bench_ranges[1][1] == '2025-06-30'
+
+
+def test_source_timeout_uses_default():
+    _reset_snapshots()
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp, delays={'usd_krw': 1.5})
+        started = time.monotonic()
+        inputs = gate._fetch_inputs('2026-02-27')
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 1.0, elapsed
+        assert inputs['source_status']['usd_krw'] == 'timeout'
+        assert inputs['usd_krw'] == 1350.0
+        assert inputs['supply_data'] == {'foreign_buy': 1}
+
+        # 부분 결과는 스냅샷으로 저장하지 않는다
+        gate._fetch_inputs('2026-02-27')
+        assert gate.calls['price'] == 2
+
+
+def _saturate_pool(seconds: float) -> list:
+    executor = market_gate_module._get_fetch_executor()
+    return [executor.submit(time.sleep, seconds) for _ in range(market_gate_module._FETCH_MAX_WORKERS)]
+
+
+def test_local_csv_not_starved_by_busy_pool():
+    _reset_snapshots()
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp)
+        blockers = _saturate_pool(1.5)
+        inputs = gate._fetch_inputs('2026-02-27', use_cache=False)
+        for blocker in blockers:
+            blocker.result()
+
+        assert inputs['source_status']['price'] == 'ok'
+        assert inputs['source_status']['supply'] == 'ok'
+        assert not inputs['price_df'].empty
+        assert inputs['source_status']['global'] == 'timeout'  # 대기열에서 타임아웃
+
+
+def test_timeout_counts_from_task_start():
+    _reset_snapshots()
+    with tempfile.TemporaryDirectory() as tmp:
+        # 풀이 0.3초 밀린 뒤 0.3초 걸리는 소스: 제출 기준이면 0.6초 > 0.5초로 타임아웃
+        gate = _make_gate(tmp, delays={name: 0.3 for name in ('benchmark', 'usd_krw', 'global', 'sector')})
+        blockers = _saturate_pool(0.3)
+        inputs = gate._fetch_inputs('2026-02-27', use_cache=False)
+        for blocker in blockers:
+            blocker.result()
+
+        assert inputs['source_status'] == {name: 'ok' for name in MarketGate.FETCH_TIMEOUTS}
+
+
+def test_snapshot_cache():
+    _reset_snapshots()
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp)
+        first = gate._fetch_inputs('2026-02-27')
+        first['price_df']['close'] = 0  # 호출자가 바꿔도 스냅샷은 그대로
+
+        second = gate._fetch_inputs('2026-02-27')
+        assert gate.calls['price'] == 1
+        assert second['price_df']['close'].iloc[-1] != 0
+
+        gate._fetch_inputs('2026-02-27', use_cache=False)
+        assert gate.calls['price'] == 2
+
+        # 입력 CSV가 바뀌면 키가 달라진다
+        with open(os.path.join(tmp, 'daily_prices.csv'), 'w') as f:
+            f.write('date,ticker,close\n')
+        gate._fetch_inputs('2026-02-27')
+        assert gate.calls['price'] == 3
+
+
+def test_timed_out_calls_do_not_accumulate_threads():
+    _reset_snapshots()
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp, delays={'global': 2.0, 'sector': 2.0})
+        for _ in range(4):
+            gate._fetch_inputs('2026-02-27', use_cache=False)
+        workers = [t for t in threading.enumerate() if t.name.startswith('market-gate')]
+        assert len(workers) <= market_gate_module._FETCH_MAX_WORKERS
+
+
+if __name__ == '__main__':
+    test_price_and_benchmark_run_concurrently()
+    test_benchmark_refetched_when_prices_are_older_than_lookback()
+    test_source_timeout_uses_default()
+    test_local_csv_not_starved_by_busy_pool()
+    test_timeout_counts_from_task_start()
+    test_snapshot_cache()
+    test_timed_out_calls_do_not_accumulate_threads()
+    print('OK')
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MarketGate 히스토리 테스트 (네트워크 없이 벤치마크/부가 소스를 대체)
+
+- build_history(_score_frame 벡터화)가 날짜별 analyze() 결과와 같은지
+- load_history는 오래된 테이블도 그대로 돌려주고 요청 스레드에서 재계산하지 않는지
+- 백그라운드 재계산은 data_dir당 하나만 실행되는지
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+import engine.market_gate as market_gate_module
+from engine.market_gate import MarketGate
+
+DETAIL_COLUMNS = ['trend_score', 'rsi_score', 'macd_score', 'vol_score', 'rs_score']
+
+
+def _write_prices(tmp: str, days: int = 160) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    dates = pd.bdate_range(end='2026-02-27', periods=days).strftime('%Y-%m-%d')
+    close = 30000 * np.cumprod(1 + rng.normal(0, 0.012, days))
+    prices = pd.DataFrame({
+        'date': dates,
+        'ticker': '069500',
+        'close': close.round(0),
+        'volume': rng.integers(500_000, 2_000_000, days),
+    })
+    # 다른 종목 행이 섞여 있어도 KODEX 200만 사용해야 한다
+    other = prices.assign(ticker='005930', close=prices['close'] * 2)
+    pd.concat([prices, other]).to_csv(os.path.join(tmp, 'daily_prices.csv'), index=False)
+    bench = pd.DataFrame({
+        'date': dates,
+        'bench_close': (2500 * np.cumprod(1 + rng.normal(0, 0.01, days))).round(2),
+    })
+    return bench
+
+
+def _make_gate(tmp: str, bench: pd.DataFrame) -> MarketGate:
+    gate = MarketGate(data_dir=tmp)
+    gate.kis = None
+
+    def fetch_benchmark(start, end):
+        return bench[(bench['date'] >= start) & (bench['date'] <= end)].copy()
+
+    gate._fetch_benchmark_data = fetch_benchmark
+    gate._get_usd_krw = lambda: 1400.0
+    gate._load_supply_data = lambda **kwargs: {}
+    gate._get_global_data = lambda *args: {'indices': {}}
+    gate._get_sector_data = lambda *args: {}
+    return gate
+
+
+def test_score_frame_matches_row_scorers():
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp, _write_prices(tmp))
+        df = gate._load_price_data().reset_index(drop=True)
+        df = gate._calculate_indicators(df, gate._fetch_benchmark_data('2000-01-01', '2099-12-31'))
+        scores = gate._score_frame(df)
+
+        for i, row in df.iterrows():
+            expected = [
+                gate._score_trend(row), gate._score_rsi(row), gate._score_macd(row),
+                gate._score_volume(row), gate._score_rs(row),
+            ]
+            assert scores.loc[i, DETAIL_COLUMNS].tolist() == expected, row['date']
+
+
+def test_history_matches_daily_analyze():
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp, _write_prices(tmp))
+        history = gate.build_history(save=False)
+        assert len(history) == 160
+
+        for _, row in history.iloc[-40:].iterrows():
+            result = gate.analyze(target_date=row['date'], use_cache=False)
+            assert result['dataset_date'] == row['date']
+            assert result['total_score'] == row['total_score'], row['date']
+            assert result['color'] == row['color'], row['date']
+            assert result['is_gate_open'] == bool(row['is_gate_open'])
+            for col in DETAIL_COLUMNS:
+                assert result['details'][col] == row[col], (row['date'], col)
+
+
+def test_load_history_does_not_rebuild_inline():
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp, _write_prices(tmp))
+        calls = []
+        gate.build_history = lambda *args, **kwargs: calls.append(threading.current_thread().name)
+
+        # 테이블이 없으면 빈 프레임
+        assert gate.history_is_stale()
+        assert gate.load_history().empty
+
+        path = os.path.join(tmp, MarketGate.HISTORY_FILE)
+        pd.DataFrame([{c: 0 for c in MarketGate.HISTORY_COLUMNS} | {'date': '2026-01-02'}]).to_csv(path, index=False)
+        past = time.time() - 60
+        os.utime(path, (past, past))  # daily_prices.csv보다 오래된 테이블
+
+        assert gate.history_is_stale()
+        history = gate.load_history()
+        assert history['date'].tolist() == ['2026-01-02']
+        assert gate.get_gate_state('2026-02-27')['date'] == '2026-01-02'
+        assert calls == []
+
+
+def test_background_rebuild_runs_once_per_data_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        gate = _make_gate(tmp, _write_prices(tmp))
+        release = threading.Event()
+        calls = []
+
+        def slow_build():
+            calls.append(threading.current_thread().name)
+            release.wait(2)
+
+        gate.build_history = slow_build
+        assert gate.rebuild_history_in_background()
+        assert not gate.rebuild_history_in_background()
+        release.set()
+
+        for _ in range(100):
+            with market_gate_module._HISTORY_REBUILD_LOCK:
+                if not market_gate_module._HISTORY_REBUILDS:
+                    break
+            time.sleep(0.01)
+        assert calls == ['market-gate-history']
+
+        # 끝난 뒤에는 다시 시작할 수 있다
+        gate.build_history = lambda: None
+        assert gate.rebuild_history_in_background()
+
+
+if __name__ == '__main__':
+    test_score_frame_matches_row_scorers()
+    test_history_matches_daily_analyze()
+    test_load_history_does_not_rebuild_inline()
+    test_background_rebuild_runs_once_per_data_dir()
+    print('OK')
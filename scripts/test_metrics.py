@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.metrics 테스트
+
+- timer/timed가 예외 시에도 시간을 기록하고 오류 카운터를 올리는지
+- Prometheus 출력의 버킷이 누적값이고 +Inf가 전체 개수와 같은지
+- 라벨 정규화 (종목 코드, 날짜가 들어간 파일명)
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.metrics import MetricsRegistry, file_label, get_registry, timed, timer, url_route
+
+
+def test_timer_records_errors():
+    registry = get_registry()
+    registry.reset()
+
+    with timer('data_load_seconds', kind='csv', file='a.csv') as t:
+        pass
+    assert t.elapsed >= 0
+    try:
+        with timer('data_load_seconds', kind='csv', file='a.csv'):
+            raise ValueError('boom')
+    except ValueError:
+        pass
+
+    snapshot = registry.snapshot()
+    key = (('file', 'a.csv'), ('kind', 'csv'))
+    assert snapshot['histograms']['data_load_seconds'][key]['count'] == 2
+    assert snapshot['counters']['data_load_errors_total'][key] == 1
+
+
+def test_timed_async():
+    registry = get_registry()
+    registry.reset()
+
+    @timed('pipeline_phase_seconds', phase='phase1')
+    async def run():
+        return 42
+
+    assert asyncio.run(run()) == 42
+    assert registry.snapshot()['histograms']['pipeline_phase_seconds'][(('phase', 'phase1'),)]['count'] == 1
+
+
+def test_prometheus_render():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        registry.observe('llm_request_seconds', value, provider='gemini')
+    registry.inc('llm_retries_total', provider='gemini', model='m"1')
+
+    text = registry.render_prometheus()
+    assert '# TYPE llm_request_seconds histogram' in text
+    assert 'llm_request_seconds_bucket{provider="gemini",le="0.1"} 1' in text
+    assert 'llm_request_seconds_bucket{provider="gemini",le="1"} 2' in text
+    assert 'llm_request_seconds_bucket{provider="gemini",le="+Inf"} 3' in text
+    assert 'llm_request_seconds_count{provider="gemini"} 3' in text
+    assert 'llm_retries_total{model="m\\"1",provider="gemini"} 1' in text
+
+
+def test_label_normalization():
+    assert url_route('https://wts-info-api.tossinvest.com/api/v2/stock-infos/A005930', prefix='/api') == '/v2/stock-infos/{code}'
+    assert url_route('https://finance.naver.com/item/main.naver?code=005930') == '/item/main.naver'
+    assert file_label('/data/jongga_v2_results_20260227.json') == 'jongga_v2_results_*.json'
+
+
+if __name__ == '__main__':
+    test_timer_records_errors()
+    test_timed_async()
+    test_prometheus_render()
+    test_label_normalization()
+    print('OK')
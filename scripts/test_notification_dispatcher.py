@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.notification_dispatcher 테스트 (httpx.MockTransport, 실제 웹훅 호출 없음)
+
+- Outbox 등록 / claim_due lease (선점 중인 항목은 다시 나오지 않음)
+- 분할 메시지 중간 실패 시 남은 요청만 재시도, 시도 한도 초과 시 dead
+- 429 Retry-After 대기 후 재전송, 긴 Retry-After는 Outbox로
+- 재시도 불가 4xx / 설정 누락은 Outbox에 넣지 않음
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import closing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from engine.notification_dispatcher import Delivery, NotificationDispatcher, NotificationOutbox
+
+WEBHOOK_URL = 'https://discord.test/webhook'
+
+
+class FakeWebhook:
+    """응답 목록을 순서대로 돌려주고 받은 본문을 기록 (목록이 끝나면 200)"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.bodies = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.bodies.append(json.loads(request.content)['content'])
+        if self.responses:
+            status, headers = self.responses.pop(0)
+            return httpx.Response(status, headers=headers, json={'message': 'x'})
+        return httpx.Response(204)
+
+
+def _dispatcher(tmp, webhook, **outbox_kwargs):
+    outbox_kwargs.setdefault('base_delay', 0)
+    outbox = NotificationOutbox(os.path.join(tmp, 'outbox.db'), **outbox_kwargs)
+    dispatcher = NotificationDispatcher(outbox=outbox)
+    dispatcher._client = httpx.AsyncClient(transport=httpx.MockTransport(webhook))
+    return dispatcher
+
+
+def _delivery(*contents):
+    return Delivery('discord', [{'json': {'content': c}} for c in contents], label='test')
+
+
+def _rows(outbox):
+    with closing(outbox._connect()) as conn:
+        return [dict(r) for r in conn.execute('SELECT * FROM outbox ORDER BY id')]
+
+
+def setup_module(module=None):
+    os.environ['DISCORD_WEBHOOK_URL'] = WEBHOOK_URL
+
+
+def test_outbox_enqueue_and_claim_lease():
+    with tempfile.TemporaryDirectory() as tmp:
+        outbox = NotificationOutbox(os.path.join(tmp, 'outbox.db'), base_delay=0)
+        item_id = outbox.enqueue(_delivery('a', 'b'), 'HTTP 500')
+
+        claimed = outbox.claim_due(lease=0.2)
+        assert [c['id'] for c in claimed] == [item_id]
+        assert json.loads(claimed[0]['requests']) == [{'json': {'content': 'a'}}, {'json': {'content': 'b'}}]
+        assert claimed[0]['attempts'] == 1
+        # lease 동안은 다른 워커가 선점할 수 없다
+        assert outbox.claim_due() == []
+        time.sleep(0.25)
+        assert [c['id'] for c in outbox.claim_due()] == [item_id]
+
+
+def test_partial_failure_retries_remaining_requests():
+    with tempfile.TemporaryDirectory() as tmp:
+        webhook = FakeWebhook((204, {}), (500, {}))
+        dispatcher = _dispatcher(tmp, webhook)
+
+        result = asyncio.run(dispatcher._send_all([_delivery('1/3', '2/3', '3/3')]))
+        assert result == {'discord': False}
+        rows = _rows(dispatcher.outbox)
+        assert len(rows) == 1
+        assert [r['json']['content'] for r in json.loads(rows[0]['requests'])] == ['2/3', '3/3']
+
+        # 재시도: 2/3 성공 후 3/3 실패 -> 3/3만 남고 attempts 증가
+        webhook.responses = [(204, {}), (503, {})]
+        assert asyncio.run(dispatcher.retry_due()) == 0
+        rows = _rows(dispatcher.outbox)
+        assert [r['json']['content'] for r in json.loads(rows[0]['requests'])] == ['3/3']
+        assert (rows[0]['attempts'], rows[0]['status']) == (2, 'pending')
+
+        assert asyncio.run(dispatcher.retry_due()) == 1
+        assert _rows(dispatcher.outbox) == []
+        assert webhook.bodies == ['1/3', '2/3', '2/3', '3/3', '3/3']
+
+
+def test_dead_letter_after_max_attempts():
+    with tempfile.TemporaryDirectory() as tmp:
+        webhook = FakeWebhook(*[(502, {})] * 3)
+        dispatcher = _dispatcher(tmp, webhook, max_attempts=2)
+
+        asyncio.run(dispatcher._send_all([_delivery('a')]))
+        asyncio.run(dispatcher.retry_due())
+        rows = _rows(dispatcher.outbox)
+        assert (rows[0]['attempts'], rows[0]['status']) == (2, 'dead')
+        # dead 항목은 더 이상 선점되지 않는다
+        assert dispatcher.outbox.claim_due() == []
+
+
+def test_rate_limit_retry_after():
+    with tempfile.TemporaryDirectory() as tmp:
+        webhook = FakeWebhook((429, {'Retry-After': '0.05'}))
+        dispatcher = _dispatcher(tmp, webhook)
+        started = time.monotonic()
+        assert asyncio.run(dispatcher._send_all([_delivery('a')])) == {'discord': True}
+        assert time.monotonic() - started >= 0.05
+        assert webhook.bodies == ['a', 'a']
+        assert _rows(dispatcher.outbox) == []
+
+        # 안내된 대기가 길면 기다리지 않고 Outbox로
+        webhook.responses = [(429, {'Retry-After': '60'})]
+        assert asyncio.run(dispatcher._send_all([_delivery('b')])) == {'discord': False}
+        assert len(_rows(dispatcher.outbox)) == 1
+
+
+def test_non_retryable_errors_are_not_enqueued():
+    with tempfile.TemporaryDirectory() as tmp:
+        webhook = FakeWebhook((400, {}))
+        dispatcher = _dispatcher(tmp, webhook)
+        assert asyncio.run(dispatcher._send_all([_delivery('a')])) == {'discord': False}
+        assert _rows(dispatcher.outbox) == []
+
+        del os.environ['DISCORD_WEBHOOK_URL']
+        try:
+            assert asyncio.run(dispatcher._send_all([_delivery('b')])) == {'discord': False}
+            assert _rows(dispatcher.outbox) == []
+        finally:
+            os.environ['DISCORD_WEBHOOK_URL'] = WEBHOOK_URL
+
+
+def test_retry_with_non_retryable_error_goes_dead():
+    with tempfile.TemporaryDirectory() as tmp:
+        webhook = FakeWebhook((500, {}), (404, {}))
+        dispatcher = _dispatcher(tmp, webhook)
+        asyncio.run(dispatcher._send_all([_delivery('a')]))
+        asyncio.run(dispatcher.retry_due())
+        assert _rows(dispatcher.outbox)[0]['status'] == 'dead'
+
+
+if __name__ == '__main__':
+    setup_module()
+    test_outbox_enqueue_and_claim_lease()
+    test_partial_failure_retries_remaining_requests()
+    test_dead_letter_after_max_attempts()
+    test_rate_limit_retry_after()
+    test_non_retryable_errors_are_not_enqueued()
+    test_retry_with_non_retryable_error_goes_dead()
+    print('OK')
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+services.paper_trading 시세 동기화 리더 선출 테스트 (다른 프로세스가 리더 락을 잡은 상태)
+
+- 리더 락을 못 잡은 워커는 외부 시세를 조회하지 않고, 리더가 price_cache 테이블에 기록한 시세를 읽는지
+- 리더 프로세스가 끝나면 락이 풀려 대기하던 워커가 리더를 이어받아 시세를 조회하는지
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.paper_trading import PaperTradingService
+
+LEADER_SCRIPT = '''
+import sys
+sys.path.insert(0, sys.argv[1])
+from services.paper_trading import PaperTradingService
+
+service = PaperTradingService(data_dir=sys.argv[2], start_sync=False)
+assert service._try_acquire_sync_leader()
+service._publish_prices({'005930': 71000, '000660': 182000})
+print('ready', flush=True)
+sys.stdin.read()
+'''
+
+
+def _wait_until(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_follower_reads_leader_prices_and_takes_over():
+    with tempfile.TemporaryDirectory() as tmp:
+        leader = subprocess.Popen(
+            [sys.executable, '-c', LEADER_SCRIPT, ROOT, tmp],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        )
+        follower = None
+        try:
+            assert leader.stdout.readline().strip() == 'ready'
+
+            follower = PaperTradingService(data_dir=tmp, start_sync=False)
+            follower.FOLLOWER_RETRY_SEC = 0.05
+            follower.db.execute(
+                "INSERT INTO portfolio (ticker, name, avg_price, quantity, total_cost, last_updated) "
+                "VALUES ('005930', '삼성전자', 70000, 1, 70000, '')"
+            )
+            fetched = []
+
+            def fetch_prices(tickers):
+                fetched.append(list(tickers))
+                follower.is_running = False
+                return {ticker: 72000 for ticker in tickers}
+
+            follower._fetch_prices = fetch_prices
+            assert not follower._try_acquire_sync_leader()
+            assert follower._load_shared_prices() == {'005930': 71000, '000660': 182000}
+
+            # 리더가 살아 있는 동안 동기화 루프는 락 재시도만 한다
+            follower.is_running = True
+            follower.bg_thread = threading.Thread(target=follower._update_prices_loop, daemon=True)
+            follower.bg_thread.start()
+            time.sleep(0.5)
+            assert fetched == []
+            assert follower._sync_lock_file is None
+
+            leader.stdin.close()
+            assert leader.wait(timeout=10) == 0
+
+            assert _wait_until(lambda: fetched == [['005930']])
+            assert follower._sync_lock_file is not None
+            assert _wait_until(lambda: follower._load_shared_prices()['005930'] == 72000)
+            assert follower._load_shared_prices()['000660'] == 182000
+        finally:
+            if leader.poll() is None:
+                leader.kill()
+                leader.wait()
+            if follower is not None:
+                follower.is_running = False
+                if follower._sync_lock_file is not None:
+                    follower._sync_lock_file.close()
+
+
+if __name__ == '__main__':
+    test_follower_reads_leader_prices_and_takes_over()
+    print('OK')
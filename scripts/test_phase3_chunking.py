@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.phases.Phase3LLMAnalyzer 청크 분할 테스트 (LLM 호출 없이 분석기를 대체)
+
+- 토큰 예산에 프롬프트 기본 토큰(지시문 + 시장 상황)이 포함되는지 (execute / execute_stream 동일)
+- 예산보다 큰 종목 1개는 단독 청크
+- 응답 파싱 실패(BatchParseError) 시 청크를 반으로 나눠 재시도하고, 1종목 청크는 포기하는지
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.constants import LLM as LLM_THRESHOLD
+from engine.llm_analyzer import BatchParseError
+from engine.phases import Phase3LLMAnalyzer
+
+OUTPUT = LLM_THRESHOLD.OUTPUT_TOKENS_PER_STOCK
+
+
+class FakeAnalyzer:
+    """종목 텍스트는 종목당 text_chars 글자, 기본 프롬프트는 base_chars 글자"""
+
+    def __init__(self, base_chars: int = 0, text_chars: int = 0, max_batch: int = 100, broken=()):
+        self.client = object()
+        self.base_chars = base_chars
+        self.text_chars = text_chars
+        self.max_batch = max_batch
+        self.broken = set(broken)
+        self.calls = []
+
+    def _build_stocks_text(self, items):
+        return ''.join('x' * item.get('chars', self.text_chars) for item in items)
+
+    def _build_batch_prompt(self, items, market_status=None):
+        return 'p' * self.base_chars + self._build_stocks_text(items)
+
+    async def analyze_news_batch(self, items, market_status=None, raise_parse_errors=False):
+        names = [item['stock'].name for item in items]
+        self.calls.append(names)
+        if len(items) > self.max_batch or self.broken.intersection(names):
+            raise BatchParseError('broken')
+        return {name: {'score': 1} for name in names}
+
+
+def _items(count: int, **extra):
+    return [{'stock': SimpleNamespace(code=f'{i:06d}', name=f'종목{i}'), **extra} for i in range(count)]
+
+
+def test_base_prompt_counts_against_budget():
+    # 종목당 100 + 300 = 400토큰, 기본 프롬프트 1000토큰 → 예산 2000에 2종목씩
+    analyzer = FakeAnalyzer(base_chars=2000, text_chars=200)
+    phase = Phase3LLMAnalyzer(analyzer, chunk_size=10, token_budget=2000)
+    assert phase._estimate_base_tokens() == 1000
+    assert phase._estimate_item_tokens(_items(1)[0]) == 100 + OUTPUT
+
+    chunks = phase._create_chunks(_items(5), 10, 2000, base_tokens=phase._estimate_base_tokens())
+    assert [len(c) for c in chunks] == [2, 2, 1]
+
+    # 기본 프롬프트를 빼면 5종목 모두 한 청크
+    assert [len(c) for c in phase._create_chunks(_items(5), 10, 2000)] == [5]
+
+    results = asyncio.run(phase.execute(_items(5)))
+    assert len(results) == 5
+    assert sorted(len(c) for c in analyzer.calls) == [1, 2, 2]
+
+
+def test_stream_uses_same_packing():
+    analyzer = FakeAnalyzer(base_chars=2000, text_chars=200)
+    phase = Phase3LLMAnalyzer(analyzer, chunk_size=10, token_budget=2000)
+    seen = []  # 청크 구성만 확인 (분석은 대체)
+
+    async def source():
+        for item in _items(5):
+            yield item
+
+    async def fake_process_chunk(label, chunk_data, market_status, on_result=None, total_chunks=0):
+        seen.append(len(chunk_data))
+        return {}
+
+    phase._process_chunk = fake_process_chunk
+    asyncio.run(phase.execute_stream(source(), None, lambda item, result: None))
+    assert seen == [2, 2, 1]
+
+
+def test_oversized_item_is_own_chunk():
+    analyzer = FakeAnalyzer(base_chars=200)
+    phase = Phase3LLMAnalyzer(analyzer, chunk_size=10, token_budget=1000)
+    items = _items(1, chars=100) + _items(1, chars=4000) + _items(1, chars=100)
+    chunks = phase._create_chunks(items, 10, 1000, base_tokens=phase._estimate_base_tokens())
+    assert [len(c) for c in chunks] == [1, 1, 1]
+
+
+def test_parse_error_halves_chunk():
+    analyzer = FakeAnalyzer(max_batch=2, broken={'종목4'})
+    phase = Phase3LLMAnalyzer(analyzer, chunk_size=5, token_budget=10**9)
+    results = asyncio.run(phase._analyze_chunk('1', _items(5), None))
+
+    # 5 → 2 + 3 → 1 + 2 → 1 + 1, 파싱이 계속 실패하는 1종목(종목4)은 포기
+    assert sorted(results) == [f'종목{i}' for i in range(4)]
+    assert sorted(len(c) for c in analyzer.calls) == [1, 1, 1, 2, 2, 3, 5]
+
+
+if __name__ == '__main__':
+    test_base_prompt_counts_against_budget()
+    test_stream_uses_same_packing()
+    test_oversized_item_is_own_chunk()
+    test_parse_error_halves_chunk()
+    print('OK')
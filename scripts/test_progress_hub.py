@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+services.progress_hub 테스트
+
+- publish가 대기 중인 구독자를 즉시 깨우고, 채널 필터/채널별 최신 병합이 동작하는지
+- long-poll 대기는 이벤트가 없으면 timeout 후 빈 목록을 돌려주는지
+- 같은 소켓 디렉토리의 다른 허브(워커)로 이벤트가 전파되는지
+- SSE 연결 슬롯 상한
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.progress_hub import ProgressHub
+
+
+def test_publish_wakes_subscriber():
+    hub = ProgressHub(fanout=False)
+    seq, _ = hub.events_since(0)
+    received = {}
+
+    def subscriber():
+        started = time.monotonic()
+        received['result'] = hub.wait_for_events(seq, ['vcp'], timeout=5)
+        received['elapsed'] = time.monotonic() - started
+
+    thread = threading.Thread(target=subscriber)
+    thread.start()
+    time.sleep(0.1)
+    hub.publish('update', {'isRunning': True})  # 구독하지 않은 채널은 깨우지 않음
+    time.sleep(0.1)
+    assert thread.is_alive()
+    hub.publish('vcp', {'running': True, 'progress': 10})
+    thread.join(2)
+
+    new_seq, events = received['result']
+    assert received['elapsed'] < 1.0
+    assert new_seq == 2
+    assert [(e['channel'], e['data']['progress']) for e in events] == [('vcp', 10)]
+
+
+def test_events_are_merged_per_channel():
+    hub = ProgressHub(fanout=False)
+    for progress in (10, 50, 90):
+        hub.publish('vcp', {'progress': progress})
+    hub.publish('jongga_v2', {'isRunning': False})
+
+    seq, events = hub.events_since(0)
+    assert seq == 4
+    assert [(e['channel'], e['seq']) for e in events] == [('vcp', 3), ('jongga_v2', 4)]
+    assert hub.latest('vcp') == {'progress': 90}
+    assert hub.events_since(4) == (4, [])
+
+
+def test_long_poll_timeout():
+    hub = ProgressHub(fanout=False)
+    started = time.monotonic()
+    seq, events = hub.wait_for_events(0, ['update'], timeout=0.3)
+    elapsed = time.monotonic() - started
+    assert (seq, events) == (0, [])
+    assert 0.25 <= elapsed < 1.0, elapsed
+
+
+def test_fanout_between_hubs():
+    with tempfile.TemporaryDirectory() as tmp:
+        sender, receiver = ProgressHub(socket_dir=tmp), ProgressHub(socket_dir=tmp)
+        try:
+            receiver.start()
+            sender.publish('jongga_v2', {'isRunning': True})
+            _, events = receiver.wait_for_events(0, ['jongga_v2'], timeout=2)
+            assert [e['data'] for e in events] == [{'isRunning': True}]
+            # 자기 자신에게는 다시 적용되지 않는다
+            assert sender.events_since(0)[0] == 1
+        finally:
+            sender.close()
+            receiver.close()
+
+
+def test_stream_slots():
+    hub = ProgressHub(fanout=False)
+    assert hub.try_open_stream(2) and hub.try_open_stream(2)
+    assert not hub.try_open_stream(2)
+    hub.close_stream()
+    assert hub.open_streams == 1
+    assert hub.try_open_stream(2)
+    for _ in range(5):
+        hub.close_stream()
+    assert hub.open_streams == 0
+
+
+if __name__ == '__main__':
+    test_publish_wakes_subscriber()
+    test_events_are_merged_per_channel()
+    test_long_poll_timeout()
+    test_fanout_between_hubs()
+    test_stream_slots()
+    print('OK')
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+app.routes.response_cache 테스트
+
+- 입력 파일이 그대로면 뷰를 다시 실행하지 않는지
+- ETag 일치 시 304, 입력 파일 변경 시 재생성되는지
+- 모듈 import가 블루프린트(페이퍼 트레이딩 DB/스레드, 쿼터 파일 이동)를 끌어오지 않는지
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify
+
+from app.routes.response_cache import cached_json, response_cache, track_input
+
+
+def test_cached_json_revalidates_on_input_change():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'input.json')
+        calls = []
+        app = Flask(__name__)
+
+        @app.route('/data')
+        @cached_json()
+        def data():
+            calls.append(1)
+            track_input(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                return jsonify({'value': f.read()})
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('a')
+        response_cache.clear()
+        client = app.test_client()
+
+        first = client.get('/data')
+        etag = first.headers['ETag']
+        assert client.get('/data').data == first.data
+        assert len(calls) == 1
+        assert client.get('/data', headers={'If-None-Match': etag}).status_code == 304
+
+        time.sleep(0.01)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('bb')
+        changed = client.get('/data')
+        assert len(calls) == 2
+        assert changed.get_json() == {'value': 'bb'}
+        assert changed.headers['ETag'] != etag
+
+
+def test_import_has_no_blueprint_side_effects():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as tmp:
+        code = (
+            "import sys, threading\n"
+            f"sys.path.insert(0, {root!r})\n"
+            "import app.routes.response_cache, app.routes.kr_market_helpers\n"
+            "assert 'app.routes.kr_market' not in sys.modules\n"
+            "assert 'app.routes.common' not in sys.modules\n"
+            "assert [t.name for t in threading.enumerate()] == ['MainThread']\n"
+        )
+        subprocess.run([sys.executable, '-c', code], cwd=tmp, check=True, env=dict(os.environ, SCHEDULER_ENABLED='false'))
+        assert os.listdir(tmp) == []
+
+
+if __name__ == '__main__':
+    test_cached_json_revalidates_on_input_change()
+    test_import_has_no_blueprint_side_effects()
+    print('OK')
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scorer NumPy 커널 골든 값 테스트
+
+- 아래 legacy_* 함수는 list 기반 ChartData 시절 Scorer 구현을 그대로 옮긴 기준 구현이다.
+- 무작위/경계 차트에서 벡터화 커널 점수가 기준 구현과 완전히 동일한지 확인한다.
+"""
+
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.models import ChartData, StockData, SupplyData
+from engine.scorer import Scorer
+
+
+# ---------------------------------------------------------------------------
+# 기준 구현 (변경 전 Scorer 로직, list 입력)
+# ---------------------------------------------------------------------------
+
+def legacy_score_candle(opens, highs, lows, closes):
+    recent_candles = 5
+    if len(lows) < recent_candles or len(closes) < recent_candles:
+        return 0
+
+    last_lows = lows[-recent_candles:]
+    last_highs = highs[-recent_candles:]
+    last_closes = closes[-recent_candles:]
+    last_opens = opens[-recent_candles:]
+
+    for i in range(1, recent_candles):
+        body_size = last_closes[i] - last_opens[i]
+        if body_size > 0 and abs(body_size) > abs(last_lows[i] - last_highs[i]) * 2:
+            upper_shadow = last_highs[i] - max(last_opens[i], last_closes[i])
+            if upper_shadow < body_size * 0.3:
+                return 1
+    return 0
+
+
+def legacy_score_timing(closes):
+    if len(closes) < 20:
+        return 0
+
+    band_widths = []
+    is_breakout = False
+    for i in range(20):
+        end_idx = len(closes) - i
+        start_idx = end_idx - 20
+        if start_idx < 0:
+            break
+
+        window = closes[start_idx:end_idx]
+        avg = sum(window) / 20
+        variance = sum([(x - avg) ** 2 for x in window]) / 20
+        std_dev = math.sqrt(variance)
+
+        upper = avg + (std_dev * 2)
+        lower = avg - (std_dev * 2)
+
+        if avg > 0:
+            band_widths.append((upper - lower) / avg)
+
+        if i == 0 and closes[-1] > upper:
+            is_breakout = True
+
+    if len(band_widths) < 10:
+        return 0
+
+    recent_bw_avg = sum(band_widths[1:6]) / 5
+    past_bw_avg = sum(band_widths[6:]) / len(band_widths[6:])
+    is_contracted = (recent_bw_avg < past_bw_avg * 0.8) or (recent_bw_avg < 0.15)
+    return 1 if is_contracted and is_breakout else 0
+
+
+def legacy_score_chart(stock, highs, closes):
+    score = 0
+    is_new_high = False
+    is_breakout = False
+    ma_aligned = False
+
+    if stock.high_52w > 0 and stock.close > stock.high_52w:
+        is_new_high = True
+        score += 1
+
+    if len(closes) >= 20:
+        ma20 = sum(closes[-20:]) / 20
+        ma60 = sum(closes[-60:]) / 60
+        if ma20 > ma60 and stock.close > ma20:
+            ma_aligned = True
+            score += 1
+
+    if len(highs) >= 10:
+        if max(highs[-5:]) > max(highs[-10:-5]):
+            is_breakout = True
+
+    return min(2, score), is_new_high, is_breakout, ma_aligned
+
+
+def legacy_volume_ratio(stock, volumes):
+    volume_ratio = 0.0
+    if len(volumes) >= 2:
+        today_vol = stock.volume if stock.volume > 0 else volumes[-1]
+        lookback = min(20, len(volumes) - 1)
+        if lookback > 0:
+            avg_vol = sum(volumes[-lookback - 1:-1]) / lookback
+            if avg_vol > 0:
+                volume_ratio = round(today_vol / avg_vol, 2)
+    return volume_ratio
+
+
+# ---------------------------------------------------------------------------
+# 테스트 데이터
+# ---------------------------------------------------------------------------
+
+def _random_chart(rng, length):
+    price = rng.uniform(1_000, 200_000)
+    opens, highs, lows, closes, volumes = [], [], [], [], []
+    squeeze_from = length - rng.randint(6, 15) if rng.random() < 0.4 else length
+    for day in range(length):
+        drift = 0.002 if day >= squeeze_from else 0.04
+        open_p = price * (1 + rng.uniform(-drift, drift))
+        close_p = open_p * (1 + rng.uniform(-drift, drift * 1.5))
+        if day == length - 1 and rng.random() < 0.5:
+            close_p = open_p * (1 + rng.uniform(0.05, 0.3))  # 돌파/장대양봉 유도
+        high_p = max(open_p, close_p) * (1 + rng.uniform(0, 0.02))
+        low_p = min(open_p, close_p) * (1 - rng.uniform(0, 0.02))
+        if rng.random() < 0.5:
+            open_p, high_p, low_p, close_p = (round(v) for v in (open_p, high_p, low_p, close_p))
+        opens.append(open_p)
+        highs.append(high_p)
+        lows.append(low_p)
+        closes.append(close_p)
+        volumes.append(rng.randint(0, 5_000_000))
+        price = close_p
+    return opens, highs, lows, closes, volumes
+
+
+def _cases():
+    rng = random.Random(20240101)
+    for _ in range(3000):
+        yield _random_chart(rng, rng.choice([3, 5, 9, 10, 19, 20, 25, 29, 40, 59, 60, 61, 80, 120]))
+
+    # 경계: 횡보(표준편차 0), 0원 가격 구간, 정확히 20일
+    flat = [10_000.0] * 40
+    yield flat, flat, flat, flat[:-1] + [12_000.0], [1_000] * 40
+    zeros = [0.0] * 25 + [100.0] * 20
+    yield zeros, zeros, zeros, zeros, [0] * 45
+    twenty = list(range(1, 21))
+    yield twenty, [x + 1 for x in twenty], [x - 1 for x in twenty], twenty, twenty
+
+
+def test_scorer_kernels_match_legacy():
+    scorer = Scorer()
+    hits = {'candle': 0, 'timing': 0, 'ma': 0}
+    rng = random.Random(7)
+
+    for opens, highs, lows, closes, volumes in _cases():
+        charts = ChartData(opens=opens, highs=highs, lows=lows, closes=closes, volumes=volumes)
+        stock = StockData(
+            code='000000', name='TEST', market='KOSPI',
+            close=closes[-1] if closes else 0,
+            high_52w=max(highs) * rng.choice([0.9, 1.0, 1.1]) if highs else 0,
+            volume=rng.choice([0, rng.randint(1, 10_000_000)]),
+        )
+
+        candle = scorer._score_candle(charts)
+        assert candle == legacy_score_candle(opens, highs, lows, closes)
+
+        timing = scorer._score_timing(stock, charts)
+        assert timing == legacy_score_timing(closes)
+
+        chart = scorer._score_chart(stock, charts)
+        assert chart == legacy_score_chart(stock, highs, closes)
+
+        assert scorer._calculate_volume_ratio(stock, charts) == legacy_volume_ratio(stock, volumes)
+
+        hits['candle'] += candle
+        hits['timing'] += timing
+        hits['ma'] += chart[3]
+
+    # 무작위 데이터가 양쪽 분기를 모두 통과했는지 확인
+    assert all(count > 0 for count in hits.values()), hits
+
+
+def test_score_candidates_match_per_stock():
+    """길이가 제각각인 차트를 한 배치로 계산해도 종목별 계산과 같은지 확인"""
+    scorer = Scorer()
+    rng = random.Random(11)
+    stocks, charts, supplies = [], [], []
+
+    for opens, highs, lows, closes, volumes in _cases():
+        charts.append(ChartData(opens=opens, highs=highs, lows=lows, closes=closes, volumes=volumes) if rng.random() > 0.05 else None)
+        stocks.append(StockData(
+            code='000000', name='TEST', market='KOSPI',
+            close=closes[-1], high_52w=max(highs) * rng.choice([0.9, 1.1]),
+            change_pct=rng.uniform(0, 32), trading_value=rng.choice([0, 6e10, 2e11, 7e11, 2e12]),
+            volume=rng.choice([0, rng.randint(1, 10_000_000)]),
+        ))
+        supplies.append(SupplyData(
+            foreign_buy_5d=rng.randint(-10**10, 10**11), inst_buy_5d=rng.randint(-10**10, 10**11),
+        ) if rng.random() > 0.1 else None)
+
+    rows = scorer.score_candidates(stocks, charts, supplies, allow_no_news=True)
+    grades = set()
+    for stock, chart, supply, (score, checklist, details, grade) in zip(stocks, charts, supplies, rows):
+        assert (score, checklist, details) == scorer.calculate(stock, chart, [], supply, None)
+        assert grade == scorer.determine_grade(stock, score, details, supply, chart, allow_no_news=True)
+        grades.add(grade)
+
+    assert len(grades) > 2, grades
+
+
+def test_chart_data_list_view_compat():
+    charts = ChartData(opens=[1, 2], highs=[3, 4], lows=[0, 1], closes=[2, 3], volumes=[10, 20], dates=['d1', 'd2'])
+
+    assert charts.closes == [2.0, 3.0]
+    assert charts.closes[-1] == 3.0 and isinstance(charts.closes[-1], float)
+    assert charts.volumes[-1] == 20 and isinstance(charts.volumes[-1], int)
+    assert charts.highs[-2:] == [3.0, 4.0]
+    assert sum(charts.volumes) == 30 and len(charts.lows) == 2 and bool(charts.opens)
+
+    charts.closes[-1] = 5
+    assert charts.close_array[-1] == 5.0
+    assert not ChartData().closes
+
+
+if __name__ == '__main__':
+    test_scorer_kernels_match_legacy()
+    test_score_candidates_match_per_stock()
+    test_chart_data_list_view_compat()
+    print('OK')
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.phases.SignalGenerationPipeline 테스트 (수집기/스코어러/LLM을 대체한 실제 Phase 객체)
+
+- 순차 모드와 스트리밍 모드가 같은 시그널(순서 포함)과 같은 Phase별 통계를 내는지
+  (거래대금 미달, 등급 미달, 뉴스 없음, 응답 파싱 실패 청크 포함)
+- 중단 요청(STOP_REQUESTED) 시 두 모드 모두 ScreeningStoppedError로 끝나고 남은 Task가 없는지
+"""
+
+import asyncio
+import os
+import sys
+from datetime import date
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import engine.shared as shared_state
+from engine.exceptions import ScreeningStoppedError
+from engine.llm_analyzer import BatchParseError
+from engine.models import Grade, NewsItem, ScoreDetail, StockData
+from engine.phases import (
+    Phase1Analyzer,
+    Phase2NewsCollector,
+    Phase3LLMAnalyzer,
+    Phase4SignalFinalizer,
+    SignalGenerationPipeline,
+)
+
+TARGET_DATE = date(2026, 2, 27)
+
+# 종목 번호별 시나리오
+LOW_TRADING_VALUE = {2}
+PRE_GRADE_FAIL = {3}
+NO_NEWS = {4}
+BROKEN_LLM = {6}
+FINAL_GRADE_FAIL = {9}
+
+
+class StubCollector:
+    def __init__(self, stop_after: int = 0):
+        self.stop_after = stop_after
+        self.calls = 0
+
+    async def get_stock_detail(self, code):
+        await asyncio.sleep(0)
+        self.calls += 1
+        if self.stop_after and self.calls >= self.stop_after:
+            shared_state.STOP_REQUESTED = True
+        return {'high_52w': 20000}
+
+    async def get_chart_data(self, code, days):
+        return None
+
+    async def get_supply_data(self, code):
+        return None
+
+
+class StubNews:
+    async def get_stock_news(self, code, limit, name):
+        await asyncio.sleep(0)
+        if int(code) in NO_NEWS:
+            return []
+        return [NewsItem(title=f'{name} 수주', source='연합', url=f'https://news/{code}')]
+
+
+class StubScorer:
+    def score_candidates(self, stocks, charts, supplies, news=None, llm_results=None, allow_no_news=False):
+        scored = []
+        for i, stock in enumerate(stocks):
+            n = int(stock.code)
+            llm_result = llm_results[i] if llm_results else None
+            total = n + (llm_result or {}).get('score', 0)
+            if news is None:
+                grade = None if n in PRE_GRADE_FAIL else Grade.B
+            else:
+                grade = None if n in FINAL_GRADE_FAIL else (Grade.A if llm_result else Grade.B)
+            scored.append((ScoreDetail(total=total), {}, {'volume_ratio': 1.0}, grade))
+        return scored
+
+
+class StubPositionSizer:
+    def calculate(self, close, grade):
+        return SimpleNamespace(
+            entry_price=close, stop_price=close * 0.95, target_price=close * 1.1,
+            r_value=close * 0.05, position_size=1_000_000, quantity=10, r_multiplier=1.0,
+        )
+
+
+class StubLLM:
+    """종목 번호가 BROKEN_LLM인 종목이 든 배치는 파싱 실패"""
+
+    def __init__(self):
+        self.client = object()
+
+    def _build_stocks_text(self, items):
+        return ''.join('x' * 200 for _ in items)
+
+    def _build_batch_prompt(self, items, market_status=None):
+        return 'p' * 1000 + self._build_stocks_text(items)
+
+    def _results(self, items):
+        if any(int(item['stock'].code) in BROKEN_LLM for item in items):
+            raise BatchParseError('broken')
+        return {item['stock'].name: {'score': 1, 'action': 'BUY'} for item in items}
+
+    async def analyze_news_batch(self, items, market_status=None, raise_parse_errors=False):
+        await asyncio.sleep(0)
+        return self._results(items)
+
+    async def stream_news_batch(self, items, market_status=None):
+        results = self._results(items)
+        for name, result in results.items():
+            await asyncio.sleep(0)
+            yield name, result
+
+
+def _candidates(count: int = 12):
+    return [
+        StockData(
+            code=f'{i:06d}', name=f'종목{i}', market='KOSPI', close=10000 + i, change_pct=5.0,
+            trading_value=10 if i in LOW_TRADING_VALUE else 1_000_000,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _pipeline(streaming: bool, collector=None) -> SignalGenerationPipeline:
+    scorer = StubScorer()
+    return SignalGenerationPipeline(
+        Phase1Analyzer(collector or StubCollector(), scorer, trading_value_min=100),
+        Phase2NewsCollector(StubNews()),
+        Phase3LLMAnalyzer(StubLLM(), chunk_size=3, token_budget=2000),
+        Phase4SignalFinalizer(scorer, StubPositionSizer(), None),
+        streaming=streaming,
+        queue_size=2,
+    )
+
+
+def _summary(signals):
+    return [
+        (s.stock_code, s.grade, s.score.total, s.score_details.get('ai_evaluation'), len(s.news_items))
+        for s in signals
+    ]
+
+
+def test_modes_produce_same_signals_and_stats():
+    sequential = _pipeline(streaming=False)
+    streaming = _pipeline(streaming=True)
+
+    expected = asyncio.run(sequential.execute(_candidates(), {'status': 'GREEN'}, TARGET_DATE))
+    actual = asyncio.run(streaming.execute(_candidates(), {'status': 'GREEN'}, TARGET_DATE))
+
+    assert _summary(actual) == _summary(expected)
+    assert sequential.get_pipeline_stats() == streaming.get_pipeline_stats()
+
+    # 2: 거래대금 미달, 3: 사전 등급 미달, 4: 뉴스 없음, 9: 최종 등급 미달
+    grades = {int(s.stock_code): s.grade for s in expected}
+    assert list(grades) == [1, 5, 6, 7, 8, 10, 11, 12]
+    # 6이 든 청크는 반으로 나눠 재시도 → 6만 LLM 결과 없이 B, 같은 청크의 1, 5는 A
+    assert grades[6] == Grade.B
+    assert all(grade == Grade.A for code, grade in grades.items() if code != 6)
+
+
+def test_stop_request_cancels_both_modes():
+    for streaming in (False, True):
+        shared_state.STOP_REQUESTED = False
+        try:
+            collector = StubCollector(stop_after=4)
+            pipeline = _pipeline(streaming, collector=collector)
+
+            async def run():
+                try:
+                    await pipeline.execute(_candidates(), None, TARGET_DATE)
+                except ScreeningStoppedError:
+                    pass
+                else:
+                    raise AssertionError(f'streaming={streaming}: 중단되지 않음')
+                return [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+            assert asyncio.run(run()) == []
+            assert collector.calls == 4  # 중단 요청 이후 수집하지 않음
+        finally:
+            shared_state.STOP_REQUESTED = False
+
+
+if __name__ == '__main__':
+    test_modes_produce_same_signals_and_stats()
+    test_stop_request_cancels_both_modes()
+    print('OK')
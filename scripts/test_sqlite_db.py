@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+engine.sqlite_db 동시성 테스트
+
+- 스레드별 연결 재사용, WAL 적용 여부
+- 스레드가 끝나면 그 스레드의 연결이 닫히는지 (연결 누수 방지)
+- 여러 스레드가 동시에 check_and_increment 해도 한도를 넘지 않는지 확인
+"""
+
+import gc
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.sqlite_db import get_database
+
+
+def test_thread_connections_and_wal():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = get_database(os.path.join(tmp, 'pool.db'))
+        assert db.connection() is db.connection()
+        assert db.query_one('PRAGMA journal_mode')[0] == 'wal'
+
+        other = []
+        t = threading.Thread(target=lambda: other.append(db.connection()))
+        t.start()
+        t.join()
+        assert other[0] is not db.connection()
+        db.close_all()
+
+
+def test_connections_released_after_thread_join():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = get_database(os.path.join(tmp, 'threads.db'))
+        db.connection()
+        opened = []
+
+        def worker():
+            conn = db.connection()
+            conn.execute('SELECT 1')
+            opened.append(conn)
+
+        for _ in range(3):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        gc.collect()
+
+        assert len(opened) == 24
+        assert db.open_connections == 1  # 메인 스레드 연결만 남는다
+        for conn in opened:
+            try:
+                conn.execute('SELECT 1')
+            except sqlite3.ProgrammingError:
+                continue
+            raise AssertionError('worker connection left open')
+
+        # 스레드 로컬 해제가 늦더라도 새 연결을 열 때 종료된 스레드의 연결을 정리한다
+        db._connections[sqlite3.connect(':memory:', check_same_thread=False)] = (lambda: None, os.getpid())
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        db.connection()
+        assert db.open_connections == 1
+        db.close_all()
+        assert db.open_connections == 0
+
+
+def test_concurrent_increment_respects_limit():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = get_database(os.path.join(tmp, 'usage.db'))
+        db.execute('CREATE TABLE usage_log (email TEXT PRIMARY KEY, count INTEGER)')
+        allowed = []
+        limit = 25
+
+        def worker():
+            for _ in range(10):
+                with db.transaction() as conn:
+                    row = conn.execute('SELECT count FROM usage_log WHERE email = ?', ('a',)).fetchone()
+                    count = row[0] if row else 0
+                    if count >= limit:
+                        continue
+                    conn.execute(
+                        'INSERT INTO usage_log (email, count) VALUES (?, 1) '
+                        'ON CONFLICT(email) DO UPDATE SET count = count + 1', ('a',)
+                    )
+                allowed.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(allowed) == limit
+        assert db.query_one('SELECT count FROM usage_log')[0] == limit
+        db.close_all()
+
+
+if __name__ == '__main__':
+    test_thread_connections_and_wal()
+    test_connections_released_after_thread_join()
+    test_concurrent_increment_respects_limit()
+    print('OK')
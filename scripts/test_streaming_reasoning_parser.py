@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+chatbot.markdown_utils.StreamingReasoningParser 테스트
+
+청크를 어떤 크기로 나눠 넣어도 델타를 이어 붙인 결과가
+전체 응답을 한 번에 파싱한 _extract_reasoning_and_answer와 같아야 한다.
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot.markdown_utils import StreamingReasoningParser, _extract_reasoning_and_answer
+
+SAMPLES = [
+    "**[추론 과정]**\n시장 상황을 보면 KOSPI가 상승.\n- 수급 양호\n\n**[답변]**\n삼성전자는 **매수** 의견입니다.\n[참고] 리스크 있음",
+    "[추론 과정]\n짧은 추론\n---\n[답변]\n답변 본문",
+    "__[추론 과정]__\n추론\n\n__[답변]__\n\n여러 줄\n답변\n",
+    "### [추론 과정]\n1. 첫째\n2. 둘째\n\n***\n**[답변]**\n\n| 표 | 값 |\n|---|---|\n| a | 1 |",
+    "**[답변]** 인라인 답변 헤더",
+    "그냥 답변만 있는 응답입니다. [참고] 괄호 포함 *강조*",
+]
+
+
+def _feed(text, sizes):
+    parser = StreamingReasoningParser()
+    reasoning, answer, pos = "", "", 0
+    for size in sizes:
+        r, a = parser.feed(text[pos:pos + size])
+        reasoning, answer, pos = reasoning + r, answer + a, pos + size
+        if pos >= len(text):
+            break
+    r, a = parser.finish()
+    reasoning, answer = reasoning + r, answer + a
+    assert (parser.reasoning, parser.answer) == (reasoning, answer)
+    return reasoning, answer
+
+
+def test_fixed_chunk_sizes_match_full_parse():
+    for text in SAMPLES:
+        expected = _extract_reasoning_and_answer(text)
+        for size in list(range(1, 12)) + [len(text)]:
+            assert _feed(text, [size] * len(text)) == expected, (size, text[:20])
+
+
+def test_random_chunking_matches_full_parse():
+    rng = random.Random(7)
+    for text in SAMPLES:
+        expected = _extract_reasoning_and_answer(text)
+        for _ in range(50):
+            sizes = [rng.randint(1, 8) for _ in range(len(text))]
+            assert _feed(text, sizes) == expected, text[:20]
+
+
+if __name__ == '__main__':
+    test_fixed_chunk_sizes_match_full_parse()
+    test_random_chunking_matches_full_parse()
+    print('OK')
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+services.task_graph.DependencyExecutor 테스트
+
+- 선행 작업이 끝난 뒤에만 실행되고, 독립 작업은 동시에 실행되는지
+- 선행 작업이 실패해도 후속 작업은 실행되고 실패한 결과는 전달되지 않는지
+- 순환/중복 이름 검증, 같은 resource 작업 직렬화, 중단 요청 시 대기 작업 취소
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.task_graph import DependencyExecutor, TaskSpec
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+        self.seen = {}
+
+    def task(self, name, delay=0.0, value=None, fail=False):
+        def run(upstream):
+            with self.lock:
+                self.events.append(('start', name, time.monotonic()))
+                self.seen[name] = dict(upstream)
+            time.sleep(delay)
+            with self.lock:
+                self.events.append(('end', name, time.monotonic()))
+            if fail:
+                raise RuntimeError(f'{name} boom')
+            return value if value is not None else name
+        return run
+
+    def at(self, kind, name):
+        return next(t for k, n, t in self.events if k == kind and n == name)
+
+
+def test_dependency_order_and_parallelism():
+    rec = Recorder()
+    tasks = [
+        TaskSpec('prices', rec.task('prices', 0.2)),
+        TaskSpec('trend', rec.task('trend', 0.2)),
+        TaskSpec('gate', rec.task('gate'), depends_on=('prices',)),
+        TaskSpec('vcp', rec.task('vcp', value='df'), depends_on=('prices', 'trend')),
+        TaskSpec('ai', rec.task('ai'), depends_on=('vcp',)),
+    ]
+    statuses = []
+    results = DependencyExecutor(tasks, max_workers=4, on_status=lambda *a: statuses.append(a[:2])).run()
+
+    assert {name: r.status for name, r in results.items()} == {name: 'done' for name in results}
+    assert len(results) == 5
+    # 독립 작업은 동시에 시작
+    assert abs(rec.at('start', 'prices') - rec.at('start', 'trend')) < 0.1
+    assert rec.at('start', 'gate') >= rec.at('end', 'prices')
+    assert rec.at('start', 'vcp') >= max(rec.at('end', 'prices'), rec.at('end', 'trend'))
+    assert rec.seen['ai']['vcp'] == 'df'
+    assert ('ai', 'running') in statuses and ('ai', 'done') in statuses
+
+
+def test_failure_does_not_block_dependents():
+    rec = Recorder()
+    tasks = [
+        TaskSpec('prices', rec.task('prices', fail=True)),
+        TaskSpec('gate', rec.task('gate'), depends_on=('prices',)),
+    ]
+    results = DependencyExecutor(tasks).run()
+
+    assert results['prices'].status == 'error'
+    assert 'boom' in results['prices'].error
+    assert results['gate'].status == 'done'
+    assert 'prices' not in rec.seen['gate']
+
+
+def test_unselected_dependencies_are_ignored():
+    rec = Recorder()
+    results = DependencyExecutor([TaskSpec('gate', rec.task('gate'), depends_on=('prices',))]).run()
+    assert results['gate'].status == 'done'
+
+
+def test_cycle_and_duplicate_names_rejected():
+    noop = lambda upstream: None
+    for tasks in (
+        [TaskSpec('a', noop, depends_on=('b',)), TaskSpec('b', noop, depends_on=('a',))],
+        [TaskSpec('a', noop, depends_on=('a',))],
+        [TaskSpec('a', noop), TaskSpec('a', noop)],
+    ):
+        try:
+            DependencyExecutor(tasks)
+        except ValueError:
+            continue
+        raise AssertionError(f'accepted invalid graph: {[t.name for t in tasks]}')
+
+
+def test_shared_resource_runs_serially():
+    rec = Recorder()
+    tasks = [
+        TaskSpec('ai', rec.task('ai', 0.1), resources=('llm',)),
+        TaskSpec('jongga', rec.task('jongga', 0.1), resources=('llm',)),
+    ]
+    DependencyExecutor(tasks, max_workers=2).run()
+    first, second = sorted(['ai', 'jongga'], key=lambda n: rec.at('start', n))
+    assert rec.at('start', second) >= rec.at('end', first)
+
+
+def test_stop_cancels_pending_tasks():
+    rec = Recorder()
+    stop = threading.Event()
+
+    def prices(upstream):
+        stop.set()
+        return rec.task('prices')(upstream)
+
+    tasks = [
+        TaskSpec('prices', prices),
+        TaskSpec('gate', rec.task('gate'), depends_on=('prices',)),
+    ]
+    statuses = []
+    results = DependencyExecutor(tasks, should_stop=stop.is_set, on_status=lambda *a: statuses.append(a[:2])).run()
+
+    assert results['prices'].status == 'done'  # 실행 중이던 작업은 끝까지
+    assert results['gate'].status == 'cancelled'
+    assert ('gate', 'cancelled') in statuses
+    assert 'gate' not in rec.seen
+
+
+if __name__ == '__main__':
+    test_dependency_order_and_parallelism()
+    test_failure_does_not_block_dependents()
+    test_unselected_dependencies_are_ignored()
+    test_cycle_and_duplicate_names_rejected()
+    test_shared_resource_runs_serially()
+    test_stop_cancels_pending_tasks()
+    print('OK')
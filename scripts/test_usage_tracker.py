@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+services.usage_tracker.UsageTracker 테스트
+
+- 여러 스레드 + 여러 프로세스가 동시에 try_increment해도 허용 횟수와 최종 사용량이 정확히 한도인지
+- decrement는 0 아래로 내려가지 않는지
+- import_json_counts가 기존 값과 MAX로 병합하고, 파일을 *.migrated로 옮겨 재실행 시 다시 가산하지 않는지
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.usage_tracker import UsageTracker
+
+LIMIT = 25
+THREADS = 8
+ATTEMPTS_PER_THREAD = 10
+
+WORKER_SCRIPT = '''
+import sys
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, sys.argv[1])
+from services.usage_tracker import UsageTracker
+
+tracker = UsageTracker(db_path=sys.argv[2], limit=int(sys.argv[3]))
+sys.stdin.readline()  # 모든 프로세스가 준비된 뒤 동시에 시작
+with ThreadPoolExecutor(max_workers=int(sys.argv[4])) as pool:
+    results = list(pool.map(lambda _: tracker.try_increment('user@test')[0], range(int(sys.argv[5]))))
+print(sum(results), flush=True)
+'''
+
+
+def _run_local(tracker: UsageTracker) -> int:
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        results = list(pool.map(lambda _: tracker.try_increment('user@test')[0], range(THREADS * ATTEMPTS_PER_THREAD)))
+    return sum(results)
+
+
+def test_concurrent_increment_stops_at_limit():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'usage.db')
+        tracker = UsageTracker(db_path=db_path, limit=LIMIT)
+
+        workers = [
+            subprocess.Popen(
+                [sys.executable, '-c', WORKER_SCRIPT, ROOT, db_path, str(LIMIT),
+                 str(THREADS), str(THREADS * ATTEMPTS_PER_THREAD)],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+            )
+            for _ in range(2)
+        ]
+        try:
+            for worker in workers:
+                worker.stdin.write('go\n')
+                worker.stdin.flush()
+            allowed = _run_local(tracker)
+            for worker in workers:
+                out, _ = worker.communicate(timeout=60)
+                assert worker.returncode == 0
+                allowed += int(out.strip())
+        finally:
+            for worker in workers:
+                if worker.poll() is None:
+                    worker.kill()
+                    worker.wait()
+
+        assert allowed == LIMIT
+        assert tracker.get_usage('user@test') == LIMIT
+        assert tracker.try_increment('user@test') == (False, LIMIT)
+        assert tracker.try_increment('other@test') == (True, 1)  # 키별 한도
+
+
+def test_decrement_floors_at_zero():
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = UsageTracker(db_path=os.path.join(tmp, 'usage.db'), limit=3)
+        tracker.try_increment('user@test')
+        tracker.try_increment('user@test')
+
+        assert tracker.decrement('user@test') == 1
+        assert tracker.decrement('user@test', 5) == 0
+        assert tracker.decrement('user@test') == 0
+        assert tracker.decrement('missing@test') == 0
+        assert tracker.try_increment('user@test') == (True, 1)
+
+
+def test_import_json_counts_merges_with_max():
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = UsageTracker(db_path=os.path.join(tmp, 'usage.db'), limit=10, table='chatbot_quota')
+        for _ in range(4):
+            tracker.try_increment('a@test')
+        tracker.try_increment('b@test')
+
+        json_path = os.path.join(tmp, 'user_quota.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'a@test': 2, 'b@test': 7, 'c@test': 3, 'bad': 'x'}, f)
+
+        assert tracker.import_json_counts(json_path) == 3
+        assert not os.path.exists(json_path)
+        assert os.path.exists(json_path + '.migrated')
+        assert tracker.get_usage('a@test') == 4   # DB 값이 더 크면 유지
+        assert tracker.get_usage('b@test') == 7
+        assert tracker.get_usage('c@test') == 3
+        assert tracker.get_usage('bad') == 0
+
+        # 다른 워커가 같은 파일을 다시 이관해도 가산되지 않음
+        os.replace(json_path + '.migrated', json_path)
+        assert tracker.import_json_counts(json_path) == 3
+        assert tracker.get_usage('b@test') == 7
+        assert tracker.import_json_counts(json_path) == 0  # 이미 이관됨
+
+
+if __name__ == '__main__':
+    test_concurrent_increment_stops_at_limit()
+    test_decrement_floors_at_zero()
+    test_import_json_counts_merges_with_max()
+    print('OK')
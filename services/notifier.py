@@ -1,19 +1,17 @@
 """
 AI 종가베팅 알림 서비스 모듈
 Discord, Telegram, Slack, Email로 분석 결과를 발송합니다.
+채널은 engine.notification_dispatcher를 통해 동시에 발송되며, 실패분은 Outbox에서 재시도됩니다.
 """
 
 import os
 import json
 import logging
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 from typing import List, Dict, Optional
 from collections import Counter
 
-import requests
+from engine.notification_dispatcher import Delivery, get_dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -159,16 +157,36 @@ class NotificationService:
         
         return '\n'.join(lines)
     
-    def send_all(self, signals: List[Dict], date_str: Optional[str] = None) -> Dict[str, bool]:
+    def build_deliveries(self, message: str, date_str: Optional[str] = None) -> List[Delivery]:
+        """설정된 채널별 발송 단위 생성 (설정이 불완전한 채널은 경고 후 제외)"""
+        deliveries = []
+        for channel in self.channels:
+            channel = channel.lower()
+            builder = {
+                'discord': self._discord_delivery,
+                'telegram': self._telegram_delivery,
+                'slack': self._slack_delivery,
+                'email': lambda msg: self._email_delivery(msg, date_str),
+            }.get(channel)
+            if builder is None:
+                logger.warning(f"[Notifier] 알 수 없는 채널: {channel}")
+                continue
+            delivery = builder(message)
+            if delivery is not None:
+                deliveries.append(delivery)
+        return deliveries
+
+    def send_all(self, signals: List[Dict], date_str: Optional[str] = None, wait: bool = True) -> Dict[str, bool]:
         """
-        설정된 모든 채널로 알림 발송
+        설정된 모든 채널로 알림 동시 발송
         
         Args:
             signals: 분석된 시그널 리스트
             date_str: 날짜 문자열
+            wait: False면 발송 예약 후 즉시 반환 (실패분은 Outbox에서 재시도)
         
         Returns:
-            채널별 발송 성공 여부
+            채널별 발송 성공 여부 (wait=False면 빈 dict)
         """
         if not self.enabled:
             logger.info("[Notifier] 알림이 비활성화되어 있습니다.")
@@ -179,139 +197,99 @@ class NotificationService:
             return {}
         
         message = self.format_jongga_message(signals, date_str)
-        results = {}
-        
-        for channel in self.channels:
-            channel = channel.lower()
-            try:
-                if channel == 'discord':
-                    results['discord'] = self.send_discord(message)
-                elif channel == 'telegram':
-                    results['telegram'] = self.send_telegram(message)
-                elif channel == 'slack':
-                    results['slack'] = self.send_slack(message)
-                elif channel == 'email':
-                    results['email'] = self.send_email(message, date_str)
-                else:
-                    logger.warning(f"[Notifier] 알 수 없는 채널: {channel}")
-            except Exception as e:
-                logger.error(f"[Notifier] {channel} 발송 실패: {e}")
-                results[channel] = False
-        
+        deliveries = self.build_deliveries(message, date_str)
+        # 설정이 불완전해 제외된 채널도 실패로 보고
+        results = {ch.lower(): False for ch in self.channels if ch.lower() in ('discord', 'telegram', 'slack', 'email')}
+        if not deliveries:
+            return results
+
+        try:
+            sent = get_dispatcher().send(deliveries, wait=wait)
+        except Exception as e:
+            logger.error(f"[Notifier] 발송 실패: {e}")
+            return results
+        if not wait:
+            return {}
+        results.update(sent)
         return results
-    
-    def send_discord(self, message: str) -> bool:
-        """Discord 웹훅으로 메시지 발송"""
-        if not self.discord_webhook_url:
-            logger.warning("[Notifier] Discord 웹훅 URL이 설정되지 않았습니다.")
+
+    def _send_single(self, delivery: Optional[Delivery]) -> bool:
+        if delivery is None:
             return False
-        
         try:
-            # 2000자 제한 처리 (안전하게 1900자로 분할)
-            import time
-            chunks = [message[i:i+1900] for i in range(0, len(message), 1900)]
-            
-            for chunk in chunks:
-                payload = {"content": chunk}
-                response = requests.post(
-                    self.discord_webhook_url,
-                    json=payload,
-                    timeout=10
-                )
-                response.raise_for_status()
-                # Rate Limit 방지를 위한 짧은 대기
-                if len(chunks) > 1:
-                    time.sleep(0.5)
-            
-            logger.info("[Notifier] Discord 발송 성공")
-            return True
+            return get_dispatcher().send([delivery]).get(delivery.channel, False)
         except Exception as e:
-            logger.error(f"[Notifier] Discord 발송 실패: {e}")
+            logger.error(f"[Notifier] {delivery.channel} 발송 실패: {e}")
             return False
+
+    def _discord_delivery(self, message: str) -> Optional[Delivery]:
+        if not self.discord_webhook_url:
+            logger.warning("[Notifier] Discord 웹훅 URL이 설정되지 않았습니다.")
+            return None
+        # 2000자 제한 처리 (안전하게 1900자로 분할), rate limit은 디스패처가 Retry-After로 처리
+        chunks = [message[i:i+1900] for i in range(0, len(message), 1900)]
+        return Delivery('discord', [{'json': {"content": chunk}} for chunk in chunks])
+
+    def _telegram_delivery(self, message: str) -> Optional[Delivery]:
+        if not self.telegram_bot_token or not self.telegram_chat_id:
+            logger.warning("[Notifier] Telegram 설정이 불완전합니다.")
+            return None
+        payload = {
+            "chat_id": self.telegram_chat_id,
+            "text": message,
+            "parse_mode": "HTML"
+        }
+        return Delivery('telegram', [{'json': payload}])
+
+    def _slack_delivery(self, message: str) -> Optional[Delivery]:
+        if not self.slack_webhook_url:
+            logger.warning("[Notifier] Slack 웹훅 URL이 설정되지 않았습니다.")
+            return None
+        return Delivery('slack', [{'json': {"text": message}}])
+
+    def _email_delivery(self, message: str, date_str: Optional[str] = None) -> Optional[Delivery]:
+        if not self.smtp_user or not self.smtp_password or not self.email_recipients:
+            logger.warning("[Notifier] 이메일 설정이 불완전합니다.")
+            return None
+        if not date_str:
+            date_str = datetime.now().strftime('%Y-%m-%d')
+        # 메시지 본문을 HTML로 변환 (줄바꿈 유지)
+        html_message = message.replace('\n', '<br>')
+        return Delivery('email', [{
+            'subject': f"📊 종가베팅 알림 ({date_str})",
+            'html': f"<pre style='font-family: monospace;'>{html_message}</pre>",
+            'recipients': self.email_recipients,
+        }])
+
+    def send_discord(self, message: str) -> bool:
+        """Discord 웹훅으로 메시지 발송"""
+        return self._send_single(self._discord_delivery(message))
     
     def send_telegram(self, message: str) -> bool:
         """Telegram 봇으로 메시지 발송"""
-        if not self.telegram_bot_token or not self.telegram_chat_id:
-            logger.warning("[Notifier] Telegram 설정이 불완전합니다.")
-            return False
-        
-        try:
-            url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
-            payload = {
-                "chat_id": self.telegram_chat_id,
-                "text": message,
-                "parse_mode": "HTML"
-            }
-            response = requests.post(url, json=payload, timeout=10)
-            response.raise_for_status()
-            logger.info("[Notifier] Telegram 발송 성공")
-            return True
-        except Exception as e:
-            logger.error(f"[Notifier] Telegram 발송 실패: {e}")
-            return False
+        return self._send_single(self._telegram_delivery(message))
     
     def send_slack(self, message: str) -> bool:
         """Slack 웹훅으로 메시지 발송"""
-        if not self.slack_webhook_url:
-            logger.warning("[Notifier] Slack 웹훅 URL이 설정되지 않았습니다.")
-            return False
-        
-        try:
-            payload = {"text": message}
-            response = requests.post(
-                self.slack_webhook_url,
-                json=payload,
-                timeout=10
-            )
-            response.raise_for_status()
-            logger.info("[Notifier] Slack 발송 성공")
-            return True
-        except Exception as e:
-            logger.error(f"[Notifier] Slack 발송 실패: {e}")
-            return False
+        return self._send_single(self._slack_delivery(message))
     
     def send_email(self, message: str, date_str: Optional[str] = None) -> bool:
         """이메일로 메시지 발송"""
-        if not self.smtp_user or not self.smtp_password or not self.email_recipients:
-            logger.warning("[Notifier] 이메일 설정이 불완전합니다.")
-            return False
-        
-        if not date_str:
-            date_str = datetime.now().strftime('%Y-%m-%d')
-        
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.smtp_user
-            msg['To'] = ', '.join(self.email_recipients)
-            msg['Subject'] = f"📊 종가베팅 알림 ({date_str})"
-            
-            # 메시지 본문을 HTML로 변환 (줄바꿈 유지)
-            html_message = message.replace('\n', '<br>')
-            msg.attach(MIMEText(f"<pre style='font-family: monospace;'>{html_message}</pre>", 'html'))
-            
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
-            
-            logger.info("[Notifier] 이메일 발송 성공")
-            return True
-        except Exception as e:
-            logger.error(f"[Notifier] 이메일 발송 실패: {e}")
-            return False
+        return self._send_single(self._email_delivery(message, date_str))
 
 
 # 편의 함수
-def send_jongga_notification(signals: List[Dict], date_str: Optional[str] = None) -> Dict[str, bool]:
+def send_jongga_notification(signals: List[Dict], date_str: Optional[str] = None, wait: bool = True) -> Dict[str, bool]:
     """
     종가베팅 알림 발송 (편의 함수)
     
     Args:
         signals: 분석된 시그널 리스트
         date_str: 날짜 문자열
+        wait: False면 발송 완료를 기다리지 않음
     
     Returns:
         채널별 발송 성공 여부
     """
     notifier = NotificationService()
-    return notifier.send_all(signals, date_str)
+    return notifier.send_all(signals, date_str, wait=wait)
@@ -4,130 +4,148 @@
 Paper Trading Service (Mock Investment)
 - Manages user's virtual portfolio and trade history.
 - Uses SQLite for persistence.
+- Price sync: gunicorn 워커 중 파일 락을 잡은 1개 워커만 외부 시세를 조회하고,
+  SQLite(WAL) price_cache 테이블에 기록하면 모든 워커가 같은 값을 읽는다.
 """
 
+import fcntl
 import os
-import sqlite3
 import logging
 import threading
 import time
-import pandas as pd
 from datetime import datetime
 from engine.data_sources import fetch_stock_price
+from engine.lazy_import import lazy_import
+from engine.sqlite_db import get_database
+
+pd = lazy_import('pandas')
 
 logger = logging.getLogger(__name__)
 
 class PaperTradingService:
-    def __init__(self, db_name='paper_trading.db'):
+    # 리더가 아닌 워커가 리더 락 재시도하는 주기 (리더 종료 시 인계 지연 상한)
+    FOLLOWER_RETRY_SEC = 15
+
+    def __init__(self, db_name='paper_trading.db', data_dir=None, start_sync=True):
         # Root path logic
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.db_path = os.path.join(base_dir, 'data', db_name)
+        if data_dir is None:
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            data_dir = os.path.join(base_dir, 'data')
+        self.db_path = os.path.join(data_dir, db_name)
+        self.sync_lock_path = os.path.join(data_dir, 'paper_trading_sync.lock')
+        # 스레드별 연결 재사용 + WAL (engine.sqlite_db)
+        self.db = get_database(self.db_path)
         
-        # Cache for real-time prices
+        # Local mirror of the shared price_cache table
         self.price_cache = {}
         self.cache_lock = threading.Lock()
         self.last_update = None
         self.is_running = False
         self.bg_thread = None
-        
-        self.is_running = False
-        self.bg_thread = None
+        self._sync_pid = None
+        self._sync_lock_file = None
         
         self._init_db()
         
         # [Optimization] Auto-start background sync on initialization
-        self.start_background_sync()
+        if start_sync:
+            self.start_background_sync()
 
     def _init_db(self):
         """Initialize SQLite database tables"""
         try:
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Portfolio Table (Current Holdings)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS portfolio (
-                    ticker TEXT PRIMARY KEY,
-                    name TEXT,
-                    avg_price REAL,
-                    quantity INTEGER,
-                    total_cost REAL,
-                    last_updated TEXT
-                )
-            ''')
-            
-            # Trade Log Table (History)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS trade_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    action TEXT,  -- 'BUY' or 'SELL'
-                    ticker TEXT,
-                    name TEXT,
-                    price REAL,
-                    quantity INTEGER,
-                    timestamp TEXT,
-                    profit REAL DEFAULT 0,
-                    profit_rate REAL DEFAULT 0
-                )
-            ''')
-            
-            # Migration: Add columns if not exists (for existing DB)
-            try:
-                cursor.execute('ALTER TABLE trade_log ADD COLUMN profit REAL DEFAULT 0')
-            except Exception:
-                pass # Already exists
-                
-            try:
-                cursor.execute('ALTER TABLE trade_log ADD COLUMN profit_rate REAL DEFAULT 0')
-            except Exception:
-                pass # Already exists
-            
-            # Asset History Table (For Charting)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS asset_history (
-                    date TEXT PRIMARY KEY,
-                    total_asset REAL,
-                    cash REAL,
-                    stock_value REAL,
-                    timestamp TEXT
-                )
-            ''')
-            
-            # Balance Table (Cash & Deposit History)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS balance (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    cash REAL DEFAULT 100000000,
-                    total_deposit REAL DEFAULT 0
-                )
-            ''')
-            
-            # Migration: Add total_deposit if missing (Run this BEFORE Insert)
-            try:
-                cursor.execute('ALTER TABLE balance ADD COLUMN total_deposit REAL DEFAULT 0')
-            except Exception:
-                pass # Already exists
-
-            # Initialize balance if not exists
-            cursor.execute('INSERT OR IGNORE INTO balance (id, cash, total_deposit) VALUES (1, 100000000, 0)')
-            
-            conn.commit()
-            conn.close()
+            with self.db.transaction() as conn:
+                self._create_tables(conn.cursor())
         except Exception as e:
             logger.error(f"Failed to initialize paper trading db: {e}")
 
+    def _create_tables(self, cursor):
+        """Create tables and run column migrations"""
+            
+        # Portfolio Table (Current Holdings)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS portfolio (
+                ticker TEXT PRIMARY KEY,
+                name TEXT,
+                avg_price REAL,
+                quantity INTEGER,
+                total_cost REAL,
+                last_updated TEXT
+            )
+        ''')
+            
+        # Trade Log Table (History)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS trade_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                action TEXT,  -- 'BUY' or 'SELL'
+                ticker TEXT,
+                name TEXT,
+                price REAL,
+                quantity INTEGER,
+                timestamp TEXT,
+                profit REAL DEFAULT 0,
+                profit_rate REAL DEFAULT 0
+            )
+        ''')
+            
+        # Migration: Add columns if not exists (for existing DB)
+        try:
+            cursor.execute('ALTER TABLE trade_log ADD COLUMN profit REAL DEFAULT 0')
+        except Exception:
+            pass # Already exists
+                
+        try:
+            cursor.execute('ALTER TABLE trade_log ADD COLUMN profit_rate REAL DEFAULT 0')
+        except Exception:
+            pass # Already exists
+            
+        # Asset History Table (For Charting)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS asset_history (
+                date TEXT PRIMARY KEY,
+                total_asset REAL,
+                cash REAL,
+                stock_value REAL,
+                timestamp TEXT
+            )
+        ''')
+            
+        # Shared Price Cache (written by the sync leader, read by every worker)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS price_cache (
+                ticker TEXT PRIMARY KEY,
+                price REAL,
+                updated_at TEXT
+            )
+        ''')
+            
+        # Balance Table (Cash & Deposit History)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS balance (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                cash REAL DEFAULT 100000000,
+                total_deposit REAL DEFAULT 0
+            )
+        ''')
+            
+        # Migration: Add total_deposit if missing (Run this BEFORE Insert)
+        try:
+            cursor.execute('ALTER TABLE balance ADD COLUMN total_deposit REAL DEFAULT 0')
+        except Exception:
+            pass # Already exists
+
+        # Initialize balance if not exists
+        cursor.execute('INSERT OR IGNORE INTO balance (id, cash, total_deposit) VALUES (1, 100000000, 0)')
+
     def get_context(self):
-        """Helper to get db connection"""
-        return sqlite3.connect(self.db_path)
+        """Helper to get db connection (pooled per thread - do not close)"""
+        return self.db.connection()
 
     def get_balance(self):
         """Get current cash balance"""
-        with self.get_context() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT cash FROM balance WHERE id = 1')
-            row = cursor.fetchone()
-            return row[0] if row else 0
+        row = self.db.query_one('SELECT cash FROM balance WHERE id = 1')
+        return row[0] if row else 0
 
     def deposit_cash(self, amount):
         """Deposit cash (Charging)"""
@@ -135,18 +153,14 @@ class PaperTradingService:
             return {'status': 'error', 'message': 'Amount must be positive'}
             
         try:
-            conn = self.get_context()
-            cursor = conn.cursor()
-            cursor.execute('UPDATE balance SET cash = cash + ?, total_deposit = total_deposit + ? WHERE id = 1', (amount, amount))
-            conn.commit()
-            conn.close()
+            self.db.execute('UPDATE balance SET cash = cash + ?, total_deposit = total_deposit + ? WHERE id = 1', (amount, amount))
             return {'status': 'success', 'message': f'Deposited {amount:,} KRW'}
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
 
     def update_balance(self, amount, operation='add'):
         """Update cash balance"""
-        with self.get_context() as conn:
+        with self.db.transaction() as conn:
             cursor = conn.cursor()
             current = self.get_balance()
             if operation == 'subtract':
@@ -155,7 +169,6 @@ class PaperTradingService:
                 new_balance = current + amount
             
             cursor.execute('UPDATE balance SET cash = ? WHERE id = 1', (new_balance,))
-            conn.commit()
             return new_balance
 
     def buy_stock(self, ticker, name, price, quantity):
@@ -169,57 +182,57 @@ class PaperTradingService:
         execution_price = price
         
         # [Sync Cache] Update cache with the executed price so Portfolio Current Price matches
-        with self.cache_lock:
-            self.price_cache[ticker] = int(execution_price)
-            self.last_update = datetime.now()
+        try:
+            self._publish_prices({ticker: execution_price})
+        except Exception as e:
+            logger.error(f"Failed to publish execution price: {e}")
 
         total_cost = int(execution_price * quantity) # 정수로 처리
-        current_cash = self.get_balance()
-        
-        if current_cash < total_cost:
-            return {
-                'status': 'error', 
-                'message': f'잔고 부족 (필요: {total_cost:,}원, 보유: {int(current_cash):,}원)'
-            }
 
         try:
-            conn = self.get_context()
-            cursor = conn.cursor()
-            
-            # 1. Update Portfolio
-            cursor.execute('SELECT avg_price, quantity, total_cost FROM portfolio WHERE ticker = ?', (ticker,))
-            row = cursor.fetchone()
-            
-            if row:
-                # Update existing position
-                old_avg, old_qty, old_cost = row
-                new_qty = old_qty + quantity
-                new_total_cost = old_cost + total_cost
-                new_avg = new_total_cost / new_qty
+            # 잔고 확인~차감을 한 트랜잭션으로 처리 (동시 주문 시 잔고 초과 매수 방지)
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                current_cash = self.get_balance()
                 
+                if current_cash < total_cost:
+                    return {
+                        'status': 'error', 
+                        'message': f'잔고 부족 (필요: {total_cost:,}원, 보유: {int(current_cash):,}원)'
+                    }
+
+                # 1. Update Portfolio
+                cursor.execute('SELECT avg_price, quantity, total_cost FROM portfolio WHERE ticker = ?', (ticker,))
+                row = cursor.fetchone()
+            
+                if row:
+                    # Update existing position
+                    old_avg, old_qty, old_cost = row
+                    new_qty = old_qty + quantity
+                    new_total_cost = old_cost + total_cost
+                    new_avg = new_total_cost / new_qty
+                
+                    cursor.execute('''
+                        UPDATE portfolio 
+                        SET avg_price = ?, quantity = ?, total_cost = ?, last_updated = ?
+                        WHERE ticker = ?
+                    ''', (new_avg, new_qty, new_total_cost, datetime.now().isoformat(), ticker))
+                else:
+                    # Create new position
+                    cursor.execute('''
+                        INSERT INTO portfolio (ticker, name, avg_price, quantity, total_cost, last_updated)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    ''', (ticker, name, execution_price, quantity, total_cost, datetime.now().isoformat()))
+            
+                # 2. Log Trade
                 cursor.execute('''
-                    UPDATE portfolio 
-                    SET avg_price = ?, quantity = ?, total_cost = ?, last_updated = ?
-                    WHERE ticker = ?
-                ''', (new_avg, new_qty, new_total_cost, datetime.now().isoformat(), ticker))
-            else:
-                # Create new position
-                cursor.execute('''
-                    INSERT INTO portfolio (ticker, name, avg_price, quantity, total_cost, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (ticker, name, execution_price, quantity, total_cost, datetime.now().isoformat()))
-            
-            # 2. Log Trade
-            cursor.execute('''
-                INSERT INTO trade_log (action, ticker, name, price, quantity, timestamp, profit, profit_rate)
-                VALUES (?, ?, ?, ?, ?, ?, 0, 0)
-            ''', ('BUY', ticker, name, execution_price, quantity, datetime.now().isoformat()))
-            
-            # 3. Deduct Cash
-            cursor.execute('UPDATE balance SET cash = cash - ? WHERE id = 1', (total_cost,))
+                    INSERT INTO trade_log (action, ticker, name, price, quantity, timestamp, profit, profit_rate)
+                    VALUES (?, ?, ?, ?, ?, ?, 0, 0)
+                ''', ('BUY', ticker, name, execution_price, quantity, datetime.now().isoformat()))
             
-            conn.commit()
-            conn.close()
+                # 3. Deduct Cash
+                cursor.execute('UPDATE balance SET cash = cash - ? WHERE id = 1', (total_cost,))
+
             return {'status': 'success', 'message': f'{name} {quantity}주 매수 완료'}
             
         except Exception as e:
@@ -232,56 +245,54 @@ class PaperTradingService:
             return {'status': 'error', 'message': 'Quantity must be positive'}
 
         try:
-            conn = self.get_context()
-            cursor = conn.cursor()
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
             
-            # 1. Check Portfolio
-            cursor.execute('SELECT name, avg_price, quantity, total_cost FROM portfolio WHERE ticker = ?', (ticker,))
-            row = cursor.fetchone()
+                # 1. Check Portfolio
+                cursor.execute('SELECT name, avg_price, quantity, total_cost FROM portfolio WHERE ticker = ?', (ticker,))
+                row = cursor.fetchone()
             
-            if not row or row[2] < quantity:
-                conn.close()
-                return {'status': 'error', 'message': 'Not enough shares to sell'}
+                if not row or row[2] < quantity:
+                    return {'status': 'error', 'message': 'Not enough shares to sell'}
             
-            name, avg_price, current_qty, current_total_cost = row
+                name, avg_price, current_qty, current_total_cost = row
             
-            # [User Request] Trust Client Price
-            execution_price = price
+                # [User Request] Trust Client Price
+                execution_price = price
             
-            # [Sync Cache] Update cache immediately
-            with self.cache_lock:
-                self.price_cache[ticker] = int(execution_price)
-                self.last_update = datetime.now()
+                # [Sync Cache] Update cache immediately
+                try:
+                    self._publish_prices({ticker: execution_price})
+                except Exception as e:
+                    logger.error(f"Failed to publish execution price: {e}")
             
-            # 2. Update/Remove Portfolio
-            remaining_qty = current_qty - quantity
+                # 2. Update/Remove Portfolio
+                remaining_qty = current_qty - quantity
             
-            if remaining_qty == 0:
-                cursor.execute('DELETE FROM portfolio WHERE ticker = ?', (ticker,))
-            else:
-                new_total_cost = avg_price * remaining_qty
-                cursor.execute('''
-                    UPDATE portfolio 
-                    SET quantity = ?, total_cost = ?, last_updated = ?
-                    WHERE ticker = ?
-                ''', (remaining_qty, new_total_cost, datetime.now().isoformat(), ticker))
+                if remaining_qty == 0:
+                    cursor.execute('DELETE FROM portfolio WHERE ticker = ?', (ticker,))
+                else:
+                    new_total_cost = avg_price * remaining_qty
+                    cursor.execute('''
+                        UPDATE portfolio 
+                        SET quantity = ?, total_cost = ?, last_updated = ?
+                        WHERE ticker = ?
+                    ''', (remaining_qty, new_total_cost, datetime.now().isoformat(), ticker))
             
-            # 3. Calculate Profit & Log Trade
-            total_proceeds = int(execution_price * quantity)
-            cost_basis = int(avg_price * quantity)
-            profit = total_proceeds - cost_basis
-            profit_rate = (profit / cost_basis * 100) if cost_basis > 0 else 0
+                # 3. Calculate Profit & Log Trade
+                total_proceeds = int(execution_price * quantity)
+                cost_basis = int(avg_price * quantity)
+                profit = total_proceeds - cost_basis
+                profit_rate = (profit / cost_basis * 100) if cost_basis > 0 else 0
             
-            cursor.execute('''
-                INSERT INTO trade_log (action, ticker, name, price, quantity, timestamp, profit, profit_rate)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', ('SELL', ticker, name, execution_price, quantity, datetime.now().isoformat(), profit, profit_rate))
-            
-            # 4. Add Cash
-            cursor.execute('UPDATE balance SET cash = cash + ? WHERE id = 1', (total_proceeds,))
+                cursor.execute('''
+                    INSERT INTO trade_log (action, ticker, name, price, quantity, timestamp, profit, profit_rate)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', ('SELL', ticker, name, execution_price, quantity, datetime.now().isoformat(), profit, profit_rate))
             
-            conn.commit()
-            conn.close()
+                # 4. Add Cash
+                cursor.execute('UPDATE balance SET cash = cash + ? WHERE id = 1', (total_proceeds,))
+
             return {'status': 'success', 'message': f'{name} {quantity}주 매도 완료'}
             
         except Exception as e:
@@ -290,8 +301,7 @@ class PaperTradingService:
 
     def get_portfolio(self):
         """Get all holdings"""
-        with self.get_context() as conn:
-            conn.row_factory = sqlite3.Row
+        with self.db.transaction(immediate=False) as conn:
             cursor = conn.cursor()
             
             cursor.execute('SELECT * FROM portfolio')
@@ -313,17 +323,69 @@ class PaperTradingService:
             }
 
     def start_background_sync(self):
-        """Start background price sync thread"""
-        if self.is_running:
+        """Start background price sync thread (one per process; only the lock holder fetches)"""
+        # fork된 워커는 부모의 스레드를 물려받지 못하므로 pid 기준으로 다시 시작
+        if self.is_running and self._sync_pid == os.getpid():
             return
             
         self.is_running = True
+        self._sync_pid = os.getpid()
         self.bg_thread = threading.Thread(target=self._update_prices_loop, daemon=True)
         self.bg_thread.start()
         logger.info("PaperTrading Price Sync Started")
 
+    def _try_acquire_sync_leader(self):
+        """
+        Price sync leader election across gunicorn workers.
+        스케줄러와 같은 방식의 비차단 파일 락 - 락을 잡은 워커만 외부 시세를 조회하고,
+        leader 프로세스가 죽으면 락이 풀려 다른 워커가 이어받는다.
+        """
+        if self._sync_lock_file is not None:
+            return True
+        lock_file = open(self.sync_lock_path, 'w')
+        try:
+            fcntl.lockf(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except IOError:
+            lock_file.close()
+            return False
+        self._sync_lock_file = lock_file
+        logger.info(f"PaperTrading price sync leader elected (pid={os.getpid()})")
+        return True
+
     def _update_prices_loop(self):
-        """Background loop to fetch prices"""
+        """Background loop: leader fetches prices, followers wait for leadership"""
+        while self.is_running:
+            try:
+                if not self._try_acquire_sync_leader():
+                    time.sleep(self.FOLLOWER_RETRY_SEC)
+                    continue
+            except Exception as e:
+                logger.error(f"PaperTrading sync lock error: {e}")
+                time.sleep(self.FOLLOWER_RETRY_SEC)
+                continue
+
+            try:
+                # 1. Get all tickers from portfolio
+                tickers = [row[0] for row in self.db.query('SELECT ticker FROM portfolio')]
+                
+                if not tickers:
+                    time.sleep(10)
+                    continue
+
+                new_prices = self._fetch_prices(tickers)
+                
+                # 5. Publish to shared cache (all workers read it)
+                self._publish_prices(new_prices)
+
+
+            except Exception as e:
+                logger.error(f"PaperTrading Loop Error: {e}")
+            
+            
+            time.sleep(60) # Update every 60 seconds (Optimized from 30s)
+
+    def _fetch_prices(self, tickers):
+        """Fetch current prices: Toss -> Naver -> yfinance -> pykrx"""
         import yfinance as yf
         try:
             from pykrx import stock
@@ -335,178 +397,185 @@ class PaperTradingService:
         logging.getLogger('yfinance').setLevel(logging.CRITICAL)
         logging.getLogger('peewee').setLevel(logging.CRITICAL)
         logging.getLogger('urllib3').setLevel(logging.ERROR)
-        
-        while self.is_running:
+
+        new_prices = {}
+
+        # 2. Try Toss Securities API first (Mobile/WTS) - Robust & Supports Bulk
+        missing_tickers = [t for t in tickers if t not in new_prices]
+        if missing_tickers:
+            import requests
+
+            # Create mapping: padded(6) -> original_ticker_in_db
+            ticker_map = {str(t).zfill(6): t for t in missing_tickers}
+
+            # Format tickers for Toss (A005930) - Ensure 6 digits
+            toss_codes = [f"A{str(t).zfill(6)}" for t in missing_tickers]
+
+            # Split into chunks of 50 to avoid URL length limits
+            chunk_size = 50
+            for i in range(0, len(toss_codes), chunk_size):
+                chunk = toss_codes[i:i + chunk_size]
+                codes_str = ",".join(chunk)
+
+                # Retry Logic for Toss API
+                for attempt in range(3):
+                    try:
+                        url = f"https://wts-info-api.tossinvest.com/api/v3/stock-prices/details?productCodes={codes_str}"
+                        headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
+                        res = requests.get(url, headers=headers, timeout=5)
+
+                        if res.status_code == 200:
+                            data = res.json()
+                            results = data.get('result', [])
+
+                            count = 0
+                            for item in results:
+                                raw_code = item.get('code', '')
+                                clean_code = raw_code[1:] if raw_code.startswith('A') else raw_code
+                                original_t = ticker_map.get(clean_code)
+                                close = item.get('close')
+
+                                if original_t and close is not None:
+                                    new_prices[original_t] = int(close)
+                                    count += 1
+                            # Success - break retry loop
+                            break
+                        elif res.status_code == 429:
+                            wait = (attempt + 1) * 2
+                            logger.warning(f"Toss API Rate Limit. Waiting {wait}s...")
+                            time.sleep(wait)
+                            continue
+                        else:
+                            logger.warning(f"Toss API returned {res.status_code}: {res.text[:100]}")
+                            if 400 <= res.status_code < 500 and res.status_code != 429:
+                                break
+
+                    except Exception as te:
+                        if attempt < 2:
+                            time.sleep(1)
+                            logger.warning(f"Toss API Retry {attempt+1}/3 failed: {te}")
+                        else:
+                            logger.error(f"Toss API Error after 3 attempts: {te}")
+
+        # 3. 네이버 증권 API (개별) - 토스 실패 종목 대상
+        missing_tickers = [t for t in tickers if t not in new_prices]
+        if missing_tickers:
+            logger.info(f"Toss failed for {len(missing_tickers)} tickers. Trying Naver API...")
+            import requests
+            from requests.exceptions import ConnectionError as ReqConnectionError
+
+            for t in missing_tickers:
+                time.sleep(0.2)  # [Rate Limit Prevention]
+                try:
+                    url = f"https://m.stock.naver.com/api/stock/{t}/basic"
+                    headers = {
+                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                        'Referer': 'https://m.stock.naver.com/'
+                    }
+                    res = requests.get(url, headers=headers, timeout=5)
+
+                    if res.status_code == 200:
+                        data = res.json()
+                        if 'closePrice' in data:
+                            price_str = data['closePrice'].replace(',', '')
+                            new_prices[t] = int(price_str)
+                            continue
+                except ReqConnectionError as ce:
+                    # DNS 오류 등 네트워크 자체 실패 → 나머지도 같은 이유로 실패하므로 즉시 중단
+                    logger.warning(f"Naver API 네트워크 오류 (DNS/연결 실패). 나머지 {len(missing_tickers)}개 종목 건너뜀: {ce}")
+                    break
+                except Exception as ne:
+                    logger.error(f"Naver API Error for {t}: {ne}")
+
+        # 4. yfinance Fallback (토스/네이버 모두 실패 시)
+        missing_tickers = [t for t in tickers if t not in new_prices]
+        if missing_tickers:
+            logger.info(f"Toss/Naver failed for {len(missing_tickers)} tickers: {missing_tickers}. Trying yfinance...")
+            yf_tickers = [f"{t}.KS" for t in missing_tickers]
             try:
-                # 1. Get all tickers from portfolio
-                with self.get_context() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute('SELECT ticker FROM portfolio')
-                    tickers = [row[0] for row in cursor.fetchall()]
-                
-                if not tickers:
-                    time.sleep(10)
-                    continue
+                df = yf.download(yf_tickers, period="1d", progress=False, threads=False)
 
-                new_prices = {}
-                
-                # 2. Try Toss Securities API first (Mobile/WTS) - Robust & Supports Bulk
-                missing_tickers = [t for t in tickers if t not in new_prices]
-                if missing_tickers:
-                    import requests
-                    
-                    # Create mapping: padded(6) -> original_ticker_in_db
-                    ticker_map = {str(t).zfill(6): t for t in missing_tickers}
+                if not df.empty:
+                    try:
+                        closes = df['Close']
+                    except KeyError:
+                        closes = df.xs('Close', axis=1, level=0, drop_level=True) if isinstance(df.columns, pd.MultiIndex) and 'Close' in df.columns.get_level_values(0) else df
 
-                    # Format tickers for Toss (A005930) - Ensure 6 digits
-                    toss_codes = [f"A{str(t).zfill(6)}" for t in missing_tickers]
-                    
-                    # Split into chunks of 50 to avoid URL length limits
-                    chunk_size = 50
-                    for i in range(0, len(toss_codes), chunk_size):
-                        chunk = toss_codes[i:i + chunk_size]
-                        codes_str = ",".join(chunk)
-
-                        # Retry Logic for Toss API
-                        for attempt in range(3):
-                            try:
-                                url = f"https://wts-info-api.tossinvest.com/api/v3/stock-prices/details?productCodes={codes_str}"
-                                headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
-                                res = requests.get(url, headers=headers, timeout=5)
-                                
-                                if res.status_code == 200:
-                                    data = res.json()
-                                    results = data.get('result', [])
-                                    
-                                    count = 0
-                                    for item in results:
-                                        raw_code = item.get('code', '')
-                                        clean_code = raw_code[1:] if raw_code.startswith('A') else raw_code
-                                        original_t = ticker_map.get(clean_code)
-                                        close = item.get('close')
-                                        
-                                        if original_t and close is not None:
-                                            new_prices[original_t] = int(close)
-                                            count += 1
-                                    # Success - break retry loop
-                                    break
-                                elif res.status_code == 429:
-                                    wait = (attempt + 1) * 2
-                                    logger.warning(f"Toss API Rate Limit. Waiting {wait}s...")
-                                    time.sleep(wait)
-                                    continue
-                                else:
-                                    logger.warning(f"Toss API returned {res.status_code}: {res.text[:100]}")
-                                    if 400 <= res.status_code < 500 and res.status_code != 429:
-                                        break
-                                            
-                            except Exception as te:
-                                if attempt < 2:
-                                    time.sleep(1)
-                                    logger.warning(f"Toss API Retry {attempt+1}/3 failed: {te}")
-                                else:
-                                    logger.error(f"Toss API Error after 3 attempts: {te}")
-
-                # 3. 네이버 증권 API (개별) - 토스 실패 종목 대상
-                missing_tickers = [t for t in tickers if t not in new_prices]
-                if missing_tickers:
-                    logger.info(f"Toss failed for {len(missing_tickers)} tickers. Trying Naver API...")
-                    import requests
-                    from requests.exceptions import ConnectionError as ReqConnectionError
-                    
                     for t in missing_tickers:
-                        time.sleep(0.2)  # [Rate Limit Prevention]
+                        ks_ticker = f"{t}.KS"
+                        val = None
                         try:
-                            url = f"https://m.stock.naver.com/api/stock/{t}/basic"
-                            headers = {
-                                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                                'Referer': 'https://m.stock.naver.com/'
-                            }
-                            res = requests.get(url, headers=headers, timeout=5)
-                            
-                            if res.status_code == 200:
-                                data = res.json()
-                                if 'closePrice' in data:
-                                    price_str = data['closePrice'].replace(',', '')
-                                    new_prices[t] = int(price_str)
-                                    continue
-                        except ReqConnectionError as ce:
-                            # DNS 오류 등 네트워크 자체 실패 → 나머지도 같은 이유로 실패하므로 즉시 중단
-                            logger.warning(f"Naver API 네트워크 오류 (DNS/연결 실패). 나머지 {len(missing_tickers)}개 종목 건너뜀: {ce}")
-                            break
-                        except Exception as ne:
-                            logger.error(f"Naver API Error for {t}: {ne}")
-
-                # 4. yfinance Fallback (토스/네이버 모두 실패 시)
-                missing_tickers = [t for t in tickers if t not in new_prices]
-                if missing_tickers:
-                    logger.info(f"Toss/Naver failed for {len(missing_tickers)} tickers: {missing_tickers}. Trying yfinance...")
-                    yf_tickers = [f"{t}.KS" for t in missing_tickers]
-                    try:
-                        df = yf.download(yf_tickers, period="1d", progress=False, threads=False)
-                        
-                        if not df.empty:
-                            try:
-                                closes = df['Close']
-                            except KeyError:
-                                closes = df.xs('Close', axis=1, level=0, drop_level=True) if isinstance(df.columns, pd.MultiIndex) and 'Close' in df.columns.get_level_values(0) else df
-                            
-                            for t in missing_tickers:
-                                ks_ticker = f"{t}.KS"
-                                val = None
-                                try:
-                                    if isinstance(closes, pd.Series):
-                                        val = closes.iloc[-1]
-                                    elif ks_ticker in closes.columns:
-                                        val = closes[ks_ticker].dropna().iloc[-1]
-                                    
-                                    if val is not None:
-                                        new_prices[t] = int(float(val))
-                                except Exception:
-                                    pass
-                    except Exception as e:
-                        logger.error(f"PaperTrading YF Error: {e}")
-                still_missing = [t for t in tickers if t not in new_prices]
-                if still_missing and stock:  # Check if stock is available
+                            if isinstance(closes, pd.Series):
+                                val = closes.iloc[-1]
+                            elif ks_ticker in closes.columns:
+                                val = closes[ks_ticker].dropna().iloc[-1]
+
+                            if val is not None:
+                                new_prices[t] = int(float(val))
+                        except Exception:
+                            pass
+            except Exception as e:
+                logger.error(f"PaperTrading YF Error: {e}")
+        still_missing = [t for t in tickers if t not in new_prices]
+        if still_missing and stock:  # Check if stock is available
+            try:
+                today_str = datetime.now().strftime("%Y%m%d")
+                for t in still_missing:
                     try:
-                        today_str = datetime.now().strftime("%Y%m%d")
-                        for t in still_missing:
-                            try:
-                                # pykrx get_market_ohlcv returns dataframe
-                                df = stock.get_market_ohlcv(today_str, today_str, t)
-                                if not df.empty and '종가' in df.columns:
-                                    price = df['종가'].iloc[-1]
-                                    if price > 0:
-                                        new_prices[t] = int(price)
-                                else:
-                                    # Try yesterday
-                                    yesterday = (datetime.now() - pd.Timedelta(days=1)).strftime("%Y%m%d")
-                                    df = stock.get_market_ohlcv(yesterday, yesterday, t)
-                                    if not df.empty and '종가' in df.columns:
-                                        price = df['종가'].iloc[-1]
-                                        if price > 0:
-                                            new_prices[t] = int(price)
-                            except Exception:
-                                pass
+                        # pykrx get_market_ohlcv returns dataframe
+                        df = stock.get_market_ohlcv(today_str, today_str, t)
+                        if not df.empty and '종가' in df.columns:
+                            price = df['종가'].iloc[-1]
+                            if price > 0:
+                                new_prices[t] = int(price)
+                        else:
+                            # Try yesterday
+                            yesterday = (datetime.now() - pd.Timedelta(days=1)).strftime("%Y%m%d")
+                            df = stock.get_market_ohlcv(yesterday, yesterday, t)
+                            if not df.empty and '종가' in df.columns:
+                                price = df['종가'].iloc[-1]
+                                if price > 0:
+                                    new_prices[t] = int(price)
                     except Exception:
                         pass
-                
-                # 5. Update Cache safely
-                with self.cache_lock:
-                    self.price_cache.update(new_prices)
-                    self.last_update = datetime.now()
+            except Exception:
+                pass
 
+        return new_prices
 
-            except Exception as e:
-                logger.error(f"PaperTrading Loop Error: {e}")
-            
-            
-            time.sleep(60) # Update every 60 seconds (Optimized from 30s)
+    def _publish_prices(self, prices):
+        """Write prices to the shared price_cache table and the local mirror"""
+        if not prices:
+            return
+        now = datetime.now()
+        self.db.executemany('''
+            INSERT INTO price_cache (ticker, price, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT(ticker) DO UPDATE SET price = excluded.price, updated_at = excluded.updated_at
+        ''', [(ticker, int(price), now.isoformat()) for ticker, price in prices.items()])
+        with self.cache_lock:
+            self.price_cache.update({ticker: int(price) for ticker, price in prices.items()})
+            self.last_update = now
+
+    def _load_shared_prices(self):
+        """Read the shared price cache (written by the sync leader or any trade)"""
+        try:
+            rows = self.db.query('SELECT ticker, price, updated_at FROM price_cache')
+        except Exception as e:
+            logger.error(f"Failed to read shared price cache: {e}")
+            with self.cache_lock:
+                return self.price_cache.copy()
+
+        prices = {row[0]: int(row[1]) for row in rows}
+        latest = max((row[2] for row in rows if row[2]), default=None)
+        with self.cache_lock:
+            self.price_cache = prices
+            if latest:
+                self.last_update = datetime.fromisoformat(latest)
+            return prices.copy()
 
     def get_portfolio_valuation(self):
         """Get portfolio with cached prices (Fast)"""
-        with self.get_context() as conn:
-            conn.row_factory = sqlite3.Row
+        with self.db.transaction(immediate=False) as conn:
             cursor = conn.cursor()
             
             cursor.execute('SELECT * FROM portfolio')
@@ -520,21 +589,17 @@ class PaperTradingService:
         updated_holdings = []
         total_stock_value = 0
         
-        # Use Cached Prices
-        with self.cache_lock:
-            current_prices = self.price_cache.copy()
+        # Use Cached Prices (shared across workers)
+        current_prices = self._load_shared_prices()
 
         # [Improvement] If cache is empty but we have holdings, wait briefly for background sync
         if not current_prices and holdings and self.bg_thread and self.bg_thread.is_alive():
             logger.info("Portfolio Valuation: Waiting for initial price sync...")
-        if not current_prices and holdings and self.bg_thread and self.bg_thread.is_alive():
-            logger.info("Portfolio Valuation: Waiting for initial price sync...")
-            for _ in range(50): # Wait up to 5 seconds (0.1s * 50)
-                time.sleep(0.1)
-                with self.cache_lock:
-                    if self.price_cache:
-                        current_prices = self.price_cache.copy()
-                        break
+            for _ in range(10): # Wait up to 5 seconds (0.5s * 10)
+                time.sleep(0.5)
+                current_prices = self._load_shared_prices()
+                if current_prices:
+                    break
             if current_prices:
                 logger.info("Portfolio Valuation: Synced successfully waited.")
             
@@ -616,11 +681,8 @@ class PaperTradingService:
             total_asset = cash + current_stock_value
             today = datetime.now().strftime('%Y-%m-%d')
             
-            conn = self.get_context()
-            cursor = conn.cursor()
-            
             # 하루에 하나의 기록만 남김 (UPDATE or INSERT)
-            cursor.execute('''
+            self.db.execute('''
                 INSERT INTO asset_history (date, total_asset, cash, stock_value, timestamp)
                 VALUES (?, ?, ?, ?, ?)
                 ON CONFLICT(date) DO UPDATE SET
@@ -629,9 +691,6 @@ class PaperTradingService:
                     stock_value = excluded.stock_value,
                     timestamp = excluded.timestamp
             ''', (today, total_asset, cash, current_stock_value, datetime.now().isoformat()))
-            
-            conn.commit()
-            conn.close()
         except Exception as e:
             logger.error(f"Failed to record asset history: {e}")
 
@@ -639,8 +698,7 @@ class PaperTradingService:
         """Get asset history for chart"""
         from datetime import timedelta  # Ensure timedelta is available
 
-        with self.get_context() as conn:
-            conn.row_factory = sqlite3.Row
+        with self.db.transaction(immediate=False) as conn:
             cursor = conn.cursor()
             # Fetch latest N records (DESC), then sort by date (ASC) for chart
             cursor.execute('''
@@ -658,16 +716,13 @@ class PaperTradingService:
                 current_cash = self.get_balance()
                 
                 # Calculate current stock value from portfolio
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
                 cursor.execute('SELECT quantity, avg_price, ticker FROM portfolio')
                 portfolio_rows = cursor.fetchall()
                 
                 current_stock_val = 0
                 import yfinance as yf # For fallback price check if needed, but for dummy data, use avg_price or cache
                 
-                with self.cache_lock:
-                    prices = self.price_cache
+                prices = self._load_shared_prices()
                     
                 for r in portfolio_rows:
                     qty = r['quantity']
@@ -693,22 +748,19 @@ class PaperTradingService:
     def reset_account(self):
         """Reset everything to default"""
         try:
-            conn = self.get_context()
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM portfolio')
-            cursor.execute('DELETE FROM trade_log')
-            cursor.execute('DELETE FROM asset_history') # 히스토리도 초기화
-            cursor.execute('UPDATE balance SET cash = 100000000, total_deposit = 0 WHERE id = 1')
-            conn.commit()
-            conn.close()
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('DELETE FROM portfolio')
+                cursor.execute('DELETE FROM trade_log')
+                cursor.execute('DELETE FROM asset_history') # 히스토리도 초기화
+                cursor.execute('UPDATE balance SET cash = 100000000, total_deposit = 0 WHERE id = 1')
             return True
         except Exception:
             return False
 
     def get_trade_history(self, limit=50):
         """Get trade history"""
-        with self.get_context() as conn:
-            conn.row_factory = sqlite3.Row
+        with self.db.transaction(immediate=False) as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT id, action, ticker, name, price, quantity, timestamp, profit, profit_rate
@@ -720,5 +772,15 @@ class PaperTradingService:
             return {'trades': trades}
 
 # Global Instance
-paper_trading = PaperTradingService()
+# 처음 접근할 때 만든다 - 모듈 import만으로 data/ DB와 동기화 스레드가 생기지 않도록
+_global_lock = threading.Lock()
+
+
+def __getattr__(name):
+    if name == 'paper_trading':
+        with _global_lock:
+            if 'paper_trading' not in globals():
+                globals()['paper_trading'] = PaperTradingService()
+        return globals()['paper_trading']
+    raise AttributeError(f"module 'services.paper_trading' has no attribute {name!r}")
 
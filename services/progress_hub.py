@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+진행 상태 이벤트 허브 (SSE / long-poll 용)
+
+- 채널별 최신 상태 스냅샷과 증가하는 시퀀스 번호를 프로세스 메모리에 유지한다.
+- 구독자는 Condition 대기로 블로킹하므로 유휴 시 디스크/CPU 부하가 없다.
+- gunicorn 워커 간 전파: 워커마다 Unix datagram 소켓을 하나씩 열고,
+  publish 시 소켓 디렉토리의 모든 워커에게 이벤트를 전송한다 (죽은 워커 소켓은 정리).
+"""
+
+import atexit
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_DIR = os.path.join(tempfile.gettempdir(), 'kr_market_progress')
+MAX_DATAGRAM_SIZE = 64 * 1024
+
+
+class ProgressHub:
+    """채널별 최신 이벤트를 보관하고 대기 중인 구독자를 깨운다."""
+
+    def __init__(self, socket_dir: Optional[str] = None, fanout: bool = True):
+        self.socket_dir = socket_dir or os.getenv('PROGRESS_SOCKET_DIR', DEFAULT_SOCKET_DIR)
+        self.fanout = fanout
+        self._cond = threading.Condition()
+        self._seq = 0
+        # channel -> (seq, event)
+        self._latest: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._sock: Optional[socket.socket] = None
+        self._sock_path: Optional[str] = None
+        self._listener: Optional[threading.Thread] = None
+        self._listener_pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self._streams = 0
+
+    # ------------------------------------------------------------------
+    # 발행 / 조회
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """워커 시작 시 호출 - 다른 워커의 이벤트를 바로 받을 수 있도록 소켓을 연다."""
+        self._ensure_listener()
+
+    def publish(self, channel: str, data: Dict[str, Any]) -> int:
+        """이벤트 발행 (로컬 구독자 + 다른 워커)"""
+        self._ensure_listener()
+        event = {
+            'channel': channel,
+            'data': data,
+            'ts': time.time(),
+            'origin': self._sock_path,
+        }
+        seq = self._apply(event)
+        if self.fanout:
+            self._broadcast(event)
+        return seq
+
+    def latest(self, channel: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            item = self._latest.get(channel)
+            return item[1]['data'] if item else None
+
+    def events_since(self, since: int, channels: Optional[Iterable[str]] = None) -> Tuple[int, List[Dict[str, Any]]]:
+        """since 이후 갱신된 채널의 최신 이벤트 (채널당 1개로 병합)"""
+        with self._cond:
+            return self._seq, self._collect_locked(since, channels)
+
+    def wait_for_events(self, since: int, channels: Optional[Iterable[str]] = None, timeout: float = 25.0) -> Tuple[int, List[Dict[str, Any]]]:
+        """새 이벤트가 올 때까지 블로킹 대기 (timeout 시 빈 목록)"""
+        self._ensure_listener()
+        channels = set(channels) if channels else None
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                events = self._collect_locked(since, channels)
+                remaining = deadline - time.monotonic()
+                if events or remaining <= 0:
+                    return self._seq, events
+                self._cond.wait(remaining)
+
+    def try_open_stream(self, limit: int) -> bool:
+        """SSE 연결/long-poll 대기 슬롯 확보 (이 프로세스에서 사용 중인 슬롯이 limit 이상이면 False)"""
+        with self._cond:
+            if self._streams >= limit:
+                return False
+            self._streams += 1
+            return True
+
+    def close_stream(self) -> None:
+        with self._cond:
+            self._streams = max(self._streams - 1, 0)
+
+    @property
+    def open_streams(self) -> int:
+        return self._streams
+
+    def _collect_locked(self, since: int, channels: Optional[Iterable[str]]) -> List[Dict[str, Any]]:
+        events = [
+            {'seq': seq, 'channel': channel, 'data': event['data'], 'ts': event['ts']}
+            for channel, (seq, event) in self._latest.items()
+            if seq > since and (not channels or channel in channels)
+        ]
+        return sorted(events, key=lambda e: e['seq'])
+
+    def _apply(self, event: Dict[str, Any]) -> int:
+        with self._cond:
+            self._seq += 1
+            self._latest[event['channel']] = (self._seq, event)
+            self._cond.notify_all()
+            return self._seq
+
+    # ------------------------------------------------------------------
+    # 워커 간 전파 (Unix datagram socket)
+    # ------------------------------------------------------------------
+    def _ensure_listener(self) -> None:
+        # fork 이후 자식 프로세스는 부모의 소켓을 공유하지 않고 새로 연다
+        if not self.fanout or self._listener_pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._listener_pid == os.getpid():
+                return
+            try:
+                os.makedirs(self.socket_dir, exist_ok=True)
+                path = os.path.join(self.socket_dir, f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock")
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                sock.bind(path)
+                self._sock, self._sock_path = sock, path
+                atexit.register(self.close)
+            except Exception as e:
+                logger.warning(f"Progress hub socket unavailable, local-only mode: {e}")
+                self.fanout = False
+                return
+            self._listener_pid = os.getpid()
+            self._listener = threading.Thread(target=self._listen, name='progress-hub', daemon=True)
+            self._listener.start()
+
+    def _listen(self) -> None:
+        sock = self._sock
+        while sock is not None:
+            try:
+                payload = sock.recv(MAX_DATAGRAM_SIZE)
+            except OSError:
+                break
+            try:
+                event = json.loads(payload.decode('utf-8'))
+                if event.get('origin') != self._sock_path:
+                    self._apply(event)
+            except Exception as e:
+                logger.debug(f"Invalid progress event: {e}")
+
+    def _broadcast(self, event: Dict[str, Any]) -> None:
+        if not self._sock_path:
+            return
+        try:
+            payload = json.dumps(event, ensure_ascii=False, default=str).encode('utf-8')
+        except Exception as e:
+            logger.debug(f"Progress event not serializable: {e}")
+            return
+        if len(payload) > MAX_DATAGRAM_SIZE:
+            logger.debug(f"Progress event too large for fan-out: {len(payload)} bytes")
+            return
+
+        try:
+            names = os.listdir(self.socket_dir)
+        except OSError:
+            return
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sender.setblocking(False)
+        try:
+            for name in names:
+                path = os.path.join(self.socket_dir, name)
+                if not name.endswith('.sock') or path == self._sock_path:
+                    continue
+                try:
+                    sender.sendto(payload, path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # 종료된 워커의 소켓 파일
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+                except OSError as e:
+                    # 수신 버퍼가 가득 찬 경우 등 - 해당 워커는 다음 이벤트에서 최신 상태를 받는다
+                    logger.debug(f"Progress fan-out to {name} failed: {e}")
+        finally:
+            sender.close()
+
+    def close(self) -> None:
+        sock, path = self._sock, self._sock_path
+        self._sock = None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+        if path:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+_hub: Optional[ProgressHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_progress_hub() -> ProgressHub:
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = ProgressHub()
+    return _hub
+
+
+def publish_progress(channel: str, data: Dict[str, Any]) -> None:
+    """발행 실패가 작업 자체를 중단시키지 않도록 예외를 삼킨다."""
+    try:
+        get_progress_hub().publish(channel, data)
+    except Exception as e:
+        logger.debug(f"Progress publish failed ({channel}): {e}")
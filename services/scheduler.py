@@ -14,16 +14,12 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 's
 
 from engine.config import app_config  # Config Import
 
-from init_data import (
 
-    create_signals_log, # Corrected
-    create_jongga_v2_latest,
-    fetch_sector_indices,
-    create_daily_prices,
-    create_institutional_trend,
-    send_jongga_notification,
-    log
-)
+
+def _init_data():
+    """scripts/init_data 작업 함수 모듈 (pandas/yfinance 등을 끌어오므로 작업 실행 시점에 로드)"""
+    import init_data
+    return init_data
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -56,14 +52,14 @@ def run_jongga_v2_analysis(test_mode=False):
         # create_daily_prices()
         
         # 2. 분석 실행
-        analysis_ok = create_jongga_v2_latest()
+        analysis_ok = _init_data().create_jongga_v2_latest()
         if analysis_ok is False:
             logger.error("[Scheduler] 종가베팅 결과 생성 실패 감지")
         else:
             logger.info("<<< [Scheduler] AI 종가베팅 분석 완료 (16:30)")
         
-        # 3. 알림 발송 (Messenger 사용)
-        send_jongga_notification()
+        # 3. 알림 발송 (Messenger 사용) - 느린 웹훅에 스케줄 체인이 묶이지 않도록 예약만 하고 진행
+        _init_data().send_jongga_notification(wait=False)
         
         logger.info("<<< [Scheduler] AI 종가베팅 분석 완료")
         
@@ -85,18 +81,18 @@ def run_daily_closing_analysis(test_mode=False):
     try:
         # 1. 최신 데이터 수집
         logger.info("[Scheduler] 일별 주가 데이터 수집...")
-        prices_ok = create_daily_prices()
+        prices_ok = _init_data().create_daily_prices()
         if prices_ok is False:
             logger.error("[Scheduler] 일별 주가 데이터 수집 실패 감지")
         
         logger.info("[Scheduler] 기관/외인 수급 데이터 수집...")
-        inst_ok = create_institutional_trend()
+        inst_ok = _init_data().create_institutional_trend()
         if inst_ok is False:
             logger.error("[Scheduler] 기관/외인 수급 데이터 수집 실패 감지")
         
         # 2. 분석 실행
         logger.info("[Scheduler] VCP 시그널 분석...")
-        vcp_ok = create_signals_log(run_ai=True)
+        vcp_ok = _init_data().create_signals_log(run_ai=True)
         if vcp_ok is False:
             logger.error("[Scheduler] VCP 시그널 분석 실패 감지")
         
@@ -143,13 +139,32 @@ def run_market_gate_sync():
         # 3. Market Gate 분석
         from engine.market_gate import MarketGate
         mg = MarketGate()
-        result = mg.analyze()
+        result = mg.analyze(use_cache=False)  # 주기 갱신이므로 입력 스냅샷 무시
         mg.save_analysis(result)
+        # 히스토리 조회 API는 저장된 테이블만 읽으므로 가격 데이터가 바뀌었으면 여기서 재계산
+        if mg.history_is_stale():
+            mg.build_history()
         
         logger.debug("<<< [Scheduler] Market Gate 및 전체 데이터 동기화 완료")
     except Exception as e:
         logger.error(f"[Scheduler] Market Gate 동기화 실패: {e}")
 
+def run_jongga_rescore():
+    """저장된 종가베팅 결과를 현재 등급 규칙 버전으로 재산정"""
+    try:
+        from engine.jongga_rescore import run_rescore_job
+        run_rescore_job(os.path.join(os.path.dirname(__file__), '..', 'data'))
+    except Exception as e:
+        logger.error(f"[Scheduler] 종가베팅 등급 재산정 실패: {e}")
+
+def start_notification_retry():
+    """실패한 알림 Outbox 주기 재시도 시작"""
+    try:
+        from engine.notification_dispatcher import get_dispatcher
+        get_dispatcher().start_retry_worker()
+    except Exception as e:
+        logger.error(f"[Scheduler] 알림 재시도 워커 시작 실패: {e}")
+
 def update_market_gate_interval(minutes: int):
     """실시간으로 Market Gate 업데이트 주기 변경"""
     try:
@@ -182,6 +197,12 @@ def start_scheduler():
         # Silent return - no log needed to avoid duplicates
         return
 
+    # 종가베팅 결과 등급 재산정 (규칙 버전이 바뀐 파일만, 잠금 획득 워커에서 1회)
+    threading.Thread(target=run_jongga_rescore, daemon=True, name='jongga-rescore').start()
+
+    # 실패 알림 재발송 (웹 요청에서 실패한 발송도 포함되므로 스케줄러 비활성화와 무관하게 실행)
+    start_notification_retry()
+
     # 2. Config Check (잠금 획득한 워커에서만 실행)
     if not app_config.SCHEDULER_ENABLED:
         logger.info("Scheduler is disabled in configuration. Skipping start.")
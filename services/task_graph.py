@@ -0,0 +1,134 @@
+"""
+의존성 기반 병렬 작업 실행기 (데이터 업데이트 파이프라인용)
+
+- 선택된 작업 중 의존 작업이 모두 끝난 작업부터 동시에 실행한다.
+- 같은 resource 태그를 가진 작업은 동시에 실행하지 않는다 (예: LLM 호출량 보호).
+- 의존 작업이 실패해도 후속 작업은 실행한다 (기존 순차 실행과 동일한 정책).
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskSpec:
+    """실행 단위 정의 - func(results)는 선행 작업 결과 dict를 받는다."""
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...] = ()
+    resources: Tuple[str, ...] = ()
+
+
+@dataclass
+class TaskResult:
+    name: str
+    status: str  # done | error | cancelled
+    duration: float = 0.0
+    value: Any = None
+    error: Optional[str] = None
+
+
+@dataclass
+class _RunState:
+    pending: Dict[str, TaskSpec] = field(default_factory=dict)
+    running: Dict[Any, Tuple[TaskSpec, float]] = field(default_factory=dict)
+    busy_resources: set = field(default_factory=set)
+    results: Dict[str, TaskResult] = field(default_factory=dict)
+
+
+class DependencyExecutor:
+    """TaskSpec 목록을 의존성 순서대로(가능하면 병렬로) 실행한다."""
+
+    def __init__(
+        self,
+        tasks: List[TaskSpec],
+        max_workers: int = 4,
+        on_status: Optional[Callable[[str, str, Optional[float]], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ):
+        names = [t.name for t in tasks]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Duplicate task names: {names}")
+        self.tasks = tasks
+        self.max_workers = max(1, max_workers)
+        self.on_status = on_status or (lambda name, status, duration: None)
+        self.should_stop = should_stop or (lambda: False)
+        self._validate_acyclic()
+
+    def _deps(self, task: TaskSpec) -> Tuple[str, ...]:
+        """선택되지 않은 작업에 대한 의존성은 무시한다."""
+        selected = {t.name for t in self.tasks}
+        return tuple(d for d in task.depends_on if d in selected)
+
+    def _validate_acyclic(self) -> None:
+        remaining = {t.name: set(self._deps(t)) for t in self.tasks}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle among tasks: {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _ready_tasks(self, state: _RunState) -> List[TaskSpec]:
+        ready = []
+        claimed = set(state.busy_resources)
+        for task in self.tasks:
+            if task.name not in state.pending:
+                continue
+            if any(dep not in state.results for dep in self._deps(task)):
+                continue
+            if claimed.intersection(task.resources):
+                continue
+            claimed.update(task.resources)
+            ready.append(task)
+        return ready
+
+    def run(self) -> Dict[str, TaskResult]:
+        state = _RunState(pending={t.name: t for t in self.tasks})
+        values: Dict[str, Any] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='task-graph') as pool:
+            while state.pending or state.running:
+                if not self.should_stop():
+                    for task in self._ready_tasks(state):
+                        if len(state.running) >= self.max_workers:
+                            break
+                        del state.pending[task.name]
+                        state.busy_resources.update(task.resources)
+                        self.on_status(task.name, 'running', None)
+                        future = pool.submit(task.func, dict(values))
+                        state.running[future] = (task, time.monotonic())
+                elif state.pending:
+                    for name in list(state.pending):
+                        state.results[name] = TaskResult(name=name, status='cancelled')
+                        self.on_status(name, 'cancelled', None)
+                    state.pending.clear()
+
+                if not state.running:
+                    if state.pending:
+                        # 의존 작업이 모두 끝났는데도 실행 불가한 작업은 없어야 한다 (순환은 생성 시 검증)
+                        raise RuntimeError(f"Unschedulable tasks: {sorted(state.pending)}")
+                    break
+
+                done, _ = wait(list(state.running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    task, started = state.running.pop(future)
+                    state.busy_resources.difference_update(task.resources)
+                    duration = round(time.monotonic() - started, 3)
+                    try:
+                        value = future.result()
+                        values[task.name] = value
+                        state.results[task.name] = TaskResult(task.name, 'done', duration, value)
+                        self.on_status(task.name, 'done', duration)
+                    except Exception as e:
+                        logger.error(f"{task.name} Failed: {e}")
+                        state.results[task.name] = TaskResult(task.name, 'error', duration, error=str(e))
+                        self.on_status(task.name, 'error', duration)
+
+        return state.results
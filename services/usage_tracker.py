@@ -8,37 +8,78 @@ Usage Tracker Service
 """
 
 import os
-import sqlite3
+import json
 import logging
+import threading
 from datetime import datetime
+from typing import Optional, Tuple
+
+from engine.sqlite_db import get_database
 
 logger = logging.getLogger(__name__)
 
 class UsageTracker:
-    def __init__(self, db_path='usage.db', limit=10):
+    """
+    사용량 카운터 (SQLite, 워커/스레드 간 원자적 증가)
+
+    같은 usage.db 안에서 용도별로 테이블을 나눈다.
+    - usage_log: AI 재분석 무료 사용량 (이메일 기준)
+    - chatbot_quota: 챗봇 무료 사용량 (이메일 또는 세션 ID 기준, 구 user_quota.json)
+    """
+
+    def __init__(self, db_path='usage.db', limit=10, table='usage_log'):
         # DB Path relative to data directory or root
         self.db_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', db_path)
         self.limit = limit
+        # 테이블명은 코드에서만 지정 (사용자 입력 아님)
+        self.table = table
+        self.db = get_database(self.db_path)
         self._init_db()
 
     def _init_db(self):
         """Initialize SQLite database table"""
         try:
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS usage_log (
+            self.db.execute(f'''
+                CREATE TABLE IF NOT EXISTS {self.table} (
                     email TEXT PRIMARY KEY,
                     count INTEGER DEFAULT 0,
                     last_used TEXT
                 )
             ''')
-            conn.commit()
-            conn.close()
         except Exception as e:
             logger.error(f"Failed to initialize usage db: {e}")
 
+    def try_increment(self, email: str, limit: Optional[int] = None) -> Tuple[bool, int]:
+        """
+        한도 미만일 때만 1 증가 (단일 UPSERT - 동시 요청에서도 한도를 넘지 않음)
+
+        Returns:
+            (허용 여부, 증가 후(거부 시 현재) 사용량)
+        """
+        limit = self.limit if limit is None else limit
+        if limit <= 0:
+            return False, self.get_usage(email)
+
+        with self.db.transaction() as conn:
+            cursor = conn.execute(f'''
+                INSERT INTO {self.table} (email, count, last_used) VALUES (?, 1, ?)
+                ON CONFLICT(email) DO UPDATE SET count = count + 1, last_used = excluded.last_used
+                WHERE {self.table}.count < ?
+            ''', (email, datetime.now().isoformat(), limit))
+            allowed = cursor.rowcount > 0
+            row = conn.execute(f'SELECT count FROM {self.table} WHERE email = ?', (email,)).fetchone()
+        return allowed, (row[0] if row else 0)
+
+    def decrement(self, email: str, amount: int = 1) -> int:
+        """사용량 차감 (최소 0) - 실패한 호출 환불 / 충전. 반환: 차감 후 사용량"""
+        with self.db.transaction() as conn:
+            conn.execute(
+                f'UPDATE {self.table} SET count = MAX(0, count - ?) WHERE email = ?',
+                (amount, email),
+            )
+            row = conn.execute(f'SELECT count FROM {self.table} WHERE email = ?', (email,)).fetchone()
+        return row[0] if row else 0
+
     def check_and_increment(self, email: str) -> bool:
         """
         Check if user has remaining quota and increment if yes.
@@ -48,33 +89,10 @@ class UsageTracker:
             return False
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Check current usage
-            cursor.execute('SELECT count FROM usage_log WHERE email = ?', (email,))
-            row = cursor.fetchone()
-            
-            current_count = 0
-            if row:
-                current_count = row[0]
-            
-            if current_count >= self.limit:
-                conn.close()
-                return False
-            
-            # Increment
-            now = datetime.now().isoformat()
-            if row:
-                cursor.execute('UPDATE usage_log SET count = count + 1, last_used = ? WHERE email = ?', (now, email))
-            else:
-                cursor.execute('INSERT INTO usage_log (email, count, last_used) VALUES (?, 1, ?)', (email, now))
-                
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"User {email} usage incremented: {current_count + 1}/{self.limit}")
-            return True
+            allowed, count = self.try_increment(email)
+            if allowed:
+                logger.info(f"User {email} usage incremented: {count}/{self.limit}")
+            return allowed
             
         except Exception as e:
             logger.error(f"Usage tracking error: {e}")
@@ -85,14 +103,63 @@ class UsageTracker:
     def get_usage(self, email: str) -> int:
         """Get current usage count"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('SELECT count FROM usage_log WHERE email = ?', (email,))
-            row = cursor.fetchone()
-            conn.close()
+            row = self.db.query_one(f'SELECT count FROM {self.table} WHERE email = ?', (email,))
             return row[0] if row else 0
         except:
             return 0
 
-# Global Instance
-usage_tracker = UsageTracker()
+    def reset(self) -> None:
+        """모든 사용량 삭제 (Factory Reset)"""
+        self.db.execute(f'DELETE FROM {self.table}')
+
+    def import_json_counts(self, json_path: str) -> int:
+        """
+        구 JSON 카운터 파일({key: count})을 1회 이관 후 파일명을 *.migrated로 변경.
+        여러 워커가 동시에 실행해도 MAX로 병합하므로 중복 가산되지 않는다.
+        """
+        if not os.path.exists(json_path):
+            return 0
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            rows = [
+                (str(key), int(count), datetime.now().isoformat())
+                for key, count in (data.items() if isinstance(data, dict) else [])
+                if isinstance(count, (int, float))
+            ]
+            self.db.executemany(f'''
+                INSERT INTO {self.table} (email, count, last_used) VALUES (?, ?, ?)
+                ON CONFLICT(email) DO UPDATE SET count = MAX(count, excluded.count)
+            ''', rows)
+            os.replace(json_path, json_path + '.migrated')
+            logger.info(f"Migrated {len(rows)} usage counters from {os.path.basename(json_path)}")
+            return len(rows)
+        except FileNotFoundError:
+            return 0  # 다른 워커가 먼저 이관
+        except Exception as e:
+            logger.error(f"Usage counter migration failed ({json_path}): {e}")
+            return 0
+
+def _create_chatbot_quota() -> UsageTracker:
+    # 챗봇 무료 사용량 (구 data/user_quota.json)
+    tracker = UsageTracker(limit=10, table='chatbot_quota')
+    tracker.import_json_counts(os.path.join(os.path.dirname(tracker.db_path), 'user_quota.json'))
+    return tracker
+
+
+# Global Instances
+# 처음 접근할 때 만든다 - 모듈 import만으로 data/usage.db 생성과 JSON 이관이 일어나지 않도록
+_GLOBAL_FACTORIES = {
+    'usage_tracker': UsageTracker,
+    'chatbot_quota': _create_chatbot_quota,
+}
+_global_lock = threading.Lock()
+
+
+def __getattr__(name):
+    if name in _GLOBAL_FACTORIES:
+        with _global_lock:
+            if name not in globals():
+                globals()[name] = _GLOBAL_FACTORIES[name]()
+        return globals()[name]
+    raise AttributeError(f"module 'services.usage_tracker' has no attribute {name!r}")